@@ -0,0 +1,325 @@
+"""
+수집 런타임 공용 구성 (Main.MainWindow / Acquisition_Daemon 공용)
+
+GUI 프로세스와 헤드리스 데몬이 같은 안전 경로, 같은 장비 연결 절차를 쓰도록
+구성/연결/시험 시작·정지 처리를 한 곳에 둔다.
+
+- build_acquisition(): SafetyGuard(+규칙 엔진) → EmergencyStop → DataHandler(+파단 감지)
+  → 원시 스트림 캡처 → Motor / Loadcell / Temp Manager
+- connect_motor / connect_loadcell / connect_temp: 포트 열기 + 핸드셰이크 + Manager 서비스 시작
+- release_device: Manager 서비스 중지 + 포트 닫기
+- begin_test_safety / arm_emergency_stop / end_test_safety / stop_motor: 시험 시작·정지 시 안전 경로
+- set_unloading: 프로파일 하중 제거 단계 동안만 하중 감소 검사 중지
+"""
+
+import logging
+from dataclasses import dataclass
+
+from Break_Detector import BreakDetector
+from Controller_Loadcell import verify_loadcell_connection
+from Data_Handler import DataHandler
+from Data_Synchronizer import DataSynchronizer
+from Device_Simulator import create_serial, modbus_client_factory
+from Emergency_Stop import EmergencyStop
+from Manager_loadcell import LoadcellManager
+from Manager_motor import MotorManager
+from Manager_temp import TempManager
+from Modbus_Bus import acquire_modbus_client
+from Safety_Guard import SafetyGuard
+from Safety_Rules import SafetyRuleEngine, emergency_force_limit
+from Stream_Capture import StreamCapture, capture_path
+from Tensioning_Controller import TensioningController
+from config import (
+    break_cfg, capture_cfg, loadcell_cfg, motor_cfg, safety_cfg, safety_rules_cfg, temp_cfg
+)
+
+logger = logging.getLogger(__name__)
+
+
+class DeviceConnectError(Exception):
+    """포트 열기 / 핸드셰이크 실패"""
+
+
+class ServiceStartError(DeviceConnectError):
+    """핸드셰이크는 성공했지만 Manager 서비스 시작 실패"""
+
+
+# ============================================================================
+# 구성
+# ============================================================================
+
+@dataclass
+class AcquisitionStack:
+    """build_acquisition() 결과 (소유자가 각 구성 요소를 속성으로 보관)"""
+    safety_guard: SafetyGuard
+    guard: object                  # DataHandler에 주입된 가드 (규칙 엔진 또는 safety_guard)
+    emergency_stop: EmergencyStop
+    synchronizer: DataSynchronizer
+    tensioning: TensioningController
+    data_handler: DataHandler
+    stream_capture: StreamCapture
+    motor_manager: MotorManager
+    loadcell_manager: LoadcellManager
+    temp_manager: TempManager
+
+
+def build_acquisition(safety_guard: SafetyGuard, ui_updater, data_receiver, stop_callback,
+                      ui=None, plot_service=None, capture_metadata: dict = None) -> AcquisitionStack:
+    """
+    DataHandler ← Manager ← Monitor 워커 구성
+
+    Args:
+        safety_guard: 변위/하중 제한 가드 (GUI는 UI 스핀박스 연동, 데몬은 고정 제한값)
+        ui_updater: 라벨 갱신 (데몬은 UIUpdater(None))
+        data_receiver: IDataReceiver (GUI: PlotService, 데몬: DaemonRecorder)
+        stop_callback: 가드 트립 시 중앙 정지 함수
+        ui / plot_service: TempManager 온도 표시용 (데몬은 None)
+        capture_metadata: 원시 스트림 캡처 파일 메타데이터 (capture_cfg.ENABLED일 때만 사용)
+    """
+    # 하중/온도 규칙 엔진 (변위 검사는 SafetyGuard에 위임)
+    guard = safety_guard
+    if safety_rules_cfg.ENABLED:
+        guard = SafetyRuleEngine(safety_guard, safety_rules_cfg)
+
+    # Emergency Stop (워커 스레드에서 제한 검사 → 즉시 모터 정지)
+    emergency_stop = EmergencyStop(safety_cfg)
+
+    synchronizer = DataSynchronizer()
+    tensioning = TensioningController()
+    data_handler = DataHandler(
+        ui_updater=ui_updater,
+        safety_guard=guard,
+        synchronizer=synchronizer,
+        tensioning=tensioning,
+        data_receiver=data_receiver,
+        stop_callback=stop_callback,
+        break_detector=BreakDetector(break_cfg) if break_cfg.ENABLED else None
+    )
+
+    # 원시 스트림 캡처 (재생 벤치마크/트립 분석용, 기본 비활성)
+    stream_capture = StreamCapture()
+    if capture_cfg.ENABLED:
+        try:
+            stream_capture.open(capture_path(), metadata=capture_metadata or {})
+        except OSError as e:
+            logger.error(f"[CAPTURE] 캡처 파일 열기 실패: {e}")
+
+    return AcquisitionStack(
+        safety_guard=safety_guard,
+        guard=guard,
+        emergency_stop=emergency_stop,
+        synchronizer=synchronizer,
+        tensioning=tensioning,
+        data_handler=data_handler,
+        stream_capture=stream_capture,
+        motor_manager=MotorManager(
+            data_handler=data_handler,
+            safety_stage=emergency_stop,
+            capture=stream_capture
+        ),
+        loadcell_manager=LoadcellManager(
+            data_handler=data_handler,
+            safety_stage=emergency_stop,
+            capture=stream_capture
+        ),
+        temp_manager=TempManager(
+            ui,
+            plot_service=plot_service,
+            data_handler=data_handler,
+            capture=stream_capture,
+            ui_updater=ui_updater
+        )
+    )
+
+
+# ============================================================================
+# 장비 연결
+# ============================================================================
+
+def _modbus_handshake(client, device: str, read):
+    try:
+        if not client.connect():
+            raise DeviceConnectError(f"{device}: 포트를 열 수 없음")
+        chk = read()
+        if chk.isError():
+            raise DeviceConnectError(f"{device}: Handshake 실패 ({chk})")
+    except DeviceConnectError:
+        client.close()
+        raise
+    except Exception as e:
+        client.close()
+        raise DeviceConnectError(f"{device}: 연결 실패 ({e})") from e
+
+
+def connect_motor(manager: MotorManager, port: str, baud: int, interval_ms: int):
+    """
+    모터 연결 (같은 포트의 온도 제어기와 Modbus 버스 공유)
+
+    Returns:
+        Modbus 클라이언트 (연결 해제 시 release_device에 전달)
+
+    Raises:
+        DeviceConnectError: 포트 열기 / 핸드셰이크 실패
+        ServiceStartError: MotorManager 서비스 시작 실패
+    """
+    client = acquire_modbus_client(
+        port=port,
+        client_factory=modbus_client_factory(port),
+        baudrate=baud, bytesize=8, parity='N', stopbits=1,
+        timeout=motor_cfg.DEFAULT_TIMEOUT
+    )
+    _modbus_handshake(
+        client, 'motor',
+        lambda: client.read_holding_registers(
+            address=motor_cfg.ADDR_POSITION_HI, count=2, device_id=motor_cfg.DEFAULT_UNIT_ID
+        )
+    )
+    logger.info(f"[MOTOR] Handshake 성공: {port} @ {baud}")
+
+    if not manager.start_service(
+        client=client, unit_id=motor_cfg.DEFAULT_UNIT_ID, interval_ms=interval_ms
+    ):
+        client.close()
+        raise ServiceStartError("motor: 서비스 시작 실패")
+    return client
+
+
+def connect_loadcell(manager: LoadcellManager, port: str, baud: int, interval_ms: int):
+    """
+    로드셀 연결 (SIM: 포트는 가상 장비)
+
+    Returns:
+        시리얼 포트 객체
+
+    Raises:
+        DeviceConnectError: 포트 열기 / 핸드셰이크 실패
+        ServiceStartError: LoadcellManager 서비스 시작 실패
+    """
+    ser = create_serial(port)
+    ser.port = port
+    ser.baudrate = baud
+    ser.parity = loadcell_cfg.DEFAULT_PARITY
+    ser.bytesize = loadcell_cfg.DEFAULT_BYTESIZE
+    ser.stopbits = loadcell_cfg.DEFAULT_STOPBITS
+    ser.timeout = loadcell_cfg.DEFAULT_TIMEOUT
+    try:
+        ser.open()
+        ok, err = verify_loadcell_connection(ser)
+    except Exception as e:
+        ok, err = False, str(e)
+    if not ok:
+        _close_port(ser)
+        raise DeviceConnectError(f"loadcell: 연결 실패 ({err})")
+    logger.info(f"[LC] Handshake 성공: {port} @ {baud}")
+
+    if not manager.start_service(serial_port=ser, interval_ms=interval_ms):
+        _close_port(ser)
+        raise ServiceStartError("loadcell: 서비스 시작 실패")
+    return ser
+
+
+def connect_temp(manager: TempManager, port: str, baud: int, interval_ms: int):
+    """
+    온도 제어기 연결
+
+    Returns:
+        Modbus 클라이언트
+
+    Raises:
+        DeviceConnectError: 포트 열기 / 핸드셰이크 실패
+        ServiceStartError: TempManager 서비스 시작 실패
+    """
+    client = acquire_modbus_client(
+        port=port,
+        client_factory=modbus_client_factory(port),
+        baudrate=baud, bytesize=8, parity=temp_cfg.DEFAULT_PARITY, stopbits=1,
+        timeout=temp_cfg.DEFAULT_TIMEOUT
+    )
+    _modbus_handshake(
+        client, 'temp',
+        lambda: client.read_input_registers(
+            address=temp_cfg.HANDSHAKE_TEST_ADDRESS,
+            count=temp_cfg.HANDSHAKE_TEST_COUNT,
+            device_id=temp_cfg.DEFAULT_UNIT_ID
+        )
+    )
+    logger.info(f"[TEMP] Handshake 성공: {port} @ {baud}")
+
+    if not manager.start_service(client, interval_ms):
+        client.close()
+        raise ServiceStartError("temp: 서비스 시작 실패")
+    return client
+
+
+def release_device(manager, port_handle):
+    """Manager 서비스 중지 후 포트 닫기 (port_handle: connect_*가 돌려준 객체, None 허용)"""
+    manager.stop_service()
+    if port_handle is not None:
+        _close_port(port_handle)
+
+
+def _close_port(port_handle):
+    try:
+        if getattr(port_handle, 'is_open', True):
+            port_handle.close()
+    except Exception as e:
+        logger.error(f"포트 닫기 실패: {e}")
+
+
+# ============================================================================
+# 시험 시작 / 정지
+# ============================================================================
+
+def begin_test_safety(data_handler: DataHandler):
+    """시험 시작 시 파단 감지 / 하중 감소 검사 켜기"""
+    data_handler.break_detection_enabled = True
+    data_handler.guard.set_load_drop_checks(True)
+
+
+def set_unloading(data_handler: DataHandler, unloading: bool):
+    """
+    프로파일 하중 제거 단계 진입/이탈
+
+    unloading이면 파단 감지와 하중 감소 검사(규칙 엔진 load_drop, 변화량 가드)를 끄고,
+    당김/유지 단계로 돌아오면 다시 켠다. 재개 시 파단 감지는 낮아진 하중에서
+    피크를 새로 추적하도록 리셋한다 (하중 제거 전 피크와 비교하면 바로 파단 판정).
+    """
+    enabled = not unloading
+    if enabled and not data_handler.break_detection_enabled and data_handler.break_detector is not None:
+        data_handler.break_detector.reset()
+    data_handler.break_detection_enabled = enabled
+    data_handler.guard.set_load_drop_checks(enabled)
+
+
+def arm_emergency_stop(emergency_stop: EmergencyStop, safety_guard: SafetyGuard,
+                       data_handler: DataHandler, motor_controller) -> bool:
+    """현재 제한값으로 워커 쪽 긴급 정지 단계 장착 (비활성 설정이면 False)"""
+    if not safety_cfg.EMERGENCY_STOP_ENABLED:
+        return False
+    limits = safety_guard.limits
+    emergency_stop.arm(
+        stop_fn=motor_controller.submit_stop,
+        start_pos_um=data_handler.start_pos_um,
+        displacement_limit_um=limits.displacement_limit_mm * 1000.0,
+        force_limit_n=emergency_force_limit(limits.force_limit_n),
+        check_force_drops=safety_guard.load_drop_checks
+    )
+    return True
+
+
+def end_test_safety(emergency_stop: EmergencyStop, data_handler: DataHandler):
+    """시험 종료 시 긴급 정지 해제, 파단 감지 끄기, 하중 감소 검사 복구"""
+    emergency_stop.disarm()
+    data_handler.break_detection_enabled = False  # 시험 밖에서는 파단 감지 안 함
+    data_handler.guard.set_load_drop_checks(True)  # 프로파일이 중지했던 검사 복구
+
+
+def stop_motor(motor_manager: MotorManager):
+    """연결되어 있으면 모터 정지 (예외는 기록만)"""
+    if not motor_manager.is_connected():
+        return
+    try:
+        motor_manager.controller.stop_motor()
+        logger.info("[TEST_CONTROL] 하드웨어 모터 정지 완료")
+    except Exception as e:
+        logger.error(f"[TEST_CONTROL] motor.stop_motor() 예외: {e}")
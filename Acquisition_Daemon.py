@@ -0,0 +1,757 @@
+"""
+헤드리스 수집 데몬 + GUI 클라이언트
+
+GUI 없이 MotorManager / LoadcellManager / TempManager, 안전 경로(SafetyGuard,
+규칙 엔진, EmergencyStop, 파단 감지)와 CSV/바이너리 로그를 소유하는 프로세스.
+렌더링이 멈춰도 수집/안전 검사/로그 기록은 영향을 받지 않으며, 밤새 진행하는
+크리프 시험처럼 GUI 없이 장시간 돌리는 용도로 쓴다.
+
+GUI(또는 스크립트)는 로컬 소켓(QLocalServer, Unix 소켓 / Windows 명명 파이프)으로
+붙어서 명령을 보내고, 데몬이 주기적으로 방출하는 축약된 샘플/상태를 받는다.
+
+프로토콜 (UTF-8 JSON 한 줄 = 메시지 하나):
+
+    클라이언트 → 데몬   {"id": 1, "cmd": "start_test", "args": {"log_path": "a.csv"}}
+    데몬 → 클라이언트   {"type": "reply", "id": 1, "ok": true, "result": {...}}
+                        {"type": "reply", "id": 1, "ok": false, "error": "..."}
+                        {"type": "samples", "t": [...], "force": [...], "pos": [...], "status": {...}}
+                        {"type": "event", "kind": "stopped" | "command", ...}
+
+명령: status, connect, disconnect, start_test, stop, jog, set_speed, set_limits,
+      zero_loadcell, zero_motor, set_temp, shutdown
+
+사용:
+    python Acquisition_Daemon.py --motor-port SIM:MOTOR --loadcell-port SIM:LOADCELL
+    python Acquisition_Daemon.py --motor-port COM3 --loadcell-port COM4 --log creep.csv --start
+"""
+
+import sys
+import json
+import time
+import signal
+import logging
+from datetime import datetime
+
+import numpy as np
+from PyQt5 import QtCore, QtNetwork
+
+from Acquisition_Core import (
+    DeviceConnectError, arm_emergency_stop, begin_test_safety, build_acquisition,
+    connect_loadcell, connect_motor, connect_temp, end_test_safety, release_device, stop_motor
+)
+from Basic_Test import BasicTest
+from Binary_Log import BinaryLogSink, binary_log_path
+from Log_Writer import CsvLogSink, LogWriter, events_log_path, write_events
+from Plot_Decimation import lttb
+from Safety_Guard import SafetyGuard, SafetyLimits
+from UI_Updater import UIUpdater
+from interfaces import IDataReceiver
+from config import (
+    daemon_cfg, loadcell_cfg, log_writer_cfg, monitor_cfg, motor_cfg, safety_cfg, temp_cfg
+)
+
+logger = logging.getLogger(__name__)
+
+
+DEVICES = ("motor", "loadcell", "temp")
+
+
+class DaemonError(Exception):
+    """클라이언트에 실패 응답으로 돌려줄 명령 오류"""
+
+
+def encode_message(message: dict) -> bytes:
+    """메시지 → JSON 한 줄"""
+    return json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+class _LineReader:
+    """소켓 수신 바이트를 줄 단위 JSON 메시지로 분리"""
+
+    def __init__(self):
+        self._buf = bytearray()
+
+    def feed(self, data: bytes) -> list:
+        self._buf += data
+        messages = []
+        while True:
+            end = self._buf.find(b"\n")
+            if end < 0:
+                break
+            line = bytes(self._buf[:end]).strip()
+            del self._buf[:end + 1]
+            if not line:
+                continue
+            try:
+                messages.append(json.loads(line.decode("utf-8")))
+            except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                logger.warning(f"[DAEMON] 잘못된 메시지 무시: {e}")
+        if len(self._buf) > daemon_cfg.MAX_LINE_BYTES:
+            logger.warning(f"[DAEMON] 줄 길이 초과 - {len(self._buf)} 바이트 폐기")
+            self._buf.clear()
+        return messages
+
+
+# ============================================================================
+# 데이터 수신자 (로그 기록 + 방출 버퍼)
+# ============================================================================
+
+class DaemonRecorder(IDataReceiver):
+    """
+    PlotService 대신 DataHandler에 연결되는 수신자
+
+    - 시험 중: PlotService와 같은 행 (경과 초, 위치, 하중, CH1 온도)을 LogWriter로 기록
+    - 항상: 다음 방출 주기까지 샘플을 모아 두었다가 take_batch()로 축약해서 넘김
+    """
+
+    def __init__(self):
+        self.log_writer = None
+        self.log_path = None
+        self.events = []
+        self._rows_submitted = 0
+        self._start_perf = None
+
+        self._pending_t = []
+        self._pending_force = []
+        self._pending_pos = []
+
+    @property
+    def is_logging(self) -> bool:
+        return self.log_writer is not None
+
+    def start_log(self, file_path: str, start_perf: float, metadata: dict = None):
+        """
+        로그 기록 시작
+
+        Raises:
+            OSError: 파일 생성 실패
+        """
+        if self.log_writer is not None:
+            raise DaemonError("이미 로그를 기록 중입니다")
+
+        sinks = []
+        try:
+            sinks.append(CsvLogSink(file_path))
+            if log_writer_cfg.BINARY_LOG_ENABLED:
+                meta = dict(metadata or {})
+                meta.setdefault('created', datetime.now().isoformat(timespec='seconds'))
+                sinks.append(BinaryLogSink(binary_log_path(file_path), meta))
+        except OSError:
+            for sink in sinks:
+                sink.close()
+            raise
+
+        self.log_writer = LogWriter(sinks)
+        self.log_writer.start()
+        self.log_path = file_path
+        self.events = []
+        self._rows_submitted = 0
+        self._start_perf = start_perf
+        logger.info(f"[DAEMON] 로그 기록 시작: {file_path}")
+
+    def stop_log(self):
+        if self.log_writer is None:
+            return
+        self.log_writer.stop()
+        stats = self.log_writer.get_stats()
+        self.log_writer = None
+        logger.info(f"[DAEMON] 로그 기록 종료: {self.log_path} ({stats})")
+
+    def take_batch(self, max_points: int) -> dict:
+        """
+        지난 방출 이후의 샘플 (max_points 초과 시 LTTB로 축약)
+
+        Returns:
+            {'t': [...], 'force': [...], 'pos': [...], 'received': 원래 샘플 수}
+        """
+        t, force, pos = self._pending_t, self._pending_force, self._pending_pos
+        self._pending_t, self._pending_force, self._pending_pos = [], [], []
+
+        n = len(t)
+        if n > max_points >= 3:
+            # 인덱스를 x로 써서 선택된 샘플의 위치도 함께 보냄
+            idx, _ = lttb(np.arange(n, dtype=float), np.asarray(force, dtype=float), max_points)
+            keep = idx.astype(np.int64)
+            t = [t[i] for i in keep]
+            force = [force[i] for i in keep]
+            pos = [pos[i] for i in keep]
+        return {'t': t, 'force': force, 'pos': pos, 'received': n}
+
+    # ----- IDataReceiver -----
+
+    def receive_motor_data(self, elapsed: float, displacement_um: float):
+        pass
+
+    def receive_loadcell_data(self, force_n, position_um, temp_ch1, timestamp=None):
+        self._pending_t.append(timestamp)
+        self._pending_force.append(float(force_n))
+        self._pending_pos.append(float(position_um))
+
+        if self.log_writer is None or timestamp is None:
+            return
+        elapsed_sec = timestamp - self._start_perf
+        if elapsed_sec < 0:
+            return  # 시험 시작 전에 획득된 샘플
+        if self.log_writer.submit((elapsed_sec, float(position_um), float(force_n), temp_ch1)):
+            self._rows_submitted += 1
+
+    def receive_temp_data(self, elapsed: float, temps: list):
+        pass
+
+    def mark_event(self, kind: str, timestamp: float = None, samples_ago: int = 0, **info):
+        if self.log_writer is None:
+            return
+        event = {
+            'kind': kind,
+            'row': max(0, self._rows_submitted - 1 - int(samples_ago)),
+            'time_s': round(timestamp - self._start_perf, 6) if timestamp is not None else None,
+        }
+        event.update(info)
+        self.events.append(event)
+        try:
+            write_events(events_log_path(self.log_path), self.events)
+        except OSError as e:
+            logger.error(f"[DAEMON] 이벤트 파일 기록 실패: {e}")
+
+
+# ============================================================================
+# 데몬
+# ============================================================================
+
+class AcquisitionDaemon(QtCore.QObject):
+    """
+    헤드리스 수집 런타임
+
+    Main.MainWindow와 같은 구성(Acquisition_Core.build_acquisition)을
+    위젯 없이 만들고, 로컬 소켓으로 명령/데이터를 주고받는다.
+    """
+
+    shutdown_requested = QtCore.pyqtSignal()
+
+    def __init__(self, server_name: str = None, displacement_limit_mm: float = 0.0,
+                 force_limit_n: float = 0.0):
+        super().__init__()
+        self.server_name = server_name or daemon_cfg.SERVER_NAME
+
+        # ===== 안전 경로 / 데이터 처리 / Manager (GUI와 공용 구성) =====
+        self.safety_guard = SafetyGuard(
+            None, safety_cfg, limits=SafetyLimits(displacement_limit_mm, force_limit_n)
+        )
+        self.recorder = DaemonRecorder()
+        stack = build_acquisition(
+            safety_guard=self.safety_guard,
+            ui_updater=UIUpdater(None),
+            data_receiver=self.recorder,
+            stop_callback=self.stop_all,
+            capture_metadata={'source': 'daemon'}
+        )
+        self.emergency_stop = stack.emergency_stop
+        self.emergency_stop.tripped.connect(self._on_emergency_stop)
+        self.data_handler = stack.data_handler
+        self.stream_capture = stack.stream_capture
+        self.motor_manager = stack.motor_manager
+        self.loadcell_manager = stack.loadcell_manager
+        self.temp_manager = stack.temp_manager
+
+        self.motor_client = None
+        self.temp_client = None
+        self.loadcell_serial = None
+        self.ports = {}
+        self.basic_test = None
+        self.test_start_perf = None
+        self.run_speed_rps = motor_cfg.DEFAULT_SAFE_SPEED_RPS
+        self.last_stop_reason = ""
+
+        # ===== 로컬 소켓 서버 =====
+        self.server = QtNetwork.QLocalServer(self)
+        self.server.newConnection.connect(self._on_new_connection)
+        self._clients = {}  # QLocalSocket → _LineReader
+
+        self.publish_timer = QtCore.QTimer(self)
+        self.publish_timer.setInterval(max(1, int(1000 / daemon_cfg.PUBLISH_HZ)))
+        self.publish_timer.timeout.connect(self._publish)
+
+        self._commands = {
+            'status': self._cmd_status,
+            'connect': self._cmd_connect,
+            'disconnect': self._cmd_disconnect,
+            'start_test': self._cmd_start_test,
+            'stop': self._cmd_stop,
+            'jog': self._cmd_jog,
+            'set_speed': self._cmd_set_speed,
+            'set_limits': self._cmd_set_limits,
+            'zero_loadcell': self._cmd_zero_loadcell,
+            'zero_motor': self._cmd_zero_motor,
+            'set_temp': self._cmd_set_temp,
+            'shutdown': self._cmd_shutdown,
+        }
+
+    # ========================================================================
+    # 서버
+    # ========================================================================
+
+    def listen(self) -> bool:
+        """로컬 소켓 대기 시작 (이전 비정상 종료로 남은 소켓 파일은 제거)"""
+        QtNetwork.QLocalServer.removeServer(self.server_name)
+        if not self.server.listen(self.server_name):
+            logger.error(f"[DAEMON] 서버 시작 실패 ({self.server_name}): {self.server.errorString()}")
+            return False
+        self.publish_timer.start()
+        logger.info(f"[DAEMON] 대기 중: {self.server.fullServerName()}")
+        return True
+
+    def close(self):
+        """모든 서비스/로그/서버 정리"""
+        self.publish_timer.stop()
+        self.stop_all(reason="데몬 종료")
+        for device in DEVICES:
+            self.disconnect_device(device)
+        self.stream_capture.close()
+        for sock in list(self._clients):
+            sock.disconnectFromServer()
+        self.server.close()
+        logger.info("[DAEMON] 종료 완료")
+
+    def _on_new_connection(self):
+        while self.server.hasPendingConnections():
+            sock = self.server.nextPendingConnection()
+            self._clients[sock] = _LineReader()
+            sock.readyRead.connect(lambda s=sock: self._on_ready_read(s))
+            sock.disconnected.connect(lambda s=sock: self._on_client_disconnected(s))
+            logger.info(f"[DAEMON] 클라이언트 연결 (총 {len(self._clients)})")
+
+    def _on_client_disconnected(self, sock):
+        if self._clients.pop(sock, None) is not None:
+            sock.deleteLater()
+            logger.info(f"[DAEMON] 클라이언트 해제 (총 {len(self._clients)})")
+
+    def _on_ready_read(self, sock):
+        reader = self._clients.get(sock)
+        if reader is None:
+            return
+        for message in reader.feed(bytes(sock.readAll())):
+            sock.write(encode_message(self.handle_message(message)))
+
+    def handle_message(self, message: dict) -> dict:
+        """명령 메시지 하나 처리 → 응답 메시지"""
+        request_id = message.get('id') if isinstance(message, dict) else None
+        reply = {'type': 'reply', 'id': request_id}
+        try:
+            if not isinstance(message, dict):
+                raise DaemonError("메시지는 JSON 객체여야 합니다")
+            handler = self._commands.get(message.get('cmd'))
+            if handler is None:
+                raise DaemonError(f"알 수 없는 명령: {message.get('cmd')}")
+            args = message.get('args') or {}
+            if not isinstance(args, dict):
+                raise DaemonError("args는 JSON 객체여야 합니다")
+            reply['result'] = handler(**args)
+            reply['ok'] = True
+        except (DaemonError, TypeError, ValueError, OSError) as e:
+            reply['ok'] = False
+            reply['error'] = str(e)
+        except Exception as e:
+            logger.error(f"[DAEMON] 명령 처리 예외: {message}", exc_info=True)
+            reply['ok'] = False
+            reply['error'] = str(e)
+        return reply
+
+    def broadcast(self, message: dict, droppable: bool = False):
+        """
+        모든 클라이언트에 방출
+
+        droppable이면 전송 대기 바이트가 쌓인 (느린) 클라이언트는 건너뛴다
+        - 수집 프로세스가 렌더링 속도에 묶이지 않도록.
+        """
+        if not self._clients:
+            return
+        data = encode_message(message)
+        for sock in list(self._clients):
+            if droppable and sock.bytesToWrite() > daemon_cfg.MAX_CLIENT_BACKLOG_BYTES:
+                continue
+            sock.write(data)
+
+    def _publish(self):
+        batch = self.recorder.take_batch(daemon_cfg.MAX_POINTS_PER_PUBLISH)
+        batch['type'] = 'samples'
+        batch['status'] = self.status()
+        self.broadcast(batch, droppable=True)
+
+    # ========================================================================
+    # 장비 연결
+    # ========================================================================
+
+    def connect_device(self, device: str, port: str, baud: int = None):
+        """
+        장비 연결 + 핸드셰이크 + Manager 서비스 시작
+
+        Raises:
+            DaemonError: 알 수 없는 장비 / 이미 연결됨 / 핸드셰이크 실패
+        """
+        if device not in DEVICES:
+            raise DaemonError(f"알 수 없는 장비: {device}")
+        if device in self.ports:
+            raise DaemonError(f"{device}: 이미 연결됨 ({self.ports[device]})")
+
+        interval_ms = monitor_cfg.DEFAULT_INTERVAL_MS
+        try:
+            if device == 'motor':
+                self.motor_client = connect_motor(
+                    self.motor_manager, port, int(baud or motor_cfg.DEFAULT_BAUDRATE), interval_ms
+                )
+                self.motor_manager.controller.signals.finished.connect(self._on_command_finished)
+                self.basic_test = BasicTest(self.motor_manager.controller, lambda: self.run_speed_rps)
+            elif device == 'loadcell':
+                self.loadcell_serial = connect_loadcell(
+                    self.loadcell_manager, port, int(baud or loadcell_cfg.DEFAULT_BAUDRATE), interval_ms
+                )
+                self.loadcell_manager.controller.signals.finished.connect(self._on_command_finished)
+            else:
+                self.temp_client = connect_temp(
+                    self.temp_manager, port, int(baud or temp_cfg.DEFAULT_BAUDRATE), interval_ms
+                )
+        except DeviceConnectError as e:
+            raise DaemonError(str(e)) from e
+
+        self.ports[device] = port
+        logger.info(f"[DAEMON] {device} 연결: {port}")
+
+    def disconnect_device(self, device: str):
+        if device == 'motor':
+            if self.basic_test:
+                self.basic_test.stop()
+            self.basic_test = None
+            release_device(self.motor_manager, self.motor_client)
+            self.motor_client = None
+        elif device == 'loadcell':
+            release_device(self.loadcell_manager, self.loadcell_serial)
+            self.loadcell_serial = None
+        elif device == 'temp':
+            release_device(self.temp_manager, self.temp_client)
+            self.temp_client = None
+        else:
+            raise DaemonError(f"알 수 없는 장비: {device}")
+        self.ports.pop(device, None)
+
+    # ========================================================================
+    # 시험 제어
+    # ========================================================================
+
+    def start_test(self, log_path: str = None, metadata: dict = None):
+        """
+        당김 시험 시작 (log_path가 있으면 로그 기록 포함)
+
+        Raises:
+            DaemonError: 모터 미연결
+            OSError: 로그 파일 생성 실패
+        """
+        if self.basic_test is None or not self.motor_manager.is_connected():
+            raise DaemonError("motor가 연결되어 있지 않습니다")
+
+        self.data_handler.reset_guards()
+        self.data_handler.capture_start_position()
+        begin_test_safety(self.data_handler)
+
+        start_perf = time.perf_counter()
+        if log_path:
+            meta = dict(metadata or {})
+            meta.setdefault('speed_rps', self.run_speed_rps)
+            meta.setdefault('displacement_limit_mm', self.safety_guard.limits.displacement_limit_mm)
+            meta.setdefault('force_limit_n', self.safety_guard.limits.force_limit_n)
+            self.recorder.start_log(log_path, start_perf, meta)
+
+        self.last_stop_reason = ""
+        self.test_start_perf = start_perf  # attach 모드 GUI의 플롯 시간 기준
+        self.basic_test.start()
+        self._arm_emergency_stop()
+
+    def _arm_emergency_stop(self):
+        arm_emergency_stop(
+            self.emergency_stop, self.safety_guard, self.data_handler,
+            self.motor_manager.controller
+        )
+
+    def stop_all(self, reason="Unknown"):
+        """[중앙 정지] 모터 정지 → 시험/로그 종료 → 클라이언트에 알림"""
+        logger.info(f"[DAEMON] 모든 작업 중지. 사유: {reason}")
+        end_test_safety(self.emergency_stop, self.data_handler)
+        stop_motor(self.motor_manager)
+
+        if self.basic_test:
+            self.basic_test.stop()
+        self.recorder.stop_log()
+
+        self.last_stop_reason = reason
+        self.broadcast({'type': 'event', 'kind': 'stopped', 'reason': reason})
+
+    def _on_emergency_stop(self, message: str):
+        self.stop_all(reason=message)
+
+    def _on_command_finished(self, result):
+        self.broadcast({
+            'type': 'event', 'kind': 'command', 'label': result.label, 'ok': result.ok,
+            'elapsed_ms': round(result.elapsed_ms, 1), 'error': result.error,
+        })
+
+    def status(self) -> dict:
+        limits = self.safety_guard.limits
+        return {
+            'ports': dict(self.ports),
+            'running': bool(self.basic_test and self.basic_test._running),
+            'test_start_t': self.test_start_perf,
+            'logging': self.recorder.log_path if self.recorder.is_logging else None,
+            'rows': self.recorder._rows_submitted,
+            'force_n': self.data_handler.last_force,
+            'position_um': self.data_handler.last_pos_um,
+            'displacement_um': self.data_handler.last_pos_um - self.data_handler.start_pos_um,
+            'temp_ch1': self.data_handler.last_temp_ch1,
+            'speed_rps': self.run_speed_rps,
+            'displacement_limit_mm': limits.displacement_limit_mm,
+            'force_limit_n': limits.force_limit_n,
+            'estop_armed': self.emergency_stop.is_armed,
+            'last_stop_reason': self.last_stop_reason,
+        }
+
+    # ========================================================================
+    # 명령 핸들러 (인자는 JSON args 객체)
+    # ========================================================================
+
+    def _cmd_status(self):
+        return self.status()
+
+    def _cmd_connect(self, device, port, baud=None):
+        self.connect_device(device, port, baud)
+        return self.status()
+
+    def _cmd_disconnect(self, device):
+        if device == 'motor':
+            self.stop_all(reason="motor 연결 해제")
+        self.disconnect_device(device)
+        return self.status()
+
+    def _cmd_start_test(self, log_path=None, metadata=None):
+        self.start_test(log_path, metadata)
+        return self.status()
+
+    def _cmd_stop(self, reason="클라이언트 정지 요청"):
+        self.stop_all(reason=reason)
+        return self.status()
+
+    def _cmd_jog(self, direction):
+        motor = self._require('motor', self.motor_manager.controller)
+        if direction == 'forward':
+            motor.set_jog_speed(self.run_speed_rps)
+            motor.jog_forward()
+        elif direction == 'backward':
+            motor.set_jog_speed(self.run_speed_rps)
+            motor.jog_backward()
+        elif direction == 'stop':
+            motor.stop_motor()
+        else:
+            raise DaemonError(f"알 수 없는 jog 방향: {direction}")
+        return {'direction': direction}
+
+    def _cmd_set_speed(self, speed_rps):
+        speed_rps = float(speed_rps)
+        if speed_rps <= 0:
+            raise DaemonError("속도는 양수여야 합니다")
+        self.run_speed_rps = speed_rps
+        return {'speed_rps': speed_rps}
+
+    def _cmd_set_limits(self, displacement_limit_mm=None, force_limit_n=None):
+        self.safety_guard.set_limits(
+            displacement_limit_mm=None if displacement_limit_mm is None else float(displacement_limit_mm),
+            force_limit_n=None if force_limit_n is None else float(force_limit_n)
+        )
+        if self.emergency_stop.is_armed:
+            self._arm_emergency_stop()
+        limits = self.safety_guard.limits
+        return {'displacement_limit_mm': limits.displacement_limit_mm, 'force_limit_n': limits.force_limit_n}
+
+    def _cmd_zero_loadcell(self):
+        """완료는 'command' 이벤트로 알림"""
+        lc = self._require('loadcell', self.loadcell_manager.controller)
+        return {'command_id': lc.send_zero_command_async().command_id}
+
+    def _cmd_zero_motor(self):
+        motor = self._require('motor', self.motor_manager.controller)
+        return {'command_id': motor.write_zero_position_async().command_id}
+
+    def _cmd_set_temp(self, sv, run=True, channel=None):
+        tc = self._require('temp', self.temp_manager.controller)
+        ch = int(channel or temp_cfg.DEFAULT_CONTROL_CHANNEL)
+        tc.set_sv(ch, sv)
+        tc.set_run_stop(ch, run=bool(run))
+        return {'channel': ch, 'sv': sv, 'run': bool(run)}
+
+    def _cmd_shutdown(self):
+        QtCore.QTimer.singleShot(0, self.shutdown_requested.emit)
+        return {}
+
+    @staticmethod
+    def _require(device: str, controller):
+        if controller is None:
+            raise DaemonError(f"{device}가 연결되어 있지 않습니다")
+        return controller
+
+
+
+# ============================================================================
+# 클라이언트 (GUI / 스크립트)
+# ============================================================================
+
+class DaemonClient(QtCore.QObject):
+    """
+    데몬 접속 클라이언트
+
+    GUI는 request()로 명령을 보내고 시그널로 결과/데이터를 받는다 (이벤트 루프 필요).
+    스크립트는 call()로 응답을 기다릴 수 있다.
+    """
+
+    connected = QtCore.pyqtSignal()
+    disconnected = QtCore.pyqtSignal()
+    samples_received = QtCore.pyqtSignal(dict)   # {'t', 'force', 'pos', 'received', 'status'}
+    event_received = QtCore.pyqtSignal(dict)
+    reply_received = QtCore.pyqtSignal(dict)
+
+    def __init__(self, server_name: str = None, parent=None):
+        super().__init__(parent)
+        self.server_name = server_name or daemon_cfg.SERVER_NAME
+        self.socket = QtNetwork.QLocalSocket(self)
+        self.socket.connected.connect(self.connected)
+        self.socket.disconnected.connect(self.disconnected)
+        self.socket.readyRead.connect(self._on_ready_read)
+        self._reader = _LineReader()
+        self._next_id = 1
+        self._replies = {}
+        self.last_status = {}
+
+    @property
+    def is_connected(self) -> bool:
+        return self.socket.state() == QtNetwork.QLocalSocket.ConnectedState
+
+    def connect_to_daemon(self, timeout_ms: int = 1000) -> bool:
+        self.socket.connectToServer(self.server_name)
+        ok = self.socket.waitForConnected(timeout_ms)
+        if not ok:
+            logger.warning(f"[DAEMON] 접속 실패 ({self.server_name}): {self.socket.errorString()}")
+        return ok
+
+    def close(self):
+        self.socket.disconnectFromServer()
+
+    def request(self, cmd: str, **args) -> int:
+        """명령 전송 (응답은 reply_received) → 요청 ID"""
+        request_id = self._next_id
+        self._next_id += 1
+        self.socket.write(encode_message({'id': request_id, 'cmd': cmd, 'args': args}))
+        self.socket.flush()
+        return request_id
+
+    def call(self, cmd: str, timeout_ms: int = None, **args) -> dict:
+        """
+        명령 전송 후 응답까지 대기
+
+        Returns:
+            응답 결과 (reply['result'])
+
+        Raises:
+            DaemonError: 실패 응답
+            TimeoutError: 시간 초과
+        """
+        timeout_ms = daemon_cfg.CALL_TIMEOUT_MS if timeout_ms is None else timeout_ms
+        request_id = self.request(cmd, **args)
+        deadline = QtCore.QDeadlineTimer(timeout_ms)
+        while request_id not in self._replies:
+            remaining = deadline.remainingTime()
+            if remaining <= 0 or not self.is_connected:
+                raise TimeoutError(f"데몬 응답 없음: {cmd}")
+            self.socket.waitForReadyRead(remaining)
+            self._on_ready_read()
+
+        reply = self._replies.pop(request_id)
+        if not reply.get('ok'):
+            raise DaemonError(reply.get('error', ''))
+        return reply.get('result')
+
+    def _on_ready_read(self):
+        data = bytes(self.socket.readAll())
+        if not data:
+            return
+        for message in self._reader.feed(data):
+            kind = message.get('type')
+            if kind == 'samples':
+                self.last_status = message.get('status', {})
+                self.samples_received.emit(message)
+            elif kind == 'event':
+                self.event_received.emit(message)
+            elif kind == 'reply':
+                self._replies[message.get('id')] = message
+                self.reply_received.emit(message)
+        # 시그널로만 받는 요청의 응답이 쌓이지 않도록
+        while len(self._replies) > daemon_cfg.MAX_PENDING_REPLIES:
+            self._replies.pop(next(iter(self._replies)))
+
+
+# ============================================================================
+# 진입점
+# ============================================================================
+
+def main(argv=None) -> int:
+    import argparse
+    import Logging_Config
+    from config import validate_config
+
+    parser = argparse.ArgumentParser(description="헤드리스 수집 데몬")
+    parser.add_argument("--name", default=daemon_cfg.SERVER_NAME, help="로컬 소켓 이름")
+    parser.add_argument("--motor-port", help="모터 포트 (예: COM3, SIM:MOTOR)")
+    parser.add_argument("--loadcell-port", help="로드셀 포트")
+    parser.add_argument("--temp-port", help="온도 제어기 포트")
+    parser.add_argument("--disp-limit-mm", type=float, default=0.0, help="변위 제한 (mm, 0=검사 안 함)")
+    parser.add_argument("--force-limit-n", type=float, default=0.0, help="하중 변화 제한 (N, 0=검사 안 함)")
+    parser.add_argument("--speed-rps", type=float, default=None, help="당김 속도 (rps)")
+    parser.add_argument("--log", help="시험 로그 CSV 경로 (--start와 함께)")
+    parser.add_argument("--start", action="store_true", help="장비 연결 후 바로 시험 시작")
+    args = parser.parse_args(argv)
+
+    Logging_Config.setup_logging()
+    validate_config()
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication(sys.argv[:1])
+
+    daemon = AcquisitionDaemon(args.name, args.disp_limit_mm, args.force_limit_n)
+    if args.speed_rps:
+        daemon.run_speed_rps = args.speed_rps
+    daemon.shutdown_requested.connect(app.quit)
+
+    try:
+        for device, port in (('motor', args.motor_port), ('loadcell', args.loadcell_port),
+                             ('temp', args.temp_port)):
+            if port:
+                daemon.connect_device(device, port)
+        if args.start:
+            daemon.start_test(args.log)
+    except (DaemonError, OSError) as e:
+        logger.error(f"[DAEMON] 시작 실패: {e}")
+        print(f"시작 실패: {e}", file=sys.stderr)
+        daemon.close()
+        return 1
+
+    if not daemon.listen():
+        daemon.close()
+        return 1
+
+    # Ctrl+C → 이벤트 루프 종료 (파이썬 시그널 처리를 위해 주기적으로 깨움)
+    signal.signal(signal.SIGINT, lambda *_: app.quit())
+    wake = QtCore.QTimer()
+    wake.timeout.connect(lambda: None)
+    wake.start(200)
+
+    print(f"수집 데몬 실행 중: {daemon.server.fullServerName()} (Ctrl+C로 종료)")
+    try:
+        return app.exec_()
+    finally:
+        daemon.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,250 @@
+"""
+비동기 장비 명령 계층
+
+0점 설정처럼 대기(sleep)와 응답 읽기가 섞인 명령 시퀀스를 GUI 스레드가 아닌
+장비 I/O 스레드에서 실행하고, 결과를 Future와 Qt 시그널로 돌려준다.
+
+- 모터: Modbus 버스 스레드 (공유 버스) 또는 전용 실행 스레드
+- 로드셀: 모니터 워커 스레드 (CommandQueue, 스트리밍은 명령 동안 일시 정지)
+          또는 모니터가 없을 때 전용 실행 스레드
+
+완료 시 명령 ID, 성공 여부, 제출→완료 소요 시간을 CommandResult로 보고한다.
+명령 사이의 대기(정지 후 안정화, 0점 적용 대기 등)는 CommandSequence가 GUI 스레드의
+단발 QTimer로 처리하여 I/O 스레드를 점유하지 않는다.
+"""
+
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Optional
+from PyQt5 import QtCore
+
+logger = logging.getLogger(__name__)
+
+
+_command_ids = itertools.count(1)
+
+
+@dataclass(frozen=True)
+class CommandResult:
+    """비동기 명령 완료 보고"""
+    command_id: int
+    label: str
+    ok: bool
+    elapsed_ms: float         # 제출 → 완료 (대기열 대기 포함)
+    value: Any = None
+    error: str = ""
+
+
+class CommandSignals(QtCore.QObject):
+    """
+    명령 완료 시그널
+
+    I/O 스레드에서 방출되며, GUI 스레드의 QObject 슬롯에는 자동으로 큐 연결된다.
+    """
+    finished = QtCore.pyqtSignal(object)  # CommandResult
+
+
+def track_command(future: Future, label: str, signals: Optional[CommandSignals] = None) -> Future:
+    """
+    Future에 명령 ID를 붙이고 완료 시 소요 시간 기록 + signals.finished 방출
+
+    함수가 False를 반환하거나 예외가 나면 실패로 본다.
+
+    Returns:
+        같은 Future (future.command_id 사용 가능)
+    """
+    command_id = next(_command_ids)
+    future.command_id = command_id
+    started = time.perf_counter()
+
+    def _done(f: Future):
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        value, error = None, ""
+        if f.cancelled():
+            error = "취소됨"
+        elif f.exception() is not None:
+            error = str(f.exception())
+        else:
+            value = f.result()
+        ok = not error and value is not False
+
+        result = CommandResult(command_id, label, ok, elapsed_ms, value, error)
+        if ok:
+            logger.info(f"[CMD] {label} #{command_id} 완료 ({elapsed_ms:.1f} ms)")
+        else:
+            logger.error(f"[CMD] {label} #{command_id} 실패 ({elapsed_ms:.1f} ms) {error}")
+        if signals is not None:
+            signals.finished.emit(result)
+
+    future.add_done_callback(_done)
+    return future
+
+
+class CommandQueue:
+    """
+    소유 스레드에서 실행할 명령 대기열
+
+    다른 스레드는 submit()으로 넣고, 소유 스레드(예: LoadcellWorker)가
+    notify 콜백을 받아 drain()으로 실행한다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.active = False
+        self.notify = None  # 새 명령이 들어왔을 때 호출 (소유 스레드 깨우기)
+        self._items = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+    def submit(self, func, *args, **kwargs) -> Future:
+        future = Future()
+        with self._lock:
+            if not self.active:
+                future.set_exception(ConnectionError(f"I/O 스레드가 실행 중이 아닙니다: {self.name}"))
+                return future
+            self._items.append((func, args, kwargs, future))
+        notify = self.notify
+        if notify is not None:
+            notify()
+        return future
+
+    def drain(self) -> int:
+        """대기 중인 명령을 현재 스레드에서 모두 실행"""
+        count = 0
+        while True:
+            with self._lock:
+                if not self._items:
+                    return count
+                func, args, kwargs, future = self._items.popleft()
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(func(*args, **kwargs))
+                except Exception as e:
+                    future.set_exception(e)
+            count += 1
+
+    def close(self, reason: str = "I/O 스레드 종료"):
+        """비활성화 후 남은 명령은 실패 처리"""
+        with self._lock:
+            self.active = False
+            self.notify = None
+            items, self._items = list(self._items), deque()
+        for _, _, _, future in items:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(ConnectionError(f"{self.name}: {reason}"))
+
+
+class SerialExecutor:
+    """전용 I/O 스레드가 없을 때 쓰는 단일 실행 스레드 (명령 순서 보장)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def submit(self, func, *args, **kwargs) -> Future:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"Cmd-{self.name}")
+            return self._executor.submit(func, *args, **kwargs)
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def _future_error(future: Future) -> str:
+    """완료된 명령 Future의 실패 사유 (성공이면 빈 문자열, False 반환도 실패)"""
+    if future.cancelled():
+        return "취소됨"
+    if future.exception() is not None:
+        return str(future.exception())
+    if future.result() is False:
+        return "명령 실패"
+    return ""
+
+
+class CommandSequence(QtCore.QObject):
+    """
+    비동기 명령을 차례로 실행하고 단계 사이 대기는 단발 QTimer로 처리 (GUI 스레드)
+
+    단계: (이름, Future를 돌려주는 제출 함수, 완료 후 대기 ms)
+    대기 동안 버스/워커 스레드는 비어 있으므로 SAFETY 정지나 주기 읽기가 막히지 않는다.
+    한 단계가 실패(예외 / False / 제출 실패)하면 남은 단계는 실행하지 않는다.
+    """
+
+    finished = QtCore.pyqtSignal(bool, str)   # 성공 여부, 실패 시 "단계: 사유"
+    _step_done = QtCore.pyqtSignal(object)    # I/O 스레드 → GUI 스레드 (Future)
+
+    def __init__(self, name: str, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self._steps = deque()
+        self._pending = None  # 완료를 기다리는 단계 Future
+        self._step_done.connect(self._on_step_done)
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._run_next)
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._steps) or self._pending is not None or self._timer.isActive()
+
+    def start(self, steps) -> bool:
+        """시퀀스 시작 (이미 실행 중이면 False)"""
+        if self.is_running:
+            logger.warning(f"[CMD] {self.name} 시퀀스 실행 중 - 요청 무시")
+            return False
+        self._steps = deque(steps)
+        self._run_next()
+        return True
+
+    def cancel(self):
+        """남은 단계와 대기 취소 (실행 중인 명령의 늦은 완료는 무시)"""
+        self._timer.stop()
+        self._steps.clear()
+        self._pending = None
+
+    def _run_next(self):
+        if not self._steps:
+            logger.info(f"[CMD] {self.name} 시퀀스 완료")
+            self.finished.emit(True, "")
+            return
+
+        _, submit_fn, _ = self._steps[0]
+        try:
+            future = submit_fn()
+            if future is None:
+                raise RuntimeError("명령을 제출할 수 없음")
+        except Exception as e:
+            future = Future()
+            future.set_exception(e)
+        self._pending = future
+        future.add_done_callback(self._step_done.emit)
+
+    @QtCore.pyqtSlot(object)
+    def _on_step_done(self, future: Future):
+        if future is not self._pending:
+            return  # 취소된 시퀀스의 늦은 완료
+        self._pending = None
+        label, _, settle_ms = self._steps.popleft()
+
+        error = _future_error(future)
+        if error:
+            self._steps.clear()
+            logger.error(f"[CMD] {self.name} 시퀀스 중단 ({label}): {error}")
+            self.finished.emit(False, f"{label}: {error}")
+            return
+        self._timer.start(max(0, int(settle_ms)))
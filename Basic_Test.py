@@ -4,9 +4,10 @@ from config import motor_cfg
 logger = logging.getLogger(__name__)
 
 class BasicTest:
-    def __init__(self, motor, get_run_speed_callback):
+    def __init__(self, motor, get_run_speed_callback, rate_controller=None):
         self.motor = motor
         self.get_run_speed = get_run_speed_callback
+        self.rate_controller = rate_controller  # 폐루프 속도 제어 (없으면 개루프 jog)
         self._running = False
 
     def start(self):
@@ -23,6 +24,10 @@ class BasicTest:
         self.motor.set_jog_speed(rps)
         self.motor.jog_backward()
 
+        # 폐루프 모드: 설정 속도를 피드포워드로 두고 제어 루프가 속도 보정
+        if self.rate_controller is not None:
+            self.rate_controller.start(rps)
+
         logger.info(f"START (pull, Jog-) rps={rps:.3f}")
         self._running = True
 
@@ -31,5 +36,7 @@ class BasicTest:
         if not self._running:
             return
         self.motor.stop_motor()
+        if self.rate_controller is not None:
+            self.rate_controller.stop()
         logger.info("STOP")
         self._running = False
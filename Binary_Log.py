@@ -0,0 +1,131 @@
+"""
+바이너리 테스트 로그 (.ttlog)
+CSV와 함께 기록되는 추가 전용(append-only) 고정 폭 레코드 로그
+
+파일 구조:
+    [MAGIC 6B][VERSION u16][META_LEN u32][META JSON][RECORD...]
+
+    RECORD = time_s, position_um, load_n, temp_ch1_c (모두 little-endian float64)
+    온도 없음은 NaN으로 기록
+
+레코드 폭이 고정이므로 리더는 파일 전체를 np.memmap으로 열어
+컬럼별 NumPy 뷰를 파싱 없이 바로 얻는다. 비정상 종료로 마지막 레코드가
+잘려 있으면 완전한 레코드까지만 읽는다.
+"""
+
+import os
+import json
+import struct
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+BINARY_LOG_EXTENSION = ".ttlog"
+
+MAGIC = b"TTLOG\x00"
+VERSION = 1
+_PREAMBLE = struct.Struct("<6sHI")  # magic, version, meta_len
+
+# CSV 헤더와 동일한 표시용 컬럼명 (RECORD_DTYPE 순서)
+COLUMN_LABELS = ('Time (s)', 'Position (um)', 'Load (N)', 'Temp_CH1 (°C)')
+
+RECORD_DTYPE = np.dtype([
+    ('time_s', '<f8'),
+    ('position_um', '<f8'),
+    ('load_n', '<f8'),
+    ('temp_ch1_c', '<f8'),
+])
+
+
+class BinaryLogSink:
+    """
+    바이너리 로그 출력 (LogWriter sink)
+
+    행 형식: (elapsed_sec, position_um, force_n, temp_ch1 또는 None)
+    """
+
+    def __init__(self, file_path: str, metadata: dict = None):
+        meta = dict(metadata or {})
+        meta['columns'] = list(RECORD_DTYPE.names)
+        meta_bytes = json.dumps(meta, ensure_ascii=False).encode('utf-8')
+
+        self.file_path = file_path
+        self._file = open(file_path, 'wb')
+        self._file.write(_PREAMBLE.pack(MAGIC, VERSION, len(meta_bytes)))
+        self._file.write(meta_bytes)
+
+    def write_rows(self, rows: list):
+        """행 배치를 레코드 배열로 변환하여 한 번에 기록"""
+        records = np.array(
+            [
+                (t, pos, force, np.nan if temp is None else temp)
+                for t, pos, force, temp in rows
+            ],
+            dtype=RECORD_DTYPE
+        )
+        self._file.write(records.tobytes())
+
+    def flush(self):
+        self._file.flush()
+
+    def fsync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        self._file.close()
+
+
+def binary_log_path(csv_path: str) -> str:
+    """CSV 경로에 대응하는 바이너리 로그 경로"""
+    return os.path.splitext(csv_path)[0] + BINARY_LOG_EXTENSION
+
+
+def read_binary_log(file_path: str):
+    """
+    바이너리 로그 읽기 (메모리 매핑)
+
+    Args:
+        file_path: .ttlog 파일 경로
+
+    Returns:
+        (records, metadata)
+        records: RECORD_DTYPE 구조 배열 (np.memmap, 읽기 전용).
+                 records['load_n'] 처럼 컬럼 뷰로 접근
+        metadata: 기록 시 저장한 메타데이터 dict
+
+    Raises:
+        ValueError: 형식이 맞지 않는 파일
+    """
+    with open(file_path, 'rb') as f:
+        preamble = f.read(_PREAMBLE.size)
+        if len(preamble) < _PREAMBLE.size:
+            raise ValueError(f"바이너리 로그 헤더가 손상되었습니다: {file_path}")
+
+        magic, version, meta_len = _PREAMBLE.unpack(preamble)
+        if magic != MAGIC:
+            raise ValueError(f"바이너리 로그 파일이 아닙니다: {file_path}")
+        if version != VERSION:
+            raise ValueError(f"지원하지 않는 바이너리 로그 버전: {version}")
+
+        meta_bytes = f.read(meta_len)
+        if len(meta_bytes) < meta_len:
+            raise ValueError(f"바이너리 로그 메타데이터가 손상되었습니다: {file_path}")
+        metadata = json.loads(meta_bytes.decode('utf-8'))
+
+    offset = _PREAMBLE.size + meta_len
+    n_records = (os.path.getsize(file_path) - offset) // RECORD_DTYPE.itemsize
+
+    if n_records == 0:
+        return np.empty(0, dtype=RECORD_DTYPE), metadata
+
+    records = np.memmap(
+        file_path,
+        dtype=RECORD_DTYPE,
+        mode='r',
+        offset=offset,
+        shape=(n_records,)
+    )
+    return records, metadata
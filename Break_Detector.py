@@ -0,0 +1,95 @@
+"""
+시편 파단 감지
+피크 하중을 추적하다가 설정 비율 이상의 하중 감소가 N 샘플 연속되면 파단으로 판정
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Optional
+from config import break_cfg
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BreakEvent:
+    """
+    파단 판정 결과
+
+    time/force_n은 감소가 시작된 첫 샘플 기준이며,
+    samples_ago는 판정 샘플로부터 그 샘플까지의 거리이다.
+    """
+    time: float
+    peak_n: float
+    force_n: float
+    samples_ago: int
+
+    @property
+    def message(self) -> str:
+        return (
+            f"시편 파단 감지\n"
+            f"피크: {self.peak_n:.3f} N\n"
+            f"파단 후: {self.force_n:.3f} N"
+        )
+
+
+class BreakDetector:
+    """
+    하중 급감 기반 파단 감지기
+
+    - |F|의 피크를 추적 (MIN_PEAK_N 미만이면 판정 안 함)
+    - |F| <= 피크 × (1 - DROP_PERCENT/100) 가 SUSTAIN_SAMPLES 연속이면 파단
+    - 테스트당 한 번만 판정하며 reset()으로 재무장
+
+    Example:
+        >>> detector = BreakDetector()
+        >>> event = detector.update(timestamp, force_n)
+        >>> if event: stop_motor()
+    """
+
+    def __init__(self, config=None):
+        self.cfg = config or break_cfg
+        self.reset()
+
+    def reset(self):
+        """새 시편 시작"""
+        self.peak_n = 0.0
+        self.detected: Optional[BreakEvent] = None
+        self._run = 0
+        self._run_start = None  # (시각, 하중)
+
+    def update(self, timestamp: float, force_n: float) -> Optional[BreakEvent]:
+        """
+        샘플 1개 평가
+
+        Returns:
+            이번 샘플에서 파단을 판정했으면 BreakEvent, 아니면 None
+        """
+        if self.detected is not None:
+            return None
+
+        magnitude = abs(force_n)
+        if magnitude > self.peak_n:
+            self.peak_n = magnitude
+
+        threshold = self.peak_n * (1.0 - self.cfg.DROP_PERCENT / 100.0)
+        if self.peak_n < self.cfg.MIN_PEAK_N or magnitude > threshold:
+            self._run = 0
+            self._run_start = None
+            return None
+
+        self._run += 1
+        if self._run_start is None:
+            self._run_start = (timestamp, force_n)
+        if self._run < self.cfg.SUSTAIN_SAMPLES:
+            return None
+
+        start_time, start_force = self._run_start
+        self.detected = BreakEvent(
+            time=float(start_time),
+            peak_n=float(self.peak_n),
+            force_n=float(start_force),
+            samples_ago=self._run - 1
+        )
+        logger.warning(f"[BREAK] {self.detected.message}")
+        return self.detected
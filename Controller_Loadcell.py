@@ -3,6 +3,9 @@ import time
 import serial
 import re
 import logging
+from concurrent.futures import Future
+from Async_Command import CommandSignals, SerialExecutor, track_command
+from Serial_Reader import read_frame
 from config import loadcell_cfg
 
 logger = logging.getLogger(__name__)
@@ -32,6 +35,9 @@ class LoadcellService:
             ser: 외부에서 생성된 serial.Serial 객체 (Main.py에서 주입)
         """
         self.ser = ser
+        self.io_queue = None  # 모니터 워커의 CommandQueue (LoadcellManager가 설정)
+        self.signals = CommandSignals()  # 비동기 명령 완료 (CommandResult)
+        self._executor = SerialExecutor("loadcell")
         logger.info("LoadcellService 초기화됨 (Serial 객체는 외부 주입)")
 
     def set_serial(self, ser: serial.Serial):
@@ -43,6 +49,23 @@ class LoadcellService:
         """Serial 객체 반환"""
         return self.ser
 
+    def submit_async(self, label, func, *args, **kwargs) -> Future:
+        """
+        명령 시퀀스를 기다리지 않고 제출
+
+        모니터 워커가 실행 중이면 그 스레드에서 실행되어 측정 읽기와
+        시리얼 포트를 두고 경합하지 않는다 (스트리밍은 명령 동안 일시 정지).
+        완료 시 self.signals.finished로 CommandResult가 방출된다.
+        """
+        if self.io_queue is not None and self.io_queue.active:
+            future = self.io_queue.submit(func, *args, **kwargs)
+        else:
+            future = self._executor.submit(func, *args, **kwargs)
+        return track_command(future, f"loadcell.{label}", self.signals)
+
+    def send_zero_command_async(self) -> Future:
+        return self.submit_async("send_zero_command", self.send_zero_command)
+
     def _send_cmd(self, payload, pause=0.15):
         if not self.ser or not self.ser.is_open:
             logger.error(f"명령 전송 실패 (연결 없음): {payload}")
@@ -52,27 +75,15 @@ class LoadcellService:
         logger.debug(f"[TX] {frame.decode().strip()}")
         self.ser.write(frame)
         self.ser.flush()
-        time.sleep(pause)
+        if pause:
+            time.sleep(pause)
 
     def _read_raw(self, max_wait=1.5, idle_gap=0.10) -> bytes:
+        """응답 프레임 읽기 (CRLF 도착 즉시 반환)"""
         if not self.ser or not self.ser.is_open:
             logger.error("읽기 실패 (연결 없음)")
             return b""
-        t0 = time.time()
-        last = t0
-        buf = bytearray()
-        while time.time() - t0 < max_wait:
-            n = self.ser.in_waiting or 0
-            if n > 0:
-                chunk = self.ser.read(n)
-                if chunk:
-                    buf += chunk
-                    last = time.time()
-            elif len(buf) > 0 and (time.time() - last) >= idle_gap:
-                break
-            elif n == 0:
-                time.sleep(0.01)
-        return bytes(buf)
+        return read_frame(self.ser, max_wait=max_wait, idle_gap=idle_gap)
 
     @staticmethod
     def _to_s32_be(b4: bytes) -> int:
@@ -84,17 +95,28 @@ class LoadcellService:
 
     def zero_position(self):
         """로드셀 값을 0으로 보정 (CDL 명령)"""
+        if self.send_zero_command():
+            time.sleep(0.3)
+            logger.info("0점 설정 완료")
+
+    def send_zero_command(self) -> bool:
+        """
+        CDL 명령 전송 (적용 대기 없음)
+
+        적용 대기는 호출 측이 맡는다 (PretensionTest의 비차단 0점 상태 기계 등).
+        """
         if not self.ser or not self.ser.is_open:
             logger.error("serial 포트가 열려 있지 않습니다.")
-            return
+            return False
 
         try:
-            # 주소 선택
+            # 주소 선택 (응답을 읽어 CDL 응답과 섞이지 않게 함)
             self.ser.reset_input_buffer()
-            self._send_cmd(f"S{loadcell_cfg.DEVICE_ADDRESS}")
+            self._send_cmd(f"S{loadcell_cfg.DEVICE_ADDRESS}", pause=0)
+            self._read_raw()
             
             # Zeroing
-            self._send_cmd("CDL")
+            self._send_cmd("CDL", pause=0)
             raw_z = self._read_raw()
             asc_z = raw_z.decode("ascii", errors="ignore")
             zcode = _extract_status_code_from_ascii(asc_z)
@@ -102,12 +124,11 @@ class LoadcellService:
                 logger.warning("[CDL] 상태코드 추출 실패(계속 진행)")
             else:
                 logger.info(_interpret_status(zcode, "CDL"))
-            
-            time.sleep(0.3)
-            logger.info("0점 설정 완료")
+            return True
 
         except Exception as e:
             logger.error(f"zero_position 예외: {e}")
+            return False
 
 
 # ===== 새로운 함수: Handshake 검증 =====
@@ -126,30 +147,13 @@ def verify_loadcell_connection(ser: serial.Serial) -> tuple[bool, str]:
     
     try:
         ser.reset_input_buffer()
-        time.sleep(0.05)
         
         # 1. 주소 선택 (S21)
         ser.write(f";S{loadcell_cfg.DEVICE_ADDRESS};".encode("ascii"))
         ser.flush()
-        time.sleep(0.15)
         
-        # 응답 읽기
-        t0 = time.time()
-        last = t0
-        buf = bytearray()
-        while time.time() - t0 < 1.0:
-            n = ser.in_waiting or 0
-            if n > 0:
-                chunk = ser.read(n)
-                if chunk:
-                    buf += chunk
-                    last = time.time()
-            elif len(buf) > 0 and (time.time() - last) >= 0.1:
-                break
-            elif n == 0:
-                time.sleep(0.01)
-        
-        raw_s = bytes(buf)
+        # 응답 읽기 (CRLF 도착 즉시 반환)
+        raw_s = read_frame(ser, max_wait=1.0)
         logger.debug(f"[Handshake] S21 응답: {_hex_dump(raw_s)}")
         
         if len(raw_s) < 2:
@@ -162,22 +166,8 @@ def verify_loadcell_connection(ser: serial.Serial) -> tuple[bool, str]:
         ser.write(b";MSV?;")
         ser.flush()
         
-        t0 = time.time()
-        last = t0
-        buf = bytearray()
-        while time.time() - t0 < 1.5:
-            n = ser.in_waiting or 0
-            if n > 0:
-                chunk = ser.read(n)
-                if chunk:
-                    buf += chunk
-                    last = time.time()
-            elif len(buf) > 0 and (time.time() - last) >= 0.1:
-                break
-            elif n == 0:
-                time.sleep(0.01)
-        
-        raw_msv = bytes(buf)
+        # 값 4바이트 + CRLF (값 안의 0x0D0A는 종료로 보지 않음)
+        raw_msv = read_frame(ser, max_wait=1.5, min_size=loadcell_cfg.STREAM_FRAME_SIZE)
         logger.debug(f"[Handshake] MSV? 응답: {_hex_dump(raw_msv)}")
         
         if len(raw_msv) < 4:
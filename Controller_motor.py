@@ -4,6 +4,9 @@ from pymodbus.client.serial import ModbusSerialClient
 import time
 import serial
 import logging
+from concurrent.futures import Future
+from Modbus_Bus import BusClient, Priority
+from Async_Command import CommandSignals, SerialExecutor, track_command
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +17,31 @@ class MotorService:
         """
         self.client = client
         self.unit_id = unit_id 
+        self.signals = CommandSignals()  # 비동기 명령 완료 (CommandResult)
+        self._executor = SerialExecutor("motor")
+
+    # ─────────────────────────────
+    # 비동기 명령: 버스 스레드(또는 전용 스레드)에서 시퀀스 실행
+    # ─────────────────────────────
+    def submit_async(self, label, func, *args, **kwargs) -> Future:
+        """
+        명령 시퀀스를 기다리지 않고 제출
+
+        공유 버스면 버스 스레드에서 WRITE 우선순위로 통째로 실행되어
+        시퀀스 중간에 다른 트랜잭션이 끼어들지 않는다.
+        완료 시 self.signals.finished로 CommandResult가 방출된다.
+        """
+        if isinstance(self.client, BusClient):
+            future = self.client.bus.submit(Priority.WRITE, func, *args, **kwargs)
+        else:
+            future = self._executor.submit(func, *args, **kwargs)
+        return track_command(future, f"motor.{label}", self.signals)
+
+    def write_zero_position_async(self) -> Future:
+        return self.submit_async("write_zero_position", self.write_zero_position)
+
+    def move_to_absolute_async(self, target_pulses, speed_rps) -> Future:
+        return self.submit_async("move_to_absolute", self.move_to_absolute, target_pulses, speed_rps)
 
     # ─────────────────────────────
     # 헬퍼: 32-bit 조합
@@ -72,15 +100,20 @@ class MotorService:
     # ─────────────────────────────
     # 기본 명령: send/조그/정지/속도 설정/읽기들
     # ─────────────────────────────
-    def send_command(self, address, value):
+    def send_command(self, address, value, priority=None):
         if not self.client or not self.client.is_socket_open():
              logger.error(f"명령 전송 실패: (연결 없음) address={hex(address)}")
              return None
         try:
+            kwargs = {}
+            if priority is not None and isinstance(self.client, BusClient):
+                # 공유 버스: 대기 중인 폴링/쓰기보다 먼저 전송
+                kwargs["priority"] = priority
             return self.client.write_register(
                 address=address, 
                 value=value,
-                device_id=self.unit_id
+                device_id=self.unit_id,
+                **kwargs
             )
         except Exception as e:
             logger.error(f"명령 전송 실패 (address={hex(address)}): {e}")
@@ -95,7 +128,33 @@ class MotorService:
 
     def stop_motor(self):
         logger.info("[모터] 정지 명령")
-        return self.send_command(0x0143, 6)  # Stop
+        return self.send_command(0x0143, 6, priority=Priority.SAFETY)  # Stop
+
+    def submit_stop(self) -> Future:
+        """
+        정지 명령을 기다리지 않고 제출 (워커 스레드의 긴급 정지용)
+
+        공유 버스면 SAFETY 우선순위로 큐에 넣고 바로 반환하며,
+        직접 연결된 클라이언트면 즉시 전송한 결과를 Future로 감싼다.
+        """
+        if isinstance(self.client, BusClient):
+            return self.client.submit(
+                "write_register",
+                address=0x0143,
+                value=6,
+                device_id=self.unit_id,
+                priority=Priority.SAFETY
+            )
+        future = Future()
+        try:
+            future.set_result(self.send_command(0x0143, 6))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def stop_async(self) -> Future:
+        """submit_stop + 완료 보고 (0점 설정 시퀀스 등 GUI 명령용)"""
+        return track_command(self.submit_stop(), "motor.stop", self.signals)
 
     def set_jog_speed(self, speed_rps):
         try:
@@ -175,6 +234,27 @@ class MotorService:
             self.stop_motor() 
             time.sleep(0.05)
 
+            if not self.write_zero_position():
+                return False
+
+            time.sleep(0.05)
+            logger.info("0점 설정 시퀀스 완료: 정지→값쓰기(0x1B)→커맨드8 OK")
+            return True
+        except Exception as e:
+            logger.error(f"0점 설정 예외: {e}")
+            return False
+
+    def write_zero_position(self) -> bool:
+        """
+        0점 레지스터 쓰기 + 커맨드8 (대기 없음)
+
+        모터가 이미 정지해 있어야 하며, 전후 대기는 호출 측이 맡는다
+        (PretensionTest의 비차단 0점 상태 기계 등).
+        """
+        if not self.client or not self.client.is_socket_open():
+            logger.error("0점 설정 실패 (연결 없음)")
+            return False
+        try:
             w = self.client.write_registers(
                 address=0x0141, 
                 values=[0x0000, 0x0000],
@@ -192,12 +272,9 @@ class MotorService:
             if (not c) or (hasattr(c, "isError") and c.isError()):
                 logger.error(f"커맨드8 트리거 실패: {c}")
                 return False
-
-            time.sleep(0.05)
-            logger.info("0점 설정 시퀀스 완료: 정지→값쓰기(0x1B)→커맨드8 OK")
             return True
         except Exception as e:
-            logger.error(f"0점 설정 예외: {e}")
+            logger.error(f"0점 쓰기 예외: {e}")
             return False
 
     # ─────────────────────────────
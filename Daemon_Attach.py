@@ -0,0 +1,294 @@
+"""
+GUI attach 모드 (Main.py --attach)
+
+장비, 안전 경로(가드/규칙 엔진/긴급 정지/파단 감지), 로그 기록은 수집 데몬
+(Acquisition_Daemon.py)이 소유하고 MainWindow는 DaemonClient로만 주고받는다.
+
+- 상태: 주기 방출의 status → 연결 버튼 / 하중·위치·온도 라벨 / 상태 표시줄
+- 샘플: 축약된 샘플 → PlotService (로그 없이 플롯만, begin_replay)
+- 명령: 연결/해제, 시험 시작/정지, 조그, 제한값, 0점, 온도 → DaemonClient.request
+
+GUI가 멈추거나 닫혀도 데몬의 수집/안전 검사/로그 기록은 계속된다.
+프로파일 시험, Pre-Tension, Reset은 데몬 명령이 없어 attach 모드에서는 비활성.
+"""
+
+import logging
+from PyQt5 import QtCore, QtWidgets
+from ErrorHandler import ErrorHandler
+from config import loadcell_cfg, motor_cfg, temp_cfg
+
+logger = logging.getLogger(__name__)
+
+
+# 장비 → (포트 콤보, 보드레이트 콤보, 연결 버튼, 해제 버튼, 기본 보드레이트)
+DEVICE_WIDGETS = {
+    'motor': ("Com_comboBox", "Baud_comboBox",
+              "Comconnect_pushButton", "Comdisconnect_pushButton", motor_cfg.DEFAULT_BAUDRATE),
+    'loadcell': ("Com_comboBox_2", "Baud_comboBox_2",
+                 "Comconnect_pushButton_2", "Comdisconnect_pushButton_2", loadcell_cfg.DEFAULT_BAUDRATE),
+    'temp': ("Com_comboBox_3", "Baud_comboBox_3",
+             "Comconnect_pushButton_3", "Comdisconnect_pushButton_3", temp_cfg.DEFAULT_BAUDRATE),
+}
+
+# 데몬 명령이 없는 버튼 (attach 모드에서 비활성)
+UNSUPPORTED_BUTTONS = ("Basictestreset_pushButton", "tension_start_pushButton", "tension_stop_pushButton")
+
+
+class DaemonAttachment(QtCore.QObject):
+    """
+    MainWindow ↔ 수집 데몬 연결
+
+    MainWindow가 로컬 Manager에 연결해 둔 버튼을 bind()에서 데몬 명령으로 다시 연결한다.
+    명령 응답/데이터는 DaemonClient 시그널로 GUI 스레드에서 받는다.
+    """
+
+    def __init__(self, window, client):
+        super().__init__(window)
+        self.window = window
+        self.ui = window.ui
+        self.client = client
+        self.status = {}
+        self._plotting = False
+        self._pending = {}  # 요청 ID → 명령 이름 (실패 응답 알림용)
+
+        client.samples_received.connect(self._on_samples)
+        client.event_received.connect(self._on_event)
+        client.reply_received.connect(self._on_reply)
+        client.disconnected.connect(self._on_daemon_lost)
+
+    # ========================================================================
+    # 바인딩
+    # ========================================================================
+
+    def bind(self):
+        """버튼/제한값 입력을 데몬 명령으로 연결하고 현재 상태 요청"""
+        for device, (_, _, connect_name, disconnect_name, _) in DEVICE_WIDGETS.items():
+            self._rebind(connect_name, 'clicked', lambda _=False, d=device: self.connect_device(d))
+            self._rebind(disconnect_name, 'clicked', lambda _=False, d=device: self.disconnect_device(d))
+
+        self._rebind("Basicteststart_pushButton", 'clicked', lambda _=False: self.start_test())
+        self._rebind("Basicteststop_pushButton", 'clicked', lambda _=False: self.stop_test())
+        self._rebind("Jogfowerd_pushButton", 'pressed', lambda: self.jog('forward'))
+        self._rebind("Jogfowerd_pushButton", 'released', lambda: self.jog('stop'))
+        self._rebind("Jogbackwerd_pushButton", 'pressed', lambda: self.jog('backward'))
+        self._rebind("Jogbackwerd_pushButton", 'released', lambda: self.jog('stop'))
+        self._rebind("Load0_pushButton", 'clicked', lambda _=False: self.send('zero_loadcell'))
+        self._rebind("En0_pushButton", 'clicked', lambda _=False: self.send('zero_motor'))
+        self._rebind("temp_start_btn", 'clicked', lambda _=False: self.set_temp(run=True))
+        self._rebind("temp_stop_btn", 'clicked', lambda _=False: self.set_temp(run=False))
+
+        # 로컬 SafetyGuard 스냅샷 갱신 슬롯은 그대로 두고 데몬에도 전달
+        for name in ("DisplaceLimitMax_doubleSpinBox", "ForceLimitMax_doubleSpinBox"):
+            spin = getattr(self.ui, name, None)
+            if spin is not None:
+                spin.valueChanged.connect(self.push_limits)
+
+        for name in UNSUPPORTED_BUTTONS:
+            btn = getattr(self.ui, name, None)
+            if btn is not None:
+                btn.setEnabled(False)
+
+        self.window.setWindowTitle(f"{self.window.windowTitle()} [attach: {self.client.server_name}]")
+        self.send('status')
+        logger.info(f"[ATTACH] 데몬 attach 모드: {self.client.server_name}")
+
+    def _rebind(self, name: str, signal_name: str, slot):
+        widget = getattr(self.ui, name, None)
+        if widget is None:
+            return
+        signal = getattr(widget, signal_name)
+        try:
+            signal.disconnect()
+        except Exception:
+            pass
+        signal.connect(slot)
+
+    def close(self):
+        """창을 닫을 때 데몬 접속만 끊음 (끊김 경고 없이)"""
+        try:
+            self.client.disconnected.disconnect(self._on_daemon_lost)
+        except TypeError:
+            pass
+        self.client.close()
+
+    # ========================================================================
+    # 명령
+    # ========================================================================
+
+    def send(self, cmd: str, quiet: bool = False, **args):
+        """
+        데몬에 명령 전송 (응답은 _on_reply)
+
+        Returns:
+            요청 ID (데몬 미연결이면 None, quiet가 아니면 경고 표시)
+        """
+        if not self.client.is_connected:
+            if not quiet:
+                ErrorHandler.show_warning(
+                    "수집 데몬",
+                    f"수집 데몬에 연결되어 있지 않습니다 ({self.client.server_name})",
+                    self.window
+                )
+            return None
+        request_id = self.client.request(cmd, **args)
+        self._pending[request_id] = cmd
+        return request_id
+
+    def connect_device(self, device: str):
+        combo_name, baud_name, _, _, default_baud = DEVICE_WIDGETS[device]
+        combo = getattr(self.ui, combo_name, None)
+        port = ((combo.currentText() if combo else "") or "").strip()
+        if not port:
+            ErrorHandler.show_info(
+                ErrorHandler._translate("error.port_required"),
+                ErrorHandler._translate("error.select_port"),
+                self.window
+            )
+            return
+
+        baud_cb = getattr(self.ui, baud_name, None)
+        try:
+            baud = int(baud_cb.currentText() or default_baud) if baud_cb else default_baud
+        except ValueError:
+            baud = default_baud
+        self.send('connect', device=device, port=port, baud=baud)
+
+    def disconnect_device(self, device: str):
+        self.send('disconnect', device=device)
+
+    def start_test(self):
+        """로그 파일을 골라 데몬에서 당김 시험 시작 (로그는 데몬이 기록)"""
+        file_path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self.window,
+            "로그 파일 저장",
+            "",
+            "CSV Files (*.csv);;All Files (*)"
+        )
+        if not file_path:
+            logger.info("[ATTACH] 파일 저장을 취소했습니다.")
+            return
+
+        # 요청은 한 소켓에서 순서대로 처리되므로 제한값/속도가 시작보다 먼저 반영됨
+        self.push_limits()
+        self.send('set_speed', speed_rps=self.window.speed_controller.get_run_speed())
+        self.send('start_test', log_path=file_path, metadata=self.window._collect_test_metadata())
+
+    def stop_test(self):
+        self.send('stop', reason="사용자 Stop 버튼 클릭")
+
+    def jog(self, direction: str):
+        if direction != 'stop':
+            self.send('set_speed', speed_rps=self.window.speed_controller.get_run_speed())
+        self.send('jog', direction=direction)
+
+    def push_limits(self, _value=None):
+        """현재 제한값 입력을 데몬에 전달 (장착 중이면 데몬이 긴급 정지 단계를 다시 장착)"""
+        self.send(
+            'set_limits', quiet=True,
+            displacement_limit_mm=self.ui.DisplaceLimitMax_doubleSpinBox.value(),
+            force_limit_n=self.ui.ForceLimitMax_doubleSpinBox.value()
+        )
+
+    def set_temp(self, run: bool):
+        sv_input = getattr(self.ui, "temp_sv_input", None)
+        if sv_input is None:
+            return
+        self.send('set_temp', sv=sv_input.value(), run=run)
+
+    # ========================================================================
+    # 수신
+    # ========================================================================
+
+    def apply_status(self, status: dict):
+        """데몬 상태 → 버튼 / 라벨 / 플롯 시작·종료 / 상태 표시줄"""
+        self.status = status
+        ports = status.get('ports') or {}
+        for device, (_, _, connect_name, disconnect_name, _) in DEVICE_WIDGETS.items():
+            connected = device in ports
+            connect_btn = getattr(self.ui, connect_name, None)
+            disconnect_btn = getattr(self.ui, disconnect_name, None)
+            if connect_btn is not None:
+                connect_btn.setEnabled(not connected)
+            if disconnect_btn is not None:
+                disconnect_btn.setEnabled(connected)
+
+        updater = self.window.ui_updater
+        if status.get('force_n') is not None:
+            updater.update_loadcell_value(status['force_n'])
+        if status.get('position_um') is not None:
+            updater.update_motor_position(status['position_um'])
+        if status.get('temp_ch1') is not None:
+            updater.update_temperature(1, status['temp_ch1'])
+
+        running = bool(status.get('running'))
+        if running and not self._plotting:
+            self._begin_plot(status.get('test_start_t'))
+        elif not running and self._plotting:
+            self._end_plot()
+
+        if running:
+            text = f"수집 데몬 {self.client.server_name}: 시험 중 ({status.get('rows', 0)} 행)"
+        else:
+            text = f"수집 데몬 {self.client.server_name}: 대기"
+            if status.get('last_stop_reason'):
+                text += f" (마지막 정지: {status['last_stop_reason']})"
+        self.window.statusBar().showMessage(text)
+
+    def _begin_plot(self, start_t):
+        plot_service = self.window.plot_service
+        if plot_service is None or start_t is None:
+            return
+        plot_service.begin_replay(start_t)
+        self._plotting = True
+
+    def _end_plot(self):
+        self._plotting = False
+        if self.window.plot_service is not None:
+            self.window.plot_service.stop_plotting()
+
+    def _on_samples(self, message: dict):
+        self.apply_status(message.get('status') or {})
+
+        times = message.get('t') or []
+        if not self._plotting or not times:
+            return
+        temp = self.status.get('temp_ch1')
+        temps = [float('nan') if temp is None else temp] * len(times)
+        self.window.plot_service.receive_loadcell_batch(
+            times, message.get('force') or [], message.get('pos') or [], temps
+        )
+
+    def _on_event(self, message: dict):
+        kind = message.get('kind')
+        if kind == 'stopped':
+            logger.info(f"[ATTACH] 데몬 시험 정지: {message.get('reason')}")
+            self.send('status', quiet=True)
+        elif kind == 'command' and not message.get('ok'):
+            ErrorHandler.show_command_error(
+                message.get('label') or "", message.get('error') or "", self.window
+            )
+
+    def _on_reply(self, reply: dict):
+        cmd = self._pending.pop(reply.get('id'), None)
+        if cmd is None:
+            return
+        if not reply.get('ok'):
+            logger.error(f"[ATTACH] 데몬 명령 실패 ({cmd}): {reply.get('error')}")
+            ErrorHandler.show_error("수집 데몬", f"{cmd}: {reply.get('error', '')}", self.window)
+            return
+        result = reply.get('result')
+        if isinstance(result, dict) and 'ports' in result:
+            self.apply_status(result)
+
+    def _on_daemon_lost(self):
+        logger.warning(f"[ATTACH] 수집 데몬 연결 끊김: {self.client.server_name}")
+        if self._plotting:
+            self._end_plot()
+        self._pending.clear()
+        self.window.statusBar().showMessage(f"수집 데몬 {self.client.server_name}: 연결 끊김")
+        ErrorHandler.show_warning(
+            "수집 데몬",
+            f"수집 데몬 연결이 끊겼습니다 ({self.client.server_name}).\n"
+            "데몬이 실행 중이면 수집/안전 검사/로그 기록은 이 창과 관계없이 계속됩니다.",
+            self.window
+        )
@@ -9,19 +9,35 @@
 
 import time
 import logging
-from typing import Callable
+from typing import Callable, Optional
+
+import numpy as np
 
 from interfaces import (
     IDataReceiver, 
     IUIUpdater, 
     ISafetyGuard, 
     IDataSynchronizer,
-    ITensioningController
+    ITensioningController,
+    as_batch_receiver,
+    as_batch_ui_updater
 )
 
 logger = logging.getLogger(__name__)
 
 
+def _to_seconds(timestamp_ns: Optional[int]) -> float:
+    """
+    획득 타임스탬프(ns) → 초
+
+    워커가 읽기 직후 찍은 time.perf_counter_ns() 값을 사용하며,
+    없으면(직접 호출 등) 현재 시각으로 대체한다.
+    """
+    if timestamp_ns is None:
+        return time.perf_counter()
+    return timestamp_ns / 1e9
+
+
 class DataHandler:
     """
     데이터 흐름 조정자
@@ -36,7 +52,8 @@ class DataHandler:
         synchronizer: IDataSynchronizer,
         tensioning: ITensioningController,
         data_receiver: IDataReceiver,  # PlotService 등
-        stop_callback: Callable
+        stop_callback: Callable,
+        break_detector=None
     ):
         """
         의존성 주입 (Dependency Injection)
@@ -48,6 +65,7 @@ class DataHandler:
             tensioning: 텐셔닝 제어 담당
             data_receiver: 데이터 수신 담당 (PlotService)
             stop_callback: 긴급 정지 콜백
+            break_detector: 시편 파단 감지기 (선택)
         """
         self.ui_updater = ui_updater
         self.guard = safety_guard
@@ -55,12 +73,20 @@ class DataHandler:
         self.tension = tensioning
         self.receiver = data_receiver
         self.stop_callback = stop_callback
+        self.break_detector = break_detector
+        # 시험(BasicTest/프로파일) 실행 중에만 켬 - 수동 jog 후 하중 제거, Reset 복귀,
+        # Pre-Tension 0점 등 시험 밖의 하중 감소를 파단으로 판정하지 않도록
+        self.break_detection_enabled = False
+        self._sample_listeners = []
+        self._position_listeners = []
         
         # 상태 변수
         self.start_pos_um = 0.0
         self.last_pos_um = 0.0
         self.last_force = 0.0
+        self.last_force_time = None  # 마지막 하중 샘플 획득 시각 (perf_counter 초, 샘플 끊김 판정용)
         self.last_temp_ch1 = 0.0
+        self._temp_received = False
         
         logger.info("DataHandler 초기화 완료 (의존성 주입)")
     
@@ -68,17 +94,22 @@ class DataHandler:
     # 모터 데이터 처리
     # ========================================================================
     
-    def update_motor_position(self, pos_um: float):
+    def update_motor_position(self, pos_um: float, timestamp_ns: Optional[int] = None):
         """
         모터 위치 업데이트
         
+        Args:
+            pos_um: 위치 (um)
+            timestamp_ns: 워커 스레드의 획득 시각 (perf_counter_ns)
+        
         처리 순서:
         1. UI 업데이트
         2. 데이터 동기화 버퍼에 추가
-        3. 안전 가드 검사 (텐셔닝 중이 아닐 때만)
+        3. 위치 리스너 (프로파일 시퀀서 등)
+        4. 안전 가드 검사 (텐셔닝 중이 아닐 때만)
         """
         try:
-            timestamp = time.time()
+            timestamp = _to_seconds(timestamp_ns)
             self.last_pos_um = float(pos_um)
             
             # 1. UI 업데이트
@@ -87,7 +118,14 @@ class DataHandler:
             # 2. 동기화 버퍼에 추가
             self.sync.add_position(timestamp, pos_um)
             
-            # 3. 안전 가드 (텐셔닝 중엔 체크 안 함)
+            # 3. 위치 리스너 (리스너 안에서 등록 해제할 수 있도록 복사본 순회)
+            for listener in tuple(self._position_listeners):
+                try:
+                    listener(timestamp, pos_um)
+                except Exception as e:
+                    logger.error(f"위치 리스너 실패: {e}", exc_info=True)
+            
+            # 4. 안전 가드 (텐셔닝 중엔 체크 안 함)
             if not self.tension.is_active():
                 exceeded, message = self.guard.check_displacement_limit(
                     pos_um, 
@@ -104,22 +142,29 @@ class DataHandler:
     # 로드셀 데이터 처리
     # ========================================================================
     
-    def update_loadcell_value(self, force_n: float):
+    def update_loadcell_value(self, force_n: float, timestamp_ns: Optional[int] = None):
         """
         로드셀 값 업데이트
         
+        Args:
+            force_n: 하중 (N)
+            timestamp_ns: 워커 스레드의 획득 시각 (perf_counter_ns)
+        
         처리 순서:
         1. UI 업데이트
         2. 동기화 버퍼에 추가
         3. 매칭된 위치 찾기
         4. 데이터 수신자(PlotService)에 전달
-        5. 텐셔닝 체크
-        6. 안전 가드 체크 (텐셔닝 중이 아닐 때만)
+        5. 샘플 리스너 (프로파일 시퀀서 등)
+        6. 텐셔닝 체크
+        7. 파단 감지 (텐셔닝 중이 아닐 때만)
+        8. 안전 가드 체크 (텐셔닝 중이 아닐 때만)
         """
         try:
-            timestamp = time.time()
+            timestamp = _to_seconds(timestamp_ns)
             previous_force = self.last_force
             self.last_force = float(force_n)
+            self.last_force_time = timestamp
             
             # 1. UI 업데이트
             self.ui_updater.update_loadcell_value(force_n)
@@ -134,20 +179,45 @@ class DataHandler:
             self.receiver.receive_loadcell_data(
                 force_n, 
                 matched_pos,
-                self.last_temp_ch1
+                self.last_temp_ch1,
+                timestamp=timestamp
             )
             
-            # 5. 텐셔닝 체크
+            # 5. 샘플 리스너 (리스너 안에서 등록 해제할 수 있도록 복사본 순회)
+            for listener in tuple(self._sample_listeners):
+                try:
+                    listener(timestamp, force_n, matched_pos)
+                except Exception as e:
+                    logger.error(f"샘플 리스너 실패: {e}", exc_info=True)
+            
+            # 6. 텐셔닝 체크
             if self.tension.is_active():
                 if self.tension.check_threshold(force_n):
                     self.tension.stop_tensioning()
                     self.stop_callback(reason="텐셔닝 목표 도달")
                 return  # 텐셔닝 중엔 안전 가드 체크 안 함
             
-            # 6. 안전 가드
-            exceeded, message = self.guard.check_force_limit(
-                force_n, 
-                previous_force
+            # 7. 파단 감지 → 모터 정지 + 로그에 파단 위치 기록
+            if self.break_detector is not None and self.break_detection_enabled:
+                event = self.break_detector.update(timestamp, force_n)
+                if event is not None:
+                    self.receiver.mark_event(
+                        'break',
+                        timestamp=event.time,
+                        samples_ago=event.samples_ago,
+                        peak_n=event.peak_n,
+                        force_n=event.force_n
+                    )
+                    self.stop_callback(reason=event.message)
+                    return
+            
+            # 8. 안전 가드 (규칙 엔진이면 하중/온도 규칙을 함께 평가)
+            temp = self.last_temp_ch1 if self._temp_received else float('nan')
+            exceeded, message = self.guard.evaluate_batch(
+                (timestamp,),
+                (force_n,),
+                temps=(temp,),
+                previous_force=previous_force
             )
             
             if exceeded:
@@ -156,20 +226,103 @@ class DataHandler:
         except Exception as e:
             logger.error(f"로드셀 값 처리 실패: {e}", exc_info=True)
     
+    def update_loadcell_batch(self, forces, timestamps_ns):
+        """
+        로드셀 샘플 배치 업데이트 (워커가 한 주기에 읽은 샘플 묶음)
+        
+        Args:
+            forces: 하중 배열 (N, 시간 오름차순)
+            timestamps_ns: 획득 시각 배열 (perf_counter_ns)
+        
+        update_loadcell_value와 같은 순서로 처리하되, UI/동기화/수신자/안전 규칙은
+        배치당 한 번씩 호출한다. 텐셔닝/파단 감지처럼 샘플마다 상태가 바뀌는
+        단계만 샘플 단위로 순회한다.
+        """
+        try:
+            forces = np.asarray(forces, dtype=np.float64)
+            n = len(forces)
+            if n == 0:
+                return
+            times = np.asarray(timestamps_ns, dtype=np.int64) / 1e9
+            previous_force = self.last_force
+            self.last_force = float(forces[-1])
+            self.last_force_time = float(times[-1])
+            
+            # 1. UI 업데이트 (마지막 값)
+            as_batch_ui_updater(self.ui_updater).update_loadcell_batch(forces)
+            
+            # 2-3. 동기화 버퍼 추가 + 매칭 위치
+            self.sync.add_force_batch(times, forces)
+            positions = self.sync.get_matched_positions(times)
+            temps = np.full(n, self.last_temp_ch1)
+            
+            # 4. 데이터 수신자
+            as_batch_receiver(self.receiver).receive_loadcell_batch(times, forces, positions, temps)
+            
+            # 5. 샘플 리스너
+            if self._sample_listeners:
+                for t, force, pos in zip(times.tolist(), forces.tolist(), positions.tolist()):
+                    for listener in tuple(self._sample_listeners):
+                        try:
+                            listener(t, force, pos)
+                        except Exception as e:
+                            logger.error(f"샘플 리스너 실패: {e}", exc_info=True)
+            
+            # 6. 텐셔닝 체크
+            if self.tension.is_active():
+                for force in forces.tolist():
+                    if self.tension.check_threshold(force):
+                        self.tension.stop_tensioning()
+                        self.stop_callback(reason="텐셔닝 목표 도달")
+                        break
+                return
+            
+            # 7. 파단 감지 (samples_ago는 배치 마지막 샘플 기준으로 환산)
+            if self.break_detector is not None and self.break_detection_enabled:
+                for i, (t, force) in enumerate(zip(times.tolist(), forces.tolist())):
+                    event = self.break_detector.update(t, force)
+                    if event is not None:
+                        self.receiver.mark_event(
+                            'break',
+                            timestamp=event.time,
+                            samples_ago=event.samples_ago + (n - 1 - i),
+                            peak_n=event.peak_n,
+                            force_n=event.force_n
+                        )
+                        self.stop_callback(reason=event.message)
+                        return
+            
+            # 8. 안전 가드 (배치 전체를 한 번에 평가)
+            temp = self.last_temp_ch1 if self._temp_received else float('nan')
+            exceeded, message = self.guard.evaluate_batch(
+                times,
+                forces,
+                temps=np.full(n, temp),
+                previous_force=previous_force
+            )
+            
+            if exceeded:
+                self.stop_callback(reason=message)
+        
+        except Exception as e:
+            logger.error(f"로드셀 배치 처리 실패: {e}", exc_info=True)
+    
     # ========================================================================
     # 온도 데이터 처리
     # ========================================================================
     
-    def update_temperature_ch1(self, temp_ch1: float):
+    def update_temperature_ch1(self, temp_ch1: float, timestamp_ns: Optional[int] = None):
         """
         온도 CH1 업데이트 (Test 로그용)
         
         Args:
             temp_ch1: CH1 온도 (°C)
+            timestamp_ns: 워커 스레드의 획득 시각 (perf_counter_ns)
         """
         try:
             if temp_ch1 is not None:
                 self.last_temp_ch1 = float(temp_ch1)
+                self._temp_received = True
                 logger.debug(f"CH1 온도 업데이트: {temp_ch1:.1f}°C")
         
         except Exception as e:
@@ -187,8 +340,40 @@ class DataHandler:
     def reset_guards(self):
         """모든 가드 리셋"""
         self.guard.reset_all()
+        if self.break_detector is not None:
+            self.break_detector.reset()
         logger.info("모든 가드 리셋")
     
+    def add_sample_listener(self, listener: Callable[[float, float, float], None]):
+        """
+        하중 샘플마다 호출될 리스너 등록
+        
+        Args:
+            listener: (timestamp 초, force_n, 매칭된 position_um) 콜백
+        """
+        if listener not in self._sample_listeners:
+            self._sample_listeners.append(listener)
+    
+    def remove_sample_listener(self, listener: Callable[[float, float, float], None]):
+        """리스너 등록 해제 (없으면 무시)"""
+        if listener in self._sample_listeners:
+            self._sample_listeners.remove(listener)
+    
+    def add_position_listener(self, listener: Callable[[float, float], None]):
+        """
+        모터 위치 샘플마다 호출될 리스너 등록 (로드셀 샘플이 없어도 호출됨)
+        
+        Args:
+            listener: (timestamp 초, position_um) 콜백
+        """
+        if listener not in self._position_listeners:
+            self._position_listeners.append(listener)
+    
+    def remove_position_listener(self, listener: Callable[[float, float], None]):
+        """리스너 등록 해제 (없으면 무시)"""
+        if listener in self._position_listeners:
+            self._position_listeners.remove(listener)
+    
     def start_tensioning(self, threshold_n: float):
         """텐셔닝 시작"""
         self.tension.start_tensioning(threshold_n)
@@ -8,6 +8,7 @@ from .preprocessor_tab import TabPreprocessor
 from .multi_compare_tab import TabMultiCompare
 from .utils import (
     safe_read_csv,
+    load_test_log,
     font_big,
     font_small,
     calculate_yield_strength,
@@ -20,6 +21,7 @@ __all__ = [
     'TabPreprocessor',
     'TabMultiCompare',
     'safe_read_csv',
+    'load_test_log',
     'font_big',
     'font_small',
     'calculate_yield_strength',
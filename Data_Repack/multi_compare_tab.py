@@ -20,7 +20,7 @@ from matplotlib.backends.backend_qt5agg import (
 from matplotlib.widgets import SpanSelector
 
 from .utils import (
-    safe_read_csv, font_big, SK_MULTI, 
+    safe_read_csv, load_test_log, TEST_LOG_FILTER, font_big, SK_MULTI, 
     calculate_yield_strength, is_likely_strain_column, is_likely_load_column
 )
 from .geometry_input import GeometryInput
@@ -322,7 +322,7 @@ class TabMultiCompare(QWidget):
             self, 
             tr("data.select_utm"),  # ← 번역 키 추가 필요
             "", 
-            "CSV Files (*.csv);;All Files (*)"
+            TEST_LOG_FILTER
         )
         if not utm_file:
             return
@@ -479,7 +479,7 @@ class TabMultiCompare(QWidget):
             self, 
             tr("data.select_multiple_utm"),
             "", 
-            "CSV (*.csv)"
+            TEST_LOG_FILTER
         )
         if not utm_files: 
             return
@@ -740,7 +740,7 @@ class TabMultiCompare(QWidget):
             utm_path, dic_path, tol = p["utm"], p["dic"], float(p["tol"])
             label = p["label"]
             try:
-                udf = safe_read_csv(utm_path)
+                udf = load_test_log(utm_path)
                 udf.columns = [c.strip() for c in udf.columns]
                 
                 ddf = safe_read_csv(dic_path)
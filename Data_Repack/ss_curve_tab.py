@@ -20,7 +20,7 @@ from matplotlib.backends.backend_qt5agg import (
 )
 
 from .utils import (
-    safe_read_csv, font_big, SK_RED, calculate_yield_strength,
+    safe_read_csv, load_test_log, TEST_LOG_FILTER, font_big, SK_RED, calculate_yield_strength,
     is_likely_strain_column, is_likely_load_column
 )
 from .geometry_input import GeometryInput
@@ -264,17 +264,17 @@ class TabDICUTM(QWidget):
             self._pan_info = {'active': False}
 
     def load_utm(self):
-        """UTM CSV 파일 로드"""
+        """UTM 로그 파일 로드 (CSV 또는 바이너리 로그)"""
         path, _ = QFileDialog.getOpenFileName(
             self, 
             "Select UTM CSV", 
             "", 
-            "CSV (*.csv);;All Files (*)"
+            TEST_LOG_FILTER
         )
         if not path: 
             return
         try:
-            df = safe_read_csv(path)
+            df = load_test_log(path)
             df.columns = [c.strip() for c in df.columns]
             self.udf = df
             self.lbl_utm.setText(f"UTM: {os.path.basename(path)}")
@@ -54,6 +54,41 @@ def safe_read_csv(path, **kw):
         return pd.read_csv(path, encoding="cp949", **kw)
 
 
+# ── 테스트 로그 파일 필터 (CSV + 바이너리 로그)
+TEST_LOG_FILTER = "Test Logs (*.csv *.ttlog);;CSV (*.csv);;Binary Log (*.ttlog);;All Files (*)"
+
+
+def load_test_log(path):
+    """
+    테스트 로그 읽기 (.ttlog는 메모리 매핑, 그 외는 CSV)
+    
+    바이너리 로그는 CSV와 같은 컬럼명으로 반환하며,
+    기록 시 메타데이터는 df.attrs['metadata']에 담긴다.
+    이벤트 파일(.events.json)이 있으면 df.attrs['events']에 담긴다 (파단 행 등).
+    """
+    from Log_Writer import read_events, events_log_path
+    
+    if str(path).lower().endswith(".ttlog"):
+        from Binary_Log import read_binary_log, COLUMN_LABELS
+        
+        records, metadata = read_binary_log(path)
+        df = pd.DataFrame({
+            label: np.asarray(records[name])
+            for label, name in zip(COLUMN_LABELS, records.dtype.names)
+        })
+        df.attrs['metadata'] = metadata
+    else:
+        df = safe_read_csv(path)
+    
+    try:
+        events = read_events(events_log_path(str(path)))
+    except (OSError, ValueError):
+        events = []  # 손상된 이벤트 파일은 무시 (데이터는 그대로 사용)
+    if events:
+        df.attrs['events'] = events
+    return df
+
+
 def calculate_yield_strength(strain, stress, offset_percent=0.2):
     """
     0.2% 오프셋 방법으로 항복강도 계산
@@ -3,10 +3,11 @@
 타임스탬프 기반으로 Motor와 Loadcell 데이터 매칭
 """
 
-import time
 import logging
-from collections import deque
+import threading
+import numpy as np
 from interfaces import IDataSynchronizer
+from Ring_Buffer import TimeSeriesBuffer
 from config import sync_cfg  # ===== 추가 =====
 
 logger = logging.getLogger(__name__)
@@ -18,27 +19,60 @@ class DataSynchronizer(IDataSynchronizer):
     
     책임:
     - 위치/하중 데이터를 타임스탬프와 함께 버퍼에 저장
-    - 하중 측정 시점에 가장 가까운 위치 찾기
+    - 하중 측정 시점에 가장 가까운 위치 찾기 (이진 탐색, O(log n))
+    - 선택적으로 앞뒤 두 위치 샘플 사이를 선형 보간
     """
     
-    def __init__(self, buffer_size: int = None):  # ===== 수정: 기본값 None =====
+    def __init__(self, buffer_size: int = None, interpolate: bool = None):  # ===== 수정: 기본값 None =====
         # ===== 개선: config에서 버퍼 크기 로드 =====
         if buffer_size is None:
             buffer_size = sync_cfg.BUFFER_SIZE
+        if interpolate is None:
+            interpolate = sync_cfg.INTERPOLATE
         
-        self.pos_buffer = deque(maxlen=buffer_size)    # (timestamp, position_um)
-        self.force_buffer = deque(maxlen=buffer_size)  # (timestamp, force_n)
-        logger.info(f"DataSynchronizer 초기화 (버퍼 크기: {buffer_size})")
+        self.interpolate = interpolate
+        self.pos_buffer = TimeSeriesBuffer(buffer_size)    # (timestamp, position_um)
+        self.force_buffer = TimeSeriesBuffer(buffer_size)  # (timestamp, force_n)
+        self._lock = threading.Lock()
+        logger.info(
+            f"DataSynchronizer 초기화 (버퍼 크기: {buffer_size}, "
+            f"보간: {'ON' if interpolate else 'OFF'})"
+        )
     
     def add_position(self, timestamp: float, pos_um: float):
         """위치 데이터 추가"""
-        self.pos_buffer.append((timestamp, pos_um))
-        logger.debug(f"위치 추가: {timestamp:.3f}s, {pos_um:.1f}um")
+        with self._lock:
+            self._append(self.pos_buffer, timestamp, pos_um, "위치")
     
     def add_force(self, timestamp: float, force_n: float):
         """하중 데이터 추가"""
-        self.force_buffer.append((timestamp, force_n))
-        logger.debug(f"하중 추가: {timestamp:.3f}s, {force_n:.3f}N")
+        with self._lock:
+            self._append(self.force_buffer, timestamp, force_n, "하중")
+    
+    def add_force_batch(self, times, forces):
+        """하중 샘플 배치 추가 (시간 오름차순)"""
+        times = np.asarray(times, dtype=np.float64)
+        if len(times) == 0:
+            return
+        with self._lock:
+            last = self.force_buffer.last_time
+            if (last is not None and times[0] < last) or np.any(np.diff(times) < 0):
+                # 역행 처리는 샘플별 경로와 동일하게
+                for t, force in zip(times.tolist(), np.asarray(forces).tolist()):
+                    self._append(self.force_buffer, t, force, "하중")
+                return
+            self.force_buffer.extend(times, forces)
+    
+    @staticmethod
+    def _append(buffer: TimeSeriesBuffer, timestamp: float, value: float, name: str):
+        """단조 증가가 깨지면(시계 기준 변경 등) 이진 탐색이 불가하므로 버퍼를 비운다"""
+        last = buffer.last_time
+        if last is not None and timestamp < last:
+            logger.warning(
+                f"{name} 타임스탬프 역행 ({last:.3f}s → {timestamp:.3f}s) - 버퍼 초기화"
+            )
+            buffer.clear()
+        buffer.append(timestamp, value)
     
     def get_matched_position(self, force_timestamp: float) -> float:
         """
@@ -48,19 +82,38 @@ class DataSynchronizer(IDataSynchronizer):
             force_timestamp: 하중 측정 시각
             
         Returns:
-            매칭된 위치 (um)
+            매칭된 위치 (um). 보간 사용 시 앞뒤 샘플 사이 선형 보간 값
         """
-        if not self.pos_buffer:
-            logger.warning("위치 버퍼가 비어있음")
-            return 0.0
-        
-        # 시간 차이가 가장 작은 항목 찾기
-        matched = min(
-            self.pos_buffer,
-            key=lambda x: abs(x[0] - force_timestamp)
-        )
-        
-        time_diff_ms = abs(matched[0] - force_timestamp) * 1000
+        with self._lock:
+            n = len(self.pos_buffer)
+            if n == 0:
+                logger.warning("위치 버퍼가 비어있음")
+                return 0.0
+            
+            times = self.pos_buffer.times
+            values = self.pos_buffer.values()
+            idx = int(np.searchsorted(times, force_timestamp, side="left"))
+            
+            if idx == 0:
+                nearest = 0
+            elif idx == n:
+                nearest = n - 1
+            else:
+                # 동일 거리면 이전 샘플 우선
+                left_diff = force_timestamp - times[idx - 1]
+                right_diff = times[idx] - force_timestamp
+                nearest = idx - 1 if left_diff <= right_diff else idx
+            
+            time_diff_ms = abs(times[nearest] - force_timestamp) * 1000
+            
+            if self.interpolate and 0 < idx < n:
+                t0, t1 = times[idx - 1], times[idx]
+                v0, v1 = values[idx - 1], values[idx]
+                span = t1 - t0
+                ratio = (force_timestamp - t0) / span if span > 0 else 0.0
+                matched = float(v0 + (v1 - v0) * ratio)
+            else:
+                matched = float(values[nearest])
         
         # ===== 개선: config에서 허용 오차 로드 =====
         if time_diff_ms > sync_cfg.MAX_TIME_DIFF_MS:
@@ -68,13 +121,76 @@ class DataSynchronizer(IDataSynchronizer):
                 f"동기화 정확도 낮음: {time_diff_ms:.1f}ms "
                 f"(허용: {sync_cfg.MAX_TIME_DIFF_MS}ms)"
             )
-        else:
-            logger.debug(f"동기화 성공: 시간차 {time_diff_ms:.1f}ms")
         
-        return matched[1]  # position_um 반환
+        return matched  # position_um 반환
+    
+    def get_matched_positions(self, force_timestamps) -> np.ndarray:
+        """
+        하중 타임스탬프 배열에 매칭되는 위치 배열 (get_matched_position의 벡터화)
+        
+        허용 오차 초과 경고는 배치당 한 번만 남긴다.
+        """
+        ft = np.asarray(force_timestamps, dtype=np.float64)
+        with self._lock:
+            n = len(self.pos_buffer)
+            if n == 0:
+                logger.warning("위치 버퍼가 비어있음")
+                return np.zeros(len(ft))
+            
+            times = self.pos_buffer.times
+            values = self.pos_buffer.values()
+            idx = np.searchsorted(times, ft, side="left")
+            left = np.clip(idx - 1, 0, n - 1)
+            right = np.clip(idx, 0, n - 1)
+            
+            # 동일 거리면 이전 샘플 우선
+            nearest = np.where(ft - times[left] <= times[right] - ft, left, right)
+            nearest = np.where(idx == 0, 0, np.where(idx == n, n - 1, nearest))
+            time_diff_ms = np.abs(times[nearest] - ft) * 1000
+            
+            matched = values[nearest]
+            if self.interpolate:
+                inner = (idx > 0) & (idx < n)
+                t0, t1 = times[left], times[right]
+                v0, v1 = values[left], values[right]
+                span = t1 - t0
+                ratio = np.divide(ft - t0, span, out=np.zeros_like(ft), where=span > 0)
+                matched = np.where(inner, v0 + (v1 - v0) * ratio, matched)
+            matched = matched.astype(np.float64, copy=True)
+        
+        worst_ms = float(time_diff_ms.max()) if len(ft) else 0.0
+        if worst_ms > sync_cfg.MAX_TIME_DIFF_MS:
+            logger.warning(
+                f"동기화 정확도 낮음: 최대 {worst_ms:.1f}ms "
+                f"(허용: {sync_cfg.MAX_TIME_DIFF_MS}ms, 배치 {len(ft)}개)"
+            )
+        
+        return matched
+    
+    def get_recent(self, window_sec: float):
+        """
+        최근 window_sec 구간의 위치/하중 샘플 복사본 (제어 루프용)
+        
+        Returns:
+            (pos_times, pos_values, force_times, force_values)
+        """
+        with self._lock:
+            return (
+                *self._recent(self.pos_buffer, window_sec),
+                *self._recent(self.force_buffer, window_sec)
+            )
+    
+    @staticmethod
+    def _recent(buffer: TimeSeriesBuffer, window_sec: float):
+        times = buffer.times
+        if len(times) == 0:
+            return np.empty(0), np.empty(0)
+        lo = int(np.searchsorted(times, times[-1] - window_sec, side="left"))
+        return times[lo:].copy(), buffer.values()[lo:].copy()
     
     def clear(self):
         """버퍼 초기화"""
-        self.pos_buffer.clear()
-        self.force_buffer.clear()
+        with self._lock:
+            self.pos_buffer.clear()
+            self.force_buffer.clear()
         logger.info("동기화 버퍼 초기화")
@@ -0,0 +1,482 @@
+"""
+가상 장비 (하드웨어 없이 부하 시험 / 작업자 교육용)
+
+COM 포트 목록의 SIM: 항목을 선택하면 실제 장비 대신 같은 프로토콜을
+말하는 프로세스 내부 시뮬레이터에 연결된다. 운용 PC에서 실수로 선택되지
+않도록 목록 표시는 기본 꺼져 있고, Main.py --sim 또는 환경 변수
+TENSILE_TESTER_SIM=1로 켠다.
+
+- SIM:LOADCELL  CDL 프로토콜 (S21 / MSV? / MSV?0 / STP / CDL), serial.Serial 대체
+- SIM:MOTOR     스테퍼 드라이브 Modbus 레지스터 맵 (config.motor_cfg)
+- SIM:TEMP      TM4 온도 제어기 Modbus 레지스터 맵 (config.temp_cfg)
+
+세 장비는 하나의 SimulatedRig를 공유한다: 모터가 움직이면 가상 시편이
+늘어나고 로드셀 하중이 응력-변형 모델을 따라 변한다 (항복, 파단 포함).
+응답 지연, 하중 노이즈, 응답 누락, 연속 출력 속도는 sim_cfg로 설정한다.
+"""
+
+import math
+import os
+import random
+import threading
+import time
+import logging
+from dataclasses import dataclass
+from typing import Optional
+import serial
+from config import loadcell_cfg, motor_cfg, sim_cfg, temp_cfg
+
+logger = logging.getLogger(__name__)
+
+
+SIM_PORT_PREFIX = "SIM:"
+SIM_PORTS = ("SIM:MOTOR", "SIM:LOADCELL", "SIM:TEMP")
+SIM_ENABLE_ENV = "TENSILE_TESTER_SIM"
+SIM_PORT_TOOLTIP = "가상 장비 (시뮬레이터, 실제 장비 아님)"
+
+_STATUS_OK = b"0\r\n"
+
+
+def is_sim_port(port: str) -> bool:
+    return bool(port) and port.upper().startswith(SIM_PORT_PREFIX)
+
+
+def sim_ports_enabled() -> bool:
+    """가상 포트 목록 표시 여부 (sim_cfg.ENABLED 또는 TENSILE_TESTER_SIM=1)"""
+    if sim_cfg.ENABLED:
+        return True
+    return os.environ.get(SIM_ENABLE_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def list_sim_ports() -> list:
+    """COM 포트 콤보박스에 추가할 가상 포트 (기본 꺼짐)"""
+    return list(SIM_PORTS) if sim_ports_enabled() else []
+
+
+# ============================================================================
+# 가상 시편 / 시험기
+# ============================================================================
+
+class SpecimenModel:
+    """
+    합성 응력-변형 모델 (인장만)
+
+    여유(slack) 이후 선형 탄성, 항복 후 선형 경화(소성 변형 누적, 제하 시
+    탄성 복귀), 파단 변위를 넘으면 하중 0.
+    """
+
+    def __init__(self):
+        self.k = sim_cfg.SPECIMEN_STIFFNESS_N_PER_UM
+        self.yield_n = sim_cfg.SPECIMEN_YIELD_N
+        # 경화 계수: 항복 후 접선 강성 = HARDENING * k
+        et = sim_cfg.SPECIMEN_HARDENING * self.k
+        self.kp = self.k * et / (self.k - et)
+        self.plastic_um = 0.0
+        self.broken = False
+
+    def force(self, extension_um: float) -> float:
+        if self.broken:
+            return 0.0
+        if extension_um >= sim_cfg.SPECIMEN_BREAK_UM:
+            self.broken = True
+            logger.info(f"[SIM] 가상 시편 파단 (변위 {extension_um:.1f} μm)")
+            return 0.0
+
+        strain_um = extension_um - sim_cfg.SPECIMEN_SLACK_UM
+        trial = self.k * (strain_um - self.plastic_um)
+        limit = self.yield_n + self.kp * self.plastic_um
+        if trial > limit:
+            self.plastic_um += (trial - limit) / (self.k + self.kp)
+            trial = self.k * (strain_um - self.plastic_um)
+        return max(0.0, trial)
+
+
+class SimulatedRig:
+    """
+    가상 시험기 상태 (모터 운동 + 시편 + 온도)
+
+    접근할 때마다 경과 시간만큼 적분하므로 별도 스레드가 없다.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._rng = random.Random(sim_cfg.SEED)
+        self._t = time.perf_counter()
+        self.registers = {}         # Modbus 레지스터 (모터 + TM4, 주소 겹치지 않음)
+
+        # 모터 (펄스)
+        self.abs_pulses = 0.0       # 시편 기준 절대 위치
+        self.offset_pulses = 0.0    # 0점 설정 (보고 위치 = 절대 - offset)
+        self.velocity = 0.0         # 펄스/s (jog)
+        self.move_target = None     # 절대 이동 목표 (보고 좌표)
+        self.move_speed = 0.0
+
+        self.specimen = SpecimenModel()
+        self.tare_n = 0.0
+
+        # 온도 (채널별)
+        self.temps = {ch: sim_cfg.TEMP_AMBIENT_C for ch in temp_cfg.CHANNEL_ADDRESSES}
+
+    @staticmethod
+    def pulses_per_sec(rps: float) -> float:
+        return rps * motor_cfg.LEAD_MM_PER_REV * motor_cfg.POSITION_SCALE_FACTOR
+
+    @property
+    def position_pulses(self) -> int:
+        return int(round(self.abs_pulses - self.offset_pulses))
+
+    @property
+    def extension_um(self) -> float:
+        """당김 방향(+) 변위 - 모니터 표시 변위와 같은 부호"""
+        return (motor_cfg.POSITION_SIGN_INVERT * self.abs_pulses
+                / motor_cfg.POSITION_SCALE_FACTOR * motor_cfg.UM_PER_MM)
+
+    def advance(self, now: Optional[float] = None):
+        with self._lock:
+            now = time.perf_counter() if now is None else now
+            dt = now - self._t
+            if dt <= 0:
+                return
+            self._t = now
+
+            if self.move_target is not None:
+                remaining = self.move_target - self.position_pulses
+                step = self.move_speed * dt
+                if abs(remaining) <= step:
+                    self.abs_pulses = self.move_target + self.offset_pulses
+                    self.move_target = None
+                else:
+                    self.abs_pulses += math.copysign(step, remaining)
+            else:
+                self.abs_pulses += self.velocity * dt
+
+            self._advance_temps(dt)
+
+    def _advance_temps(self, dt: float):
+        registers = self.registers
+        alpha = 1.0 - math.exp(-dt / sim_cfg.TEMP_TIME_CONSTANT_S)
+        for ch, addrs in temp_cfg.CHANNEL_ADDRESSES.items():
+            running = registers.get(addrs["RUN"], 1) == 0  # 0 = RUN
+            target = registers.get(addrs["SV"], 0) if running else sim_cfg.TEMP_AMBIENT_C
+            self.temps[ch] += (target - self.temps[ch]) * alpha
+
+    def gross_force(self, now: Optional[float] = None) -> float:
+        with self._lock:
+            self.advance(now)
+            return self.specimen.force(self.extension_um)
+
+    def net_force(self, now: Optional[float] = None) -> float:
+        """로드셀 출력 (0점 보정 + 노이즈)"""
+        with self._lock:
+            force = self.gross_force(now) - self.tare_n
+            if sim_cfg.NOISE_N > 0:
+                force += self._rng.gauss(0.0, sim_cfg.NOISE_N)
+            return force
+
+    def dropped(self) -> bool:
+        """응답/프레임 누락 여부"""
+        with self._lock:
+            return sim_cfg.DROPOUT_RATE > 0 and self._rng.random() < sim_cfg.DROPOUT_RATE
+
+    def motor_command(self, code: int):
+        """명령 레지스터(0x0143) 쓰기"""
+        with self._lock:
+            self.advance()
+            registers = self.registers
+            if code in (4, 5):  # JOG 전진 / 후진 (후진 = 당김)
+                speed = self.pulses_per_sec(registers.get(motor_cfg.ADDR_JOG_SPEED, 0))
+                self.velocity = speed if code == 4 else -speed
+                self.move_target = None
+            elif code == 6:     # 정지
+                self.velocity = 0.0
+                self.move_target = None
+            elif code == 1:     # 절대 이동
+                lo = registers.get(motor_cfg.ADDR_TARGET_LO, 0)
+                hi = registers.get(motor_cfg.ADDR_TARGET_HI, 0)
+                self.move_target = _s32((hi << 16) | lo)
+                self.move_speed = self.pulses_per_sec(registers.get(motor_cfg.ADDR_SPEED, 0))
+                self.velocity = 0.0
+            elif code == 8:     # 0점 적용
+                lo = registers.get(motor_cfg.ADDR_ZERO_POS_LO, 0)
+                hi = registers.get(motor_cfg.ADDR_ZERO_POS_HI, 0)
+                self.offset_pulses = self.abs_pulses - _s32((hi << 16) | lo)
+            else:
+                logger.warning(f"[SIM] 알 수 없는 모터 명령: {code}")
+
+
+def _s32(u32: int) -> int:
+    u32 &= 0xFFFFFFFF
+    return u32 - 0x100000000 if u32 & 0x80000000 else u32
+
+
+_rig = None
+_rig_lock = threading.Lock()
+
+
+def get_rig() -> SimulatedRig:
+    """세 가상 장비가 공유하는 시험기"""
+    global _rig
+    with _rig_lock:
+        if _rig is None:
+            _rig = SimulatedRig()
+        return _rig
+
+
+def reset_rig():
+    """새 시편으로 교체 (시뮬레이터 재시작)"""
+    global _rig
+    with _rig_lock:
+        _rig = None
+
+
+# ============================================================================
+# Modbus (모터 / 온도 제어기)
+# ============================================================================
+
+@dataclass
+class SimResponse:
+    """pymodbus 응답 대체 (registers / isError)"""
+    registers: list = None
+    error: str = ""
+
+    def isError(self) -> bool:
+        return bool(self.error)
+
+    def __str__(self):
+        return f"SimResponse(error={self.error})" if self.error else f"SimResponse({self.registers})"
+
+
+class SimulatedModbusClient:
+    """
+    ModbusSerialClient 대체 (SIM:MOTOR / SIM:TEMP)
+
+    모터와 TM4의 레지스터 주소가 겹치지 않으므로 한 레지스터 맵으로 둘 다 응답한다.
+    acquire_modbus_client(client_factory=...)로 공유 버스 아래에서 사용된다.
+    """
+
+    def __init__(self, port: str = "SIM:MOTOR", **settings):
+        self.port = port
+        self.settings = settings
+        self.rig = get_rig()
+        self._open = False
+
+    def connect(self) -> bool:
+        self._open = True
+        logger.info(f"[SIM] Modbus 가상 장비 연결 ({self.port})")
+        return True
+
+    def close(self):
+        self._open = False
+
+    def is_socket_open(self) -> bool:
+        return self._open
+
+    def _transaction(self) -> Optional[SimResponse]:
+        """응답 지연 + 누락. 누락이면 오류 응답"""
+        if not self._open:
+            return SimResponse(error="포트 닫힘")
+        if sim_cfg.LATENCY_MS > 0:
+            time.sleep(sim_cfg.LATENCY_MS / 1000.0)
+        if self.rig.dropped():
+            return SimResponse(error="응답 없음 (시뮬레이션 누락)")
+        self.rig.advance()
+        return None
+
+    def read_holding_registers(self, address, count=1, device_id=1, **kwargs):
+        error = self._transaction()
+        if error:
+            return error
+        regs = [self.rig.registers.get(address + i, 0) for i in range(count)]
+        # 현재 위치 (하위 16bit, 상위 16bit)
+        u32 = self.rig.position_pulses & 0xFFFFFFFF
+        for i, addr in enumerate(range(address, address + count)):
+            if addr == motor_cfg.ADDR_POSITION_HI:
+                regs[i] = u32 & 0xFFFF
+            elif addr == motor_cfg.ADDR_POSITION_LO:
+                regs[i] = (u32 >> 16) & 0xFFFF
+        return SimResponse(regs)
+
+    def read_input_registers(self, address, count=1, device_id=1, **kwargs):
+        error = self._transaction()
+        if error:
+            return error
+        pv_addrs = {addrs["PV"]: ch for ch, addrs in temp_cfg.CHANNEL_ADDRESSES.items()}
+        regs = []
+        for addr in range(address, address + count):
+            ch = pv_addrs.get(addr)
+            regs.append(int(round(self.rig.temps[ch])) & 0xFFFF if ch else self.rig.registers.get(addr, 0))
+        return SimResponse(regs)
+
+    def write_register(self, address, value, device_id=1, **kwargs):
+        return self.write_registers(address, [value], device_id)
+
+    def write_registers(self, address, values, device_id=1, **kwargs):
+        error = self._transaction()
+        if error:
+            return error
+        registers = self.rig.registers
+        for i, value in enumerate(values):
+            registers[address + i] = int(value) & 0xFFFF
+        if address <= motor_cfg.ADDR_COMMAND < address + len(values):
+            self.rig.motor_command(registers[motor_cfg.ADDR_COMMAND])
+        return SimResponse(list(values))
+
+
+def modbus_client_factory(port: str):
+    """acquire_modbus_client의 client_factory (실제 포트면 None → ModbusSerialClient)"""
+    return SimulatedModbusClient if is_sim_port(port) else None
+
+
+# ============================================================================
+# 로드셀 (CDL 시리얼)
+# ============================================================================
+
+class SimulatedLoadcellSerial:
+    """
+    serial.Serial 대체 (SIM:LOADCELL)
+
+    ;명령; 프레임을 해석해 지연(LATENCY_MS) 후 응답을 수신 버퍼에 넣고,
+    연속 출력(MSV?0) 중에는 LOADCELL_RATE_HZ 간격의 측정 프레임을 만든다.
+    read()는 serial.timeout만큼 블로킹한다.
+    """
+
+    def __init__(self, port: str = "SIM:LOADCELL"):
+        self.port = port
+        self.baudrate = loadcell_cfg.DEFAULT_BAUDRATE
+        self.parity = loadcell_cfg.DEFAULT_PARITY
+        self.bytesize = loadcell_cfg.DEFAULT_BYTESIZE
+        self.stopbits = loadcell_cfg.DEFAULT_STOPBITS
+        self.timeout = loadcell_cfg.DEFAULT_TIMEOUT
+        self.is_open = False
+
+        self.rig = get_rig()
+        self._lock = threading.RLock()
+        self._tx = ""
+        self._rx = bytearray()
+        self._pending = []          # (도착 시각, 바이트)
+        self._selected = False
+        self._stream_next = None    # 다음 연속 출력 프레임 시각
+
+    def open(self):
+        self.is_open = True
+        logger.info(f"[SIM] 로드셀 가상 장비 연결 ({self.port})")
+
+    def close(self):
+        self.is_open = False
+        self._stream_next = None
+
+    def flush(self):
+        pass
+
+    def reset_input_buffer(self):
+        with self._lock:
+            self._pump(time.perf_counter())
+            self._rx.clear()
+
+    def reset_output_buffer(self):
+        pass
+
+    @property
+    def in_waiting(self) -> int:
+        with self._lock:
+            self._pump(time.perf_counter())
+            return len(self._rx)
+
+    def write(self, data: bytes) -> int:
+        if not self.is_open:
+            raise serial.SerialException("포트가 열려 있지 않습니다")
+        with self._lock:
+            self._tx += data.decode("ascii", errors="ignore")
+            *commands, self._tx = self._tx.split(loadcell_cfg.FRAME_END)
+            for cmd in commands:
+                if cmd:
+                    self._handle(cmd.strip(), time.perf_counter())
+        return len(data)
+
+    def read(self, size: int = 1) -> bytes:
+        if not self.is_open:
+            raise serial.SerialException("포트가 열려 있지 않습니다")
+        deadline = None if self.timeout is None else time.perf_counter() + self.timeout
+        while True:
+            with self._lock:
+                now = time.perf_counter()
+                self._pump(now)
+                if self._rx:
+                    data = bytes(self._rx[:size])
+                    del self._rx[:size]
+                    return data
+                next_t = self._next_arrival()
+            if deadline is not None and now >= deadline:
+                return b""
+            wait = 0.05 if next_t is None else max(0.0, next_t - now)
+            if deadline is not None:
+                wait = min(wait, deadline - now)
+            time.sleep(max(wait, 0.0002))
+
+    # ----- 내부 -----
+
+    def _handle(self, cmd: str, now: float):
+        if cmd.startswith("S") and cmd[1:].isdigit():
+            self._selected = int(cmd[1:]) == loadcell_cfg.DEVICE_ADDRESS
+            if self._selected:
+                self._reply(_STATUS_OK, now)
+            return
+        if not self._selected:
+            return  # 선택되지 않은 주소는 응답하지 않음
+
+        if cmd == loadcell_cfg.CMD_CONTINUOUS_MEASURE:
+            self._stream_next = now + 1.0 / sim_cfg.LOADCELL_RATE_HZ
+        elif cmd == loadcell_cfg.CMD_SINGLE_MEASURE:
+            self._reply(self._frame(now), now)
+        elif cmd == loadcell_cfg.CMD_STOP_MEASURE:
+            self._stream_next = None
+        elif cmd == loadcell_cfg.CMD_ZERO_POSITION:
+            self.rig.tare_n = self.rig.gross_force(now)
+            self._reply(_STATUS_OK, now)
+        else:
+            logger.debug(f"[SIM] 로드셀 알 수 없는 명령: {cmd}")
+
+    def _reply(self, data: bytes, now: float):
+        if self.rig.dropped():
+            return
+        self._pending.append((now + sim_cfg.LATENCY_MS / 1000.0, data))
+
+    def _frame(self, t: float) -> bytes:
+        force = self.rig.net_force(t)
+        scale = loadcell_cfg.NORMALIZATION_FACTOR * loadcell_cfg.GRAVITY_FACTOR
+        counts = int(round(force / scale * loadcell_cfg.FULLSCALE))
+        counts = max(-0x80000000, min(0x7FFFFFFF, counts))
+        return counts.to_bytes(4, "big", signed=True) + loadcell_cfg.STREAM_FRAME_TERMINATOR
+
+    def _next_arrival(self) -> Optional[float]:
+        times = [t for t, _ in self._pending]
+        if self._stream_next is not None:
+            times.append(self._stream_next)
+        return min(times) if times else None
+
+    def _pump(self, now: float):
+        """도착 시각이 지난 응답/연속 출력 프레임을 수신 버퍼로"""
+        if self._pending:
+            ready = [item for item in self._pending if item[0] <= now]
+            if ready:
+                self._pending = [item for item in self._pending if item[0] > now]
+                for _, data in ready:
+                    self._rx += data
+
+        if self._stream_next is not None and self._stream_next <= now:
+            period = 1.0 / sim_cfg.LOADCELL_RATE_HZ
+            max_frames = loadcell_cfg.STREAM_MAX_BUFFER_BYTES // (4 + len(loadcell_cfg.STREAM_FRAME_TERMINATOR))
+            due = int((now - self._stream_next) / period) + 1
+            if due > max_frames:
+                # 오래 읽지 않은 경우 - 실제 장비처럼 오래된 출력은 버려짐
+                self._stream_next += (due - max_frames) * period
+                due = max_frames
+            for _ in range(due):
+                if not self.rig.dropped():
+                    self._rx += self._frame(self._stream_next)
+                self._stream_next += period
+
+
+def create_serial(port: str):
+    """로드셀 포트 객체 생성 (SIM: 포트면 가상 장비, 아니면 serial.Serial)"""
+    return SimulatedLoadcellSerial(port) if is_sim_port(port) else serial.Serial()
@@ -0,0 +1,250 @@
+"""
+긴급 정지 단계 (수집 스레드 내 안전 평가)
+
+모터/로드셀 워커 스레드가 샘플을 읽은 직후 변위/하중 제한을 검사하고,
+초과 시 미리 준비해 둔 정지 트랜잭션을 모터 버스에 SAFETY 우선순위로
+바로 제출한다. GUI 이벤트 루프(플롯, 대화상자 등)를 거치지 않으므로
+UI 부하와 무관하게 반응 시간이 일정하다.
+
+GUI 쪽 정리(테스트/플롯/온도 정지)는 tripped 시그널로 이어서 처리한다.
+"""
+
+import bisect
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Optional
+from PyQt5 import QtCore
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyHistogram:
+    """
+    지연 시간 히스토그램 (μs 단위 고정 버킷)
+
+    여러 스레드에서 record() 해도 안전하다.
+    """
+
+    DEFAULT_EDGES_US = (
+        100, 200, 500, 1_000, 2_000, 5_000, 10_000,
+        20_000, 50_000, 100_000, 200_000, 500_000, 1_000_000
+    )
+
+    def __init__(self, edges_us=DEFAULT_EDGES_US):
+        self.edges_us = tuple(edges_us)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.counts = [0] * (len(self.edges_us) + 1)  # 마지막은 초과 버킷
+            self.count = 0
+            self.min_us = None
+            self.max_us = None
+            self._sum_us = 0.0
+
+    def record(self, latency_ns: int):
+        """지연 시간 한 건 기록"""
+        us = latency_ns / 1000.0
+        with self._lock:
+            self.counts[bisect.bisect_left(self.edges_us, us)] += 1
+            self.count += 1
+            self._sum_us += us
+            self.min_us = us if self.min_us is None else min(self.min_us, us)
+            self.max_us = us if self.max_us is None else max(self.max_us, us)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """q 분위(0~100)가 속한 버킷의 상한 (μs). 초과 버킷이면 max 반환"""
+        with self._lock:
+            if self.count == 0:
+                return None
+            target = q / 100.0 * self.count
+            running = 0
+            for i, n in enumerate(self.counts):
+                running += n
+                if running >= target and n:
+                    return float(self.edges_us[i]) if i < len(self.edges_us) else self.max_us
+            return self.max_us
+
+    def summary(self) -> dict:
+        """통계 요약"""
+        p50 = self.percentile(50)
+        p99 = self.percentile(99)
+        with self._lock:
+            return {
+                'count': self.count,
+                'min_us': self.min_us,
+                'max_us': self.max_us,
+                'mean_us': self._sum_us / self.count if self.count else None,
+                'p50_us': p50,
+                'p99_us': p99,
+                'buckets': dict(zip(
+                    [f"<={e}" for e in self.edges_us] + [f">{self.edges_us[-1]}"],
+                    self.counts
+                )),
+            }
+
+
+class EmergencyStop(QtCore.QObject):
+    """
+    수집 스레드용 긴급 정지 단계
+
+    - arm(): 테스트 시작 시 GUI 스레드에서 제한값과 정지 트랜잭션 장착
+    - check_position()/check_force(): 워커 스레드에서 매 샘플마다 호출
+    - 제한 초과 시 한 번만 정지 명령 제출 후 자동 해제(disarm), tripped 방출
+
+    히스토그램:
+    - decision: 샘플 획득 → 정지 명령 제출
+    - command: 샘플 획득 → 모터 드라이브 응답 (버스 완료)
+    """
+
+    tripped = QtCore.pyqtSignal(str)
+
+    def __init__(self, config):
+        """
+        Args:
+            config: SafetyConfig (허용 오차)
+        """
+        super().__init__()
+        self.config = config
+
+        self._lock = threading.Lock()
+        self._armed = None  # (start_um, disp_limit_um, force_limit_n, stop_fn, check_drops) 또는 None
+        self._last_force = None
+
+        self.decision_latency = LatencyHistogram()
+        self.command_latency = LatencyHistogram()
+
+        logger.info("EmergencyStop 초기화 완료")
+
+    # ========================================================================
+    # 장착 / 해제 (GUI 스레드)
+    # ========================================================================
+
+    def arm(
+        self,
+        stop_fn: Callable,
+        start_pos_um: float,
+        displacement_limit_um: float,
+        force_limit_n: float,
+        check_force_drops: bool = True
+    ):
+        """
+        제한값과 정지 트랜잭션 장착
+
+        Args:
+            stop_fn: 정지 명령 제출 함수 (Future 또는 결과 반환)
+            start_pos_um: 시작 위치
+            displacement_limit_um: 변위 제한 (0 이하면 검사 안 함)
+            force_limit_n: 샘플 간 하중 변화량 제한 (0 이하면 검사 안 함)
+            check_force_drops: False면 하중 감소 방향 변화량은 검사 안 함 (의도적 하중 제거 구간)
+        """
+        with self._lock:
+            self._armed = (
+                float(start_pos_um),
+                float(displacement_limit_um),
+                float(force_limit_n),
+                stop_fn,
+                bool(check_force_drops)
+            )
+        logger.info(
+            f"EmergencyStop 장착 (변위 {displacement_limit_um:.1f} um, "
+            f"하중 변화 {force_limit_n:.3f} N)"
+        )
+
+    def disarm(self):
+        with self._lock:
+            was_armed = self._armed is not None
+            self._armed = None
+        if was_armed:
+            logger.info("EmergencyStop 해제")
+
+    @property
+    def is_armed(self) -> bool:
+        return self._armed is not None
+
+    # ========================================================================
+    # 샘플 검사 (워커 스레드)
+    # ========================================================================
+
+    def check_position(self, pos_um: float, timestamp_ns: int) -> bool:
+        """변위 제한 검사. 정지 명령을 제출했으면 True"""
+        armed = self._armed
+        if armed is None:
+            return False
+
+        start_um, limit_um = armed[0], armed[1]
+        if limit_um <= 0:
+            return False
+
+        displacement = abs(pos_um - start_um)
+        if displacement < limit_um - self.config.DISPLACEMENT_TOLERANCE_UM:
+            return False
+
+        return self._trip(
+            timestamp_ns,
+            f"변위 가드 발동 (긴급 정지)\n"
+            f"현재: {displacement:.1f} um\n"
+            f"제한: {limit_um:.1f} um"
+        )
+
+    def check_force(self, force_n: float, timestamp_ns: int) -> bool:
+        """샘플 간 하중 변화량 제한 검사. 정지 명령을 제출했으면 True"""
+        previous = self._last_force
+        self._last_force = force_n
+
+        armed = self._armed
+        if armed is None or previous is None:
+            return False
+
+        limit_n = armed[2]
+        if limit_n <= 0:
+            return False
+
+        delta = abs(force_n - previous)
+        if delta < limit_n:
+            return False
+        if not armed[4] and abs(force_n) < abs(previous):
+            return False
+
+        return self._trip(
+            timestamp_ns,
+            f"하중 가드 발동 (긴급 정지)\n"
+            f"변화량: {delta:.3f} N\n"
+            f"제한: {limit_n:.3f} N"
+        )
+
+    def _trip(self, timestamp_ns: int, message: str) -> bool:
+        with self._lock:
+            armed = self._armed
+            if armed is None:
+                return False  # 다른 스레드가 먼저 발동
+            self._armed = None
+        stop_fn = armed[3]
+
+        try:
+            result = stop_fn()
+        except Exception as e:
+            logger.error(f"[E-STOP] 정지 명령 제출 실패: {e}")
+            result = None
+        self.decision_latency.record(time.perf_counter_ns() - timestamp_ns)
+
+        if isinstance(result, Future):
+            result.add_done_callback(
+                lambda _f: self.command_latency.record(time.perf_counter_ns() - timestamp_ns)
+            )
+        else:
+            self.command_latency.record(time.perf_counter_ns() - timestamp_ns)
+
+        logger.warning(f"[E-STOP] {message}")
+        self.tripped.emit(message)
+        return True
+
+    def get_latency_stats(self) -> dict:
+        """지연 시간 히스토그램 요약"""
+        return {
+            'decision': self.decision_latency.summary(),
+            'command': self.command_latency.summary(),
+        }
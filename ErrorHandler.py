@@ -12,6 +12,9 @@ class ErrorHandler:
     # ===== 클래스 변수로 LanguageManager 저장 =====
     _language_manager = None
     
+    # 비동기 명령 라벨("장비.명령") 중 0점 설정 명령
+    _ZEROING_COMMANDS = frozenset({"zero_position", "write_zero_position", "send_zero_command"})
+    
     @classmethod
     def set_language_manager(cls, lang_mgr):
         """LanguageManager 설정"""
@@ -221,6 +224,22 @@ class ErrorHandler:
         # 로그에는 원본 오류 기록
         logger.error(f"[{device}] 통신 오류 - 원본: {error}")
     
+    @classmethod
+    def show_command_error(cls, label: str, error: str = "", parent=None):
+        """
+        비동기 장비 명령 실패 (label: CommandResult.label, 예: "motor.write_zero_position")
+        
+        0점 설정 명령만 영점 오류로 표시하고 나머지는 일반 명령 오류로 표시
+        """
+        if label.rsplit(".", 1)[-1] in cls._ZEROING_COMMANDS:
+            title = cls._translate("msg.zeroing_error")
+            message = cls._translate("msg.zeroing_failed_desc").format(error or label)
+        else:
+            title = cls._translate("error.command_failed")
+            message = cls._translate("error.command_failed_desc").format(label, error or "-")
+        
+        cls.show_error(title, message, parent)
+    
     @classmethod
     def show_not_connected_error(cls, device_name: str, parent=None):
         """장치 미연결 에러 (번역 지원)"""
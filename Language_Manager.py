@@ -362,6 +362,12 @@ TRANSLATIONS = {
         "KR": "{0} 통신 중 오류가 발생했습니다.\n\n오류: {1}\n\n연결 상태를 확인하세요."
     },
     
+    "error.command_failed": {"en": "Device Command Error", "KR": "장비 명령 오류"},
+    "error.command_failed_desc": {
+        "en": "Device command {0} failed.\n\nError: {1}",
+        "KR": "장비 명령 {0}이(가) 실패했습니다.\n\n오류: {1}"
+    },
+    
     "error.port_required": {"en": "Port Selection Required", "KR": "포트 선택 필요"},
     "error.select_port": {
         "en": "Please select a port or connect the device.",
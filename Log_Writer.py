@@ -0,0 +1,233 @@
+"""
+테스트 로그 기록 스레드
+GUI/수집 경로와 분리된 전용 스레드에서 로그 행을 배치 기록
+"""
+
+import os
+import csv
+import json
+import time
+import queue
+import logging
+import threading
+from Binary_Log import COLUMN_LABELS
+from config import log_writer_cfg
+
+logger = logging.getLogger(__name__)
+
+
+CSV_HEADER = list(COLUMN_LABELS)
+
+# CSV 컬럼은 그대로 두고 파단 등 이벤트는 별도 파일에 기록
+EVENTS_EXTENSION = ".events.json"
+
+
+def events_log_path(log_path: str) -> str:
+    """로그 파일 경로에 대응하는 이벤트 파일 경로"""
+    return os.path.splitext(log_path)[0] + EVENTS_EXTENSION
+
+
+def write_events(file_path: str, events: list):
+    """
+    이벤트 목록 저장 (매번 전체를 임시 파일에 쓴 뒤 교체)
+
+    각 이벤트: {'kind', 'row', 'time_s', ...}
+    row는 로그 데이터 행 인덱스 (헤더 제외, 0부터)
+    """
+    tmp_path = file_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'events': events}, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, file_path)
+
+
+def read_events(file_path: str) -> list:
+    """이벤트 파일 읽기 (없으면 빈 리스트)"""
+    if not os.path.exists(file_path):
+        return []
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f).get('events', [])
+
+
+class CsvLogSink:
+    """
+    CSV 로그 출력
+
+    행 형식: (elapsed_sec, position_um, force_n, temp_ch1 또는 None)
+    """
+
+    def __init__(self, file_path: str):
+        # 파일 열기 실패(권한 등)는 호출자에게 그대로 전달
+        self.file_path = file_path
+        self._file = open(file_path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(CSV_HEADER)
+
+    def write_rows(self, rows: list):
+        """행 배치 기록 (포맷팅은 기록 스레드에서 수행)"""
+        self._writer.writerows(
+            (
+                f"{t:.3f}",
+                f"{pos:.3f}",
+                f"{force:.3f}",
+                f"{temp:.2f}" if temp is not None else "N/A"
+            )
+            for t, pos, force, temp in rows
+        )
+
+    def flush(self):
+        self._file.flush()
+
+    def fsync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        self._file.close()
+
+
+class LogWriter:
+    """
+    비동기 로그 기록기
+
+    - submit()은 큐에 넣기만 하고 즉시 반환 (큐가 가득 차면 행 폐기)
+    - 기록 스레드가 큐를 배치 단위로 비워 모든 sink에 기록
+    - FSYNC_INTERVAL_SEC마다 fsync 체크포인트 (비정상 종료 시 손실 최소화)
+
+    Example:
+        >>> writer = LogWriter([CsvLogSink("test.csv")])
+        >>> writer.start()
+        >>> writer.submit((0.1, 12.0, 0.5, 25.0))
+        >>> writer.stop()
+    """
+
+    def __init__(self, sinks: list, config=None):
+        self.sinks = list(sinks)
+        self.cfg = config or log_writer_cfg
+
+        self._queue = queue.Queue(maxsize=self.cfg.QUEUE_MAX_ROWS)
+        self._stop_event = threading.Event()
+        self._thread = None
+
+        self.written_rows = 0
+        self.dropped_rows = 0
+        self._drop_warned = False
+
+    # ========================================================================
+    # 생산자 (GUI 스레드)
+    # ========================================================================
+
+    def start(self):
+        """기록 스레드 시작"""
+        self._thread = threading.Thread(
+            target=self._run,
+            name="LogWriter",
+            daemon=True
+        )
+        self._thread.start()
+        logger.info(f"LogWriter 시작 (sink {len(self.sinks)}개)")
+
+    def submit(self, row: tuple) -> bool:
+        """
+        행 추가 (논블로킹)
+
+        Returns:
+            큐에 들어갔으면 True, 가득 차서 폐기되었으면 False
+        """
+        try:
+            self._queue.put_nowait(row)
+            return True
+        except queue.Full:
+            self.dropped_rows += 1
+            if not self._drop_warned:
+                self._drop_warned = True
+                logger.warning("로그 큐 가득 참 - 행 폐기 시작 (디스크 기록 지연)")
+            return False
+
+    def stop(self):
+        """남은 행을 모두 기록하고 파일 닫기"""
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+        self._thread.join(self.cfg.STOP_TIMEOUT_SEC)
+        if self._thread.is_alive():
+            logger.error("LogWriter 종료 타임아웃 - 일부 행이 기록되지 않았을 수 있습니다.")
+        self._thread = None
+
+        logger.info(
+            f"LogWriter 종료 (기록: {self.written_rows}행, "
+            f"폐기: {self.dropped_rows}행)"
+        )
+
+    @property
+    def backlog(self) -> int:
+        """기록 대기 중인 행 수"""
+        return self._queue.qsize()
+
+    def get_stats(self) -> dict:
+        """기록 상태 통계"""
+        return {
+            'backlog': self.backlog,
+            'written': self.written_rows,
+            'dropped': self.dropped_rows,
+        }
+
+    # ========================================================================
+    # 소비자 (기록 스레드)
+    # ========================================================================
+
+    def _run(self):
+        """기록 스레드 루프"""
+        flush_timeout = self.cfg.FLUSH_INTERVAL_MS / 1000.0
+        last_fsync = time.monotonic()
+
+        try:
+            while True:
+                batch = self._next_batch(flush_timeout)
+                if batch:
+                    self._write_batch(batch)
+
+                now = time.monotonic()
+                if now - last_fsync >= self.cfg.FSYNC_INTERVAL_SEC:
+                    self._for_each_sink('fsync')
+                    last_fsync = now
+
+                if self._stop_event.is_set() and self._queue.empty():
+                    break
+
+        except Exception as e:
+            logger.error(f"LogWriter 기록 스레드 예외: {e}", exc_info=True)
+
+        finally:
+            self._for_each_sink('fsync')
+            self._for_each_sink('close')
+
+    def _next_batch(self, timeout: float) -> list:
+        """첫 행은 timeout까지 대기, 이후 쌓인 행은 BATCH_MAX_ROWS까지 즉시 수거"""
+        try:
+            batch = [self._queue.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+
+        while len(batch) < self.cfg.BATCH_MAX_ROWS:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write_batch(self, batch: list):
+        for sink in self.sinks:
+            try:
+                sink.write_rows(batch)
+                sink.flush()
+            except Exception as e:
+                logger.error(f"로그 기록 실패 ({len(batch)}행): {e}")
+        self.written_rows += len(batch)
+
+    def _for_each_sink(self, method: str):
+        for sink in self.sinks:
+            try:
+                getattr(sink, method)()
+            except Exception as e:
+                logger.error(f"로그 sink {method} 실패: {e}")
@@ -1,9 +1,16 @@
 # Logging_Config.py
+import os
 import logging
 import logging.handlers
 import sys
 
-def setup_logging():
+# 로그 파일 경로 (환경 변수로 변경 가능, 테스트는 임시 폴더로 지정)
+LOG_PATH_ENV = "TENSILE_TESTER_LOG"
+
+
+def setup_logging(log_path: str = None):
+    if log_path is None:
+        log_path = os.environ.get(LOG_PATH_ENV, 'app.log')
 
     # 1. 포맷터 정의 (로그 형식 설정)
     # [시간] - [로거 이름(파일)] - [레벨] - [메시지]
@@ -28,7 +35,7 @@ def setup_logging():
     # 4. 핸들러 2: 파일 핸들러 (exe 배포용)
     try:
         file_handler = logging.handlers.RotatingFileHandler(
-            'app.log',          # 로그 파일 이름
+            log_path,             # 로그 파일 이름 (기본: app.log)
             maxBytes=5*1024*1024, # 5 MB
             backupCount=2,        # 최대 2개 파일 유지 (app.log, app.log.1)
             encoding='utf-8'
@@ -38,7 +45,7 @@ def setup_logging():
         logger.addHandler(file_handler)
         
     except PermissionError:
-        print(f"[Logging_Config] 경고: app.log 파일에 대한 쓰기 권한이 없습니다. 파일 로깅을 건너뜁니다.")
+        print(f"[Logging_Config] 경고: {log_path} 파일에 대한 쓰기 권한이 없습니다. 파일 로깅을 건너뜁니다.")
     except Exception as e:
         print(f"[Logging_Config] 파일 핸들러 설정 중 오류 발생: {e}")
     
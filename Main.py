@@ -1,6 +1,5 @@
 ﻿# Main.py
 import time
-import serial
 import pymodbus
 import sys
 import logging
@@ -24,21 +23,26 @@ from PyQt5 import QtWidgets, QtCore, QtGui
 from GUI import Ui_MainWindow
 from Controller_motor import MotorService
 from Controller_Loadcell import LoadcellService
-from pymodbus.client.serial import ModbusSerialClient
+from Device_Simulator import SIM_PORT_TOOLTIP, is_sim_port, list_sim_ports
 
 # ===== 리팩토링된 모듈 임포트 =====
-from Data_Synchronizer import DataSynchronizer
 from Safety_Guard import SafetyGuard
-from Tensioning_Controller import TensioningController
 from UI_Updater import UIUpdater
-from Data_Handler import DataHandler
 from Plot_Service import PlotService
 
-from Manager_motor import MotorManager
-from Manager_loadcell import LoadcellManager
-from Manager_temp import TempManager
+# ===== 수집 런타임 공용 구성 (Acquisition_Daemon과 공용) =====
+from Acquisition_Core import (
+    DeviceConnectError, ServiceStartError, arm_emergency_stop, begin_test_safety,
+    build_acquisition, connect_loadcell, connect_motor, connect_temp, end_test_safety,
+    release_device, set_unloading, stop_motor
+)
+from Acquisition_Daemon import DaemonClient
+from Daemon_Attach import DaemonAttachment
 
+from Async_Command import CommandSequence
 from Basic_Test import BasicTest
+from Rate_Controller import RateController
+from Profile_Test import ProfileSequencer, load_profile
 from Ui_Binding import bind_main_signals
 from Speed_Controller import SpeedController
 
@@ -50,7 +54,7 @@ from AboutDialog import AboutDialog
 from Language_Manager import LanguageManager
 
 # ===== config.py 임포트 =====
-from config import motor_cfg, loadcell_cfg, temp_cfg, monitor_cfg, safety_cfg
+from config import motor_cfg, loadcell_cfg, temp_cfg, monitor_cfg, safety_cfg, rate_control_cfg, profile_cfg, sim_cfg, daemon_cfg
 
 try:
     from Pretension_Test import PretensionTest
@@ -120,7 +124,10 @@ class MainWindow(QtWidgets.QMainWindow):
                 return
 
             logger.info(f"[INFO] CDL Zeroing 요청...")
-            self.loadcell_manager.zero_calibration()
+            # CDL은 로드셀 워커에서 실행, 적용 대기는 타이머 (측정/워커 가드 중단 없음)
+            self.lc_zero_sequence.start([
+                ("send_zero_command", self.loadcell_manager.zero_calibration, loadcell_cfg.ZERO_SETTLE_MS),
+            ])
         
         except Exception as e:
             logger.error(f"[ERR] Zeroing 실패: {e}")
@@ -131,10 +138,24 @@ class MainWindow(QtWidgets.QMainWindow):
             )
 
     def on_zero_encoder_clicked(self):
-        if self.motor_manager.is_connected():
-            self.motor_manager.controller.zero_position()
-        else:
+        if not self.motor_manager.is_connected():
             ErrorHandler.show_not_connected_error("Motor", self)
+            return
+        
+        # 정지(SAFETY 우선순위) → 대기 → 0점 쓰기 + 커맨드8 → 적용 대기
+        # 각 명령은 버스 스레드에서 짧게 끝나고 대기는 타이머이므로
+        # 그 사이 워커 긴급 정지와 온도 폴링이 버스를 계속 사용할 수 있다.
+        motor = self.motor_manager.controller
+        self.motor_zero_sequence.start([
+            ("stop", motor.stop_async, motor_cfg.ZERO_STOP_SETTLE_MS),
+            ("write_zero_position", motor.write_zero_position_async, motor_cfg.ZERO_SETTLE_MS),
+        ])
+
+    def _on_device_command_finished(self, result):
+        """비동기 장비 명령(0점 설정 등) 실패 시 알림 (메시지는 명령 라벨로 선택)"""
+        if result.ok:
+            return
+        ErrorHandler.show_command_error(result.label, result.error, self)
 
     def on_reset_clicked(self):
         """Reset 버튼 클릭 시: 가드 리셋 + 모터 원점 복귀"""
@@ -190,7 +211,11 @@ class MainWindow(QtWidgets.QMainWindow):
         if self.pretension_test:
             self.pretension_test.stop()
 
-    def __init__(self):
+    def __init__(self, daemon_client: DaemonClient = None):
+        """
+        Args:
+            daemon_client: 접속된 DaemonClient (attach 모드: 장비/안전 경로/로그는 수집 데몬이 소유)
+        """
         super().__init__()
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
@@ -233,30 +258,40 @@ class MainWindow(QtWidgets.QMainWindow):
         # Safety Guard
         self.safety_guard = SafetyGuard(self.ui, safety_cfg)
         
-        # Data Synchronizer
-        self.data_synchronizer = DataSynchronizer(buffer_size=100)
-        
-        # Tensioning Controller
-        self.tensioning = TensioningController()
-        
-        # ===== 2. DataHandler 생성 (모든 의존성 주입) =====
-        self.data_handler = DataHandler(
-            ui_updater=self.ui_updater,
+        # ===== 2. 안전 경로 + DataHandler + Manager 구성 (데몬과 공용) =====
+        stack = build_acquisition(
             safety_guard=self.safety_guard,
-            synchronizer=self.data_synchronizer,
-            tensioning=self.tensioning,
+            ui_updater=self.ui_updater,
             data_receiver=self.plot_service,
-            stop_callback=self._stop_all_tests
-        ) 
-        
-        # ===== 3. Manager 생성 =====
-        self.motor_manager = MotorManager(data_handler=self.data_handler)
-        self.loadcell_manager = LoadcellManager(data_handler=self.data_handler)
-        self.temp_manager = TempManager(
-            self.ui, 
+            stop_callback=self._stop_all_tests,
+            ui=self.ui,
             plot_service=self.plot_service,
-            data_handler=self.data_handler
+            capture_metadata={
+                'loadcell_streaming': loadcell_cfg.STREAMING_ENABLED,
+                'loadcell_frame_size': loadcell_cfg.STREAM_FRAME_SIZE,
+            }
         )
+        self.emergency_stop = stack.emergency_stop
+        self.data_synchronizer = stack.synchronizer
+        self.tensioning = stack.tensioning
+        self.data_handler = stack.data_handler
+        self.stream_capture = stack.stream_capture
+        self.motor_manager = stack.motor_manager
+        self.loadcell_manager = stack.loadcell_manager
+        self.temp_manager = stack.temp_manager
+        
+        # Emergency Stop (워커 스레드에서 제한 검사 → 즉시 모터 정지)
+        self.emergency_stop.tripped.connect(self._on_emergency_stop)
+        
+        # 시험 중 제한값을 바꾸면 워커 쪽 긴급 정지 단계도 새 값으로 다시 장착
+        # (SafetyGuard 스냅샷 갱신 슬롯이 먼저 연결되어 있으므로 그 뒤에 실행됨)
+        for spin in (self.ui.DisplaceLimitMax_doubleSpinBox, self.ui.ForceLimitMax_doubleSpinBox):
+            spin.valueChanged.connect(self._on_safety_limits_changed)
+        
+        # 0점 설정 시퀀스 (명령 사이 대기는 GUI 스레드 타이머 - I/O 스레드를 점유하지 않음)
+        self.motor_zero_sequence = CommandSequence("motor.zero", self)
+        self.lc_zero_sequence = CommandSequence("loadcell.zero", self)
+        
         # ===== 메뉴 버튼 연결 =====
         if hasattr(self.ui, 'font_menu_btn'):
             self.ui.font_menu_btn.clicked.connect(self.show_font_menu)
@@ -322,9 +357,10 @@ class MainWindow(QtWidgets.QMainWindow):
         # ===== 버튼 연결 =====
         self.ui.Load0_pushButton.clicked.connect(self.on_lc_set_clicked)
 
-        # ===== Modbus 클라이언트 (Manager가 관리) =====
+        # ===== 포트 객체 (Manager가 관리, 연결 해제 시 release_device로 닫음) =====
         self.motor_client = None
         self.temp_client = None
+        self.loadcell_serial = None
         
         # ===== 하위 호환성 속성 (Deprecated) =====
         self.motor = None
@@ -341,6 +377,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # ===== Pretension Test =====
         self.pretension_test = None
+        self.profile_sequencer = None
 
         # ===== SpinBox 접미사 제거 =====
         try:
@@ -406,11 +443,21 @@ class MainWindow(QtWidgets.QMainWindow):
         # ===== 저장된 안전 제한값 복원 =====
         self._restore_safety_limits()
 
+        # ===== attach 모드: 버튼/상태/샘플을 수집 데몬으로 연결 =====
+        self.daemon_link = None
+        if daemon_client is not None:
+            self.daemon_link = DaemonAttachment(self, daemon_client)
+            self.daemon_link.bind()
+
     def closeEvent(self, event):
         """프로그램 종료 시 설정 저장 및 모든 서비스 정리"""
         try:
             logger.info("[CLOSE] 프로그램 종료 시작")
             
+            # attach 모드: 데몬 접속만 끊음 (데몬의 수집/로그는 계속)
+            if getattr(self, 'daemon_link', None):
+                self.daemon_link.close()
+            
             # 1. 온도 제어 정지
             self._stop_temp_control_safely()
         
@@ -456,6 +503,9 @@ class MainWindow(QtWidgets.QMainWindow):
                 except Exception as e:
                     logger.error(f"[CLOSE] Motor 클라이언트 종료 실패: {e}")
         
+            if hasattr(self, 'stream_capture'):
+                self.stream_capture.close()
+        
             # 4. 설정 저장
             try:
                 self.settings_mgr.save_window_geometry(self.saveGeometry())
@@ -748,6 +798,9 @@ class MainWindow(QtWidgets.QMainWindow):
                 logger.info(f"하중 제한값 복원: {force_limit} N")
         except Exception as e:
             logger.error(f"안전 제한값 복원 실패: {e}")
+        
+        # 값이 같아 valueChanged가 오지 않은 경우에도 가드 스냅샷 동기화
+        self.safety_guard.refresh_from_ui()
 
     def on_basic_test_start(self):
         logger.info("[TEST] 'Start' 버튼 클릭됨")
@@ -758,10 +811,22 @@ class MainWindow(QtWidgets.QMainWindow):
         if not self.basic_test or not self.motor_manager.is_connected():
             ErrorHandler.show_not_connected_error("Motor", self)
             return
+        
+        # 프로파일이 지정되어 있으면 단순 당김 대신 프로파일 실행
+        profile = None
+        if profile_cfg.PROFILE_PATH and self.profile_sequencer:
+            try:
+                profile = load_profile(profile_cfg.PROFILE_PATH)
+            except (OSError, ValueError) as e:
+                logger.error(f"[TEST] 프로파일 로드 실패: {e}")
+                ErrorHandler.show_error("프로파일 오류", str(e), self)
+                return
             
         if self.plot_service:
             try:
-                success = self.plot_service.start_plotting()
+                success = self.plot_service.start_plotting(
+                    metadata=self._collect_test_metadata()
+                )
                 if not success:
                     logger.info("[TEST] PlotService 시작 취소됨.")
                     return 
@@ -777,24 +842,73 @@ class MainWindow(QtWidgets.QMainWindow):
             logger.warning("[TEST] PlotService가 초기화되지 않았습니다.")
 
         try:
+            if profile is not None:
+                # 하중 제거 단계 동안의 검사 중지는 unloading_changed에서 단계별로 처리
+                begin_test_safety(self.data_handler)
+                if not self.profile_sequencer.start(profile):
+                    # 시작 거부 (로드셀 샘플 없음/끊김) - finished 처리에서 정리·안내
+                    return
+                self._arm_emergency_stop()
+                logger.info("[TEST] 프로파일 시작 완료")
+                return
+            begin_test_safety(self.data_handler)
             self.basic_test.start()
+            self._arm_emergency_stop()
             logger.info("[TEST] BasicTest.start() 호출 완료")
         except Exception as e:
             logger.error(f"[TEST] BasicTest.start() 예외: {e}")
 
+    def _on_profile_finished(self, completed: bool, reason: str):
+        """프로파일이 스스로 끝난 경우 (완료 / 단계 시간 초과 / 샘플 끊김 / 시작 거부) 정리"""
+        self._stop_all_tests(reason=f"프로파일 종료: {reason}")
+        if completed:
+            ErrorHandler.show_success("완료", "시험 프로파일 완료", self)
+        else:
+            ErrorHandler.show_warning("프로파일 중단", reason, self)
+
+    def _on_profile_unloading_changed(self, unloading: bool):
+        """하중 제거 단계 동안만 파단 감지 / 하중 감소 검사 중지 (워커 긴급 정지 포함)"""
+        set_unloading(self.data_handler, unloading)
+        if self.emergency_stop.is_armed:
+            self._arm_emergency_stop()
+
+    def _collect_test_metadata(self) -> dict:
+        """테스트 로그에 함께 저장할 시험 조건"""
+        meta = {}
+        try:
+            rps = float(self.speed_controller.get_run_speed())
+            lead = float(self.speed_controller.lead_mm_per_rev)
+            meta['speed_rps'] = rps
+            meta['lead_mm_per_rev'] = lead
+            meta['rate_um_s'] = rps * lead * motor_cfg.UM_PER_MM
+            meta['displacement_limit_mm'] = float(self.ui.DisplaceLimitMax_doubleSpinBox.value())
+            meta['force_limit_n'] = float(self.ui.ForceLimitMax_doubleSpinBox.value())
+            if rate_control_cfg.ENABLED:
+                meta['rate_control_mode'] = rate_control_cfg.MODE
+                meta['rate_control_target'] = rate_control_cfg.TARGET_RATE
+        except Exception as e:
+            logger.warning(f"테스트 메타데이터 수집 실패: {e}")
+        return meta
+
     def _stop_all_tests(self, reason="Unknown"):
         """[중앙 정지] 테스트, 모터, 플로팅, 온도 제어를 모두 중지"""
         logger.info(f"[TEST_CONTROL] 모든 작업 중지 시도. 사유: {reason}")
         
-        # ===== 추가: 온도 제어 정지 =====
-        self._stop_temp_control_safely()
+        # 긴급 정지 해제, 파단 감지 끄기, 프로파일이 중지했던 하중 감소 검사 복구
+        end_test_safety(self.emergency_stop, self.data_handler)
 
-        if self.motor_manager.is_connected():
+        # 프로파일이 다음 구간 명령을 내지 않도록 먼저 중단
+        if self.profile_sequencer:
             try:
-                self.motor_manager.controller.stop_motor()
-                logger.info("[TEST_CONTROL] 하드웨어 모터 정지 완료")
+                self.profile_sequencer.stop(reason=reason)
             except Exception as e:
-                logger.error(f"[TEST_CONTROL] motor.stop_motor() 예외: {e}")
+                logger.error(f"[TEST_CONTROL] profile_sequencer.stop() 예외: {e}")
+
+        # 모터를 가장 먼저 정지 (온도 제어 정지 통신이 앞을 막지 않도록)
+        stop_motor(self.motor_manager)
+
+        # ===== 추가: 온도 제어 정지 =====
+        self._stop_temp_control_safely()
 
         if self.basic_test:
             try:
@@ -814,6 +928,31 @@ class MainWindow(QtWidgets.QMainWindow):
             except Exception as e:
                 logger.error(f"[TEST_CONTROL] plot_service.stop_plotting() 예외: {e}")
 
+    def _arm_emergency_stop(self):
+        """테스트 시작 시 현재 제한값으로 긴급 정지 단계 장착"""
+        try:
+            arm_emergency_stop(
+                self.emergency_stop, self.safety_guard, self.data_handler,
+                self.motor_manager.controller
+            )
+        except Exception as e:
+            logger.error(f"[E-STOP] 긴급 정지 장착 실패: {e}")
+
+    def _on_safety_limits_changed(self, _value=None):
+        """장착 중이면 바뀐 제한값으로 다시 장착"""
+        if self.emergency_stop.is_armed:
+            self._arm_emergency_stop()
+
+    def _on_emergency_stop(self, message: str):
+        """워커 스레드에서 정지 명령을 이미 보낸 뒤 GUI 쪽 정리"""
+        stats = self.emergency_stop.get_latency_stats()
+        logger.warning(
+            f"[E-STOP] 정지 지연 - 판단: {stats['decision']['max_us']} us, "
+            f"명령 완료: {stats['command']['max_us']} us "
+            f"(누적 {stats['decision']['count']}회, p99 {stats['command']['p99_us']} us)"
+        )
+        self._stop_all_tests(reason=message)
+
     def on_basic_test_stop(self):
         """Test 패널의 Stop 버튼"""
         self._stop_all_tests(reason="사용자 Stop 버튼 클릭")
@@ -934,7 +1073,7 @@ class MainWindow(QtWidgets.QMainWindow):
             logger.error(f"포트 복원 실패: {e}")
 
     def refresh_com_ports(self):
-        ports = [p.device for p in list_ports.comports()]
+        ports = [p.device for p in list_ports.comports()] + list_sim_ports()
         logger.debug(f"[REFRESH] start, found ports: {ports}")
 
         def _fill(combo: QtWidgets.QComboBox, tag: str):
@@ -947,6 +1086,9 @@ class MainWindow(QtWidgets.QMainWindow):
             combo.clear()
             if ports:
                 combo.addItems(ports)
+                for i, port in enumerate(ports):
+                    if is_sim_port(port):
+                        combo.setItemData(i, SIM_PORT_TOOLTIP, QtCore.Qt.ToolTipRole)
                 if prev in ports:
                     combo.setCurrentText(prev)
             combo.blockSignals(False)
@@ -995,107 +1137,29 @@ class MainWindow(QtWidgets.QMainWindow):
         except ValueError:
             baud = motor_cfg.DEFAULT_BAUDRATE
 
-        # 클라이언트 객체 생성
-        self.motor_client = ModbusSerialClient(
-            port=port_text, 
-            baudrate=baud, 
-            bytesize=8, 
-            parity='N', 
-            stopbits=1, 
-            timeout=motor_cfg.DEFAULT_TIMEOUT
-        )
-
-        ok, err = False, None
+        # 포트 열기 + Handshake + MotorManager 시작 (같은 포트의 온도 제어기와 버스 공유)
         try:
-            if self.motor_client.connect():
-                logger.info("[MOTOR] Handshake 시도...")
-                
-                chk = self.motor_client.read_holding_registers(
-                    address=motor_cfg.ADDR_POSITION_HI, 
-                    count=2, 
-                    device_id=motor_cfg.DEFAULT_UNIT_ID
-                )
-                
-                if chk.isError():
-                    ok = False
-                    err = f"Modbus Error: {chk}"
-                    logger.error(f"[MOTOR] Handshake 실패: {chk}")
-                    self.motor_client.close()
-                else:
-                    ok = True
-                    logger.info(f"[MOTOR] Handshake 성공. Registers: {chk.registers}")
-            else:
-                ok = False
-
-        except Exception as e:
-            err = str(e)
-            ok = False
-            if self.motor_client:
-                self.motor_client.close()
-
-        logger.info(f"[MOTOR] Connect → {port_text} @ {baud} : {ok}")
-
-        if ok:
-            success = self.motor_manager.start_service(
-                client=self.motor_client,
-                unit_id=motor_cfg.DEFAULT_UNIT_ID,
-                interval_ms=self.monitor_interval_ms
+            self.motor_client = connect_motor(
+                self.motor_manager, port_text, baud, self.monitor_interval_ms
             )
-            
-            if success:
-                # 하위 호환성 유지
-                self.motor = self.motor_manager.controller
-                self.motor_monitor = self.motor_manager.monitor
-                
-                self.speed_controller.set_motor(self.motor)
-                self.basic_test = BasicTest(self.motor, self.speed_controller.get_run_speed)
-
-                if PretensionTest:
-                    self.pretension_test = PretensionTest(
-                        motor_service=self.motor,
-                        loadcell_service=self.loadcell_service,
-                        data_handler=self.data_handler
-                    )
-                    self.pretension_test.finished.connect(
-                        lambda: ErrorHandler.show_success(
-                            "완료", 
-                            "초기 하중 설정 및 모터 0점 설정",
-                            self
-                        )
-                    )
-
-                # ===== 연결 성공 시 포트/보드레이트 저장 =====
-                self.settings_mgr.save_motor_port(port_text)
-                self.settings_mgr.save_motor_baudrate(baud)
-
-                if hasattr(self.ui, "progressBar"): 
-                    self.ui.progressBar.setValue(100)
-                
-                ErrorHandler.show_success(
-                    ErrorHandler._translate("success.connected"),
-                    ErrorHandler._translate("success.connected_desc").format("Motor", port_text),
-                    self
-                )
-                
-                if hasattr(self.ui, "Comdisconnect_pushButton"):
-                    self.ui.Comdisconnect_pushButton.setEnabled(True)
-                if hasattr(self.ui, "Comconnect_pushButton"):
-                    self.ui.Comconnect_pushButton.setEnabled(False)
-            else:
-                logger.error("MotorManager 서비스 시작 실패")
-                if hasattr(self.ui, "progressBar"): 
-                    self.ui.progressBar.setValue(0)
-                ErrorHandler.show_warning(
-                    ErrorHandler._translate("success.service_failed"),
-                    ErrorHandler._translate("success.service_failed_desc").format("Motor"),
-                    self
-                )
-        else:
-            logger.error(f"모터 연결 실패: {port_text} @ {baud}\n{err or ''}")
+        except ServiceStartError as e:
+            logger.error(f"MotorManager 서비스 시작 실패: {e}")
+            self.motor_client = None
+            if hasattr(self.ui, "progressBar"): 
+                self.ui.progressBar.setValue(0)
+            ErrorHandler.show_warning(
+                ErrorHandler._translate("success.service_failed"),
+                ErrorHandler._translate("success.service_failed_desc").format("Motor"),
+                self
+            )
+            return
+        except DeviceConnectError as e:
+            logger.error(f"모터 연결 실패: {port_text} @ {baud}\n{e}")
+            self.motor_client = None
             if hasattr(self.ui, "progressBar"): 
                 self.ui.progressBar.setValue(0)
             
-            ErrorHandler.show_connection_error("Motor", port_text, err or "", self)
+            ErrorHandler.show_connection_error("Motor", port_text, str(e), self)
             
             if hasattr(self.ui, "Comconnect_pushButton"):
                 self.ui.Comconnect_pushButton.setEnabled(True)
@@ -1105,6 +1169,68 @@ class MainWindow(QtWidgets.QMainWindow):
             self.motor = None
             self.basic_test = None
             self.speed_controller.set_motor(None)
+            return
+
+        logger.info(f"[MOTOR] Connect → {port_text} @ {baud} : True")
+
+        # 하위 호환성 유지
+        self.motor = self.motor_manager.controller
+        self.motor_monitor = self.motor_manager.monitor
+        
+        self.speed_controller.set_motor(self.motor)
+        self.motor.signals.finished.connect(self._on_device_command_finished)
+        rate_controller = None
+        if rate_control_cfg.ENABLED:
+            rate_controller = RateController(
+                self.motor,
+                self.data_synchronizer,
+                self.speed_controller.umsec_to_rps,
+                rate_control_cfg
+            )
+        self.basic_test = BasicTest(
+            self.motor,
+            self.speed_controller.get_run_speed,
+            rate_controller=rate_controller
+        )
+        self.profile_sequencer = ProfileSequencer(
+            self.motor,
+            self.data_handler,
+            self.speed_controller.get_run_speed
+        )
+        self.profile_sequencer.finished.connect(self._on_profile_finished)
+        self.profile_sequencer.unloading_changed.connect(self._on_profile_unloading_changed)
+
+        if PretensionTest:
+            self.pretension_test = PretensionTest(
+                motor_service=self.motor,
+                loadcell_service=self.loadcell_service,
+                data_handler=self.data_handler
+            )
+            self.pretension_test.finished.connect(
+                lambda: ErrorHandler.show_success(
+                    "완료", 
+                    "초기 하중 설정 및 모터 0점 설정",
+                    self
+                )
+            )
+
+        # ===== 연결 성공 시 포트/보드레이트 저장 =====
+        self.settings_mgr.save_motor_port(port_text)
+        self.settings_mgr.save_motor_baudrate(baud)
+
+        if hasattr(self.ui, "progressBar"): 
+            self.ui.progressBar.setValue(100)
+        
+        ErrorHandler.show_success(
+            ErrorHandler._translate("success.connected"),
+            ErrorHandler._translate("success.connected_desc").format("Motor", port_text),
+            self
+        )
+        
+        if hasattr(self.ui, "Comdisconnect_pushButton"):
+            self.ui.Comdisconnect_pushButton.setEnabled(True)
+        if hasattr(self.ui, "Comconnect_pushButton"):
+            self.ui.Comconnect_pushButton.setEnabled(False)
 
     def _check_motor_monitoring(self):
         """모니터링 상태 디버깅"""
@@ -1130,24 +1256,19 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def on_com_disconnect_motor(self):
         self._stop_all_tests(reason="모터 연결 해제")
+        self.motor_zero_sequence.cancel()
 
-        self.motor_manager.stop_service()
+        release_device(self.motor_manager, self.motor_client)
+        self.motor_client = None
         
         # 하위 호환성 유지
         self.motor = None
         self.motor_monitor = None
         self.basic_test = None
         self.pretension_test = None
+        self.profile_sequencer = None
         self.speed_controller.set_motor(None)
 
-        if self.motor_client:
-            try:
-               self.motor_client.close()
-            except Exception as e:
-                logger.error(f"클라이언트 종료 실패: {e}")
-            finally:
-                self.motor_client = None
-
         if hasattr(self.ui, "progressBar"): 
             self.ui.progressBar.setValue(0)
         
@@ -1186,122 +1307,83 @@ class MainWindow(QtWidgets.QMainWindow):
         except ValueError:
             baud = loadcell_cfg.DEFAULT_BAUDRATE
 
-        # ===== Serial 객체 생성 (Main.py에서 직접 관리) =====
-        self.loadcell_serial = serial.Serial()
-        self.loadcell_serial.port = port_text
-        self.loadcell_serial.baudrate = baud
-        self.loadcell_serial.parity = loadcell_cfg.DEFAULT_PARITY
-        self.loadcell_serial.bytesize = loadcell_cfg.DEFAULT_BYTESIZE
-        self.loadcell_serial.stopbits = loadcell_cfg.DEFAULT_STOPBITS
-        self.loadcell_serial.timeout = loadcell_cfg.DEFAULT_TIMEOUT
-
-        ok = False
-        
+        # ===== 포트 열기 + Handshake + LoadcellManager 시작 (SIM: 포트는 가상 장비) =====
         try:
-            # ===== 포트 열기 =====
-            self.loadcell_serial.open()
-            logger.info(f"[LC] 포트 열림: {port_text} @ {baud}")
-            logger.info(f"[LC] Connect → {port_text} @ {baud} : {ok}")
-
-            # ===== Handshake 검증 =====
-            from Controller_Loadcell import verify_loadcell_connection
-            ok, err = verify_loadcell_connection(self.loadcell_serial)
-
-        except serial.SerialException as e:
-            err = f"시리얼 포트 오류: {e}"
-            ok = False
-            logger.error(f"[LC] 연결 실패: {err}")
-            if self.loadcell_serial.is_open:
-                self.loadcell_serial.close()
-    
-        except Exception as e:
-            err = f"예상치 못한 오류: {e}"
-            ok = False
-            logger.error(f"[LC] 연결 실패: {err}", exc_info=True)
-            if self.loadcell_serial and self.loadcell_serial.is_open:
-                self.loadcell_serial.close()
-
-        logger.info(f"[LC] Connect → {port_text} @ {baud} : {ok}")
-
-        if ok:
-            # ===== Manager 시작 (Serial 객체 전달) =====
-            success = self.loadcell_manager.start_service(
-            serial_port=self.loadcell_serial,
-            interval_ms=self.monitor_interval_ms
-        )
+            self.loadcell_serial = connect_loadcell(
+                self.loadcell_manager, port_text, baud, self.monitor_interval_ms
+            )
+        except ServiceStartError as e:
+            logger.error(f"LoadcellManager 서비스 시작 실패: {e}")
+            self.loadcell_serial = None
             
-            if success:
-                # 하위 호환성 유지
-                self.loadcell_service = self.loadcell_manager.controller
-                self.lc_monitor = self.loadcell_manager.monitor
-
-                # ===== 연결 성공 시 포트/보드레이트 저장 =====
-                self.settings_mgr.save_loadcell_port(port_text)
-                self.settings_mgr.save_loadcell_baudrate(baud)
-
-                if hasattr(self.ui, "progressBar_2"): 
-                    self.ui.progressBar_2.setValue(100)
-                
-                ErrorHandler.show_success(
-                    ErrorHandler._translate("success.connected"),
-                    ErrorHandler._translate("success.connected_desc").format("LoadCell", port_text),
-                    self
-                )
-                
-                if hasattr(self.ui, "Comdisconnect_pushButton_2"):
-                    self.ui.Comdisconnect_pushButton_2.setEnabled(True)
-                if hasattr(self.ui, "Comconnect_pushButton_2"):
-                    self.ui.Comconnect_pushButton_2.setEnabled(False)
-            else:
-                logger.error("LoadcellManager 서비스 시작 실패")
-                self.loadcell_serial.close()
-                self.loadcell_serial = None
-                
-                if hasattr(self.ui, "progressBar_2"): 
-                    self.ui.progressBar_2.setValue(0)
-                
-                ErrorHandler.show_warning(
-                    "서비스 실패",
-                    f"로드셀 서비스 시작 실패",
-                    self
-                )
-        else:
-            logger.error(f"[LC] Handshake 실패: {port_text} @ {baud}")
+            if hasattr(self.ui, "progressBar_2"): 
+                self.ui.progressBar_2.setValue(0)
+            
+            ErrorHandler.show_warning(
+                "서비스 실패",
+                f"로드셀 서비스 시작 실패",
+                self
+            )
+            return
+        except DeviceConnectError as e:
+            logger.error(f"[LC] Handshake 실패: {port_text} @ {baud} ({e})")
+            self.loadcell_serial = None
             if hasattr(self.ui, "progressBar_2"): 
                 self.ui.progressBar_2.setValue(0)
         
             ErrorHandler.show_warning(
-            ErrorHandler._translate("success.service_failed"),
-            ErrorHandler._translate("success.service_failed_desc").format("Loadcell"),
-            self
-        )
+                ErrorHandler._translate("success.service_failed"),
+                ErrorHandler._translate("success.service_failed_desc").format("Loadcell"),
+                self
+            )
             
             if hasattr(self.ui, "Comconnect_pushButton_2"):
                 self.ui.Comconnect_pushButton_2.setEnabled(True)
             if hasattr(self.ui, "Comdisconnect_pushButton_2"):
                 self.ui.Comdisconnect_pushButton_2.setEnabled(False)
-            
-            self.loadcell_serial = None
+            return
+
+        logger.info(f"[LC] Connect → {port_text} @ {baud} : True")
+
+        # 하위 호환성 유지
+        self.loadcell_service = self.loadcell_manager.controller
+        self.lc_monitor = self.loadcell_manager.monitor
+        self.loadcell_service.signals.finished.connect(self._on_device_command_finished)
+        
+        # 모터를 먼저 연결한 경우에도 Pre-Tension이 새 로드셀을 사용하도록
+        if self.pretension_test:
+            self.pretension_test.lc_service = self.loadcell_service
+
+        # ===== 연결 성공 시 포트/보드레이트 저장 =====
+        self.settings_mgr.save_loadcell_port(port_text)
+        self.settings_mgr.save_loadcell_baudrate(baud)
+
+        if hasattr(self.ui, "progressBar_2"): 
+            self.ui.progressBar_2.setValue(100)
+        
+        ErrorHandler.show_success(
+            ErrorHandler._translate("success.connected"),
+            ErrorHandler._translate("success.connected_desc").format("LoadCell", port_text),
+            self
+        )
+        
+        if hasattr(self.ui, "Comdisconnect_pushButton_2"):
+            self.ui.Comdisconnect_pushButton_2.setEnabled(True)
+        if hasattr(self.ui, "Comconnect_pushButton_2"):
+            self.ui.Comconnect_pushButton_2.setEnabled(False)
 
     def on_com_disconnect_lc(self):
         self._stop_all_tests(reason="로드셀 연결 해제")
+        self.lc_zero_sequence.cancel()
 
-        self.loadcell_manager.stop_service()
+        # ===== 서비스 중지 + Serial 포트 종료 =====
+        release_device(self.loadcell_manager, self.loadcell_serial)
+        self.loadcell_serial = None
         
         # 하위 호환성 유지
         self.loadcell_service = None
         self.lc_monitor = None
             
-        # ===== Serial 객체 종료 (Main.py에서 직접 관리) =====
-        if self.loadcell_serial:
-            try:
-                self.loadcell_serial.close()
-                logger.info("[LC] Serial 포트 종료 완료")
-            except Exception as e:
-                logger.error(f"Serial 포트 종료 실패: {e}")
-            finally:
-                self.loadcell_serial = None
-            
         if hasattr(self.ui, "progressBar_2"):
             self.ui.progressBar_2.setValue(0)
 
@@ -1388,76 +1470,42 @@ class MainWindow(QtWidgets.QMainWindow):
         except ValueError:
             baud = temp_cfg.DEFAULT_BAUDRATE
 
-        self.temp_client = ModbusSerialClient(
-            port=port_text, 
-            baudrate=baud, 
-            bytesize=8, 
-            parity=temp_cfg.DEFAULT_PARITY, 
-            stopbits=1, 
-            timeout=temp_cfg.DEFAULT_TIMEOUT
-        )
-
-        ok, err = False, None
-
+        # 포트 열기 + Handshake + TempManager 시작
         try:
-            if self.temp_client.connect():
-                logger.info(f"[TEMP] 연결 시도 중... (Port: {port_text})")
-                
-                chk = self.temp_client.read_input_registers(address=0x0066, count=1, device_id=1)
-                
-                if chk.isError():
-                    ok = False
-                    err = f"Modbus Error: {chk}"
-                    logger.error(f"[TEMP] Handshake 실패: {err}")
-                    self.temp_client.close()
-                else:
-                    ok = True
-                    logger.info(f"[TEMP] Handshake 성공. 데이터: {chk.registers}")
-            else:
-                ok = False
-                err = "Could not open port"
-
-        except Exception as e:
-            ok = False
-            err = str(e)
-            if self.temp_client:
-                self.temp_client.close()
-
-        if ok:
-            if hasattr(self, 'temp_manager'):
-                success = self.temp_manager.start_service(
-                    self.temp_client, 
-                    monitor_cfg.DEFAULT_INTERVAL_MS
-                )
-                
-                if success:
-                    logger.info(f"[TEMP] 연결 성공: {port_text}")
-                    
-                    # ===== 연결 성공 시 포트/보드레이트 저장 =====
-                    self.settings_mgr.save_temp_port(port_text)
-                    self.settings_mgr.save_temp_baudrate(baud)
-                    
-                    ErrorHandler.show_success(
-                        ErrorHandler._translate("success.connected"),
-                        ErrorHandler._translate("success.connected_desc").format("Temp Controller", port_text),
-                        self
-                    )
-                    
-                    if hasattr(self.ui, "Comdisconnect_pushButton_3"):
-                        self.ui.Comdisconnect_pushButton_3.setEnabled(True)
-                    if hasattr(self.ui, "Comconnect_pushButton_3"):
-                        self.ui.Comconnect_pushButton_3.setEnabled(False)
-                else:
-                    logger.error("TempManager 서비스 시작 실패")
-                    ErrorHandler.show_warning(
-                        ErrorHandler._translate("success.service_failed"),
-                        ErrorHandler._translate("success.service_failed_desc").format("Temp Controller"),
-                        self
-                    )
-        else:
-            logger.error(f"[TEMP] 연결 실패: {err}")
-            ErrorHandler.show_connection_error("Temp Controller", port_text, err, self)
+            self.temp_client = connect_temp(
+                self.temp_manager, port_text, baud, monitor_cfg.DEFAULT_INTERVAL_MS
+            )
+        except ServiceStartError as e:
+            logger.error(f"TempManager 서비스 시작 실패: {e}")
+            self.temp_client = None
+            ErrorHandler.show_warning(
+                ErrorHandler._translate("success.service_failed"),
+                ErrorHandler._translate("success.service_failed_desc").format("Temp Controller"),
+                self
+            )
+            return
+        except DeviceConnectError as e:
+            logger.error(f"[TEMP] 연결 실패: {e}")
+            ErrorHandler.show_connection_error("Temp Controller", port_text, str(e), self)
             self.temp_client = None
+            return
+
+        logger.info(f"[TEMP] 연결 성공: {port_text}")
+        
+        # ===== 연결 성공 시 포트/보드레이트 저장 =====
+        self.settings_mgr.save_temp_port(port_text)
+        self.settings_mgr.save_temp_baudrate(baud)
+        
+        ErrorHandler.show_success(
+            ErrorHandler._translate("success.connected"),
+            ErrorHandler._translate("success.connected_desc").format("Temp Controller", port_text),
+            self
+        )
+        
+        if hasattr(self.ui, "Comdisconnect_pushButton_3"):
+            self.ui.Comdisconnect_pushButton_3.setEnabled(True)
+        if hasattr(self.ui, "Comconnect_pushButton_3"):
+            self.ui.Comconnect_pushButton_3.setEnabled(False)
 
     def on_com_disconnect_temp(self):
         """온도 제어기 연결 해제 (제어 정지 포함)"""
@@ -1474,15 +1522,9 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _finalize_temp_disconnect(self):
         """온도 제어기 연결 해제 완료"""
-        try:
-            if self.temp_client:
-                self.temp_client.close()
-                logger.info("[TEMP_DISCONNECT] Modbus 클라이언트 종료 완료")
-        except Exception as e:
-            logger.error(f"[TEMP_DISCONNECT] close 예외: {e}")
-        
+        release_device(self.temp_manager, self.temp_client)
         self.temp_client = None
-        self.temp_manager.stop_service()
+        logger.info("[TEMP_DISCONNECT] Modbus 클라이언트 종료 완료")
 
         logger.info("온도 제어기 연결을 해제했습니다.")
         ErrorHandler.show_info(
@@ -1503,7 +1545,20 @@ class MainWindow(QtWidgets.QMainWindow):
             self.ui.temp_stop_btn.setEnabled(False)
 
 if __name__ == "__main__":
-    app = QtWidgets.QApplication(sys.argv)
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="인장 시험기 GUI", add_help=False)
+    # --sim: COM 포트 목록에 가상 장비(SIM:) 표시 (교육/부하 시험용, 기본 꺼짐)
+    parser.add_argument("--sim", action="store_true")
+    # --attach [이름]: 장비를 직접 열지 않고 실행 중인 수집 데몬(Acquisition_Daemon.py)에 붙음
+    parser.add_argument("--attach", nargs="?", const=daemon_cfg.SERVER_NAME, default=None)
+    args, qt_args = parser.parse_known_args(sys.argv[1:])
+    
+    if args.sim:
+        sim_cfg.ENABLED = True
+        logger.warning("가상 장비 모드: COM 포트 목록에 SIM: 포트 표시")
+    
+    app = QtWidgets.QApplication(sys.argv[:1] + qt_args)
     app.setStyle("Fusion")
     
     # 폰트 설정
@@ -1513,7 +1568,16 @@ if __name__ == "__main__":
         app_font = QtGui.QFont("Arial", 14, QtGui.QFont.Bold)
     app.setFont(app_font)
     
-    window = MainWindow()
+    daemon_client = None
+    if args.attach:
+        daemon_client = DaemonClient(args.attach)
+        if not daemon_client.connect_to_daemon():
+            QtWidgets.QMessageBox.critical(
+                None, "수집 데몬", f"수집 데몬에 연결할 수 없습니다: {args.attach}"
+            )
+            sys.exit(1)
+    
+    window = MainWindow(daemon_client=daemon_client)
     
     window.ui.set_language_manager(window.language_manager)
     window.ui.retranslateUi(window, window.language_manager)
@@ -5,8 +5,10 @@ Controller와 Monitor를 통합 관리하고 DataHandler를 통해 데이터 전
 """
 
 from Controller_Loadcell import LoadcellService
+from Async_Command import CommandQueue
 from Monitor_loadcell import LoadcellMonitor
-from config import loadcell_cfg, monitor_cfg
+from Sample_Bus import SampleBus
+from config import loadcell_cfg, monitor_cfg, sample_bus_cfg
 import logging
 import time
 
@@ -18,28 +20,36 @@ class LoadcellManager:
     Loadcell 장비의 Controller와 Monitor를 통합 관리
     """
     
-    def __init__(self, data_handler):
+    def __init__(self, data_handler, safety_stage=None, capture=None):
         """
         Args:
             data_handler: DataHandler 인스턴스 (데이터 처리 위임)
+            safety_stage: 워커 스레드에서 검사할 EmergencyStop (선택)
+            capture: 원시 스트림 캡처 StreamCapture (선택)
         """
         self.data_handler = data_handler
+        self.safety_stage = safety_stage
+        self.capture = capture
         self.controller = None
         self.monitor = None
+        self.sample_bus = None  # 다른 소비자는 sample_bus.cursor()로 같은 샘플을 읽을 수 있음
         self.start_time = None
         
         logger.info("LoadcellManager 초기화 완료")
     
-    def start_service(self, serial_port, interval_ms=None):
+    def start_service(self, serial_port, interval_ms=None, streaming=None):
         """
         Loadcell 서비스 시작 (연결 성공 후 호출)
         
         Args:
             serial_port: serial.Serial 인스턴스 (Main.py에서 생성)
             interval_ms: 모니터링 간격 (기본값: config에서 로드)
+            streaming: 연속 측정 출력 모드 사용 여부 (기본값: config에서 로드)
         """
         if interval_ms is None:
             interval_ms = monitor_cfg.DEFAULT_INTERVAL_MS
+        if streaming is None:
+            streaming = loadcell_cfg.STREAMING_ENABLED
             
         try:
             # Controller 생성 (Serial 객체 주입)
@@ -48,14 +58,30 @@ class LoadcellManager:
             
             logger.info("LoadcellService 생성 완료")
             
+            # 장비 명령은 모니터 워커 스레드에서 실행 (시리얼 포트 단일 소유)
+            self.controller.io_queue = CommandQueue("loadcell")
+            
+            # 샘플마다 시그널 대신 공유 메모리 링 + 깨우기 (선택)
+            if sample_bus_cfg.ENABLED:
+                self.sample_bus = SampleBus(sample_bus_cfg.CAPACITY)
+            
             # Monitor 생성 및 시작
             self.monitor = LoadcellMonitor(
                 serial_port, 
                 self._on_data_received,  # 콜백
-                interval_ms
+                interval_ms,
+                streaming=streaming,
+                safety_stage=self.safety_stage,
+                command_queue=self.controller.io_queue,
+                capture=self.capture,
+                sample_bus=self.sample_bus,
+                batch_callback=self._on_batch_received if loadcell_cfg.BATCH_DELIVERY else None
             )
             
-            logger.info(f"LoadcellManager 서비스 시작 (Interval: {interval_ms}ms)")
+            logger.info(
+                f"LoadcellManager 서비스 시작 "
+                f"(Interval: {interval_ms}ms, Streaming: {streaming})"
+            )
             return True
         
         except Exception as e:
@@ -70,6 +96,10 @@ class LoadcellManager:
                 self.monitor = None
                 logger.info("Loadcell Monitor 중지 완료")
             
+            if self.sample_bus:
+                self.sample_bus.close()
+                self.sample_bus = None
+            
             # Controller 정리 (Serial 객체는 Main.py가 닫음)
             self.controller = None
             
@@ -78,40 +108,66 @@ class LoadcellManager:
         except Exception as e:
             logger.error(f"LoadcellManager 서비스 중지 실패: {e}", exc_info=True)
     
-    def _on_data_received(self, norm_x100k: float):
+    def _on_data_received(self, norm_x100k: float, timestamp_ns: int = None):
         """
         Monitor로부터 데이터를 받아 DataHandler로 전달
         
         Args:
             norm_x100k: 정규화된 하중 값 (N)
+            timestamp_ns: 워커 스레드의 획득 시각 (perf_counter_ns)
         """
         if not self.start_time:
             return
         
         try:
             # DataHandler의 update_loadcell_value 호출
-            self.data_handler.update_loadcell_value(norm_x100k)
+            self.data_handler.update_loadcell_value(norm_x100k, timestamp_ns)
         
         except Exception as e:
             logger.error(f"Loadcell 데이터 전달 실패: {e}", exc_info=True)
     
+    def _on_batch_received(self, forces, timestamps_ns):
+        """
+        Monitor로부터 한 주기 분량의 샘플 묶음을 받아 DataHandler로 전달
+        
+        Args:
+            forces: 하중 배열 (N)
+            timestamps_ns: 획득 시각 배열 (perf_counter_ns)
+        """
+        if not self.start_time:
+            return
+        
+        try:
+            self.data_handler.update_loadcell_batch(forces, timestamps_ns)
+        
+        except Exception as e:
+            logger.error(f"Loadcell 배치 전달 실패: {e}", exc_info=True)
+    
     # ========================================================================
     # Controller 래핑 메서드 (자주 사용되는 기능)
     # ========================================================================
     
     def zero_calibration(self):
-        """영점 보정"""
+        """
+        영점 보정(CDL) 요청 (워커 스레드에서 실행, 결과는 controller.signals.finished)
+        
+        적용 대기는 하지 않는다 - 워커의 측정/가드가 멈추지 않도록 대기는 호출 측이
+        맡는다 (MainWindow의 0점 CommandSequence 등).
+        
+        Returns:
+            명령 Future (연결 없음 / 제출 실패 시 None)
+        """
         if not self.controller:
             logger.error("LoadcellService가 연결되지 않았습니다.")
-            return False
+            return None
         
         try:
-            self.controller.zero_position()
-            logger.info("Loadcell 영점 보정 성공")
-            return True
+            future = self.controller.send_zero_command_async()
+            logger.info("Loadcell 영점 보정 요청")
+            return future
         except Exception as e:
             logger.error(f"Loadcell 영점 보정 오류: {e}", exc_info=True)
-            return False
+            return None
     
     def is_connected(self):
         """연결 상태 확인"""
@@ -18,12 +18,16 @@ class MotorManager:
     Motor 장비의 Controller와 Monitor를 통합 관리
     """
     
-    def __init__(self, data_handler):
+    def __init__(self, data_handler, safety_stage=None, capture=None):
         """
         Args:
             data_handler: DataHandler 인스턴스 (데이터 처리 위임)
+            safety_stage: 워커 스레드에서 검사할 EmergencyStop (선택)
+            capture: 원시 스트림 캡처 StreamCapture (선택)
         """
         self.data_handler = data_handler
+        self.safety_stage = safety_stage
+        self.capture = capture
         self.controller = None
         self.monitor = None
         self.start_time = None
@@ -53,7 +57,9 @@ class MotorManager:
             self.monitor = MotorMonitor(
                 client, 
                 self._on_data_received,  # 콜백
-                interval_ms
+                interval_ms,
+                safety_stage=self.safety_stage,
+                capture=self.capture
             )
             
             logger.info(f"MotorManager 서비스 시작 (Unit ID: {unit_id}, Interval: {interval_ms}ms)")
@@ -79,19 +85,20 @@ class MotorManager:
         except Exception as e:
             logger.error(f"MotorManager 서비스 중지 실패: {e}", exc_info=True)
     
-    def _on_data_received(self, displacement_um: float):
+    def _on_data_received(self, displacement_um: float, timestamp_ns: int = None):
         """
         Monitor로부터 데이터를 받아 DataHandler로 전달
         
         Args:
             displacement_um: 변위 (um)
+            timestamp_ns: 워커 스레드의 획득 시각 (perf_counter_ns)
         """
         if not self.start_time:
             return
         
         try:
             # DataHandler의 update_motor_position 호출
-            self.data_handler.update_motor_position(displacement_um)
+            self.data_handler.update_motor_position(displacement_um, timestamp_ns)
         
         except Exception as e:
             logger.error(f"Motor 데이터 전달 실패: {e}")
@@ -2,6 +2,7 @@
 from Controller_temp import TempController
 from Monitor_temp import TempMonitor
 from Temp_Stabilization import TempStabilizationDetector
+from UI_Updater import UIUpdater
 from config import temp_cfg, monitor_cfg
 from ErrorHandler import ErrorHandler  # ← 추가
 import logging
@@ -11,16 +12,20 @@ logger = logging.getLogger(__name__)
 
 
 class TempManager:
-    def __init__(self, ui, plot_service=None, data_handler=None):
+    def __init__(self, ui, plot_service=None, data_handler=None, capture=None, ui_updater=None):
         """
         Args:
             ui: GUI 객체
             plot_service: PlotService 인스턴스
             data_handler: DataHandler 인스턴스
+            capture: 원시 스트림 캡처 StreamCapture (선택)
+            ui_updater: 라벨 갱신 UIUpdater (없으면 ui로 생성, 다른 라벨과 타이머를 공유하려면 주입)
         """
         self.ui = ui
+        self.ui_updater = ui_updater if ui_updater is not None else UIUpdater(ui)
         self.plot_service = plot_service
         self.data_handler = data_handler
+        self.capture = capture
         self.controller = None
         self.monitor = None
         self.start_time = None
@@ -43,7 +48,7 @@ class TempManager:
             interval_ms = monitor_cfg.DEFAULT_INTERVAL_MS
             
         self.controller = TempController(client)
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         
         # 온도 플롯 초기화
         if self.plot_service:
@@ -55,7 +60,7 @@ class TempManager:
                 logger.error(f"✗ 온도 플롯 초기화 실패: {e}")
         
         # 모니터 생성
-        self.monitor = TempMonitor(client, self.update_all, interval_ms)
+        self.monitor = TempMonitor(client, self.update_all, interval_ms, capture=self.capture)
         logger.info(f"Temp Service Started (Interval: {interval_ms}ms)")
         
         return True
@@ -84,18 +89,24 @@ class TempManager:
         """연결 상태 확인"""
         return self.controller is not None
 
-    def update_all(self, temps: list):
-        """모니터링 데이터 업데이트"""
+    def update_all(self, temps: list, timestamp_ns: int = None):
+        """
+        모니터링 데이터 업데이트
+        
+        Args:
+            temps: 채널별 온도 리스트
+            timestamp_ns: 워커 스레드의 획득 시각 (perf_counter_ns)
+        """
+        now = time.perf_counter() if timestamp_ns is None else timestamp_ns / 1e9
         if self.control_active and self.control_start_time is not None:
-            elapsed = time.time() - self.control_start_time
+            elapsed = now - self.control_start_time
         else:
-            elapsed = time.time() - self.start_time
+            elapsed = now - self.start_time
 
-        # GUI 라벨 업데이트
+        # GUI 라벨 업데이트 (표시 주기 제한 / 같은 값 생략)
         for i, val in enumerate(temps, 1):
             if val is not None:
-                if hasattr(self.ui, 'temp_channels') and i in self.ui.temp_channels:
-                    self.ui.temp_channels[i]['lbl'].setText(f"{val:.1f} °C")
+                self.ui_updater.update_temperature(i, val)
 
         # 제어 활성화 시에만 그래프 업데이트
         if self.control_active:
@@ -109,7 +120,7 @@ class TempManager:
         # DataHandler에 CH1 전달
         if self.data_handler and temps and len(temps) >= 1:
             try:
-                self.data_handler.update_temperature_ch1(temps[0])
+                self.data_handler.update_temperature_ch1(temps[0], timestamp_ns)
             except Exception as e:
                 logger.error(f"DataHandler 온도 업데이트 실패: {e}")
         
@@ -170,7 +181,7 @@ class TempManager:
             ])
             
             if success_count >= temp_cfg.CONTROL_MIN_SUCCESS_COUNT:
-                self.control_start_time = time.time()
+                self.control_start_time = time.perf_counter()
                 self.control_active = True
                 logger.info(f"[start_control] ✓ 제어 시작 완료")
                 
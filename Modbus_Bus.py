@@ -0,0 +1,254 @@
+"""
+Modbus RTU 버스 스케줄러
+포트마다 전용 스레드 하나가 ModbusSerialClient를 소유하고,
+모든 트랜잭션을 우선순위 큐로 직렬화
+
+우선순위: SAFETY(정지 명령) > WRITE(설정/명령 쓰기) > POLL(주기 읽기)
+- 정지 명령은 진행 중인 트랜잭션 1개만 기다리면 바로 전송됨
+- 같은 포트(RS-485 트렁크)에 모터/온도 제어기를 함께 연결 가능
+"""
+
+import queue
+import logging
+import itertools
+import threading
+from enum import IntEnum
+from concurrent.futures import Future
+from pymodbus.client.serial import ModbusSerialClient
+from config import bus_cfg
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """트랜잭션 우선순위 (작을수록 먼저)"""
+    SAFETY = 0
+    WRITE = 1
+    POLL = 2
+
+
+_READ_METHODS = ("read_holding_registers", "read_input_registers")
+_SHUTDOWN = 99  # 종료 신호 (대기 중인 트랜잭션을 모두 처리한 뒤)
+
+
+class ModbusBus:
+    """
+    포트 하나의 트랜잭션 스케줄러
+
+    직접 생성하지 말고 acquire_modbus_client()로 BusClient를 받아 사용한다.
+    """
+
+    def __init__(self, client: ModbusSerialClient, name: str, settings: dict = None):
+        self.client = client
+        self.name = name
+        self.settings = dict(settings or {})
+
+        self._queue = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._refs = 0
+        self._closed = False
+        self._lock = threading.Lock()
+
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"ModbusBus-{name}",
+            daemon=True
+        )
+        self._thread.start()
+        logger.info(f"ModbusBus 시작 ({name})")
+
+    # ========================================================================
+    # 트랜잭션 제출
+    # ========================================================================
+
+    def submit(self, priority: int, func, *args, **kwargs) -> Future:
+        """
+        트랜잭션 제출
+
+        Args:
+            priority: Priority 값
+            func: 버스 스레드에서 실행할 callable (client 메서드 등)
+
+        Returns:
+            결과/예외를 담을 Future
+        """
+        future = Future()
+        if self._closed:
+            future.set_exception(ConnectionError(f"버스가 닫혔습니다: {self.name}"))
+            return future
+
+        if self.in_bus_thread():
+            # 버스 스레드 안에서의 재진입은 큐를 거치지 않음 (교착 방지)
+            self._execute(func, args, kwargs, future)
+            return future
+
+        self._queue.put((int(priority), next(self._seq), func, args, kwargs, future))
+        return future
+
+    def call(self, priority: int, func, *args, **kwargs):
+        """submit 후 결과 대기 (bus_cfg.CALL_TIMEOUT_SEC)"""
+        return self.submit(priority, func, *args, **kwargs).result(bus_cfg.CALL_TIMEOUT_SEC)
+
+    def in_bus_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    @property
+    def backlog(self) -> int:
+        """대기 중인 트랜잭션 수"""
+        return self._queue.qsize()
+
+    # ========================================================================
+    # 참조 관리
+    # ========================================================================
+
+    def acquire(self):
+        with self._lock:
+            self._refs += 1
+
+    def release(self) -> bool:
+        """참조 해제. 마지막 참조면 버스를 닫고 True 반환"""
+        with self._lock:
+            self._refs -= 1
+            if self._refs > 0:
+                return False
+        self.shutdown()
+        return True
+
+    def shutdown(self):
+        """대기 중인 트랜잭션을 처리한 뒤 스레드 종료 및 포트 닫기"""
+        if self._closed:
+            return
+        self._closed = True
+
+        self._queue.put((_SHUTDOWN, next(self._seq), None, (), {}, None))
+        if not self.in_bus_thread():
+            self._thread.join(bus_cfg.CALL_TIMEOUT_SEC)
+
+        try:
+            self.client.close()
+        except Exception as e:
+            logger.error(f"ModbusBus 포트 닫기 실패 ({self.name}): {e}")
+        logger.info(f"ModbusBus 종료 ({self.name})")
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    # ========================================================================
+    # 버스 스레드
+    # ========================================================================
+
+    def _run(self):
+        while True:
+            priority, _, func, args, kwargs, future = self._queue.get()
+            if priority == _SHUTDOWN:
+                break
+            self._execute(func, args, kwargs, future)
+
+    @staticmethod
+    def _execute(func, args, kwargs, future: Future):
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+
+
+class BusClient:
+    """
+    ModbusSerialClient와 같은 인터페이스의 버스 프록시
+
+    읽기는 POLL, 쓰기는 WRITE 우선순위로 제출되며, 호출 시
+    priority=Priority.SAFETY 처럼 지정할 수 있다. 결과를 기다리지 않으려면
+    submit()으로 Future를 받는다.
+    """
+
+    def __init__(self, bus: ModbusBus):
+        self.bus = bus
+        self._released = False
+
+    # ---- 연결 ----
+
+    def connect(self) -> bool:
+        """포트 열기 (이미 열려 있으면 True)"""
+        client = self.bus.client
+        if client.is_socket_open():
+            return True
+        return bool(self.bus.call(Priority.WRITE, client.connect))
+
+    def is_socket_open(self) -> bool:
+        return (not self._released) and (not self.bus.closed) and self.bus.client.is_socket_open()
+
+    def close(self):
+        """이 프록시의 참조 해제 (마지막 참조일 때만 포트가 닫힘)"""
+        if self._released:
+            return
+        self._released = True
+        release_modbus_client(self.bus)
+
+    # ---- 트랜잭션 ----
+
+    def submit(self, method: str, *args, priority: int = None, **kwargs) -> Future:
+        """client.<method>(...)를 버스에 제출하고 Future 반환"""
+        if priority is None:
+            priority = Priority.POLL if method in _READ_METHODS else Priority.WRITE
+        func = getattr(self.bus.client, method)
+        return self.bus.submit(priority, func, *args, **kwargs)
+
+    def _call(self, method: str, args, kwargs):
+        return self.submit(method, *args, **kwargs).result(bus_cfg.CALL_TIMEOUT_SEC)
+
+    def read_holding_registers(self, *args, **kwargs):
+        return self._call("read_holding_registers", args, kwargs)
+
+    def read_input_registers(self, *args, **kwargs):
+        return self._call("read_input_registers", args, kwargs)
+
+    def write_register(self, *args, **kwargs):
+        return self._call("write_register", args, kwargs)
+
+    def write_registers(self, *args, **kwargs):
+        return self._call("write_registers", args, kwargs)
+
+
+# ============================================================================
+# 포트 레지스트리 (같은 포트 = 같은 버스)
+# ============================================================================
+
+_buses = {}
+_buses_lock = threading.Lock()
+
+
+def acquire_modbus_client(port: str, client_factory=None, **serial_kwargs) -> BusClient:
+    """
+    포트의 공유 버스에 대한 BusClient 획득
+
+    같은 포트를 이미 다른 장치가 쓰고 있으면 그 버스를 공유한다.
+
+    Args:
+        port: COM 포트 이름
+        client_factory: 클라이언트 생성 함수 (기본 ModbusSerialClient)
+        **serial_kwargs: baudrate, parity 등 통신 설정
+    """
+    factory = client_factory or ModbusSerialClient
+    with _buses_lock:
+        bus = _buses.get(port)
+        if bus is None or bus.closed:
+            bus = ModbusBus(factory(port=port, **serial_kwargs), name=port, settings=serial_kwargs)
+            _buses[port] = bus
+        elif bus.settings != serial_kwargs:
+            logger.warning(
+                f"포트 {port}는 이미 다른 설정으로 열려 있습니다 - 기존 설정 사용 "
+                f"(기존: {bus.settings}, 요청: {serial_kwargs})"
+            )
+        bus.acquire()
+    return BusClient(bus)
+
+
+def release_modbus_client(bus: ModbusBus):
+    """BusClient.close()에서 호출"""
+    with _buses_lock:
+        closed = bus.release()
+        if closed and _buses.get(bus.name) is bus:
+            del _buses[bus.name]
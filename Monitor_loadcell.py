@@ -1,7 +1,9 @@
 ﻿import time
 import serial
 import logging
+import numpy as np
 from PyQt5 import QtCore
+from Serial_Reader import read_frame
 from config import loadcell_cfg, monitor_cfg
 
 logger = logging.getLogger(__name__)
@@ -24,25 +26,101 @@ def _to_s32_be(b4: bytes) -> int:
     return u - 0x100000000 if (u & 0x80000000) else u
 
 
-def _read_until_crlf(ser, max_wait=1.5, idle_gap=0.10) -> bytes:
-    """CRLF(0x0D0A)까지 읽기"""
-    t0 = time.time()
-    last = t0
-    buf = bytearray()
-    while time.time() - t0 < max_wait:
-        n = ser.in_waiting or 1
-        chunk = ser.read(n)
-        if chunk:
-            buf += chunk
-            last = time.time()
-            if len(buf) >= 2 and buf[-2:] == b"\r\n":
-                break
-        else:
-            if len(buf) and (time.time() - last) >= idle_gap:
-                break
-            elif n == 0:
-                time.sleep(0.01)
-    return bytes(buf)
+def _counts_to_force(counts: int) -> float:
+    """sint32 카운트 → 하중 (N)"""
+    normalized = counts / float(_FULLSCALE)
+    return (
+        normalized *
+        loadcell_cfg.NORMALIZATION_FACTOR *
+        loadcell_cfg.GRAVITY_FACTOR
+    )
+
+
+def _send_frame(ser: serial.Serial, payload: str):
+    """;payload; 프레임 전송"""
+    frame = f"{loadcell_cfg.FRAME_START}{payload}{loadcell_cfg.FRAME_END}"
+    ser.write(frame.encode('ascii'))
+    ser.flush()
+
+
+def _start_stream_via_serial(ser: serial.Serial) -> bool:
+    """주소를 한 번만 선택하고 연속 측정 출력(MSV?0) 시작"""
+    if not ser or not ser.is_open:
+        logger.error("Serial 포트가 열려 있지 않습니다.")
+        return False
+
+    try:
+        ser.reset_input_buffer()
+        _send_frame(ser, loadcell_cfg.CMD_SELECT_ADDRESS.format(
+            address=loadcell_cfg.DEVICE_ADDRESS
+        ))
+        time.sleep(0.02)
+
+        # 주소 선택 응답 폐기 후 연속 출력 시작
+        ser.reset_input_buffer()
+        _send_frame(ser, loadcell_cfg.CMD_CONTINUOUS_MEASURE)
+        logger.info("로드셀 연속 측정 출력 시작")
+        return True
+
+    except Exception as e:
+        logger.error(f"_start_stream_via_serial 예외: {e}")
+        return False
+
+
+def _stop_stream_via_serial(ser: serial.Serial):
+    """연속 측정 출력 정지 (STP)"""
+    if not ser or not ser.is_open:
+        return
+
+    try:
+        _send_frame(ser, loadcell_cfg.CMD_STOP_MEASURE)
+        time.sleep(0.02)
+        ser.reset_input_buffer()
+        logger.info("로드셀 연속 측정 출력 정지")
+    except Exception as e:
+        logger.error(f"_stop_stream_via_serial 예외: {e}")
+
+
+def _parse_stream_frames(buf: bytearray) -> list:
+    """
+    롤링 버퍼에서 완성된 측정 프레임을 모두 꺼내 카운트 리스트로 반환
+
+    프레임: 빅엔디언 sint32 4바이트 + 종료 바이트(CRLF).
+    종료 바이트 위치가 맞지 않으면 1바이트씩 밀어 경계를 재동기화한다.
+    미완성 프레임은 버퍼에 남겨 다음 호출에서 이어 붙인다.
+    """
+    size = loadcell_cfg.STREAM_FRAME_SIZE
+    term = loadcell_cfg.STREAM_FRAME_TERMINATOR
+    frame_len = size + len(term)
+
+    counts = []
+    pos = 0
+    end = len(buf)
+    while end - pos >= frame_len:
+        if term and buf[pos + size:pos + frame_len] != term:
+            pos += 1
+            continue
+        counts.append(int.from_bytes(buf[pos:pos + size], "big", signed=True))
+        pos += frame_len
+
+    del buf[:pos]
+    return counts
+
+
+def _stream_samples(buf: bytearray, prev_ns: int, now_ns: int) -> list:
+    """
+    롤링 버퍼의 완성 프레임 → [(하중 N, 획득 시각 ns)]
+
+    한 번에 읽힌 프레임들은 직전 읽기 시각과 이번 읽기 시각 사이에
+    균등 간격으로 획득된 것으로 보고 타임스탬프를 배분한다.
+    (LoadcellWorker와 캡처 재생이 같은 배분을 쓰도록 공용)
+    """
+    frames = _parse_stream_frames(buf)
+    step_ns = (now_ns - prev_ns) // len(frames) if frames else 0
+    return [
+        (_counts_to_force(counts), prev_ns + step_ns * i)
+        for i, counts in enumerate(frames, 1)
+    ]
 
 
 def _msv_once_via_serial(ser: serial.Serial) -> tuple[bool, int, bytes]:
@@ -61,7 +139,7 @@ def _msv_once_via_serial(ser: serial.Serial) -> tuple[bool, int, bytes]:
         frame = f"{loadcell_cfg.FRAME_START}{addr_cmd}{loadcell_cfg.FRAME_END}"
         ser.write(frame.encode('ascii'))
         ser.flush()
-        time.sleep(0.02)
+        read_frame(ser, max_wait=0.02)  # 주소 선택 응답 폐기 (도착 즉시 반환)
 
         # 단일 측정 명령
         measure_frame = (
@@ -72,7 +150,7 @@ def _msv_once_via_serial(ser: serial.Serial) -> tuple[bool, int, bytes]:
         ser.write(measure_frame.encode('ascii'))
         ser.flush()
 
-        raw = _read_until_crlf(ser)
+        raw = read_frame(ser, min_size=loadcell_cfg.STREAM_FRAME_SIZE)
 
         if len(raw) < 4:
             logger.debug("응답이 너무 짧습니다.")
@@ -90,69 +168,196 @@ def _msv_once_via_serial(ser: serial.Serial) -> tuple[bool, int, bytes]:
 class LoadcellWorker(QtCore.QObject):
     """
     QTimer 기반 로드셀 모니터링 워커
+
+    - 폴링 모드: 매 주기마다 주소 선택 + MSV? 요청/응답
+    - 스트리밍 모드: 주소를 한 번 선택하고 연속 출력(MSV?0)을 켠 뒤,
+      매 주기마다 수신 버퍼를 비워 4바이트 프레임을 모두 파싱
+    
+    data_ready는 (하중 N, 획득 시각 perf_counter_ns)를 방출한다.
+    sample_bus가 있으면 샘플마다 방출하는 대신 공유 메모리 링에 기록하고
+    깨우기 시그널만 보낸다 (Sample_Bus.py).
+    batch=True면 한 주기에 읽은 샘플을 모아 batch_ready로 한 번에 방출한다
+    (하중 배열, 획득 시각 ns 배열).
+    safety_stage가 있으면 방출 전에 이 스레드에서 하중 제한을 먼저 검사한다.
     """
     
-    data_ready = QtCore.pyqtSignal(float)
+    data_ready = QtCore.pyqtSignal(float, 'qint64')
+    batch_ready = QtCore.pyqtSignal(object, object)  # (하중 N ndarray, 획득 시각 ns ndarray)
+    command_posted = QtCore.pyqtSignal()  # 다른 스레드가 명령을 넣었을 때 (이 스레드로 큐 전달)
 
-    def __init__(self, ser: serial.Serial, interval_ms: int):
+    def __init__(self, ser: serial.Serial, interval_ms: int, streaming: bool = False,
+                 safety_stage=None, command_queue=None, capture=None, sample_bus=None,
+                 batch=False):
         super().__init__()
         self.ser = ser
         self.interval_ms = interval_ms
+        self.streaming = streaming
+        self.safety_stage = safety_stage
+        self.command_queue = command_queue  # LoadcellService 비동기 명령 (CommandQueue)
+        self.capture = capture  # 원시 스트림 캡처 (StreamCapture, 선택)
+        self.sample_bus = sample_bus  # 공유 메모리 샘플 버스 (SampleBus, 선택)
+        self.batch = batch
+        self._pending_forces = []  # batch 모드: 이번 주기에 모은 샘플
+        self._pending_ts = []
+        self.command_posted.connect(self._run_commands)
         self._running = False  # ===== 추가: 실행 상태 플래그 =====
+        self._stream_buf = bytearray()
+        self._last_read_ns = None  # 직전 스트림 읽기 시각
         
         # ===== 중요: Timer는 run()에서 생성 =====
         self.timer = None
         
-        logger.info(f"LoadcellWorker 생성됨 (주기: {interval_ms} ms)")
+        mode = "스트리밍" if streaming else "폴링"
+        logger.info(f"LoadcellWorker 생성됨 (모드: {mode}, 주기: {interval_ms} ms)")
 
     @QtCore.pyqtSlot()
     def run(self):
         """워커 스레드에서 타이머 생성 및 시작"""
         # ===== Timer를 현재 스레드(워커 스레드)에서 생성 =====
         self.timer = QtCore.QTimer()
-        self.timer.setInterval(self.interval_ms)
+        self.timer.setInterval(self._timer_interval_ms())
         self.timer.timeout.connect(self._do_work)
         
+        if self.streaming:
+            self._stream_buf.clear()
+            self._last_read_ns = None
+            if not _start_stream_via_serial(self.ser):
+                logger.warning("연속 측정 시작 실패 - 폴링 모드로 전환합니다.")
+                self.streaming = False
+                self.timer.setInterval(self.interval_ms)
+        
         self._running = True
         self.timer.start()
+
+        if self.command_queue is not None:
+            self.command_queue.notify = self.command_posted.emit
+            self.command_queue.active = True
         
         logger.info(f"Loadcell 모니터링 타이머 시작됨 (Thread ID: {int(QtCore.QThread.currentThreadId())})")
 
+    def _timer_interval_ms(self) -> int:
+        """스트리밍 모드는 장비 출력 속도와 무관하게 짧은 주기로 버퍼를 비운다"""
+        if self.streaming:
+            return loadcell_cfg.STREAM_POLL_INTERVAL_MS
+        return self.interval_ms
+
     def _do_work(self):
         """타이머 콜백"""
         if not self._running:  # ===== 추가: 실행 체크 =====
             return
-            
+        
+        try:
+            self._poll_once()
+        finally:
+            self._flush_batch()
+
+    def _poll_once(self):
+        """한 주기 읽기 (폴링 1회 또는 스트림 버퍼 드레인)"""
         try:
             if not self.ser or not self.ser.is_open:
                 logger.debug("Serial 포트 연결 없음 (스킵)")
                 return
+
+            if self.streaming:
+                self._drain_stream()
+                return
                 
             ok, counts, raw = _msv_once_via_serial(self.ser)
+            timestamp_ns = time.perf_counter_ns()
+            if self.capture is not None:
+                self.capture.record_loadcell_poll(timestamp_ns, raw)
             if not ok:
                 logger.debug("MSV 읽기 실패 (skip)")
                 return
 
-            # 정규화 및 변환
-            normalized = counts / float(_FULLSCALE)
-            norm_x100k = (
-                normalized * 
-                loadcell_cfg.NORMALIZATION_FACTOR *
-                loadcell_cfg.GRAVITY_FACTOR
-            )
-            
-            self.data_ready.emit(norm_x100k)
+            self._emit(_counts_to_force(counts), timestamp_ns)
 
         except Exception as e:
             logger.error(f"로드셀 모니터링 워커 예외: {e}", exc_info=True)
 
+    def _drain_stream(self):
+        """
+        수신된 연속 측정 프레임을 모두 파싱하여 방출
+        
+        한 번에 읽힌 프레임들은 직전 읽기 시각과 이번 읽기 시각 사이에
+        균등 간격으로 획득된 것으로 보고 타임스탬프를 배분한다.
+        """
+        n = self.ser.in_waiting
+        if not n:
+            return
+
+        chunk = self.ser.read(n)
+        now_ns = time.perf_counter_ns()
+        if self.capture is not None:
+            self.capture.record_loadcell_stream(now_ns, chunk)
+        self._stream_buf += chunk
+        prev_ns = self._last_read_ns if self._last_read_ns is not None else now_ns
+        self._last_read_ns = now_ns
+
+        for force, timestamp_ns in _stream_samples(self._stream_buf, prev_ns, now_ns):
+            self._emit(force, timestamp_ns)
+
+        overflow = len(self._stream_buf) - loadcell_cfg.STREAM_MAX_BUFFER_BYTES
+        if overflow > 0:
+            del self._stream_buf[:overflow]
+            logger.warning(f"스트리밍 버퍼 초과 - {overflow} 바이트 폐기")
+
+    @QtCore.pyqtSlot()
+    def _run_commands(self):
+        """
+        대기 중인 장비 명령을 이 스레드에서 실행
+        
+        스트리밍 중이면 연속 출력을 멈추고 실행한 뒤 다시 시작한다
+        (명령 응답과 측정 프레임이 섞이지 않도록).
+        """
+        if self.command_queue is None or not self.command_queue.pending:
+            return
+        
+        paused = self.streaming and self._running
+        if paused:
+            _stop_stream_via_serial(self.ser)
+        try:
+            self.command_queue.drain()
+        finally:
+            if paused and self._running:
+                self._stream_buf.clear()
+                self._last_read_ns = None
+                _start_stream_via_serial(self.ser)
+
+    def _emit(self, force_n: float, timestamp_ns: int):
+        """긴급 정지 검사 후 메인 스레드로 전송"""
+        if self.safety_stage is not None:
+            self.safety_stage.check_force(force_n, timestamp_ns)
+        if self.sample_bus is not None:
+            self.sample_bus.publish(timestamp_ns, force_n)
+        elif self.batch:
+            self._pending_forces.append(force_n)
+            self._pending_ts.append(timestamp_ns)
+        else:
+            self.data_ready.emit(force_n, timestamp_ns)
+
+    def _flush_batch(self):
+        """batch 모드: 이번 주기에 모은 샘플을 한 번에 방출"""
+        if not self._pending_forces:
+            return
+        forces = np.asarray(self._pending_forces, dtype=np.float64)
+        timestamps_ns = np.asarray(self._pending_ts, dtype=np.int64)
+        self._pending_forces = []
+        self._pending_ts = []
+        self.batch_ready.emit(forces, timestamps_ns)
+
     @QtCore.pyqtSlot()
     def stop(self):
         """타이머 정지"""
         self._running = False  # ===== 추가 =====
+        if self.command_queue is not None:
+            self.command_queue.close("모니터 정지")
         if self.timer and self.timer.isActive():
             self.timer.stop()
             logger.info("Loadcell 모니터링 타이머 정지")
+        
+        if self.streaming:
+            _stop_stream_via_serial(self.ser)
 
     @QtCore.pyqtSlot(int)
     def set_interval(self, interval_ms: int):
@@ -160,6 +365,12 @@ class LoadcellWorker(QtCore.QObject):
         if not self.timer:
             logger.warning("타이머가 아직 생성되지 않았습니다.")
             return
+
+        if self.streaming:
+            # 스트리밍 모드에서는 장비 출력 속도가 샘플링 속도를 결정
+            self.interval_ms = interval_ms
+            logger.info(f"스트리밍 모드 - 주기 변경 무시 ({interval_ms} ms)")
+            return
         
         was_active = self.timer.isActive()
         
@@ -183,15 +394,26 @@ class LoadcellMonitor(QtCore.QObject):
     stop_worker = QtCore.pyqtSignal()
     interval_changed = QtCore.pyqtSignal(int)
 
-    def __init__(self, ser: serial.Serial, update_callback, interval_ms=100):
+    def __init__(self, ser: serial.Serial, update_callback, interval_ms=100, streaming=False,
+                 safety_stage=None, command_queue=None, capture=None, sample_bus=None,
+                 batch_callback=None):
+        """
+        batch_callback이 있으면 샘플 단위 update_callback 대신
+        batch_callback(하중 배열, 획득 시각 ns 배열)로 묶어서 전달한다.
+        """
         super().__init__()
+        self.update_callback = update_callback
+        self.batch_callback = batch_callback
         
-        # 스레드 생성 및 시작
+        # 스레드 생성 (시그널 연결 후 시작)
         self.thread = QtCore.QThread()
-        self.thread.start()
         
         # 워커 생성 (메인 스레드에서)
-        self.worker = LoadcellWorker(ser, interval_ms)
+        self.worker = LoadcellWorker(
+            ser, interval_ms, streaming=streaming,
+            safety_stage=safety_stage, command_queue=command_queue, capture=capture,
+            sample_bus=sample_bus, batch=batch_callback is not None
+        )
 
         # 워커를 워커 스레드로 이동
         self.worker.moveToThread(self.thread)
@@ -203,11 +425,22 @@ class LoadcellMonitor(QtCore.QObject):
         self.stop_worker.connect(self.worker.stop)
         self.interval_changed.connect(self.worker.set_interval)
         self.worker.data_ready.connect(update_callback)
+        if batch_callback is not None:
+            self.worker.batch_ready.connect(batch_callback)
+        
+        # 샘플 버스: 깨우기마다 쌓인 샘플을 몰아서 전달
+        self._bus_cursor = None
+        if sample_bus is not None:
+            self._bus_cursor = sample_bus.cursor()
+            sample_bus.samples_available.connect(self._drain_bus)
 
         # 스레드 정리
         self.thread.finished.connect(self.worker.deleteLater)
         self.thread.finished.connect(self.thread.deleteLater)
 
+        # 스레드 시작 (started → run 연결 후여야 run 호출이 누락되지 않음)
+        self.thread.start()
+
         logger.info(f"LoadcellMonitor 시작됨 (Main Thread ID: {int(QtCore.QThread.currentThreadId())})")
 
     def stop(self):
@@ -229,11 +462,29 @@ class LoadcellMonitor(QtCore.QObject):
                     logger.warning("Loadcell 스레드가 정상 종료되지 않았습니다. 강제 종료합니다.")
                     self.thread.terminate()
                     self.thread.wait()
+            
+            # 워커가 멈춘 뒤 버스에 남은 샘플 전달 후 분리
+            if self._bus_cursor is not None:
+                self._drain_bus()
+                self._bus_cursor = None
                 
             logger.info("LoadcellMonitor 중지 완료")
         except Exception as e:
             logger.error(f"LoadcellMonitor 정지 중 예외: {e}", exc_info=True)
 
+    @QtCore.pyqtSlot()
+    def _drain_bus(self):
+        """샘플 버스에 쌓인 샘플을 순서대로 콜백에 전달 (GUI 스레드)"""
+        if self._bus_cursor is None:
+            return  # 정지 후 늦게 도착한 깨우기
+        records = self._bus_cursor.read()
+        if self.batch_callback is not None:
+            if len(records):
+                self.batch_callback(records['value'], records['ts_ns'])
+            return
+        for ts_ns, force_n in zip(records['ts_ns'].tolist(), records['value'].tolist()):
+            self.update_callback(force_n, ts_ns)
+
     def update_interval(self, interval_ms: int):
         """Hz 변경 시 워커의 주기를 변경"""
         self.interval_changed.emit(interval_ms)
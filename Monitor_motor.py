@@ -7,18 +7,49 @@ from config import motor_cfg, monitor_cfg
 logger = logging.getLogger(__name__)
 
 
+def _decode_position_um(reg126: int, reg127: int) -> float:
+    """위치 레지스터 쌍 → 변위 (um) (워커와 캡처 재생 공용)"""
+    # 32비트 위치 값 조합
+    r126_hi = (reg126 >> motor_cfg.BYTE_SHIFT) & motor_cfg.BYTE_MASK_LO
+    r126_lo = reg126 & motor_cfg.BYTE_MASK_LO
+    r127_hi = (reg127 >> motor_cfg.BYTE_SHIFT) & motor_cfg.BYTE_MASK_LO
+    r127_lo = reg127 & motor_cfg.BYTE_MASK_LO
+
+    position = ((r127_hi << 24) |
+                (r127_lo << 16) |
+                (r126_hi << motor_cfg.BYTE_SHIFT) |
+                (r126_lo))
+
+    # 부호 있는 32비트로 변환
+    if position & motor_cfg.SINT32_SIGN_BIT:
+        position -= motor_cfg.SINT32_OVERFLOW
+
+    # um로 변환
+    return (
+        motor_cfg.POSITION_SIGN_INVERT *
+        (position / motor_cfg.POSITION_SCALE_FACTOR) *
+        motor_cfg.UM_PER_MM
+    )
+
+
 class MotorWorker(QtCore.QObject):
     """
     QTimer 기반 모터 모니터링 워커
+    
+    data_ready는 (변위 um, 획득 시각 perf_counter_ns)를 방출한다.
+    safety_stage가 있으면 방출 전에 이 스레드에서 변위 제한을 먼저 검사한다.
     """
     
-    data_ready = QtCore.pyqtSignal(float)
+    data_ready = QtCore.pyqtSignal(float, 'qint64')
 
-    def __init__(self, client: ModbusSerialClient, unit_id: int, interval_ms: int):
+    def __init__(self, client: ModbusSerialClient, unit_id: int, interval_ms: int, safety_stage=None,
+                 capture=None):
         super().__init__()
         self.client = client
         self.unit_id = unit_id
         self.interval_ms = interval_ms
+        self.safety_stage = safety_stage
+        self.capture = capture  # 원시 스트림 캡처 (StreamCapture, 선택)
         self._running = False
         
         # ===== 중요: Timer는 run()에서 생성해야 함 =====
@@ -54,6 +85,7 @@ class MotorWorker(QtCore.QObject):
                 count=2,
                 device_id=self.unit_id
             )
+            timestamp_ns = time.perf_counter_ns()
             
             if result_pos.isError():
                 logger.debug(f"현재 위치 읽기 실패: {result_pos}")
@@ -64,31 +96,17 @@ class MotorWorker(QtCore.QObject):
                 logger.debug(f"레지스터 데이터 없음: {regs}")
                 return
 
-            # 32비트 위치 값 조합
             reg126, reg127 = regs
-            r126_hi = (reg126 >> motor_cfg.BYTE_SHIFT) & motor_cfg.BYTE_MASK_LO
-            r126_lo = reg126 & motor_cfg.BYTE_MASK_LO
-            r127_hi = (reg127 >> motor_cfg.BYTE_SHIFT) & motor_cfg.BYTE_MASK_LO
-            r127_lo = reg127 & motor_cfg.BYTE_MASK_LO
-
-            position = ((r127_hi << 24) |
-                        (r127_lo << 16) |
-                        (r126_hi << motor_cfg.BYTE_SHIFT) |
-                        (r126_lo))
-
-            # 부호 있는 32비트로 변환
-            if position & motor_cfg.SINT32_SIGN_BIT:
-                position -= motor_cfg.SINT32_OVERFLOW
-
-            # um로 변환
-            displacement_um = (
-                motor_cfg.POSITION_SIGN_INVERT *
-                (position / motor_cfg.POSITION_SCALE_FACTOR) *
-                motor_cfg.UM_PER_MM
-            )
+            if self.capture is not None:
+                self.capture.record_motor(timestamp_ns, reg126, reg127)
+            displacement_um = _decode_position_um(reg126, reg127)
+
+            # 긴급 정지 검사 (GUI 스레드를 거치지 않음)
+            if self.safety_stage is not None:
+                self.safety_stage.check_position(displacement_um, timestamp_ns)
 
             # 메인 스레드로 데이터 전송
-            self.data_ready.emit(displacement_um)
+            self.data_ready.emit(displacement_um, timestamp_ns)
 
         except Exception as e:
             logger.error(f"모터 모니터링 워커 예외: {e}", exc_info=True)
@@ -130,15 +148,15 @@ class MotorMonitor(QtCore.QObject):
     stop_worker = QtCore.pyqtSignal()
     interval_changed = QtCore.pyqtSignal(int)
 
-    def __init__(self, client: ModbusSerialClient, update_callback, interval_ms=100, unit_id=1):
+    def __init__(self, client: ModbusSerialClient, update_callback, interval_ms=100, unit_id=1, safety_stage=None,
+                 capture=None):
         super().__init__()
         
-        # 스레드 생성 및 시작
+        # 스레드 생성 (시그널 연결 후 시작)
         self.thread = QtCore.QThread()
-        self.thread.start()
         
         # 워커 생성 (메인 스레드에서)
-        self.worker = MotorWorker(client, unit_id, interval_ms)
+        self.worker = MotorWorker(client, unit_id, interval_ms, safety_stage=safety_stage, capture=capture)
 
         # 워커를 워커 스레드로 이동
         self.worker.moveToThread(self.thread)
@@ -156,6 +174,9 @@ class MotorMonitor(QtCore.QObject):
         self.thread.finished.connect(self.worker.deleteLater)
         self.thread.finished.connect(self.thread.deleteLater)
 
+        # 스레드 시작 (started → run 연결 후여야 run 호출이 누락되지 않음)
+        self.thread.start()
+
         logger.info(f"MotorMonitor 시작됨 (Main Thread ID: {int(QtCore.QThread.currentThreadId())})")
 
     def stop(self):
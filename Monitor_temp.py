@@ -1,4 +1,6 @@
+import time
 import logging
+import numpy as np
 from PyQt5 import QtCore
 from pymodbus.client.serial import ModbusSerialClient
 from config import temp_cfg, monitor_cfg  # ===== 추가 =====
@@ -6,17 +8,56 @@ from config import temp_cfg, monitor_cfg  # ===== 추가 =====
 logger = logging.getLogger(__name__)
 
 
+def _plan_register_reads(addresses: list, max_gap: int, max_count: int) -> list:
+    """
+    레지스터 주소들을 최소 개수의 연속 블록 읽기로 묶기
+    
+    Args:
+        addresses: 읽을 주소 목록 (결과 순서 기준)
+        max_gap: 한 블록 안에서 허용할 빈 레지스터 수
+        max_count: 블록 최대 레지스터 수
+    
+    Returns:
+        [(start, count, indices, offsets), ...]
+        indices: addresses 내 위치, offsets: 블록 내 오프셋 (np.ndarray)
+    """
+    blocks = []
+    for idx in sorted(range(len(addresses)), key=addresses.__getitem__):
+        addr = addresses[idx]
+        if blocks:
+            start, count, members = blocks[-1]
+            gap = addr - (start + count)
+            if gap <= max_gap and addr - start + 1 <= max_count:
+                members.append((idx, addr - start))
+                blocks[-1] = (start, max(count, addr - start + 1), members)
+                continue
+        blocks.append((addr, 1, [(idx, 0)]))
+    
+    return [
+        (
+            start,
+            count,
+            np.array([i for i, _ in members], dtype=np.intp),
+            np.array([o for _, o in members], dtype=np.intp)
+        )
+        for start, count, members in blocks
+    ]
+
+
 class TempWorker(QtCore.QObject):
     """
     QTimer 기반 온도 모니터링 워커
+    
+    temp_ready는 (채널별 온도 리스트, 획득 시각 perf_counter_ns)를 방출한다.
     """
     
-    temp_ready = QtCore.pyqtSignal(list)
+    temp_ready = QtCore.pyqtSignal(list, 'qint64')
 
-    def __init__(self, client: ModbusSerialClient, interval_ms: int):
+    def __init__(self, client: ModbusSerialClient, interval_ms: int, capture=None):
         super().__init__()
         self.client = client
         self.interval_ms = interval_ms
+        self.capture = capture  # 원시 스트림 캡처 (StreamCapture, 선택)
         
         # ===== 수정: 매직 넘버 → config =====
         self.addr_list = [
@@ -26,9 +67,19 @@ class TempWorker(QtCore.QObject):
             temp_cfg.CHANNEL_ADDRESSES[4]["PV"]   # ← 0x03FA 대신
         ]
         
+        # 읽기 계획 (블록 읽기가 거부되면 해당 블록은 단일 읽기로 분할되어 캐시됨)
+        self._read_plan = _plan_register_reads(
+            self.addr_list,
+            temp_cfg.READ_MAX_GAP,
+            temp_cfg.READ_MAX_COUNT
+        )
+        
         self.timer = None
         
-        logger.info(f"TempWorker 생성됨 (주기: {interval_ms} ms)")
+        logger.info(
+            f"TempWorker 생성됨 (주기: {interval_ms} ms, "
+            f"읽기 {len(self._read_plan)}회/주기)"
+        )
 
     @QtCore.pyqtSlot()
     def run(self):
@@ -46,25 +97,67 @@ class TempWorker(QtCore.QObject):
             logger.debug("Temp 클라이언트 연결 없음 (스킵)")
             return
         
-        current_temps = []
+        current_temps = [None] * len(self.addr_list)
         try:
-            for addr in self.addr_list:
-                res = self.client.read_input_registers(
-                    address=addr, 
-                    count=1,
-                    device_id=temp_cfg.DEFAULT_UNIT_ID  # ← 1 대신
-                )
-                if not res.isError():
-                    val = res.registers[0]
-                    current_temps.append(val)
-                else:
-                    current_temps.append(None)
+            for block in list(self._read_plan):
+                self._read_block(block, current_temps)
+            timestamp_ns = time.perf_counter_ns()
+            if self.capture is not None:
+                self.capture.record_temps(timestamp_ns, current_temps)
             
-            self.temp_ready.emit(current_temps)
+            self.temp_ready.emit(current_temps, timestamp_ns)
         
         except Exception as e:
             logger.error(f"Temp Monitor Error: {e}", exc_info=True)
 
+    def _read_registers(self, address: int, count: int):
+        """입력 레지스터 읽기. 실패하거나 응답이 짧으면 None"""
+        res = self.client.read_input_registers(
+            address=address, 
+            count=count,
+            device_id=temp_cfg.DEFAULT_UNIT_ID  # ← 1 대신
+        )
+        if res.isError():
+            return None
+        regs = getattr(res, "registers", None)
+        if regs is None or len(regs) < count:
+            return None
+        return regs
+
+    def _read_block(self, block: tuple, out: list):
+        """블록 1회 읽기 후 채널 값 일괄 추출, 실패 시 주소별 단일 읽기"""
+        start, count, indices, offsets = block
+        
+        regs = self._read_registers(start, count)
+        if regs is not None:
+            values = np.asarray(regs[:count], dtype=np.int64)[offsets]
+            for i, val in zip(indices.tolist(), values.tolist()):
+                out[i] = val
+            return
+        
+        if count == 1:
+            return
+        
+        # 블록 읽기 실패 → 단일 읽기로 재시도
+        any_ok = False
+        for i, offset in zip(indices.tolist(), offsets.tolist()):
+            regs = self._read_registers(start + offset, 1)
+            if regs is not None:
+                out[i] = regs[0]
+                any_ok = True
+        
+        # 단일 읽기는 되는데 블록이 안 되면 장비가 빈 주소 읽기를 거부하는 것 → 계획 분할
+        if any_ok:
+            pos = self._read_plan.index(block)
+            singles = [
+                (start + offset, 1, np.array([i], dtype=np.intp), np.array([0], dtype=np.intp))
+                for i, offset in zip(indices.tolist(), offsets.tolist())
+            ]
+            self._read_plan[pos:pos + 1] = singles
+            logger.warning(
+                f"온도 블록 읽기 실패 (0x{start:04X}, {count}개) - 단일 읽기로 전환"
+            )
+
     @QtCore.pyqtSlot()
     def stop(self):
         """타이머 정지"""
@@ -101,12 +194,12 @@ class TempMonitor(QtCore.QObject):
     stop_worker = QtCore.pyqtSignal()
     interval_changed = QtCore.pyqtSignal(int)
 
-    def __init__(self, client, update_callback, interval_ms=500):
+    def __init__(self, client, update_callback, interval_ms=500, capture=None):
         super().__init__()
         
         # 스레드와 워커 생성
         self.thread = QtCore.QThread()
-        self.worker = TempWorker(client, interval_ms)
+        self.worker = TempWorker(client, interval_ms, capture=capture)
 
         # 워커를 스레드로 이동
         self.worker.moveToThread(self.thread)
@@ -0,0 +1,257 @@
+"""
+장시간 실시간 플롯용 데시메이션
+- EnvelopeStore: 최근 원본 + 과거 min/max 다해상도 엔벨로프
+- lttb: Largest-Triangle-Three-Buckets 다운샘플링
+"""
+
+import logging
+import numpy as np
+from Ring_Buffer import TimeSeriesBuffer
+
+logger = logging.getLogger(__name__)
+
+
+class _GrowableSeries:
+    """용량이 2배씩 늘어나는 (t, y) 배열"""
+
+    def __init__(self, initial: int = 1024):
+        self._t = np.empty(initial, dtype=np.float64)
+        self._y = np.empty(initial, dtype=np.float64)
+        self._n = 0
+
+    def extend(self, t, y):
+        m = len(t)
+        if self._n + m > len(self._t):
+            size = max(len(self._t) * 2, self._n + m)
+            self._t = np.resize(self._t, size)
+            self._y = np.resize(self._y, size)
+        self._t[self._n:self._n + m] = t
+        self._y[self._n:self._n + m] = y
+        self._n += m
+
+    @property
+    def times(self) -> np.ndarray:
+        return self._t[:self._n]
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._y[:self._n]
+
+    def __len__(self) -> int:
+        return self._n
+
+
+class _EnvelopeLevel:
+    """
+    min/max 엔벨로프 한 단계
+
+    입력 포인트를 group_size개씩 묶어 (최소, 최대) 두 포인트를
+    시간 순서대로 출력한다. 묶이지 않은 나머지는 pending에 남는다.
+    """
+
+    def __init__(self, group_size: int):
+        self.group_size = group_size
+        self.points = _GrowableSeries()
+        self._pending_t = []
+        self._pending_y = []
+
+    def add(self, t: float, y: float):
+        """포인트 추가. 그룹이 완성되면 출력 두 포인트를 반환"""
+        self._pending_t.append(t)
+        self._pending_y.append(y)
+        if len(self._pending_t) < self.group_size:
+            return None
+
+        ys = self._pending_y
+        i_min = min(range(len(ys)), key=ys.__getitem__)
+        i_max = max(range(len(ys)), key=ys.__getitem__)
+        first, second = sorted((i_min, i_max))
+        out_t = (self._pending_t[first], self._pending_t[second])
+        out_y = (ys[first], ys[second])
+
+        self.points.extend(out_t, out_y)
+        self._pending_t = []
+        self._pending_y = []
+        return out_t, out_y
+
+    @property
+    def pending(self):
+        return self._pending_t, self._pending_y
+
+    def clear(self):
+        self.points = _GrowableSeries()
+        self._pending_t = []
+        self._pending_y = []
+
+
+class EnvelopeStore:
+    """
+    다해상도 플롯 저장소
+
+    - level 0: 최근 capacity개 원본 (링 버퍼)
+    - level k (k>=1): 전체 이력의 min/max 엔벨로프, 해상도 1/factor^k
+
+    select()는 보이는 x 범위와 포인트 예산에 맞는 가장 세밀한 단계를 골라
+    (x, y) 배열을 반환하므로 렌더 비용이 이력 길이와 무관하게 일정하다.
+
+    Example:
+        >>> store = EnvelopeStore(capacity=10000, factor=8)
+        >>> store.append(0.01, 0.5)
+        >>> x, y = store.select(0.0, 60.0, max_points=2000)
+    """
+
+    def __init__(self, capacity: int, factor: int = 8):
+        if factor < 2:
+            raise ValueError(f"factor는 2 이상이어야 합니다: {factor}")
+
+        self.factor = int(factor)
+        self.recent = TimeSeriesBuffer(capacity, channels=1)
+        self.levels = []
+        self._total = 0
+        self._first_time = None
+
+    def append(self, t: float, y: float):
+        """원본 샘플 추가 (엔벨로프 단계로 연쇄 전파)"""
+        self.recent.append(t, y)
+        if self._total == 0:
+            self._first_time = t
+        self._total += 1
+
+        point = ([t], [y])
+        level_index = 0
+        while point is not None:
+            if level_index == len(self.levels):
+                # level 1은 원본 factor개, 이후는 하위 단계 factor개 버킷(2*factor 포인트)씩 묶음
+                group = self.factor if level_index == 0 else 2 * self.factor
+                self.levels.append(_EnvelopeLevel(group))
+
+            level = self.levels[level_index]
+            emitted = None
+            for pt, py in zip(*point):
+                out = level.add(pt, py)
+                if out is not None:
+                    emitted = out
+            point = emitted
+            level_index += 1
+
+    def clear(self):
+        self.recent.clear()
+        self.levels = []
+        self._total = 0
+        self._first_time = None
+
+    def __len__(self) -> int:
+        """지금까지 추가된 원본 샘플 수"""
+        return self._total
+
+    @property
+    def time_range(self):
+        """(처음 시각, 마지막 시각), 비어있으면 None"""
+        if self._total == 0:
+            return None
+        return float(self._first_time), float(self.recent.last_time)
+
+    # ========================================================================
+    # 단계 선택
+    # ========================================================================
+
+    def select(self, x0: float, x1: float, max_points: int):
+        """
+        [x0, x1] 구간을 max_points 이하로 표현하는 가장 세밀한 단계의 (x, y)
+
+        예산을 만족하는 단계가 없으면 가장 거친 단계를 반환한다.
+        """
+        if self._total == 0:
+            return np.empty(0), np.empty(0)
+
+        # level 0: 원본이 x0까지 덮을 때만 사용
+        recent_t = self.recent.times
+        dropped = self._total > len(self.recent)
+        if not dropped or recent_t[0] <= x0:
+            lo, hi = self._visible_slice(recent_t, x0, x1)
+            if hi - lo <= max_points or not self.levels:
+                return recent_t[lo:hi], self.recent.values()[lo:hi]
+
+        candidate = None
+        for k in range(len(self.levels)):
+            x, y = self._level_points(k, x0, x1)
+            candidate = (x, y)
+            if len(x) <= max_points:
+                break
+        return candidate
+
+    @staticmethod
+    def _visible_slice(t: np.ndarray, x0: float, x1: float):
+        """[x0, x1] 구간 인덱스 범위 (선이 화면 끝까지 이어지도록 앞뒤 한 포인트 포함)"""
+        lo = int(np.searchsorted(t, x0, side='left'))
+        hi = int(np.searchsorted(t, x1, side='right'))
+        return max(0, lo - 1), min(len(t), hi + 1)
+
+    def _level_points(self, k: int, x0: float, x1: float):
+        """level k+1 완성 포인트 + 하위 단계의 미완성(pending) 꼬리"""
+        level = self.levels[k]
+        t = level.points.times
+        lo, hi = self._visible_slice(t, x0, x1)
+
+        xs = [t[lo:hi]]
+        ys = [level.points.values[lo:hi]]
+        for j in range(k, -1, -1):
+            pt, py = self.levels[j].pending
+            if pt:
+                xs.append(np.asarray(pt))
+                ys.append(np.asarray(py))
+
+        x = np.concatenate(xs)
+        y = np.concatenate(ys)
+        # 꼬리 구간도 보이는 범위 밖은 제외 (앞뒤 한 포인트 여유)
+        mask = (x >= x0) & (x <= x1)
+        idx = np.flatnonzero(mask)
+        if len(idx) == 0:
+            return x[:0], y[:0]
+        lo = max(0, idx[0] - 1)
+        hi = min(len(x), idx[-1] + 2)
+        return x[lo:hi], y[lo:hi]
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int):
+    """
+    Largest-Triangle-Three-Buckets 다운샘플링
+
+    처음/마지막 포인트를 유지하고, 각 버킷에서 이전 선택점과 다음 버킷
+    평균점으로 만든 삼각형 면적이 가장 큰 포인트를 고른다.
+
+    Args:
+        x, y: 입력 (x 오름차순)
+        n_out: 출력 포인트 수 (3 이상)
+
+    Returns:
+        (x_out, y_out)
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            nxt_start, nxt_end = edges[i + 1], edges[i + 2]
+        else:
+            nxt_start, nxt_end = n - 1, n
+        avg_x = x[nxt_start:nxt_end].mean()
+        avg_y = y[nxt_start:nxt_end].mean()
+
+        bx = x[start:end]
+        by = y[start:end]
+        area = np.abs(
+            (x[a] - avg_x) * (by - y[a]) - (x[a] - bx) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return x[selected], y[selected]
@@ -1,11 +1,17 @@
 # Plot_Service.py
 
 from PyQt5 import QtCore, QtWidgets
+import numpy as np
 import pyqtgraph as pg
 from interfaces import IDataReceiver
-import csv
+from Log_Writer import LogWriter, CsvLogSink, events_log_path, write_events
+from Binary_Log import BinaryLogSink, binary_log_path
+from Ring_Buffer import TimeSeriesBuffer
+from Plot_Decimation import EnvelopeStore, lttb
+import time
 import logging
-from config import monitor_cfg
+from datetime import datetime
+from config import monitor_cfg, log_writer_cfg
 
 logger = logging.getLogger(__name__)
 
@@ -40,26 +46,30 @@ class PlotService(IDataReceiver):
             logger.error(f"PlotItem 초기화 실패: {e}")
             raise
         
-        # 데이터 저장소
-        self.x_data = []
-        self.y_data = []
-        
         # 최대 포인트 수 (config에서 로드)
         self.max_plot_points = monitor_cfg.MAX_PLOT_POINTS
         
+        # 데이터 저장소 (최근 원본은 링 버퍼, 전체 이력은 min/max 엔벨로프)
+        self._load_store = EnvelopeStore(
+            self.max_plot_points,
+            factor=monitor_cfg.PLOT_ENVELOPE_FACTOR
+        )
+        
         # 시간 측정기
         self.start_time = QtCore.QElapsedTimer()
+        self._start_perf = 0.0  # 획득 타임스탬프 기준점 (perf_counter 초)
         
-        # 로그 파일
-        self.log_file = None
-        self.csv_writer = None
+        # 로그 기록 스레드 (테스트 중에만 존재)
+        self.log_writer = None
+        self._log_path = None
+        self._rows_submitted = 0  # 큐에 들어간 행 수 (이벤트 행 인덱스 계산용)
+        self.events = []
         
         # 플래그
         self._is_plotting = False
 
         # ===== 온도 플롯 관련 속성 =====
-        self.temp_x = []
-        self.temp_y = [[], [], [], []]
+        self._temp_buf = TimeSeriesBuffer(self.max_plot_points, channels=4)
         self.temp_curves = []  # 통합 뷰용
         self.temp_curves_split = []  # 분할 뷰용 (4개)
         self._temp_initialized = False
@@ -71,9 +81,41 @@ class PlotService(IDataReceiver):
         # ===== 변경: 자동 범위 조정 플래그 =====
         self.temp_auto_range_enabled = True  # True면 자동 스크롤, False면 사용자 조작
         
+        # ===== 렌더 스케줄러: 수신 시 dirty 표시, 타이머 주기로만 다시 그림 =====
+        self._load_dirty = False
+        self._temp_dirty = False
+        self._render_timer = QtCore.QTimer()
+        self._render_timer.timeout.connect(self._render_tick)
+        if monitor_cfg.PLOT_RENDER_FPS > 0:
+            self._render_timer.start(max(1, int(1000 / monitor_cfg.PLOT_RENDER_FPS)))
+        
         self._setup_plot()
         logger.info("PlotService 초기화 완료")
     
+    # ========================================================================
+    # 플롯 데이터 뷰 (링 버퍼의 연속 구간, 복사 없음)
+    # ========================================================================
+    
+    @property
+    def x_data(self):
+        """하중 곡선 시간축 (s, 최근 원본)"""
+        return self._load_store.recent.times
+    
+    @property
+    def y_data(self):
+        """하중 곡선 값 (N, 최근 원본)"""
+        return self._load_store.recent.values()
+    
+    @property
+    def temp_x(self):
+        """온도 곡선 시간축 (s)"""
+        return self._temp_buf.times
+    
+    @property
+    def temp_y(self):
+        """채널별 온도 값 (CH1~CH4)"""
+        return [self._temp_buf.values(i) for i in range(4)]
+    
     def _setup_plot(self):
         """기본 테스트 그래프 설정"""
         try:
@@ -81,6 +123,12 @@ class PlotService(IDataReceiver):
             self.plot_item.setLabel('left', 'Load', units='N')
             self.plot_item.showGrid(x=True, y=True)
             self.plot_widget.setBackground('w')
+            
+            # 줌/팬/리사이즈 시 보이는 범위에 맞는 해상도로 다시 그림
+            if monitor_cfg.PLOT_DECIMATION != "none":
+                view_box = self.plot_item.getViewBox()
+                view_box.sigXRangeChanged.connect(self._on_load_view_changed)
+                view_box.sigResized.connect(self._on_load_view_changed)
         except Exception as e:
             logger.error(f"플롯 설정 실패: {e}")
     
@@ -96,44 +144,88 @@ class PlotService(IDataReceiver):
         self, 
         force_n: float, 
         position_um: float, 
-        temp_ch1: float
+        temp_ch1: float,
+        timestamp: float = None
     ):
         """로드셀 데이터 수신"""
         if not self._is_plotting:
             return
         
         try:
-            elapsed_sec = self.start_time.elapsed() / 1000.0
+            if timestamp is None:
+                elapsed_sec = self.start_time.elapsed() / 1000.0
+            else:
+                elapsed_sec = timestamp - self._start_perf
+                if elapsed_sec < 0:
+                    return  # 테스트 시작 전에 획득된 샘플
             
-            # 메모리 누수 방지
-            if len(self.x_data) >= monitor_cfg.MAX_PLOT_POINTS:
-                self.x_data.pop(0)
-                self.y_data.pop(0)
-                logger.debug(f"플롯 버퍼 정리: {len(self.x_data)} 포인트 유지")
-                
-            self.x_data.append(elapsed_sec)
-            self.y_data.append(float(force_n))
-            self.data_line.setData(self.x_data, self.y_data)
+            self._load_store.append(elapsed_sec, float(force_n))
+            self._load_dirty = True
+            self._request_render()
             
-            if self.csv_writer:
-                if temp_ch1 is not None:
-                    self.csv_writer.writerow([
-                        f"{elapsed_sec:.3f}",
-                        f"{position_um:.3f}",
-                        f"{force_n:.3f}",
-                        f"{temp_ch1:.2f}"
-                    ])
-                else:
-                    self.csv_writer.writerow([
-                        f"{elapsed_sec:.3f}",
-                        f"{position_um:.3f}",
-                        f"{force_n:.3f}",
-                        "N/A"
-                    ])
+            if self.log_writer:
+                if self.log_writer.submit(
+                    (elapsed_sec, float(position_um), float(force_n), temp_ch1)
+                ):
+                    self._rows_submitted += 1
         
         except Exception as e:
             logger.error(f"로드셀 데이터 처리 실패: {e}", exc_info=True)
     
+    def receive_loadcell_batch(self, times, forces, positions, temps):
+        """로드셀 샘플 배치 수신 (렌더 요청은 배치당 한 번)"""
+        if not self._is_plotting:
+            return
+        
+        try:
+            elapsed = np.asarray(times, dtype=np.float64) - self._start_perf
+            keep = elapsed >= 0  # 테스트 시작 전에 획득된 샘플 제외
+            if not keep.any():
+                return
+            elapsed = elapsed[keep].tolist()
+            forces = np.asarray(forces, dtype=np.float64)[keep].tolist()
+            positions = np.asarray(positions, dtype=np.float64)[keep].tolist()
+            temps = np.asarray(temps, dtype=np.float64)[keep].tolist()
+            
+            for t, force in zip(elapsed, forces):
+                self._load_store.append(t, force)
+            self._load_dirty = True
+            self._request_render()
+            
+            if self.log_writer:
+                for row in zip(elapsed, positions, forces, temps):
+                    if self.log_writer.submit(row):
+                        self._rows_submitted += 1
+        
+        except Exception as e:
+            logger.error(f"로드셀 배치 처리 실패: {e}", exc_info=True)
+    
+    def mark_event(self, kind: str, timestamp: float = None, samples_ago: int = 0, **info):
+        """
+        테스트 이벤트를 로그 행 인덱스와 함께 이벤트 파일에 기록
+        
+        Args:
+            kind: 이벤트 종류 (예: 'break')
+            timestamp: 이벤트 샘플의 획득 시각 (perf_counter 초)
+            samples_ago: 마지막 기록 행으로부터 이벤트 샘플까지의 행 수
+        """
+        if not self._is_plotting:
+            return
+        
+        event = {
+            'kind': kind,
+            'row': max(0, self._rows_submitted - 1 - int(samples_ago)),
+            'time_s': round(timestamp - self._start_perf, 6) if timestamp is not None else None,
+        }
+        event.update(info)
+        self.events.append(event)
+        logger.info(f"이벤트 기록: {event}")
+        
+        try:
+            write_events(events_log_path(self._log_path), self.events)
+        except Exception as e:
+            logger.error(f"이벤트 파일 기록 실패: {e}")
+    
     def receive_temp_data(self, elapsed: float, temps: list):
         """온도 데이터 수신"""
         if not self._temp_initialized:
@@ -142,39 +234,126 @@ class PlotService(IDataReceiver):
                 return
         
         try:
-            # 메모리 누수 방지
-            if len(self.temp_x) >= monitor_cfg.MAX_PLOT_POINTS:
-                self.temp_x.pop(0)
-                for i in range(4):
-                    if len(self.temp_y[i]) > 0:
-                        self.temp_y[i].pop(0)
-                logger.debug(f"온도 플롯 버퍼 정리: {len(self.temp_x)} 포인트 유지")
-
-            self.temp_x.append(elapsed)
+            values = [
+                temps[i] if i < len(temps) and temps[i] is not None else 0.0
+                for i in range(4)
+            ]
+            self._temp_buf.append(elapsed, *values)
+            self._temp_dirty = True
+            self._request_render()
+        
+        except Exception as e:
+            logger.error(f"온도 데이터 처리 실패: {e}", exc_info=True)
+    
+    # ========================================================================
+    # 렌더 스케줄러
+    # ========================================================================
+    
+    def _request_render(self):
+        """타이머가 없으면(PLOT_RENDER_FPS <= 0) 즉시 그림"""
+        if not self._render_timer.isActive():
+            self._render_tick()
+    
+    def _render_tick(self):
+        """
+        dirty 곡선만 다시 그림
+        
+        화면에 보이지 않는 위젯(다른 탭, 스택의 비활성 뷰)은 건너뛰고
+        dirty 상태를 유지하여 다시 보일 때 그린다.
+        """
+        try:
+            if self._load_dirty and self._is_visible(self.plot_widget):
+                self.data_line.setData(*self._load_render_data())
+                self._load_dirty = False
             
-            for i in range(min(len(temps), 4)):
-                val = temps[i] if temps[i] is not None else 0.0
-                self.temp_y[i].append(val)
+            if self._temp_dirty and self._temp_initialized and self._temp_view_visible():
+                if self.temp_view_mode == 'unified':
+                    self._update_unified_view()
+                else:  # 'split'
+                    self._update_split_view()
+                
+                # ===== 변경: 자동 범위가 활성화된 경우에만 X축 조정 =====
+                if self.temp_auto_range_enabled and len(self.temp_x) > 0:
+                    self._update_temp_xrange(self.temp_x[-1])
+                
+                self._temp_dirty = False
+        
+        except Exception as e:
+            logger.error(f"그래프 갱신 실패: {e}", exc_info=True)
+    
+    def _on_load_view_changed(self, *args):
+        """ViewBox 범위/크기 변경 → 해상도 재선택"""
+        if len(self._load_store) > 0:
+            self._load_dirty = True
+    
+    def _load_render_data(self):
+        """
+        하중 곡선 그릴 데이터 선택
+        
+        보이는 x 범위(자동 범위면 전체 이력)와 ViewBox 픽셀 폭으로 포인트 예산을
+        정하고, 예산 안에서 가장 세밀한 엔벨로프 단계를 고른다.
+        """
+        mode = monitor_cfg.PLOT_DECIMATION
+        if mode == "none" or len(self._load_store) == 0:
+            return self.x_data, self.y_data
+        
+        try:
+            view_box = self.plot_item.getViewBox()
+            width_px = max(1, int(view_box.width()))
+            
+            if view_box.state['autoRange'][0]:
+                x0, x1 = self._load_store.time_range
+            else:
+                x0, x1 = view_box.viewRange()[0]
             
-            # 뷰 모드에 따라 분기
-            if self.temp_view_mode == 'unified':
-                self._update_unified_view()
-            else:  # 'split'
-                self._update_split_view()
+            budget = max(100, int(width_px * monitor_cfg.PLOT_POINTS_PER_PIXEL))
             
-            # ===== 변경: 자동 범위가 활성화된 경우에만 X축 조정 =====
-            if self.temp_auto_range_enabled:
-                self._update_temp_xrange(elapsed)
+            if mode == "lttb":
+                x, y = self._load_store.select(x0, x1, budget * monitor_cfg.PLOT_LTTB_OVERSAMPLE)
+                return lttb(x, y, max(3, budget // 2))
+            
+            return self._load_store.select(x0, x1, budget)
         
         except Exception as e:
-            logger.error(f"온도 데이터 처리 실패: {e}", exc_info=True)
+            logger.debug(f"데시메이션 실패, 최근 원본 사용: {e}")
+            return self.x_data, self.y_data
+    
+    @staticmethod
+    def _is_visible(widget) -> bool:
+        """위젯이 실제로 화면에 보이는지 (상위 탭/스택이 숨겨져도 False)"""
+        if widget is None:
+            return False
+        try:
+            return bool(widget.isVisible())
+        except Exception:
+            return True
+    
+    def _unified_temp_widget(self):
+        """통합 뷰 온도 플롯 위젯"""
+        temp_widget = self.temp_plot_widget
+        if not temp_widget and self.ui:
+            temp_widget = getattr(self.ui, 'temp_plot_unified', None)
+        return temp_widget
+    
+    def _temp_view_visible(self) -> bool:
+        """현재 뷰 모드의 온도 플롯이 화면에 보이는지"""
+        if self.temp_view_mode == 'unified':
+            return self._is_visible(self._unified_temp_widget())
+        
+        splits = getattr(self.ui, 'temp_plot_splits', None) if self.ui else None
+        return any(self._is_visible(w) for w in splits or [])
     
     # ========================================================================
     # 플로팅 제어
     # ========================================================================
     
-    def start_plotting(self) -> bool:
-        """플로팅 및 로깅 시작"""
+    def start_plotting(self, metadata: dict = None) -> bool:
+        """
+        플로팅 및 로깅 시작
+        
+        Args:
+            metadata: 바이너리 로그에 함께 저장할 테스트 조건 (속도, 제한값 등)
+        """
         if self._is_plotting:
             logger.warning("이미 플로팅이 진행 중입니다.")
             return False
@@ -192,40 +371,57 @@ class PlotService(IDataReceiver):
             logger.info("파일 저장을 취소했습니다.")
             return False
 
+        sinks = []
         try:
-            self.log_file = open(filePath, 'w', newline='', encoding='utf-8')
-            self.csv_writer = csv.writer(self.log_file)
-            self.csv_writer.writerow([
-                'Time (s)', 
-                'Position (um)', 
-                'Load (N)',
-                'Temp_CH1 (°C)'
-            ])
+            sinks.append(CsvLogSink(filePath))
             logger.info(f"로그 파일 생성: {filePath}")
             
+            if log_writer_cfg.BINARY_LOG_ENABLED:
+                bin_path = binary_log_path(filePath)
+                meta = dict(metadata or {})
+                meta.setdefault('created', datetime.now().isoformat(timespec='seconds'))
+                sinks.append(BinaryLogSink(bin_path, meta))
+                logger.info(f"바이너리 로그 파일 생성: {bin_path}")
+            
         except PermissionError:
             logger.error(f"파일 접근 권한 없음: {filePath}")
+            self._close_sinks(sinks)
             return False
         except Exception as e:
             logger.error(f"로그 파일 열기 실패: {e}")
-            if self.log_file:
-                try:
-                    self.log_file.close()
-                except:
-                    pass
-            self.log_file = None
-            self.csv_writer = None
+            self._close_sinks(sinks)
+            self.log_writer = None
             raise
 
-        self.x_data.clear()
-        self.y_data.clear()
+        self.log_writer = LogWriter(sinks)
+        self.log_writer.start()
+        self._log_path = filePath
+        self._rows_submitted = 0
+        self.events = []
+
+        self._load_store.clear()
+        self._load_dirty = False
         self.data_line.setData(self.x_data, self.y_data)
         
         self.start_time.start()
+        self._start_perf = time.perf_counter()
         self._is_plotting = True
         
         return True
 
+    def begin_replay(self, start_time_s: float):
+        """
+        파일 대화상자/로그 없이 플로팅만 시작 (캡처 재생 벤치마크용)
+
+        Args:
+            start_time_s: 경과 시간 기준점 (재생하는 샘플의 획득 시각, 초)
+        """
+        self._load_store.clear()
+        self._load_dirty = False
+        self.start_time.start()
+        self._start_perf = start_time_s
+        self._is_plotting = True
+
     def stop_plotting(self):
         """플로팅 및 로깅 중지"""
         if not self._is_plotting:
@@ -233,22 +429,39 @@ class PlotService(IDataReceiver):
             
         self._is_plotting = False
 
-        if self.log_file:
+        if self.log_writer:
             try:
-                self.log_file.flush()
-                self.log_file.close()
+                self.log_writer.stop()
                 logger.info("로그 파일 저장 완료")
             except Exception as e:
                 logger.error(f"로그 파일 닫기 실패: {e}")
             finally:
-                self.log_file = None
-                self.csv_writer = None
+                self.log_writer = None
+    
+    @staticmethod
+    def _close_sinks(sinks: list):
+        """시작 실패 시 이미 열린 로그 파일 정리"""
+        for sink in sinks:
+            try:
+                sink.close()
+            except Exception:
+                pass
+    
+    def get_log_stats(self) -> dict:
+        """
+        로그 기록 상태 (backlog: 대기 행, written: 기록 행, dropped: 폐기 행)
+        
+        테스트 중이 아니면 빈 dict
+        """
+        if not self.log_writer:
+            return {}
+        return self.log_writer.get_stats()
     
     def clear_plot(self):
         """그래프 초기화"""
         try:
-            self.x_data.clear()
-            self.y_data.clear()
+            self._load_store.clear()
+            self._load_dirty = False
             self.data_line.setData(self.x_data, self.y_data)
         except Exception as e:
             logger.error(f"그래프 초기화 실패: {e}")
@@ -271,12 +484,9 @@ class PlotService(IDataReceiver):
         self.temp_view_mode = mode
         logger.info(f"온도 그래프 뷰 모드 변경: {mode}")
         
-        # 기존 데이터로 즉시 갱신
-        if self.temp_x:
-            if mode == 'unified':
-                self._update_unified_view()
-            else:
-                self._update_split_view()
+        # 새 뷰가 표시되는 대로 기존 데이터로 갱신
+        if len(self.temp_x) > 0:
+            self._temp_dirty = True
     
     def set_temp_auto_range(self, enabled: bool):
         """
@@ -290,7 +500,7 @@ class PlotService(IDataReceiver):
         if enabled:
             logger.info("온도 그래프: 자동 스크롤 활성화")
             # 즉시 현재 시간 기준으로 범위 설정
-            if self.temp_x:
+            if len(self.temp_x) > 0:
                 self._update_temp_xrange(self.temp_x[-1])
         else:
             logger.info("온도 그래프: 수동 모드 (마우스로 자유 조작, 우클릭 → View All)")
@@ -358,17 +568,15 @@ class PlotService(IDataReceiver):
             logger.error(f"온도 플롯 초기화 실패: {e}", exc_info=True)
     
     def _update_unified_view(self):
-        """통합 뷰 업데이트 (4채널 한 화면)"""
+        """통합 뷰 업데이트 (4채널 한 화면, 숨긴 채널은 토글 시 비워둠)"""
         for i in range(4):
             if i < len(self.temp_curves) and self.temp_curves[i]:
                 if self.channel_visible[i]:
                     self.temp_curves[i].setData(
                         self.temp_x, 
-                        self.temp_y[i],
+                        self._temp_buf.values(i),
                         connect='finite'
                     )
-                else:
-                    self.temp_curves[i].setData([], [])
     
     def _update_split_view(self):
         """분할 뷰 업데이트 (4개 그래프)"""
@@ -380,11 +588,9 @@ class PlotService(IDataReceiver):
                 if self.channel_visible[i]:
                     self.temp_curves_split[i].setData(
                         self.temp_x, 
-                        self.temp_y[i],
+                        self._temp_buf.values(i),
                         connect='finite'
                     )
-                else:
-                    self.temp_curves_split[i].setData([], [])
     
     def update_temp_plot(self, elapsed: float, temps: list):
         """온도 데이터를 실시간 그래프에 업데이트"""
@@ -466,25 +672,15 @@ class PlotService(IDataReceiver):
             is_checked = (state == QtCore.Qt.Checked)
             self.channel_visible[channel_index] = is_checked
             
-            # 즉시 갱신
-            if self.temp_view_mode == 'unified':
-                if channel_index < len(self.temp_curves):
-                    if is_checked and len(self.temp_x) > 0:
-                        self.temp_curves[channel_index].setData(
-                            self.temp_x, 
-                            self.temp_y[channel_index]
-                        )
-                    else:
-                        self.temp_curves[channel_index].setData([], [])
-            else:  # split
-                if channel_index < len(self.temp_curves_split):
-                    if is_checked and len(self.temp_x) > 0:
-                        self.temp_curves_split[channel_index].setData(
-                            self.temp_x, 
-                            self.temp_y[channel_index]
-                        )
-                    else:
-                        self.temp_curves_split[channel_index].setData([], [])
+            if is_checked:
+                # 다음 렌더 주기에 다시 그림
+                self._temp_dirty = True
+                self._request_render()
+            else:
+                # 숨긴 채널은 양쪽 뷰 모두 비워둠 (렌더 시 건너뜀)
+                for curves in (self.temp_curves, self.temp_curves_split):
+                    if channel_index < len(curves) and curves[channel_index]:
+                        curves[channel_index].setData([], [])
         except Exception as e:
             logger.error(f"채널 토글 실패: {e}")
     
@@ -493,9 +689,7 @@ class PlotService(IDataReceiver):
         window = monitor_cfg.TEMP_PLOT_WINDOW_SEC  # 기본 60초
         
         if self.temp_view_mode == 'unified':
-            temp_widget = self.temp_plot_widget
-            if not temp_widget and self.ui:
-                temp_widget = getattr(self.ui, 'temp_plot_unified', None)
+            temp_widget = self._unified_temp_widget()
             
             if temp_widget and len(self.temp_x) > 0:
                 plot_item = temp_widget.getPlotItem()
@@ -522,9 +716,8 @@ class PlotService(IDataReceiver):
             return
         
         try:
-            self.temp_x.clear()
-            for i in range(4):
-                self.temp_y[i].clear()
+            self._temp_buf.clear()
+            self._temp_dirty = False
             
             # 통합 뷰 초기화
             for i in range(len(self.temp_curves)):
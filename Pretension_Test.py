@@ -1,5 +1,5 @@
 import logging
-import time
+from concurrent.futures import Future
 from PyQt5 import QtCore
 from config import pretension_cfg  # ===== 추가 =====
 
@@ -7,119 +7,226 @@ logger = logging.getLogger(__name__)
 
 
 class PretensionTest(QtCore.QObject):
-    """Pre-Tension Test"""
-    
-    finished = QtCore.pyqtSignal() 
+    """
+    Pre-Tension Test
+
+    상태 기계:
+        idle → approach (하중 샘플마다 목표 검사, 선택적 감속)
+             → settling (모터 정지 후 진동 안정화 대기)
+             → zero_loadcell → loadcell_settle (CDL 명령 완료 → 적용 대기)
+             → zero_motor → motor_settle (커맨드8 완료 → 적용 대기)
+             → idle (finished 방출)
+
+    장비 명령은 각 장비의 I/O 스레드에서 비동기로 실행하고(Future),
+    대기는 단발 QTimer로 처리하므로 GUI 스레드를 막지 않는다.
+    stop()으로 어느 단계에서든 취소할 수 있다.
+    """
+
+    finished = QtCore.pyqtSignal()
+    _command_done = QtCore.pyqtSignal(object)  # I/O 스레드 → GUI 스레드 (Future)
 
     def __init__(self, motor_service, loadcell_service, data_handler):
         super().__init__()
         self.motor = motor_service
         self.lc_service = loadcell_service
         self.data = data_handler
-        
-        self._running = False
+
+        self._state = "idle"
         self._target_load = 0.0
-        
-        # ===== 수정: 매직 넘버 → config =====
-        self.timer = QtCore.QTimer()
-        self.timer.setInterval(pretension_cfg.CHECK_INTERVAL_MS)  # ← 50 대신
-        self.timer.timeout.connect(self._check_load_loop)
-        
+        self._base_speed = 0.0
+        self._sent_speed = None
+        self._zeroing_success = True
+        self._pending = None  # 완료를 기다리는 명령 Future
+
+        self._command_done.connect(self._on_command_done)
+
+        # 단계 간 대기용 단발 타이머 (stop()에서 취소 가능)
+        self._step_timer = QtCore.QTimer(self)
+        self._step_timer.setSingleShot(True)
+        self._step_timer.timeout.connect(self._on_step_timer)
+
         logger.info("PretensionTest 초기화 완료")
 
+    @property
+    def state(self) -> str:
+        return self._state
+
+    @property
+    def is_running(self) -> bool:
+        return self._state != "idle"
+
     def start(self, target_speed_rps: float, target_load_n: float):
         """
         Pre-Tension 시작
-        
+
         Args:
             target_speed_rps: 이동 속도 (rps)
             target_load_n: 목표 하중 (N, 절대값)
         """
-        if self._running:
+        if self.is_running:
             logger.warning("[PreTension] 이미 실행 중입니다.")
             return
-        
+
         self._target_load = abs(target_load_n)
-        self._running = True
-        
+        self._base_speed = float(target_speed_rps)
+        self._state = "approach"
+
         logger.info(f"[PreTension] 시작 - 속도: {target_speed_rps:.2f} rps, 목표: {self._target_load:.3f} N")
-        
+
         try:
+            # 하중 샘플마다 목표 검사 (폴링 주기 지연 없음)
+            self.data.add_sample_listener(self._on_sample)
+
             # 모터 속도 설정 및 이동 시작
-            self.motor.set_jog_speed(target_speed_rps)
+            self.motor.set_jog_speed(self._base_speed)
+            self._sent_speed = int(self._base_speed)
             self.motor.jog_backward()  # 당기는 방향
-            
-            # 타이머 시작 (하중 감시)
-            self.timer.start()
-            
+
             logger.info("[PreTension] 이동 시작, 하중 감시 활성화")
-        
+
         except Exception as e:
             logger.error(f"[PreTension] 시작 실패: {e}", exc_info=True)
-            self._running = False
+            self._reset()
 
     def stop(self):
-        """Pre-Tension 정지"""
-        if not self._running:
+        """Pre-Tension 정지 (0점 대기 중이면 0점 설정도 취소)"""
+        if not self.is_running:
             return
-        
-        self._running = False
-        self.timer.stop()
-        
+
+        state = self._state
+        self._reset()
+
         try:
             self.motor.stop_motor()
             logger.info("[PreTension] 모터 정지 완료")
         except Exception as e:
             logger.error(f"[PreTension] 정지 실패: {e}")
 
-    def _check_load_loop(self):
-        """타이머 콜백 - 하중 체크"""
-        if not self._running:
+        if state != "approach":
+            logger.warning(f"[PreTension] 0점 설정 취소 (단계: {state})")
+
+    def _reset(self):
+        self._state = "idle"
+        self._pending = None
+        self._step_timer.stop()
+        self.data.remove_sample_listener(self._on_sample)
+
+    # ========================================================================
+    # approach: 하중 샘플 이벤트
+    # ========================================================================
+
+    def _on_sample(self, timestamp: float, force_n: float, position_um: float):
+        """DataHandler 샘플 리스너 - 목표 하중 검사 및 접근 감속"""
+        if self._state != "approach":
             return
 
-        current_force = abs(self.data.last_force)
-        
+        current_force = abs(force_n)
+
         if current_force >= self._target_load:
             logger.info(
                 f"[PreTension] 목표 하중 도달! "
                 f"(현재: {current_force:.3f} N >= 목표: {self._target_load} N)"
             )
-            
+
             # 1. 즉시 정지
-            self.stop()
-            
-            # ===== 수정: 매직 넘버 → config =====
+            try:
+                self.motor.stop_motor()
+            except Exception as e:
+                logger.error(f"[PreTension] 정지 실패: {e}")
+            self.data.remove_sample_listener(self._on_sample)
+
             # 2. 진동 안정화 대기 후 0점 설정
-            QtCore.QTimer.singleShot(
-                pretension_cfg.SETTLING_TIME_MS,  # ← 500 대신
-                self._perform_zeroing
-            )
+            self._enter("settling", pretension_cfg.SETTLING_TIME_MS)
+            return
 
-    def _perform_zeroing(self):
-        """진동 안정화 후 자동 0점 설정"""
-        logger.info("[PreTension] 자동 0점 설정 시작...")
-        zeroing_success = True
+        if pretension_cfg.APPROACH_SLOWDOWN:
+            self._update_approach_speed(current_force)
 
-        # 1. 로드셀 0점
-        try:
-            self.lc_service.zero_position()
-            logger.info("[PreTension] 로드셀 0점 완료")
-        except Exception as e:
-            logger.error(f"[PreTension] 로드셀 0점 실패: {e}")
-            zeroing_success = False
+    def _approach_speed(self, current_force: float) -> float:
+        """목표에 가까울수록 선형 감속 (시작 비율 이전은 원래 속도)"""
+        start = pretension_cfg.APPROACH_START_FRACTION
+        min_fraction = pretension_cfg.APPROACH_MIN_SPEED_FRACTION
+        progress = current_force / self._target_load if self._target_load > 0 else 1.0
+        if progress <= start:
+            return self._base_speed
+
+        fraction = 1.0 - (progress - start) / (1.0 - start)
+        speed = self._base_speed * max(min_fraction, fraction)
+        # 드라이브 속도 레지스터는 정수 rps - 0이 되어 멈추지 않도록 1 rps 하한
+        return max(speed, min(1.0, self._base_speed))
+
+    def _update_approach_speed(self, current_force: float):
+        speed = self._approach_speed(current_force)
+        if int(speed) == self._sent_speed:
+            return  # 전송 값이 같으면 버스 트래픽 생략
+        self.motor.set_jog_speed(speed)
+        self._sent_speed = int(speed)
+        logger.debug(f"[PreTension] 접근 감속 → {speed:.2f} rps ({current_force:.3f} N)")
+
+    # ========================================================================
+    # settling → zero_loadcell → zero_motor (비차단)
+    # ========================================================================
+
+    def _enter(self, state: str, wait_ms: int):
+        self._state = state
+        self._step_timer.start(max(0, int(wait_ms)))
 
-        # 2. 모터 0점
+    def _submit(self, state: str, submit_fn):
+        """비동기 명령 제출 후 완료 대기 상태로 전환"""
+        self._state = state
         try:
-            self.motor.zero_position()
-            logger.info("[PreTension] 모터 엔코더 0점 완료")
+            future = submit_fn()
         except Exception as e:
-            logger.error(f"[PreTension] 모터 0점 실패: {e}")
-            zeroing_success = False
-
-        if zeroing_success:
-            logger.info("[PreTension] ✓ 모든 과정 완료")
-        else:
-            logger.warning("[PreTension] ✗ 일부 과정 실패")
-        
-        # Main.py에 완료 신호
-        self.finished.emit()
+            logger.error(f"[PreTension] 명령 제출 실패 ({state}): {e}")
+            future = Future()
+            future.set_exception(e)
+        self._pending = future
+        future.add_done_callback(self._command_done.emit)
+
+    def _on_step_timer(self):
+        if self._state == "settling":
+            logger.info("[PreTension] 자동 0점 설정 시작...")
+            self._zeroing_success = True
+
+            # 1. 로드셀 0점 (로드셀 워커 스레드에서 실행)
+            self._submit("zero_loadcell", lambda: self.lc_service.send_zero_command_async())
+
+        elif self._state == "loadcell_settle":
+            # 2. 모터 0점 (모터는 approach 종료 시 이미 정지, 버스 스레드에서 실행)
+            self._submit("zero_motor", lambda: self.motor.write_zero_position_async())
+
+        elif self._state == "motor_settle":
+            self._state = "idle"
+
+            if self._zeroing_success:
+                logger.info("[PreTension] ✓ 모든 과정 완료")
+            else:
+                logger.warning("[PreTension] ✗ 일부 과정 실패")
+
+            # Main.py에 완료 신호
+            self.finished.emit()
+
+    @QtCore.pyqtSlot(object)
+    def _on_command_done(self, future: Future):
+        """장비 명령 완료 (GUI 스레드)"""
+        if future is not self._pending:
+            return  # 취소된 시퀀스의 늦은 완료
+        self._pending = None
+
+        ok = not future.cancelled() and future.exception() is None and future.result() is not False
+        if not ok:
+            self._zeroing_success = False
+
+        if self._state == "zero_loadcell":
+            if ok:
+                logger.info("[PreTension] 로드셀 0점 명령 완료 (적용 대기)")
+            else:
+                logger.error("[PreTension] 로드셀 0점 실패")
+            self._enter("loadcell_settle", pretension_cfg.LOADCELL_ZERO_SETTLE_MS)
+
+        elif self._state == "zero_motor":
+            if ok:
+                logger.info("[PreTension] 모터 엔코더 0점 완료")
+            else:
+                logger.error("[PreTension] 모터 0점 실패")
+            self._enter("motor_settle", pretension_cfg.MOTOR_ZERO_SETTLE_MS)
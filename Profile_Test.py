@@ -0,0 +1,425 @@
+"""
+다단계 시험 프로파일 시퀀서
+
+JSON/YAML 프로파일의 구간(segment)을 순서대로 실행하는 상태 기계.
+구간 사이에 작업자 조작 없이 다음 구간으로 넘어간다.
+
+구간 종류:
+- ramp:   하중(force, N) 또는 위치(position, 시작 위치 기준 μm)까지 이동
+- hold:   모터 정지 후 duration_s 동안 유지 (크리프)
+- cycle:  lower ↔ upper 사이를 cycles 회 왕복 (피로)
+- unload: 하중 제거 (force: UNLOAD_FORCE_N 이하까지 풀기, position: 시작 위치로 복귀)
+
+하중을 줄이는 단계(풀기 방향 이동)에 들어가고 나올 때 unloading_changed를 방출해
+그 단계 동안만 파단 감지 / 하중 감소 검사를 끄게 한다.
+
+하중 제어는 jog(당김 = jog_backward, 풀기 = jog_forward)로,
+위치 제어는 move_to_absolute로 구동한다. 도달 조건은 DataHandler의
+하중 샘플 리스너와 위치 리스너(모터 샘플)로, hold 경과와 단계 시간 초과는
+시퀀서 타이머로 평가하므로 로드셀 샘플이 끊겨도 시간 조건은 진행된다.
+로드셀 샘플이 SAMPLE_STALE_S 이상 끊기면 시작을 거부하거나 중단한다.
+
+프로파일 예 (JSON):
+    {
+      "name": "creep-then-fatigue",
+      "segments": [
+        {"type": "ramp", "control": "force", "target": 50, "speed_rps": 20},
+        {"type": "hold", "duration_s": 600},
+        {"type": "cycle", "control": "position", "lower": 100, "upper": 500,
+         "cycles": 10, "speed_rps": 50},
+        {"type": "unload", "speed_rps": 50}
+      ]
+    }
+"""
+
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+from PyQt5 import QtCore
+from config import motor_cfg, profile_cfg
+
+logger = logging.getLogger(__name__)
+
+
+SEGMENT_TYPES = ("ramp", "hold", "cycle", "unload")
+CONTROL_MODES = ("force", "position")
+
+
+# ============================================================================
+# 프로파일 정의
+# ============================================================================
+
+@dataclass(frozen=True)
+class ProfileSegment:
+    """
+    프로파일 구간 1개
+
+    target/lower/upper 단위는 control에 따라 N(force) 또는 μm(position).
+    speed_rps가 None이면 시퀀서의 기본 속도(Speed 설정값)를 사용한다.
+    timeout_s가 0보다 크면 구간이 그 시간 안에 끝나지 않을 때 시험을 중단한다.
+    """
+    type: str
+    control: str = "force"
+    target: float = 0.0
+    lower: float = 0.0
+    upper: float = 0.0
+    cycles: int = 1
+    duration_s: float = 0.0
+    speed_rps: Optional[float] = None
+    timeout_s: float = 0.0
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ProfileSegment':
+        """dict → 구간 (형식 오류 시 ValueError)"""
+        if not isinstance(data, dict):
+            raise ValueError(f"구간은 객체여야 합니다: {data!r}")
+        unknown = set(data) - set(cls.__dataclass_fields__)
+        if unknown:
+            raise ValueError(f"알 수 없는 구간 항목: {sorted(unknown)}")
+        if data.get("type") not in SEGMENT_TYPES:
+            raise ValueError(f"구간 type은 {SEGMENT_TYPES} 중 하나여야 합니다: {data.get('type')!r}")
+
+        segment = cls(**data)
+        segment._validate()
+        return segment
+
+    def _validate(self):
+        if self.control not in CONTROL_MODES:
+            raise ValueError(f"control은 {CONTROL_MODES} 중 하나여야 합니다: {self.control!r}")
+        if self.speed_rps is not None and not 0 < self.speed_rps <= motor_cfg.MAX_SPEED_RPS:
+            raise ValueError(f"speed_rps 범위 초과: {self.speed_rps}")
+        if self.type == "hold" and self.duration_s <= 0:
+            raise ValueError("hold 구간에는 양수 duration_s가 필요합니다")
+        if self.type == "cycle":
+            if self.cycles < 1:
+                raise ValueError("cycle 구간의 cycles는 1 이상이어야 합니다")
+            if self.lower >= self.upper:
+                raise ValueError(f"cycle 구간은 lower < upper 여야 합니다: {self.lower} / {self.upper}")
+        if self.control == "force" and min(self.target, self.lower) < 0:
+            raise ValueError("하중 목표는 절대값(0 이상)으로 지정합니다")
+        # 0 N 부근은 노이즈 때문에 풀기 방향 종료 조건(|F| <= 목표)이 끝나지 않을 수 있음
+        floor = profile_cfg.UNLOAD_FORCE_N
+        if self.control == "force" and (
+            (self.type == "ramp" and self.target < floor)
+            or (self.type == "cycle" and self.lower < floor)
+        ):
+            raise ValueError(
+                f"하중 목표는 unload 종료 하중({floor:g} N) 이상이어야 합니다 "
+                f"(하중 제거는 unload 구간 사용)"
+            )
+
+
+@dataclass(frozen=True)
+class Profile:
+    """구간 목록으로 된 시험 프로파일"""
+    name: str
+    segments: Tuple[ProfileSegment, ...]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Profile':
+        segments = data.get("segments") if isinstance(data, dict) else None
+        if not segments:
+            raise ValueError("프로파일에 segments가 없습니다")
+        return cls(
+            name=str(data.get("name", "profile")),
+            segments=tuple(ProfileSegment.from_dict(s) for s in segments)
+        )
+
+
+def load_profile(path: str) -> Profile:
+    """
+    JSON/YAML 프로파일 파일 로드
+
+    Raises:
+        ValueError: 형식 오류 또는 YAML 미지원 환경
+        OSError: 파일 읽기 실패
+    """
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, 'r', encoding='utf-8') as f:
+        if ext in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError("YAML 프로파일에는 PyYAML이 필요합니다")
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+
+    profile = Profile.from_dict(data)
+    logger.info(f"프로파일 로드: {profile.name} ({len(profile.segments)}개 구간) - {path}")
+    return profile
+
+
+# ============================================================================
+# 시퀀서 상태 기계
+# ============================================================================
+
+@dataclass(frozen=True)
+class _Step:
+    """실행 단위 (cycle은 왕복 구간마다 1개씩 펼침)"""
+    segment_index: int
+    label: str
+    kind: str                  # 'move' / 'hold'
+    control: str = "force"
+    target: float = 0.0
+    speed_rps: float = 0.0
+    duration_s: float = 0.0
+    timeout_s: float = 0.0
+
+
+class ProfileSequencer(QtCore.QObject):
+    """
+    프로파일 실행기
+
+    - start(): 구간을 실행 단계로 펼치고 DataHandler 샘플/위치 리스너와 타이머 시작
+    - 하중 샘플: 하중/위치 도달 평가, 모터 샘플: 위치 도달 평가
+    - 타이머(TICK_MS): hold 경과, 단계 시간 초과, 로드셀 샘플 끊김 평가
+    - stop(): 모터 정지 후 중단 (Main의 중앙 정지에서 호출, finished 방출 안 함)
+
+    finished는 시퀀서가 스스로 끝낸 경우(완료 / 단계 시간 초과 / 샘플 끊김 /
+    시작 거부)에만 방출된다. unloading_changed는 하중 제거 단계 진입(True)과
+    당김/유지 단계 진입(False) 시 값이 바뀔 때만 방출된다.
+
+    위치는 시작 위치(DataHandler.start_pos_um) 기준이며,
+    하중은 절대값으로 비교한다.
+    """
+
+    step_started = QtCore.pyqtSignal(int, str)   # (구간 번호, 설명)
+    finished = QtCore.pyqtSignal(bool, str)      # (정상 완료 여부, 사유)
+    unloading_changed = QtCore.pyqtSignal(bool)  # 하중 제거 단계 여부
+
+    def __init__(self, motor_service, data_handler, get_run_speed_callback: Callable[[], float]):
+        super().__init__()
+        self.motor = motor_service
+        self.data = data_handler
+        self.get_run_speed = get_run_speed_callback
+
+        self.profile: Optional[Profile] = None
+        self._steps: List[_Step] = []
+        self._index = -1
+        self._step_started_at = 0.0
+        self._direction = 0        # force 이동: +1 당김 / -1 풀기
+        self._start_pos_um = 0.0
+        self._unloading = False
+        self._running = False
+
+        # 시간 조건 평가용 (샘플 도착과 무관하게 주기 실행)
+        self._tick = QtCore.QTimer(self)
+        self._tick.setInterval(profile_cfg.TICK_MS)
+        self._tick.timeout.connect(self._on_tick)
+
+        logger.info("ProfileSequencer 초기화 완료")
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def current_step(self) -> Optional[_Step]:
+        if 0 <= self._index < len(self._steps):
+            return self._steps[self._index]
+        return None
+
+    # ========================================================================
+    # 시작 / 정지
+    # ========================================================================
+
+    def start(self, profile: Profile) -> bool:
+        """
+        프로파일 실행 시작 (시작 위치는 미리 capture_start_position 되어 있어야 함)
+
+        Returns:
+            시작 여부 (로드셀 샘플이 없거나 끊겼으면 finished(False)를 방출하고 False)
+        """
+        if self._running:
+            logger.warning("[PROFILE] 이미 실행 중입니다.")
+            return False
+
+        self.profile = profile
+        stale = self._loadcell_stale_reason(time.perf_counter())
+        if stale:
+            logger.warning(f"[PROFILE] 시작 거부 - {profile.name}: {stale}")
+            self.finished.emit(False, stale)
+            return False
+
+        self._steps = self._expand(profile)
+        self._start_pos_um = self.data.start_pos_um
+        self._index = -1
+        self._unloading = False    # 시험 시작 시 검사는 켜진 상태 (begin_test_safety)
+        self._running = True
+        self.data.add_sample_listener(self._on_sample)
+        self.data.add_position_listener(self._on_position)
+        self._tick.start()
+
+        logger.info(f"[PROFILE] 시작 - {profile.name} ({len(self._steps)}단계)")
+        self._advance()
+        return True
+
+    def stop(self, reason: str = "중지"):
+        """외부 요청으로 중단 (모터 정지)"""
+        if not self._running:
+            return
+        self._finish(False, reason, notify=False)
+
+    def _finish(self, completed: bool, reason: str, notify: bool = True):
+        self._running = False
+        self._tick.stop()
+        self.data.remove_sample_listener(self._on_sample)
+        self.data.remove_position_listener(self._on_position)
+        try:
+            self.motor.stop_motor()
+        except Exception as e:
+            logger.error(f"[PROFILE] 모터 정지 실패: {e}")
+
+        if completed:
+            logger.info(f"[PROFILE] ✓ 완료 - {self.profile.name}")
+        else:
+            logger.warning(f"[PROFILE] 중단 ({self._index + 1}/{len(self._steps)}단계) - {reason}")
+        if notify:
+            self.finished.emit(completed, reason)
+
+    # ========================================================================
+    # 단계 전환
+    # ========================================================================
+
+    def _expand(self, profile: Profile) -> List[_Step]:
+        try:
+            default_speed = float(self.get_run_speed())
+        except Exception:
+            default_speed = motor_cfg.DEFAULT_SAFE_SPEED_RPS
+
+        steps = []
+        for i, seg in enumerate(profile.segments):
+            speed = seg.speed_rps if seg.speed_rps is not None else default_speed
+            common = dict(segment_index=i, speed_rps=speed, timeout_s=seg.timeout_s)
+
+            if seg.type == "ramp":
+                steps.append(_Step(label=f"ramp {seg.control} → {seg.target:g}", kind="move",
+                                   control=seg.control, target=seg.target, **common))
+            elif seg.type == "hold":
+                steps.append(_Step(label=f"hold {seg.duration_s:g}s", kind="hold",
+                                   duration_s=seg.duration_s, **common))
+            elif seg.type == "cycle":
+                for n in range(1, seg.cycles + 1):
+                    for bound in (seg.upper, seg.lower):
+                        steps.append(_Step(
+                            label=f"cycle {n}/{seg.cycles} {seg.control} → {bound:g}",
+                            kind="move", control=seg.control, target=bound, **common
+                        ))
+            else:  # unload
+                target = profile_cfg.UNLOAD_FORCE_N if seg.control == "force" else 0.0
+                steps.append(_Step(label=f"unload {seg.control}", kind="move",
+                                   control=seg.control, target=target, **common))
+        return steps
+
+    def _advance(self):
+        """다음 단계 진입 (없으면 완료)"""
+        self._index += 1
+        step = self.current_step
+        if step is None:
+            self._finish(True, "프로파일 완료")
+            return
+
+        self._step_started_at = time.perf_counter()
+        logger.info(f"[PROFILE] [{self._index + 1}/{len(self._steps)}] {step.label}")
+        self.step_started.emit(step.segment_index, step.label)
+
+        if step.kind == "hold":
+            self._set_unloading(False)
+            self.motor.stop_motor()
+        elif step.control == "position":
+            # 시작 위치에서 멀어지면 당김, 가까워지면 하중 제거
+            current = abs(self.data.last_pos_um - self._start_pos_um)
+            self._set_unloading(abs(step.target) < current)
+            target_um = self._start_pos_um + step.target
+            self.motor.move_to_absolute(self._um_to_pulses(target_um), step.speed_rps)
+        else:
+            current = abs(self.data.last_force)
+            self._direction = 1 if step.target > current else -1
+            self._set_unloading(self._direction < 0)
+            self.motor.set_jog_speed(step.speed_rps)
+            if self._direction > 0:
+                self.motor.jog_backward()  # 당김
+            else:
+                self.motor.jog_forward()   # 풀기
+
+    def _set_unloading(self, unloading: bool):
+        """하중 제거 단계 여부가 바뀌면 방출 (모터 명령 전에 검사 상태를 맞춤)"""
+        if unloading != self._unloading:
+            self._unloading = unloading
+            self.unloading_changed.emit(unloading)
+
+    def _on_sample(self, timestamp: float, force_n: float, position_um: float):
+        """DataHandler 하중 샘플 리스너 - 하중/위치 도달 평가"""
+        step = self.current_step
+        if not self._running or step is None:
+            return
+
+        if step.kind == "move" and self._reached(step, abs(force_n), position_um):
+            if step.control == "force":
+                self.motor.stop_motor()
+            self._advance()
+        else:
+            self._check_time(step, timestamp)
+
+    def _on_position(self, timestamp: float, position_um: float):
+        """DataHandler 위치 리스너 - 위치 제어 단계 도달 평가 (로드셀 샘플 불필요)"""
+        step = self.current_step
+        if not self._running or step is None:
+            return
+
+        if step.kind == "move" and step.control == "position" and self._reached(step, 0.0, position_um):
+            self._advance()
+        else:
+            self._check_time(step, timestamp)
+
+    def _on_tick(self):
+        """시퀀서 타이머 - 로드셀 샘플 끊김과 시간 조건 평가"""
+        step = self.current_step
+        if not self._running or step is None:
+            return
+
+        now = time.perf_counter()
+        stale = self._loadcell_stale_reason(now)
+        if stale:
+            self._finish(False, stale)
+            return
+        self._check_time(step, now)
+
+    def _check_time(self, step: _Step, now: float):
+        """hold 경과 / 단계 시간 초과 평가"""
+        elapsed = now - self._step_started_at
+        if step.kind == "hold" and elapsed >= step.duration_s:
+            self._advance()
+        elif step.timeout_s > 0 and elapsed >= step.timeout_s:
+            self._finish(False, f"단계 시간 초과: {step.label} ({step.timeout_s:g}s)")
+
+    def _loadcell_stale_reason(self, now: float) -> str:
+        """로드셀 샘플이 없거나 SAMPLE_STALE_S 이상 끊겼으면 사유, 아니면 빈 문자열"""
+        last = self.data.last_force_time
+        if last is None:
+            return "로드셀 샘플 없음"
+        age = now - last
+        if age > profile_cfg.SAMPLE_STALE_S:
+            return f"로드셀 샘플 끊김 ({age:.1f}s)"
+        return ""
+
+    def _reached(self, step: _Step, force: float, position_um: float) -> bool:
+        """이동 단계 목표 도달 여부"""
+        if step.control == "position":
+            target_um = self._start_pos_um + step.target
+            return abs(position_um - target_um) <= profile_cfg.POSITION_TOLERANCE_UM
+        if self._direction > 0:
+            return force >= step.target
+        return force <= step.target
+
+    @staticmethod
+    def _um_to_pulses(pos_um: float) -> int:
+        """모니터 위치(μm) → 드라이브 절대 위치(펄스), MotorWorker 변환의 역"""
+        return int(round(
+            pos_um / motor_cfg.UM_PER_MM * motor_cfg.POSITION_SCALE_FACTOR
+            / motor_cfg.POSITION_SIGN_INVERT
+        ))
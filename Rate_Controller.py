@@ -0,0 +1,287 @@
+"""
+폐루프 속도 제어 (변위율 / 하중률 / 변형률 일정 제어)
+
+BasicTest의 개루프 jog를 대신해 전용 스레드가 고정 주기로
+동기화 버퍼의 최근 위치/하중 샘플에서 변화율을 추정하고,
+피드포워드 + PID로 jog 속도를 보정한다.
+
+- displacement: 목표 변위율 (μm/s)
+- force:        목표 하중률 (N/s)
+- strain:       목표 변형률 (1/s, 게이지 길이 기준 변위율로 환산)
+
+주기는 절대 기한(deadline) 기준으로 스케줄하며, 기한 대비
+실제 실행 시각의 지연(jitter)을 히스토그램으로 기록한다.
+GUI 이벤트 루프와 무관하게 동작한다.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Optional
+import numpy as np
+from Emergency_Stop import LatencyHistogram
+from config import motor_cfg, rate_control_cfg
+
+logger = logging.getLogger(__name__)
+
+
+MODE_UNITS = {
+    'displacement': "μm/s",
+    'force': "N/s",
+    'strain': "1/s",
+}
+
+
+def estimate_rate(times: np.ndarray, values: np.ndarray) -> Optional[float]:
+    """
+    최소제곱 기울기 (값/초)
+
+    샘플이 3개 미만이거나 시간 폭이 0이면 None
+    """
+    if len(times) < 3:
+        return None
+    t = times - times.mean()
+    denom = float(np.dot(t, t))
+    if denom <= 0:
+        return None
+    return float(np.dot(t, values - values.mean()) / denom)
+
+
+class PIDController:
+    """
+    PID (적분항 클램프 anti-windup)
+
+    오차와 출력 단위는 호출 측이 정한다 (여기서는 상대 오차 → 속도 배율).
+    """
+
+    def __init__(self, kp: float, ki: float, kd: float, integral_limit: float):
+        self.kp = kp
+        self.ki = ki
+        self.kd = kd
+        self.integral_limit = integral_limit
+        self.reset()
+
+    def reset(self):
+        self.integral = 0.0
+        self._last_error = None
+
+    def update(self, error: float, dt: float) -> float:
+        """오차 1회 반영 후 제어 출력 반환"""
+        if dt > 0:
+            self.integral += error * dt
+            limit = self.integral_limit
+            self.integral = max(-limit, min(limit, self.integral))
+
+        derivative = 0.0
+        if self._last_error is not None and dt > 0:
+            derivative = (error - self._last_error) / dt
+        self._last_error = error
+
+        return self.kp * error + self.ki * self.integral + self.kd * derivative
+
+
+class RateController:
+    """
+    고정 주기 변화율 제어 루프
+
+    Example:
+        >>> controller = RateController(motor, synchronizer, speed.umsec_to_rps)
+        >>> motor.jog_backward()
+        >>> controller.start(base_rps=2.0)
+        >>> ...
+        >>> controller.stop()
+        >>> controller.get_stats()['jitter']['p99_us']
+    """
+
+    def __init__(
+        self,
+        motor,
+        synchronizer,
+        umsec_to_rps: Callable[[float], float],
+        config=None
+    ):
+        """
+        Args:
+            motor: MotorService (set_jog_speed)
+            synchronizer: DataSynchronizer (get_recent)
+            umsec_to_rps: μm/s → rps 변환 (SpeedController.umsec_to_rps)
+            config: RateControlConfig (기본: 전역 설정)
+        """
+        self.motor = motor
+        self.sync = synchronizer
+        self.umsec_to_rps = umsec_to_rps
+        self.cfg = config or rate_control_cfg
+
+        self.pid = PIDController(
+            self.cfg.KP, self.cfg.KI, self.cfg.KD, self.cfg.INTEGRAL_LIMIT
+        )
+        self.jitter = LatencyHistogram()
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+        self.target_rate = 0.0
+        self.feedforward_rps = 0.0
+        self.last_rate: Optional[float] = None
+        self.last_rps: Optional[float] = None
+        self._sent_rps: Optional[float] = None
+        self._last_tick: Optional[float] = None
+        self.ticks = 0
+        self.updates = 0
+
+        logger.info(f"RateController 초기화 완료 (모드: {self.cfg.MODE}, {self.cfg.LOOP_HZ} Hz)")
+
+    # ========================================================================
+    # 시작 / 정지 (GUI 스레드)
+    # ========================================================================
+
+    def start(self, base_rps: float):
+        """
+        제어 루프 시작 (jog가 이미 base_rps로 움직이는 상태에서 호출)
+
+        Args:
+            base_rps: 현재 설정 속도 (force 모드의 피드포워드,
+                      displacement 모드에서 TARGET_RATE가 0이면 목표로 사용)
+        """
+        self.stop()
+
+        self.target_rate, self.feedforward_rps = self._resolve_target(float(base_rps))
+        self.pid.reset()
+        self.jitter.reset()
+        self.last_rate = None
+        self.last_rps = None
+        self._sent_rps = float(base_rps)
+        self._last_tick = None
+        self.ticks = 0
+        self.updates = 0
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="RateController", daemon=True)
+        self._thread.start()
+
+        logger.info(
+            f"[RATE] 제어 시작 - 목표 {self.target_rate:.4g} {MODE_UNITS[self.cfg.MODE]}, "
+            f"피드포워드 {self.feedforward_rps:.3f} rps"
+        )
+
+    def stop(self):
+        """제어 루프 정지 (최대 한 주기 + 진행 중 통신 대기)"""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop_event.set()
+        if thread is not threading.current_thread():
+            thread.join(timeout=max(1.0, 2.0 / self.cfg.LOOP_HZ))
+        self._thread = None
+
+        stats = self.jitter.summary()
+        logger.info(
+            f"[RATE] 제어 정지 - {self.ticks}회 실행, 속도 변경 {self.updates}회, "
+            f"지터 p99 {stats['p99_us']} us (최대 {stats['max_us']} us)"
+        )
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_stats(self) -> dict:
+        """제어 루프 통계"""
+        return {
+            'mode': self.cfg.MODE,
+            'target_rate': self.target_rate,
+            'last_rate': self.last_rate,
+            'last_rps': self.last_rps,
+            'ticks': self.ticks,
+            'updates': self.updates,
+            'jitter': self.jitter.summary(),
+        }
+
+    def _resolve_target(self, base_rps: float):
+        """(목표 변화율, 피드포워드 rps)"""
+        mode = self.cfg.MODE
+        target = self.cfg.TARGET_RATE
+        if mode == 'force':
+            return target, base_rps
+        if mode == 'strain':
+            target_um_s = target * self.cfg.GAUGE_LENGTH_MM * motor_cfg.UM_PER_MM
+            return target, self.umsec_to_rps(target_um_s)
+        if target <= 0:
+            # 설정 속도를 그대로 목표 변위율로 사용
+            return base_rps / self.umsec_to_rps(1.0), base_rps
+        return target, self.umsec_to_rps(target)
+
+    # ========================================================================
+    # 제어 루프 (전용 스레드)
+    # ========================================================================
+
+    def _run(self):
+        period_ns = int(1e9 / self.cfg.LOOP_HZ)
+        deadline = time.perf_counter_ns() + period_ns
+
+        while not self._stop_event.is_set():
+            remaining = deadline - time.perf_counter_ns()
+            if remaining > 0 and self._stop_event.wait(remaining / 1e9):
+                break
+
+            now_ns = time.perf_counter_ns()
+            self.jitter.record(max(0, now_ns - deadline))
+            try:
+                self.step(now_ns / 1e9)
+            except Exception as e:
+                logger.error(f"[RATE] 제어 주기 실행 실패: {e}", exc_info=True)
+
+            # 밀린 주기는 건너뛰고 다음 기한으로 (누적 지연 방지)
+            deadline += period_ns
+            if deadline <= now_ns:
+                deadline = now_ns + period_ns - (now_ns - deadline) % period_ns
+
+    def step(self, now: float) -> Optional[float]:
+        """
+        제어 1회 실행
+
+        Args:
+            now: 현재 시각 (perf_counter 기준 초, 샘플 타임스탬프와 같은 기준)
+        Returns:
+            이번 주기의 지령 속도 (rps), 측정값이 없어 출력을 유지했으면 None
+        """
+        self.ticks += 1
+        rate = self._measure_rate(now)
+        if rate is None or self.target_rate <= 0:
+            self._last_tick = None  # 측정 공백 구간은 적분하지 않음
+            return None
+
+        dt = 0.0 if self._last_tick is None else now - self._last_tick
+        self._last_tick = now
+        self.last_rate = rate
+
+        # 상대 오차 → 피드포워드 대비 보정 비율 (모드와 무관한 게인)
+        error = (self.target_rate - rate) / self.target_rate
+        correction = self.pid.update(error, dt)
+        rps = self.feedforward_rps * (1.0 + correction)
+        rps = max(0.0, min(motor_cfg.MAX_SPEED_RPS, rps))
+        self.last_rps = rps
+
+        if self._sent_rps is None or abs(rps - self._sent_rps) >= self.cfg.MIN_DELTA_RPS:
+            self.motor.set_jog_speed(rps)
+            self._sent_rps = rps
+            self.updates += 1
+        return rps
+
+    def _measure_rate(self, now: float) -> Optional[float]:
+        """모드 단위의 현재 변화율 (크기). 샘플이 부족하거나 오래되면 None"""
+        pos_t, pos_v, force_t, force_v = self.sync.get_recent(self.cfg.ESTIMATE_WINDOW_SEC)
+        if self.cfg.MODE == 'force':
+            times, values = force_t, force_v
+        else:
+            times, values = pos_t, pos_v
+
+        if len(times) == 0 or now - times[-1] > self.cfg.STALE_SEC:
+            return None
+        slope = estimate_rate(times, values)
+        if slope is None:
+            return None
+
+        rate = abs(slope)
+        if self.cfg.MODE == 'strain':
+            rate /= self.cfg.GAUGE_LENGTH_MM * motor_cfg.UM_PER_MM
+        return rate
@@ -0,0 +1,148 @@
+"""
+시계열 링 버퍼
+사전 할당된 NumPy 배열 기반 고정 용량 (timestamp, value...) 버퍼
+"""
+
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class TimeSeriesBuffer:
+    """
+    고정 용량 시계열 링 버퍼
+
+    - 용량의 2배 배열에 같은 샘플을 두 번 기록(double-write)하여
+      최신 N개 구간이 항상 연속 메모리 뷰로 노출됨 (복사 없음)
+    - 타임스탬프는 단조 증가를 가정 (searchsorted 검색용)
+    - 용량 초과 시 가장 오래된 샘플부터 덮어씀
+
+    Example:
+        >>> buf = TimeSeriesBuffer(capacity=1000, channels=1)
+        >>> buf.append(1.0, 100.0)
+        >>> buf[-1]
+        (1.0, 100.0)
+    """
+
+    def __init__(self, capacity: int, channels: int = 1):
+        if capacity <= 0:
+            raise ValueError(f"capacity는 양수여야 합니다: {capacity}")
+        if channels <= 0:
+            raise ValueError(f"channels는 양수여야 합니다: {channels}")
+
+        self.capacity = int(capacity)
+        self.channels = int(channels)
+
+        self._times = np.zeros(2 * self.capacity, dtype=np.float64)
+        self._values = np.zeros((self.channels, 2 * self.capacity), dtype=np.float64)
+        self._start = 0  # 유효 구간 시작 인덱스 (0 ~ capacity-1)
+        self._size = 0
+
+    # ========================================================================
+    # 쓰기
+    # ========================================================================
+
+    def append(self, timestamp: float, *values: float):
+        """
+        샘플 추가
+
+        Args:
+            timestamp: 샘플 시각
+            *values: 채널별 값 (channels 개수만큼)
+        """
+        if len(values) != self.channels:
+            raise ValueError(f"값 개수 불일치: {len(values)} (필요: {self.channels})")
+
+        if self._size < self.capacity:
+            pos = self._start + self._size
+            self._size += 1
+        else:
+            pos = self._start
+            self._start = (self._start + 1) % self.capacity
+
+        # 같은 샘플을 pos와 pos+capacity 두 곳에 기록
+        slot = pos % self.capacity
+        self._times[slot] = timestamp
+        self._times[slot + self.capacity] = timestamp
+        for ch, value in enumerate(values):
+            self._values[ch, slot] = value
+            self._values[ch, slot + self.capacity] = value
+
+    def extend(self, timestamps, *values):
+        """
+        샘플 배치 추가 (벡터화, append 반복과 같은 결과)
+
+        Args:
+            timestamps: 샘플 시각 배열
+            *values: 채널별 값 배열 (channels 개수만큼)
+        """
+        if len(values) != self.channels:
+            raise ValueError(f"값 개수 불일치: {len(values)} (필요: {self.channels})")
+
+        t = np.asarray(timestamps, dtype=np.float64)
+        vals = [np.asarray(v, dtype=np.float64) for v in values]
+        n = len(t)
+        if n == 0:
+            return
+        if n >= self.capacity:
+            # 배치가 용량 이상이면 마지막 capacity개만 남음
+            t = t[-self.capacity:]
+            vals = [v[-self.capacity:] for v in vals]
+            self._start = 0
+            self._size = 0
+            n = self.capacity
+
+        slots = (self._start + self._size + np.arange(n)) % self.capacity
+        self._times[slots] = t
+        self._times[slots + self.capacity] = t
+        for ch, v in enumerate(vals):
+            self._values[ch, slots] = v
+            self._values[ch, slots + self.capacity] = v
+
+        total = self._size + n
+        if total > self.capacity:
+            self._start = (self._start + total - self.capacity) % self.capacity
+            self._size = self.capacity
+        else:
+            self._size = total
+
+    def clear(self):
+        """버퍼 비우기 (메모리는 유지)"""
+        self._start = 0
+        self._size = 0
+
+    # ========================================================================
+    # 읽기 (연속 뷰)
+    # ========================================================================
+
+    @property
+    def times(self) -> np.ndarray:
+        """타임스탬프 뷰 (오래된 순, 읽기 전용으로 사용)"""
+        return self._times[self._start:self._start + self._size]
+
+    def values(self, channel: int = 0) -> np.ndarray:
+        """채널 값 뷰 (오래된 순, 읽기 전용으로 사용)"""
+        return self._values[channel, self._start:self._start + self._size]
+
+    @property
+    def last_time(self):
+        """가장 최근 타임스탬프 (비어있으면 None)"""
+        if self._size == 0:
+            return None
+        return float(self._times[self._start + self._size - 1])
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> tuple:
+        """index번째 샘플을 (timestamp, value...) 튜플로 반환"""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("TimeSeriesBuffer index out of range")
+
+        pos = self._start + index
+        return (float(self._times[pos]),) + tuple(
+            float(self._values[ch, pos]) for ch in range(self.channels)
+        )
@@ -5,12 +5,26 @@
 """
 
 import logging
+from dataclasses import dataclass, replace
 from typing import Tuple
+import numpy as np
 from interfaces import ISafetyGuard
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class SafetyLimits:
+    """
+    안전 제한값 스냅샷 (불변)
+
+    값이 바뀌면 새 객체로 통째로 교체되므로, 어느 스레드에서 읽어도
+    두 값이 항상 같은 시점의 조합이다. 0 이하는 검사 안 함.
+    """
+    displacement_limit_mm: float = 0.0
+    force_limit_n: float = 0.0
+
+
 class SafetyGuard(ISafetyGuard):
     """
     안전 제한 검사
@@ -19,22 +33,80 @@ class SafetyGuard(ISafetyGuard):
     - 변위 제한 초과 감지
     - 하중 변화량 제한 초과 감지
     - 가드 상태 관리
+    
+    제한값은 SpinBox의 valueChanged로 갱신되는 SafetyLimits 스냅샷을
+    사용하므로 검사 경로에서 위젯에 접근하지 않는다 (워커 스레드/재생에서도 사용 가능).
     """
     
-    def __init__(self, ui, config):
+    def __init__(self, ui, config, limits: SafetyLimits = None):
         """
         Args:
-            ui: GUI 객체 (설정값 읽기용)
+            ui: GUI 객체 (제한값 SpinBox, 없으면 None)
             config: 설정 객체
+            limits: 초기 제한값 (없으면 UI에서 읽음)
         """
         self.ui = ui
         self.config = config
         
         self._disp_guard_fired = False
         self._force_guard_fired = False
+        self.load_drop_checks = True  # False면 하중 변화량 검사에서 감소 방향은 제외
+        
+        self._limits = limits if limits is not None else SafetyLimits()
+        if limits is None and ui is not None:
+            self.refresh_from_ui()
+        self._connect_ui_signals()
         
         logger.info("SafetyGuard 초기화 완료")
     
+    # ========================================================================
+    # 제한값 스냅샷
+    # ========================================================================
+    
+    @property
+    def limits(self) -> SafetyLimits:
+        """현재 제한값 스냅샷"""
+        return self._limits
+    
+    def set_limits(self, displacement_limit_mm: float = None, force_limit_n: float = None):
+        """
+        제한값 갱신 (지정한 값만 바꾼 새 스냅샷으로 교체)
+        """
+        changes = {}
+        if displacement_limit_mm is not None:
+            changes['displacement_limit_mm'] = float(displacement_limit_mm)
+        if force_limit_n is not None:
+            changes['force_limit_n'] = float(force_limit_n)
+        self._limits = replace(self._limits, **changes)
+        logger.debug(f"안전 제한값 갱신: {self._limits}")
+    
+    def refresh_from_ui(self):
+        """SpinBox 현재값으로 스냅샷 갱신 (GUI 스레드에서 호출)"""
+        self.set_limits(
+            displacement_limit_mm=self._spinbox_value('DisplaceLimitMax_doubleSpinBox'),
+            force_limit_n=self._spinbox_value('ForceLimitMax_doubleSpinBox')
+        )
+    
+    def _spinbox_value(self, name: str) -> float:
+        try:
+            return float(getattr(self.ui, name).value())
+        except Exception:
+            return 0.0
+    
+    def _connect_ui_signals(self):
+        """SpinBox 값 변경 시 스냅샷 자동 갱신"""
+        if self.ui is None:
+            return
+        try:
+            self.ui.DisplaceLimitMax_doubleSpinBox.valueChanged.connect(
+                lambda v: self.set_limits(displacement_limit_mm=v)
+            )
+            self.ui.ForceLimitMax_doubleSpinBox.valueChanged.connect(
+                lambda v: self.set_limits(force_limit_n=v)
+            )
+        except Exception as e:
+            logger.warning(f"제한값 SpinBox 시그널 연결 실패: {e}")
+    
     def check_displacement_limit(
         self, 
         current_um: float, 
@@ -53,11 +125,7 @@ class SafetyGuard(ISafetyGuard):
         if self._disp_guard_fired:
             return (False, "")
         
-        # UI에서 제한값 읽기
-        try:
-            limit_mm = float(self.ui.DisplaceLimitMax_doubleSpinBox.value())
-        except Exception:
-            limit_mm = 0.0
+        limit_mm = self._limits.displacement_limit_mm
         
         if limit_mm <= 0:
             return (False, "")
@@ -97,17 +165,16 @@ class SafetyGuard(ISafetyGuard):
         if self._force_guard_fired:
             return (False, "")
         
-        # UI에서 제한값 읽기
-        try:
-            limit_n = float(self.ui.ForceLimitMax_doubleSpinBox.value())
-        except Exception:
-            limit_n = 0.0
+        limit_n = self._limits.force_limit_n
         
         if limit_n <= 0:
             return (False, "")
         
         force_delta = abs(current_n - previous_n)
         
+        if not self.load_drop_checks and abs(current_n) < abs(previous_n):
+            return (False, "")  # 의도적 하중 제거 구간
+        
         if force_delta >= limit_n:
             self._force_guard_fired = True
             message = (
@@ -120,6 +187,43 @@ class SafetyGuard(ISafetyGuard):
         
         return (False, "")
     
+    def evaluate_batch(
+        self,
+        times,
+        forces,
+        temps=None,
+        previous_force: float = None
+    ) -> Tuple[bool, str]:
+        """
+        하중 샘플 배치 평가 (샘플 간 변화량 검사의 벡터화)
+        
+        첫 초과 지점에서 check_force_limit과 같은 메시지/발동 상태를 만든다.
+        """
+        limit_n = self._limits.force_limit_n
+        if self._force_guard_fired or limit_n <= 0:
+            return (False, "")
+        
+        f = np.asarray(forces, dtype=np.float64)
+        if previous_force is not None:
+            f = np.concatenate(([previous_force], f))
+        if len(f) < 2:
+            return (False, "")
+        
+        exceeded = np.abs(np.diff(f)) >= limit_n
+        if not self.load_drop_checks:
+            exceeded &= np.abs(f[1:]) >= np.abs(f[:-1])  # 감소 방향 제외
+        hits = np.flatnonzero(exceeded)
+        if hits.size == 0:
+            return (False, "")
+        
+        i = int(hits[0])
+        return self.check_force_limit(float(f[i + 1]), float(f[i]))
+    
+    def set_load_drop_checks(self, enabled: bool):
+        """하중 감소 방향 변화량 검사 켜기/끄기"""
+        self.load_drop_checks = bool(enabled)
+        logger.info(f"하중 감소 검사 {'사용' if enabled else '일시 중지'}")
+    
     def reset_displacement_guard(self):
         """변위 가드 리셋"""
         self._disp_guard_fired = False
@@ -0,0 +1,308 @@
+"""
+안전 규칙 엔진
+슬라이딩 NumPy 윈도우 위에서 하중/온도 규칙을 배치 단위로 한 번에 평가
+
+규칙:
+- abs_force:   절대 하중 |F| >= 제한
+- force_rate:  RATE_LAG_SEC 간격 변화율 |dF/dt| >= 제한 (샘플 주기와 무관)
+- slope:       SLOPE_WINDOW_SEC 최소제곱 기울기 >= 제한 (노이즈에 강함)
+- load_drop:   윈도우 내 피크 대비 급격한 하중 감소 (시편 파단)
+- temp_excursion: 기준 온도 대비 편차 >= 제한
+
+변위 제한은 기존 SafetyGuard에 위임한다.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Optional, Tuple
+import numpy as np
+from interfaces import ISafetyGuard
+from Ring_Buffer import TimeSeriesBuffer
+from config import safety_rules_cfg
+
+logger = logging.getLogger(__name__)
+
+
+_RULE_LABELS = {
+    'abs_force': ("절대 하중", "N"),
+    'force_rate': ("하중 변화율", "N/s"),
+    'slope': ("하중 기울기", "N/s"),
+    'load_drop': ("하중 급감", "%"),
+    'temp_excursion': ("온도 이탈", "°C"),
+}
+
+
+@dataclass(frozen=True)
+class RuleViolation:
+    """
+    규칙 발동 기록
+
+    evidence_times/evidence_values는 발동 시점 직전 EVIDENCE_SEC 구간의
+    원본 샘플 복사본이다.
+    """
+    rule: str
+    value: float
+    limit: float
+    time: float
+    evidence_times: np.ndarray
+    evidence_values: np.ndarray
+
+    @property
+    def message(self) -> str:
+        label, unit = _RULE_LABELS.get(self.rule, (self.rule, ""))
+        return (
+            f"{label} 가드 발동\n"
+            f"값: {self.value:.3f} {unit}\n"
+            f"제한: {self.limit:.3f} {unit}"
+        )
+
+
+def emergency_force_limit(force_limit_n: float, config=None) -> float:
+    """
+    워커 긴급 정지 단계에 장착할 샘플 간 하중 변화량 제한
+
+    규칙 엔진이 켜져 있고 LEGACY_FORCE_DELTA가 꺼져 있으면 기존 변화량 규칙을
+    대체한 것이므로 워커 쪽에서도 검사하지 않는다 (0 반환).
+    """
+    config = config or safety_rules_cfg
+    if config.ENABLED and not config.LEGACY_FORCE_DELTA:
+        return 0.0
+    return force_limit_n
+
+
+class SafetyRuleEngine(ISafetyGuard):
+    """
+    다중 규칙 안전 가드
+
+    ISafetyGuard를 구현하므로 DataHandler에 SafetyGuard 대신 주입한다.
+    한 규칙이라도 발동하면 reset 전까지 다시 발동하지 않는다 (기존 가드와 동일).
+
+    Example:
+        >>> engine = SafetyRuleEngine(SafetyGuard(ui, safety_cfg))
+        >>> exceeded, message = engine.evaluate_batch(times, forces)
+        >>> engine.last_violation.rule
+        'load_drop'
+    """
+
+    def __init__(self, base_guard: ISafetyGuard, config=None):
+        """
+        Args:
+            base_guard: 변위/연속 하중 변화량 검사를 맡는 기존 가드
+            config: SafetyRulesConfig (기본: 전역 설정)
+        """
+        self.base = base_guard
+        self.cfg = config or safety_rules_cfg
+
+        self._force = TimeSeriesBuffer(self.cfg.WINDOW_SIZE, channels=1)
+        self._temp = TimeSeriesBuffer(self.cfg.WINDOW_SIZE, channels=1)
+        self._temp_reference = None
+        self._fired = False
+        self._load_drop_enabled = True
+        self._load_drop_since = None  # 검사 재개 시각 (이전 샘플은 load_drop 피크에서 제외)
+        self.last_violation: Optional[RuleViolation] = None
+
+        logger.info("SafetyRuleEngine 초기화 완료")
+
+    # ========================================================================
+    # ISafetyGuard
+    # ========================================================================
+
+    def check_displacement_limit(self, current_um: float, start_um: float) -> Tuple[bool, str]:
+        return self.base.check_displacement_limit(current_um, start_um)
+
+    def check_force_limit(self, current_n: float, previous_n: float) -> Tuple[bool, str]:
+        return self.base.check_force_limit(current_n, previous_n)
+
+    def set_load_drop_checks(self, enabled: bool):
+        """
+        load_drop 규칙과 기존 가드의 감소 방향 검사를 함께 켜기/끄기
+
+        다시 켤 때는 하중 제거 전 피크와 비교하지 않도록 그때까지의 샘플을 제외한다.
+        """
+        enabled = bool(enabled)
+        if enabled and not self._load_drop_enabled:
+            times = self._force.times
+            self._load_drop_since = float(times[-1]) if len(times) else None
+        self._load_drop_enabled = enabled
+        self.base.set_load_drop_checks(enabled)
+
+    def reset_displacement_guard(self):
+        self.base.reset_displacement_guard()
+
+    def reset_force_guard(self):
+        self.base.reset_force_guard()
+        self._force.clear()
+        self._temp.clear()
+        self._temp_reference = None
+        self._fired = False
+        self._load_drop_since = None
+        self.last_violation = None
+
+    def reset_all(self):
+        self.reset_displacement_guard()
+        self.reset_force_guard()
+
+    def evaluate_batch(
+        self,
+        times,
+        forces,
+        temps=None,
+        previous_force: Optional[float] = None
+    ) -> Tuple[bool, str]:
+        """배치를 윈도우에 추가하고 모든 규칙을 한 번에 평가"""
+        if self.cfg.LEGACY_FORCE_DELTA:
+            exceeded, message = self.base.evaluate_batch(
+                times, forces, temps, previous_force=previous_force
+            )
+            if exceeded:
+                return (True, message)
+
+        t = np.asarray(times, dtype=np.float64)
+        f = np.asarray(forces, dtype=np.float64)
+        self._force.extend(t, f)
+
+        n_temp_new = 0
+        if temps is not None:
+            for ti, temp in zip(t, np.asarray(temps, dtype=np.float64)):
+                if not np.isnan(temp):
+                    self._temp.append(ti, temp)
+                    n_temp_new += 1
+
+        if self._fired or len(t) == 0:
+            return (False, "")
+
+        violation = self._evaluate(len(t), n_temp_new)
+        if violation is None:
+            return (False, "")
+
+        self._fired = True
+        self.last_violation = violation
+        logger.warning(
+            f"[GUARD:{violation.rule.upper()}] {violation.message} "
+            f"(t={violation.time:.3f}s, 근거 {len(violation.evidence_times)}개 샘플)"
+        )
+        return (True, violation.message)
+
+    # ========================================================================
+    # 규칙 평가
+    # ========================================================================
+
+    def _evaluate(self, n_new: int, n_temp_new: int) -> Optional[RuleViolation]:
+        tw = self._force.times
+        fw = self._force.values()
+        start = max(0, len(tw) - n_new)
+
+        for rule in (self._rule_abs_force, self._rule_force_rate,
+                     self._rule_slope, self._rule_load_drop):
+            violation = rule(tw, fw, start)
+            if violation is not None:
+                return violation
+
+        if n_temp_new:
+            return self._rule_temp_excursion(n_temp_new)
+        return None
+
+    def _violation(self, rule, value, limit, tw, yw, idx) -> RuleViolation:
+        t_fire = float(tw[idx])
+        lo = int(np.searchsorted(tw, t_fire - self.cfg.EVIDENCE_SEC, side='left'))
+        return RuleViolation(
+            rule=rule,
+            value=float(value),
+            limit=float(limit),
+            time=t_fire,
+            evidence_times=tw[lo:idx + 1].copy(),
+            evidence_values=yw[lo:idx + 1].copy(),
+        )
+
+    def _rule_abs_force(self, tw, fw, start):
+        limit = self.cfg.ABS_FORCE_LIMIT_N
+        if limit <= 0:
+            return None
+        magnitude = np.abs(fw[start:])
+        hits = np.flatnonzero(magnitude >= limit)
+        if len(hits) == 0:
+            return None
+        idx = start + int(hits[0])
+        return self._violation('abs_force', abs(fw[idx]), limit, tw, fw, idx)
+
+    def _rule_force_rate(self, tw, fw, start):
+        """각 새 샘플과 RATE_LAG_SEC 이전 샘플 사이의 변화율"""
+        limit = self.cfg.FORCE_RATE_LIMIT_N_S
+        if limit <= 0:
+            return None
+        lag = self.cfg.RATE_LAG_SEC
+        t_new = tw[start:]
+        ref = np.searchsorted(tw, t_new - lag, side='right') - 1
+        valid = ref >= 0  # lag만큼의 이력이 있는 샘플만
+        if not valid.any():
+            return None
+
+        idx_new = np.flatnonzero(valid) + start
+        ref = ref[valid]
+        dt = tw[idx_new] - tw[ref]
+        rate = np.abs(fw[idx_new] - fw[ref]) / dt
+        hits = np.flatnonzero(rate >= limit)
+        if len(hits) == 0:
+            return None
+        k = int(hits[0])
+        return self._violation('force_rate', rate[k], limit, tw, fw, int(idx_new[k]))
+
+    def _rule_slope(self, tw, fw, start):
+        """최신 샘플까지 SLOPE_WINDOW_SEC 구간의 최소제곱 기울기 (배치당 1회)"""
+        limit = self.cfg.SLOPE_LIMIT_N_S
+        if limit <= 0:
+            return None
+        window = self.cfg.SLOPE_WINDOW_SEC
+        last = len(tw) - 1
+        lo = int(np.searchsorted(tw, tw[last] - window, side='left'))
+        if last - lo < 2 or tw[last] - tw[lo] < 0.5 * window:
+            return None
+
+        t = tw[lo:] - tw[lo:].mean()
+        denom = np.dot(t, t)
+        if denom <= 0:
+            return None
+        slope = np.dot(t, fw[lo:] - fw[lo:].mean()) / denom
+        if abs(slope) < limit:
+            return None
+        return self._violation('slope', abs(slope), limit, tw, fw, last)
+
+    def _rule_load_drop(self, tw, fw, start):
+        """윈도우 내 누적 최대 하중 대비 감소 비율"""
+        fraction = self.cfg.LOAD_DROP_FRACTION
+        if fraction <= 0 or not self._load_drop_enabled:
+            return None
+        lo = int(np.searchsorted(tw, tw[start] - self.cfg.LOAD_DROP_WINDOW_SEC, side='left'))
+        if self._load_drop_since is not None:
+            lo = min(start, max(lo, int(np.searchsorted(tw, self._load_drop_since, side='right'))))
+        magnitude = np.abs(fw[lo:])
+        running_peak = np.maximum.accumulate(magnitude)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            drop = np.where(
+                running_peak >= self.cfg.LOAD_DROP_MIN_PEAK_N,
+                1.0 - magnitude / running_peak,
+                0.0
+            )
+        drop[:start - lo] = 0.0  # 새 샘플만 판단
+        hits = np.flatnonzero(drop >= fraction)
+        if len(hits) == 0:
+            return None
+        idx = lo + int(hits[0])
+        return self._violation('load_drop', drop[hits[0]] * 100.0, fraction * 100.0, tw, fw, idx)
+
+    def _rule_temp_excursion(self, n_temp_new: int):
+        limit = self.cfg.TEMP_EXCURSION_C
+        if limit <= 0:
+            return None
+        tw = self._temp.times
+        yw = self._temp.values()
+        start = len(tw) - n_temp_new
+        if self._temp_reference is None:
+            self._temp_reference = float(yw[0])
+
+        deviation = np.abs(yw[start:] - self._temp_reference)
+        hits = np.flatnonzero(deviation >= limit)
+        if len(hits) == 0:
+            return None
+        idx = start + int(hits[0])
+        return self._violation('temp_excursion', deviation[hits[0]], limit, tw, yw, idx)
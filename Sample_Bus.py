@@ -0,0 +1,227 @@
+"""
+공유 메모리 샘플 버스 (단일 생산자 / 다중 소비자 링 버퍼)
+
+수집 워커가 샘플마다 pyqtSignal로 파이썬 객체를 큐에 넣는 대신, 공유 메모리의
+구조화 NumPy 레코드 링에 기록하고 Qt 시그널은 "새 데이터 있음" 깨우기로만 쓴다.
+소비자(DataHandler 전달, 분석, 다른 프로세스 등)는 각자의 커서로 원하는 주기에
+몰아서 읽는다.
+
+메모리 구조:
+    [header int64 × 4][records SAMPLE_DTYPE × capacity]
+
+    header[0] write_seq     기록 완료된 레코드 수 (단조 증가)
+    header[1] reserve_seq   기록 중인 구간의 끝 (write_seq 이상)
+    header[2] capacity
+
+잠금 없이 동작한다:
+- 생산자: reserve_seq 증가 → 레코드 기록 → write_seq 증가 (한 스레드만)
+- 소비자: write_seq까지 복사한 뒤 reserve_seq를 다시 읽어, 복사하는 동안
+  덮어써졌을 수 있는 앞부분은 버리고 유실(lost)로 센다
+"""
+
+import logging
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+from PyQt5 import QtCore
+
+logger = logging.getLogger(__name__)
+
+
+SAMPLE_DTYPE = np.dtype([('ts_ns', '<i8'), ('value', '<f8')])
+
+_HEADER_WORDS = 4
+_HEADER_BYTES = _HEADER_WORDS * 8
+_WRITE, _RESERVE, _CAPACITY = 0, 1, 2
+
+
+class SampleRing:
+    """
+    공유 메모리 SPMC 링
+
+    같은 프로세스에서는 SampleRing 객체를 공유하고, 다른 프로세스에서는
+    SampleRing.attach(ring.name)으로 붙는다.
+    """
+
+    def __init__(self, capacity: int = None, name: str = None, create: bool = True):
+        """
+        Args:
+            capacity: 레코드 수 (create일 때 필수)
+            name: 공유 메모리 이름 (create면 None = 자동)
+            create: False면 기존 링에 연결 (attach 사용 권장)
+        """
+        if create:
+            if not capacity or capacity <= 0:
+                raise ValueError(f"capacity는 양수여야 합니다: {capacity}")
+            size = _HEADER_BYTES + int(capacity) * SAMPLE_DTYPE.itemsize
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+
+        self._owner = create
+        self._header = np.ndarray((_HEADER_WORDS,), dtype=np.int64, buffer=self._shm.buf)
+        if create:
+            self._header[:] = 0
+            self._header[_CAPACITY] = int(capacity)
+        self.capacity = int(self._header[_CAPACITY])
+        self._records = np.ndarray(
+            (self.capacity,), dtype=SAMPLE_DTYPE, buffer=self._shm.buf, offset=_HEADER_BYTES
+        )
+
+    @classmethod
+    def attach(cls, name: str) -> "SampleRing":
+        return cls(name=name, create=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def write_seq(self) -> int:
+        return int(self._header[_WRITE])
+
+    def close(self):
+        """매핑 해제 (생성한 쪽이면 공유 메모리도 삭제)"""
+        if self._shm is None:
+            return
+        self._header = None
+        self._records = None
+        shm, self._shm = self._shm, None
+        shm.close()
+        if self._owner:
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    # ========================================================================
+    # 생산자 (한 스레드만)
+    # ========================================================================
+
+    def publish(self, ts_ns: int, value: float):
+        seq = int(self._header[_WRITE])
+        self._header[_RESERVE] = seq + 1
+        slot = self._records[seq % self.capacity]
+        slot['ts_ns'] = ts_ns
+        slot['value'] = value
+        self._header[_WRITE] = seq + 1
+
+    def publish_many(self, ts_ns: np.ndarray, values: np.ndarray):
+        n = len(ts_ns)
+        if n == 0:
+            return
+        seq = int(self._header[_WRITE])
+        if n > self.capacity:
+            # 한 바퀴를 넘는 앞부분은 어차피 덮어쓰이므로 건너뜀 (소비자에겐 유실)
+            skip = n - self.capacity
+            ts_ns, values = ts_ns[skip:], values[skip:]
+            seq += skip
+            n = self.capacity
+
+        self._header[_RESERVE] = seq + n
+        idx = np.arange(seq, seq + n) % self.capacity
+        self._records['ts_ns'][idx] = ts_ns
+        self._records['value'][idx] = values
+        self._header[_WRITE] = seq + n
+
+    # ========================================================================
+    # 소비자
+    # ========================================================================
+
+    def read(self, seq: int, max_records: Optional[int] = None):
+        """
+        seq 이후 기록된 레코드 복사
+
+        Returns:
+            (records, next_seq, lost)
+            records: SAMPLE_DTYPE 배열 (복사본, 오래된 순)
+            lost: 링이 한 바퀴 넘게 앞서서 건너뛴 레코드 수
+        """
+        end = int(self._header[_WRITE])
+        lost = 0
+        if end - seq > self.capacity:
+            lost = end - self.capacity - seq
+            seq = end - self.capacity
+        if max_records is not None:
+            end = min(end, seq + max_records)
+        if end <= seq:
+            return np.empty(0, dtype=SAMPLE_DTYPE), seq, lost
+
+        start_slot = seq % self.capacity
+        n = end - seq
+        if start_slot + n <= self.capacity:
+            records = self._records[start_slot:start_slot + n].copy()
+        else:
+            first = self.capacity - start_slot
+            records = np.concatenate((self._records[start_slot:], self._records[:n - first]))
+
+        # 복사하는 동안 생산자가 덮어쓴 (쓰는 중인) 슬롯은 버림
+        overwritten = int(self._header[_RESERVE]) - self.capacity - seq
+        if overwritten > 0:
+            records = records[overwritten:]
+            lost += min(overwritten, n)
+            seq += min(overwritten, n)
+
+        return records, seq + len(records), lost
+
+    def cursor(self, from_start: bool = False) -> "SampleCursor":
+        """새 소비자 커서 (기본: 지금 이후 기록되는 레코드부터)"""
+        return SampleCursor(self, 0 if from_start else self.write_seq)
+
+
+class SampleCursor:
+    """소비자별 읽기 위치"""
+
+    def __init__(self, ring: SampleRing, seq: int = 0):
+        self.ring = ring
+        self.seq = seq
+        self.lost = 0  # 누적 유실 레코드 수
+
+    def read(self, max_records: Optional[int] = None) -> np.ndarray:
+        records, self.seq, lost = self.ring.read(self.seq, max_records)
+        if lost:
+            self.lost += lost
+            logger.warning(f"샘플 버스 소비자 지연 - {lost}개 유실 (누적 {self.lost})")
+        return records
+
+    @property
+    def pending(self) -> int:
+        return max(0, self.ring.write_seq - self.seq)
+
+
+class SampleBus(QtCore.QObject):
+    """
+    SampleRing + Qt 깨우기 시그널
+
+    샘플마다 시그널을 보내지 않고, 이전 깨우기가 GUI 스레드에 전달되기 전까지는
+    다시 보내지 않는다 (이벤트 루프에는 최대 1개만 대기).
+    SampleBus 객체는 소비자 스레드(GUI)에서 생성해야 한다.
+    """
+
+    samples_available = QtCore.pyqtSignal()
+
+    def __init__(self, capacity: int, name: str = None):
+        super().__init__()
+        self.ring = SampleRing(capacity, name=name)
+        self._wakeup_pending = False
+        # 가장 먼저 연결 → 소비자 슬롯보다 먼저 실행되어 읽기 전에 플래그 해제
+        self.samples_available.connect(self._clear_wakeup)
+        logger.info(f"SampleBus 생성 (공유 메모리: {self.ring.name}, 용량: {capacity})")
+
+    def publish(self, ts_ns: int, value: float):
+        """생산자 스레드에서 호출"""
+        self.ring.publish(ts_ns, value)
+        if not self._wakeup_pending:
+            self._wakeup_pending = True
+            self.samples_available.emit()
+
+    def cursor(self, from_start: bool = False) -> SampleCursor:
+        return self.ring.cursor(from_start)
+
+    def close(self):
+        self.ring.close()
+
+    @QtCore.pyqtSlot()
+    def _clear_wakeup(self):
+        self._wakeup_pending = False
@@ -0,0 +1,64 @@
+"""
+시리얼 응답 프레임 읽기 (로드셀 CDL 프로토콜 공용)
+
+in_waiting을 10 ms 간격으로 확인하는 대신 serial.timeout을 이용한 블로킹
+읽기로 대기하므로, 종료 바이트(CRLF)가 도착하는 즉시 반환한다.
+
+- 첫 바이트: 남은 최대 대기 시간까지 블로킹
+- 이후 바이트: idle_gap 동안 추가 수신이 없으면 (종료 바이트 없는 응답) 반환
+- 바이너리 응답(MSV? 4바이트 값)은 min_size로 값 안의 0x0D0A를 종료로 오인하지 않음
+"""
+
+import time
+
+CRLF = b"\r\n"
+
+
+def read_frame(ser, terminator: bytes = CRLF, max_wait: float = 1.5, idle_gap: float = 0.10,
+               min_size: int = 0, max_size: int = 256) -> bytes:
+    """
+    종료 바이트까지 읽기
+
+    Args:
+        ser: 열린 serial.Serial 객체 (timeout은 읽는 동안만 바꾸고 복원)
+        terminator: 프레임 종료 바이트 (b""면 idle_gap 또는 max_size로만 종료)
+        max_wait: 최대 대기 시간 (초)
+        idle_gap: 수신 시작 후 이 시간 동안 추가 바이트가 없으면 종료 (초)
+        min_size: 종료 바이트 앞에 있어야 하는 최소 바이트 수
+        max_size: 이 크기 이상 받으면 종료 (응답이 끝나지 않는 장비 보호)
+
+    Returns:
+        수신 바이트 (응답 없으면 b"")
+    """
+    deadline = time.perf_counter() + max_wait
+    buf = bytearray()
+    saved_timeout = ser.timeout
+    current_timeout = saved_timeout
+
+    try:
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+
+            timeout = min(remaining, idle_gap) if buf else remaining
+            if timeout != current_timeout:
+                ser.timeout = timeout
+                current_timeout = timeout
+
+            chunk = ser.read(max(1, ser.in_waiting or 0))
+            if not chunk:
+                if buf:
+                    break  # idle_gap 경과 - 종료 바이트 없는 응답
+                continue
+
+            buf += chunk
+            if terminator and buf.find(terminator, min_size) >= 0:
+                break
+            if len(buf) >= max_size:
+                break
+    finally:
+        if current_timeout != saved_timeout:
+            ser.timeout = saved_timeout
+
+    return bytes(buf)
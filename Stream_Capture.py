@@ -0,0 +1,437 @@
+"""
+원시 장비 스트림 캡처 / 재생 (.ttcap)
+
+각 모니터 워커가 읽은 원시 데이터를 획득 시각과 함께 그대로 기록하고,
+나중에 GUI 없이 DataHandler로 다시 흘려보내 파이프라인(DataSynchronizer,
+SafetyGuard/규칙 엔진, PlotService)의 처리량/지연을 재현 가능하게 측정하거나
+가드 트립을 사후 분석한다.
+
+파일 구조:
+    [MAGIC 6B][VERSION u16][META_LEN u32][META JSON][RECORD...]
+
+    RECORD = [timestamp_ns i64][source u8][length u32][payload]
+
+    source                  payload
+    LOADCELL_POLL (1)       MSV? 응답 원시 바이트
+    LOADCELL_STREAM (2)     연속 출력 수신 버퍼에서 한 번에 읽은 원시 바이트
+    MOTOR (3)               위치 레지스터 쌍 (u16 reg126, u16 reg127)
+    TEMP (4)                채널별 PV 레지스터 값 (i32, 읽기 실패는 INT32_MIN)
+
+재생은 워커와 같은 디코딩 함수를 쓰므로 라이브와 같은 샘플/타임스탬프가 나온다.
+비정상 종료로 마지막 레코드가 잘려 있으면 완전한 레코드까지만 읽는다.
+
+사용:
+    python Stream_Capture.py capture.ttcap --speed 10
+    python Stream_Capture.py capture.ttcap --max --plot
+"""
+
+import os
+import json
+import time
+import struct
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Optional
+
+from Emergency_Stop import LatencyHistogram
+from Monitor_loadcell import _counts_to_force, _stream_samples, _to_s32_be
+from Monitor_motor import _decode_position_um
+from config import capture_cfg, loadcell_cfg
+
+logger = logging.getLogger(__name__)
+
+
+CAPTURE_EXTENSION = ".ttcap"
+
+MAGIC = b"TTCAP\x00"
+VERSION = 1
+_PREAMBLE = struct.Struct("<6sHI")   # magic, version, meta_len
+_RECORD = struct.Struct("<qBI")      # timestamp_ns, source, length
+_MOTOR = struct.Struct("<HH")
+
+SOURCE_LOADCELL_POLL = 1
+SOURCE_LOADCELL_STREAM = 2
+SOURCE_MOTOR = 3
+SOURCE_TEMP = 4
+
+_TEMP_MISSING = -0x80000000
+
+
+def _close_quietly(f):
+    """기록 실패/교체로 버리는 파일 닫기 (닫기 실패는 기록만)"""
+    try:
+        f.close()
+    except (OSError, ValueError) as e:
+        logger.error(f"[CAPTURE] 파일 닫기 실패: {e}")
+
+
+class StreamCapture:
+    """
+    원시 스트림 캡처 파일 (워커들이 공유)
+
+    open() 전이나 close() 후의 record_*는 아무 것도 하지 않으므로 워커는
+    항상 호출해도 된다. 여러 워커 스레드에서 호출해도 안전하다.
+    """
+
+    def __init__(self):
+        self._file = None
+        self._lock = threading.Lock()
+        self.file_path = None
+        self.records = 0
+        self.bytes_written = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self._file is not None
+
+    def open(self, file_path: str, metadata: dict = None):
+        meta = dict(metadata or {})
+        meta.setdefault('created', datetime.now().isoformat(timespec='seconds'))
+        meta_bytes = json.dumps(meta, ensure_ascii=False).encode('utf-8')
+
+        f = open(file_path, 'wb', buffering=capture_cfg.BUFFER_BYTES)
+        f.write(_PREAMBLE.pack(MAGIC, VERSION, len(meta_bytes)))
+        f.write(meta_bytes)
+
+        with self._lock:
+            if self._file is not None:   # 열려 있던 캡처는 닫고 교체
+                logger.warning(f"[CAPTURE] 이전 캡처 파일을 닫고 새로 시작: {self.file_path}")
+                _close_quietly(self._file)
+            self._file = f
+            self.file_path = file_path
+            self.records = 0
+            self.bytes_written = 0
+        logger.info(f"[CAPTURE] 원시 스트림 캡처 시작: {file_path}")
+
+    def close(self):
+        with self._lock:
+            f, self._file = self._file, None
+        if f is not None:
+            f.close()
+            logger.info(
+                f"[CAPTURE] 캡처 종료: {self.file_path} "
+                f"({self.records} 레코드, {self.bytes_written / 1024:.1f} KB)"
+            )
+
+    def record(self, source: int, timestamp_ns: int, payload: bytes):
+        if self._file is None:
+            return
+        header = _RECORD.pack(int(timestamp_ns), source, len(payload))
+        with self._lock:
+            if self._file is None:
+                return
+            try:
+                self._file.write(header)
+                self._file.write(payload)
+            except (OSError, ValueError) as e:
+                logger.error(f"[CAPTURE] 기록 실패 - 캡처 중단: {e}")
+                _close_quietly(self._file)
+                self._file = None
+                return
+            self.records += 1
+            self.bytes_written += len(header) + len(payload)
+
+    # ----- 워커별 편의 메서드 -----
+
+    def record_loadcell_poll(self, timestamp_ns: int, raw: bytes):
+        self.record(SOURCE_LOADCELL_POLL, timestamp_ns, bytes(raw))
+
+    def record_loadcell_stream(self, timestamp_ns: int, chunk: bytes):
+        self.record(SOURCE_LOADCELL_STREAM, timestamp_ns, bytes(chunk))
+
+    def record_motor(self, timestamp_ns: int, reg126: int, reg127: int):
+        self.record(SOURCE_MOTOR, timestamp_ns, _MOTOR.pack(reg126 & 0xFFFF, reg127 & 0xFFFF))
+
+    def record_temps(self, timestamp_ns: int, values: list):
+        regs = [_TEMP_MISSING if v is None else int(v) for v in values]
+        self.record(SOURCE_TEMP, timestamp_ns, struct.pack(f"<{len(regs)}i", *regs))
+
+
+def capture_path(directory: str = None) -> str:
+    """새 캡처 파일 경로 (capture_YYYYmmdd_HHMMSS.ttcap)"""
+    directory = directory or capture_cfg.DIRECTORY
+    os.makedirs(directory, exist_ok=True)
+    name = datetime.now().strftime("capture_%Y%m%d_%H%M%S") + CAPTURE_EXTENSION
+    return os.path.join(directory, name)
+
+
+# ============================================================================
+# 읽기
+# ============================================================================
+
+def read_capture(file_path: str):
+    """
+    캡처 파일 읽기
+
+    Returns:
+        (metadata, records)
+        records: (timestamp_ns, source, payload) 리스트 (기록 순서)
+
+    Raises:
+        ValueError: 형식이 맞지 않는 파일
+    """
+    with open(file_path, 'rb') as f:
+        data = f.read()
+
+    if len(data) < _PREAMBLE.size:
+        raise ValueError(f"캡처 파일 헤더가 손상되었습니다: {file_path}")
+    magic, version, meta_len = _PREAMBLE.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"캡처 파일이 아닙니다: {file_path}")
+    if version != VERSION:
+        raise ValueError(f"지원하지 않는 캡처 버전: {version}")
+
+    pos = _PREAMBLE.size
+    if len(data) < pos + meta_len:
+        raise ValueError(f"캡처 메타데이터가 손상되었습니다: {file_path}")
+    metadata = json.loads(data[pos:pos + meta_len].decode('utf-8'))
+    pos += meta_len
+
+    records = []
+    end = len(data)
+    while pos + _RECORD.size <= end:
+        timestamp_ns, source, length = _RECORD.unpack_from(data, pos)
+        start = pos + _RECORD.size
+        if start + length > end:
+            logger.warning(f"[CAPTURE] 마지막 레코드가 잘려 있음 - {len(records)}개까지 사용")
+            break
+        records.append((timestamp_ns, source, data[start:start + length]))
+        pos = start + length
+
+    return metadata, records
+
+
+# ============================================================================
+# 재생
+# ============================================================================
+
+@dataclass
+class ReplayStats:
+    """재생 결과"""
+    samples: dict = field(default_factory=dict)   # 종류별 DataHandler 호출 수
+    wall_sec: float = 0.0
+    capture_sec: float = 0.0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)  # 호출당 처리 시간
+    trips: list = field(default_factory=list)     # (캡처 시작 기준 초, 사유)
+    first_ns: Optional[int] = None                # 첫 레코드 획득 시각
+    current_ns: Optional[int] = None              # 처리 중인 샘플 획득 시각
+
+    @property
+    def current_sec(self) -> float:
+        """처리 중인 샘플의 캡처 시작 기준 시각 (초)"""
+        if self.first_ns is None or self.current_ns is None:
+            return 0.0
+        return (self.current_ns - self.first_ns) / 1e9
+
+    @property
+    def total_samples(self) -> int:
+        return sum(self.samples.values())
+
+    @property
+    def throughput(self) -> float:
+        """초당 처리 샘플 수"""
+        return self.total_samples / self.wall_sec if self.wall_sec > 0 else 0.0
+
+
+class CaptureReplayer:
+    """
+    캡처를 DataHandler로 재생
+
+    원래 획득 타임스탬프를 그대로 전달하며, speed는 벽시계 재생 속도만 정한다
+    (1.0 = 실시간, N = N배속, 0 이하 = 대기 없이 최대 속도).
+    """
+
+    def __init__(self, data_handler, speed: float = 1.0, pump: Optional[Callable] = None,
+                 pump_interval_sec: float = 0.02):
+        """
+        Args:
+            data_handler: 재생 대상 DataHandler
+            speed: 재생 배속
+            pump: 주기적으로 호출할 함수 (Qt 이벤트 처리 등, 선택)
+        """
+        self.data = data_handler
+        self.speed = speed
+        self.pump = pump
+        self.pump_interval_sec = pump_interval_sec
+
+        self._stream_buf = bytearray()
+        self._last_stream_ns = None
+
+    def run(self, records: list, stats: ReplayStats = None) -> ReplayStats:
+        stats = stats or ReplayStats()
+        if not records:
+            return stats
+
+        t0_ns = records[0][0]
+        if stats.first_ns is None:
+            stats.first_ns = t0_ns
+        wall0 = time.perf_counter()
+        next_pump = wall0 + self.pump_interval_sec
+
+        for timestamp_ns, source, payload in records:
+            if self.speed > 0:
+                due = wall0 + (timestamp_ns - t0_ns) / 1e9 / self.speed
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+            self._dispatch(timestamp_ns, source, payload, stats)
+
+            if self.pump is not None and time.perf_counter() >= next_pump:
+                self.pump()
+                next_pump = time.perf_counter() + self.pump_interval_sec
+
+        stats.wall_sec += time.perf_counter() - wall0
+        stats.capture_sec += (records[-1][0] - t0_ns) / 1e9
+        return stats
+
+    def _dispatch(self, timestamp_ns: int, source: int, payload: bytes, stats: ReplayStats):
+        if source == SOURCE_MOTOR:
+            if len(payload) == _MOTOR.size:
+                pos_um = _decode_position_um(*_MOTOR.unpack(payload))
+                self._call(stats, 'motor', self.data.update_motor_position, pos_um, timestamp_ns)
+
+        elif source == SOURCE_LOADCELL_POLL:
+            if len(payload) >= 4:
+                force = _counts_to_force(_to_s32_be(payload[:4]))
+                self._call(stats, 'loadcell', self.data.update_loadcell_value, force, timestamp_ns)
+
+        elif source == SOURCE_LOADCELL_STREAM:
+            # LoadcellWorker._drain_stream과 같은 버퍼/타임스탬프 배분
+            self._stream_buf += payload
+            prev_ns = self._last_stream_ns if self._last_stream_ns is not None else timestamp_ns
+            self._last_stream_ns = timestamp_ns
+            for force, sample_ns in _stream_samples(self._stream_buf, prev_ns, timestamp_ns):
+                self._call(stats, 'loadcell', self.data.update_loadcell_value, force, sample_ns)
+            overflow = len(self._stream_buf) - loadcell_cfg.STREAM_MAX_BUFFER_BYTES
+            if overflow > 0:
+                del self._stream_buf[:overflow]
+
+        elif source == SOURCE_TEMP:
+            values = struct.unpack(f"<{len(payload) // 4}i", payload)
+            if values and values[0] != _TEMP_MISSING:
+                self._call(stats, 'temp', self.data.update_temperature_ch1, values[0], timestamp_ns)
+
+        else:
+            logger.debug(f"[CAPTURE] 알 수 없는 source: {source}")
+
+    @staticmethod
+    def _call(stats: ReplayStats, kind: str, func, value, timestamp_ns: int):
+        stats.current_ns = timestamp_ns
+        start = time.perf_counter_ns()
+        func(value, timestamp_ns)
+        stats.latency.record(time.perf_counter_ns() - start)
+        stats.samples[kind] = stats.samples.get(kind, 0) + 1
+
+
+# ============================================================================
+# GUI 없는 파이프라인 (CLI)
+# ============================================================================
+
+class _NullReceiver:
+    """PlotService 없이 재생할 때의 데이터 수신자"""
+
+    def receive_motor_data(self, elapsed, displacement_um):
+        pass
+
+    def receive_loadcell_data(self, force_n, position_um, temp_ch1, timestamp=None):
+        pass
+
+    def receive_temp_data(self, elapsed, temps):
+        pass
+
+    def mark_event(self, kind, timestamp=None, **info):
+        pass
+
+
+def build_headless_pipeline(stats: ReplayStats, displacement_limit_mm: float = 0.0,
+                            force_limit_n: float = 0.0, plot_service=None):
+    """
+    GUI 없는 DataHandler (라이브와 같은 동기화/가드/파단 감지 구성)
+
+    가드 트립은 정지 대신 stats.trips에 기록하고 다음 샘플부터 다시 검사한다.
+    """
+    from Break_Detector import BreakDetector
+    from Data_Handler import DataHandler
+    from Data_Synchronizer import DataSynchronizer
+    from Safety_Guard import SafetyGuard, SafetyLimits
+    from Safety_Rules import SafetyRuleEngine
+    from Tensioning_Controller import TensioningController
+    from UI_Updater import UIUpdater
+    from config import break_cfg, safety_cfg, safety_rules_cfg
+
+    guard = SafetyGuard(None, safety_cfg, limits=SafetyLimits(displacement_limit_mm, force_limit_n))
+    if safety_rules_cfg.ENABLED:
+        guard = SafetyRuleEngine(guard, safety_rules_cfg)
+
+    handler = None
+
+    def on_trip(reason=""):
+        stats.trips.append((stats.current_sec, reason))
+        logger.warning(f"[REPLAY] 가드 트립 (t={stats.current_sec:.3f} s): {reason}")
+        handler.reset_guards()
+
+    handler = DataHandler(
+        ui_updater=UIUpdater(None),
+        safety_guard=guard,
+        synchronizer=DataSynchronizer(),
+        tensioning=TensioningController(),
+        data_receiver=plot_service or _NullReceiver(),
+        stop_callback=on_trip,
+        break_detector=BreakDetector(break_cfg) if break_cfg.ENABLED else None
+    )
+    # 캡처에는 시험 구간 경계가 없으므로 전 구간에서 파단 감지
+    handler.break_detection_enabled = True
+    return handler
+
+
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="원시 스트림 캡처(.ttcap) 재생 벤치마크")
+    parser.add_argument("capture", help="캡처 파일 경로")
+    parser.add_argument("--speed", type=float, default=1.0, help="재생 배속 (기본 1.0)")
+    parser.add_argument("--max", action="store_true", help="대기 없이 최대 속도로 재생")
+    parser.add_argument("--disp-limit-mm", type=float, default=0.0, help="변위 제한 (mm, 0=검사 안 함)")
+    parser.add_argument("--force-limit-n", type=float, default=0.0, help="하중 변화 제한 (N, 0=검사 안 함)")
+    parser.add_argument("--plot", action="store_true", help="PlotService(오프스크린)까지 포함")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+
+    metadata, records = read_capture(args.capture)
+    stats = ReplayStats()
+
+    plot_service, pump = None, None
+    if args.plot:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        import pyqtgraph as pg
+        from PyQt5 import QtWidgets
+        from Plot_Service import PlotService
+
+        app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        plot_service = PlotService(None, pg.PlotWidget())
+        plot_service.begin_replay(records[0][0] / 1e9 if records else 0.0)
+        pump = app.processEvents
+
+    handler = build_headless_pipeline(stats, args.disp_limit_mm, args.force_limit_n, plot_service)
+    CaptureReplayer(handler, speed=0.0 if args.max else args.speed, pump=pump).run(records, stats)
+
+    summary = stats.latency.summary()
+    print(f"캡처: {args.capture} ({metadata.get('created', '?')}, {len(records)} 레코드)")
+    print(f"샘플: {stats.samples} / 캡처 {stats.capture_sec:.2f} s → 재생 {stats.wall_sec:.2f} s")
+    print(f"처리량: {stats.throughput:,.0f} 샘플/s")
+    print(
+        f"호출당 지연: 평균 {summary['mean_us'] or 0:.1f} μs, "
+        f"p50 ≤ {summary['p50_us'] or 0:.0f} μs, p99 ≤ {summary['p99_us'] or 0:.0f} μs, "
+        f"최대 {summary['max_us'] or 0:.1f} μs"
+    )
+    for t, reason in stats.trips:
+        print(f"가드 트립: t={t:.3f} s - {reason}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,12 +3,98 @@
 UI 업데이트 전담
 """
 
+import time
 import logging
+from PyQt5 import QtCore
 from interfaces import IUIUpdater
+from config import monitor_cfg
 
 logger = logging.getLogger(__name__)
 
 
+class LabelBinder:
+    """
+    라벨 setText 표시 주기 제한 + 변경 감지
+    
+    - 표시 중인 문자열과 같으면 setText를 부르지 않음 (레이아웃/리페인트 생략)
+    - 라벨마다 표시 주기(1 / display_hz) 안에 한 번만 즉시 반영하고,
+      그 사이에 들어온 값은 마지막 값만 남겨 하나의 타이머로 몰아서 반영
+    - display_hz <= 0이면 주기 제한 없이 바뀔 때마다 즉시 반영
+    
+    GUI 스레드에서만 호출한다 (타이머도 첫 지연 반영 시 GUI 스레드에서 생성).
+    """
+    
+    def __init__(self, display_hz: float = None):
+        if display_hz is None:
+            display_hz = monitor_cfg.LABEL_DISPLAY_HZ
+        self.period_s = 1.0 / display_hz if display_hz > 0 else 0.0
+        # 위젯 __hash__/__eq__를 거치지 않도록 id(label)를 키로 사용
+        self._shown = {}      # id(label) → 표시 중인 문자열
+        self._last_set = {}   # id(label) → 마지막 setText 시각 (perf_counter)
+        self._pending = {}    # id(label) → (label, 다음 타이머에 반영할 문자열)
+        self._timer = None
+        self.skipped = 0      # 같은 문자열이라 생략한 횟수
+        self.coalesced = 0    # 대기 중 값이 덮어써진 횟수
+    
+    def set_text(self, label, text: str):
+        """라벨 문자열 요청 (필요할 때만 setText)"""
+        key = id(label)
+        if key in self._pending:
+            if self._shown.get(key) == text:
+                del self._pending[key]  # 표시 중인 값으로 돌아옴
+            else:
+                self._pending[key] = (label, text)
+            self.coalesced += 1
+            return
+        
+        if self._shown.get(key) == text:
+            self.skipped += 1
+            return
+        
+        now = time.perf_counter()
+        last = self._last_set.get(key)
+        if self.period_s <= 0 or last is None or now - last >= self.period_s:
+            self._apply(label, text, now)
+            return
+        
+        self._pending[key] = (label, text)
+        self._schedule(self.period_s - (now - last))
+    
+    def flush(self):
+        """대기 중인 문자열을 모두 반영"""
+        if self._timer is not None:
+            self._timer.stop()
+        pending, self._pending = self._pending, {}
+        now = time.perf_counter()
+        for label, text in pending.values():
+            self._apply(label, text, now)
+    
+    def reset(self):
+        """표시 캐시 비우기 (다음 요청은 값이 같아도 다시 그림)"""
+        if self._timer is not None:
+            self._timer.stop()
+        self._shown.clear()
+        self._last_set.clear()
+        self._pending.clear()
+    
+    def _apply(self, label, text: str, now: float):
+        try:
+            label.setText(text)
+        except Exception as e:
+            logger.error(f"라벨 갱신 실패: {e}")
+            return
+        self._shown[id(label)] = text
+        self._last_set[id(label)] = now
+    
+    def _schedule(self, delay_s: float):
+        if self._timer is None:
+            self._timer = QtCore.QTimer()
+            self._timer.setSingleShot(True)
+            self._timer.timeout.connect(self.flush)
+        if not self._timer.isActive():
+            self._timer.start(max(1, int(delay_s * 1000 + 0.5)))
+
+
 class UIUpdater(IUIUpdater):
     """
     GUI 라벨 업데이트
@@ -16,22 +102,26 @@ class UIUpdater(IUIUpdater):
     책임:
     - UI 위젯에 값 표시
     - 포맷팅 (소수점, 단위 등)
+    - 표시 주기 제한 / 같은 문자열 생략 (LabelBinder)
     """
     
-    def __init__(self, ui):
+    def __init__(self, ui, display_hz: float = None):
         self.ui = ui
+        self.labels = LabelBinder(display_hz)
         logger.info("UIUpdater 초기화")
     
     def update_motor_position(self, pos_um: float):
         """모터 위치 라벨 업데이트"""
         try:
+            text = f"{pos_um:.1f} [um]"
+            
             # Setting 탭
             if hasattr(self.ui, "En0Positionnow_label"):
-                self.ui.En0Positionnow_label.setText(f"{pos_um:.1f} [um]")
+                self.labels.set_text(self.ui.En0Positionnow_label, text)
             
             # Test 탭
             if hasattr(self.ui, "test_pos_label"):
-                self.ui.test_pos_label.setText(f"{pos_um:.1f} [um]")
+                self.labels.set_text(self.ui.test_pos_label, text)
         
         except Exception as e:
             logger.error(f"모터 위치 UI 업데이트 실패: {e}")
@@ -39,13 +129,15 @@ class UIUpdater(IUIUpdater):
     def update_loadcell_value(self, force_n: float):
         """로드셀 값 라벨 업데이트"""
         try:
+            text = f"{force_n:.3f} [N]"
+            
             # Setting 탭
             if hasattr(self.ui, "Load0Currentnow_label"):
-                self.ui.Load0Currentnow_label.setText(f"{force_n:.3f} [N]")
+                self.labels.set_text(self.ui.Load0Currentnow_label, text)
             
             # Test 탭
             if hasattr(self.ui, "test_load_label"):
-                self.ui.test_load_label.setText(f"{force_n:.3f} [N]")
+                self.labels.set_text(self.ui.test_load_label, text)
         
         except Exception as e:
             logger.error(f"로드셀 UI 업데이트 실패: {e}")
@@ -54,7 +146,7 @@ class UIUpdater(IUIUpdater):
         """온도 라벨 업데이트"""
         try:
             if hasattr(self.ui, 'temp_channels') and channel in self.ui.temp_channels:
-                self.ui.temp_channels[channel]['lbl'].setText(f"{temp:.1f} °C")
+                self.labels.set_text(self.ui.temp_channels[channel]['lbl'], f"{temp:.1f} °C")
         
         except Exception as e:
             logger.error(f"온도 UI 업데이트 실패 (CH{channel}): {e}")
\ No newline at end of file
@@ -52,6 +52,10 @@ class MotorConfig:
     DEFAULT_UNIT_ID: int = 1
     DEFAULT_BAUDRATE: int = 9600
     DEFAULT_TIMEOUT: float = 1.0
+    
+    # 0점 설정 (En0 버튼, 대기는 GUI 스레드 타이머 - 버스 스레드를 점유하지 않음)
+    ZERO_STOP_SETTLE_MS: int = 50   # 정지 명령 후 0점 쓰기 전 대기 (ms)
+    ZERO_SETTLE_MS: int = 50        # 0점(커맨드 8) 후 적용 대기 (ms)
 
 
 @dataclass
@@ -79,9 +83,20 @@ class LoadcellConfig:
     CMD_SELECT_ADDRESS: str = "S{address}"  # 주소 선택 명령 포맷
     CMD_SINGLE_MEASURE: str = "MSV?"        # 단일 측정 명령
     CMD_ZERO_POSITION: str = "CDL"          # 영점 설정 명령
+    ZERO_SETTLE_MS: int = 300               # 영점(CDL) 후 적용 대기 (ms, GUI 스레드 타이머)
     FRAME_START: str = ";"                  # 프레임 시작
     FRAME_END: str = ";"                    # 프레임 종료
 
+    # 연속 측정(스트리밍) 모드
+    STREAMING_ENABLED: bool = False         # True면 MSV? 폴링 대신 연속 출력 모드 사용
+    CMD_CONTINUOUS_MEASURE: str = "MSV?0"   # 연속 측정 출력 시작 명령
+    CMD_STOP_MEASURE: str = "STP"           # 연속 측정 출력 정지 명령
+    STREAM_FRAME_SIZE: int = 4              # 측정값 바이트 수 (빅엔디언 sint32)
+    STREAM_FRAME_TERMINATOR: bytes = b"\r\n"  # 프레임 종료 바이트 (없으면 b"")
+    STREAM_POLL_INTERVAL_MS: int = 10       # 수신 버퍼 드레인 주기 (ms)
+    STREAM_MAX_BUFFER_BYTES: int = 4096     # 롤링 버퍼 최대 크기 (초과 시 오래된 바이트 폐기)
+    BATCH_DELIVERY: bool = False            # True면 읽기 주기마다 샘플 묶음(NumPy 배열)으로 DataHandler에 전달
+
 
 @dataclass
 class TempConfig:
@@ -103,6 +118,10 @@ class TempConfig:
     HANDSHAKE_TEST_ADDRESS: int = 0x0066    # 연결 테스트용 레지스터
     HANDSHAKE_TEST_COUNT: int = 1           # 읽을 레지스터 개수
     
+    # PV 일괄 읽기 (주소를 연속 블록으로 묶어 한 번에 읽음)
+    READ_MAX_GAP: int = 8                   # 블록에 포함할 최대 빈 레지스터 수 (왕복 1회 < 레지스터 8개 전송)
+    READ_MAX_COUNT: int = 125               # Modbus 단일 읽기 최대 레지스터 수
+    
     # 채널별 Modbus 주소 맵 (TM4 기준)
     CHANNEL_ADDRESSES = {
         1: {
@@ -151,6 +170,14 @@ class MonitorConfig:
 
     # 플롯 설정
     MAX_PLOT_POINTS: int = 10000         # 최대 플롯 포인트 수 (메모리 누수 방지)
+    PLOT_RENDER_FPS: int = 30            # 그래프 갱신 주기 (fps, 0 이하면 샘플마다 즉시 갱신)
+    LABEL_DISPLAY_HZ: float = 10.0       # 값 라벨 갱신 주기 (Hz, 0 이하면 샘플마다 즉시 갱신)
+    
+    # 하중 그래프 데시메이션 (전체 이력 표시)
+    PLOT_DECIMATION: str = "minmax"      # 'minmax' | 'lttb' | 'none' (none이면 최근 MAX_PLOT_POINTS만 표시)
+    PLOT_ENVELOPE_FACTOR: int = 8        # 엔벨로프 단계 간 해상도 비율
+    PLOT_POINTS_PER_PIXEL: float = 2.0   # 화면 픽셀당 최대 포인트 수 (min/max 한 쌍)
+    PLOT_LTTB_OVERSAMPLE: int = 4        # LTTB 입력으로 고를 단계의 포인트 예산 배수
     
     # 타이머 설정
     THREAD_WAIT_TIMEOUT_MS: int = 2000   # 스레드 종료 대기 시간 (ms)
@@ -162,20 +189,56 @@ class SafetyConfig:
     """안전 가드 관련 설정"""
     DISPLACEMENT_TOLERANCE_UM: float = 5.0  # 변위 가드 허용 오차 (μm)
     FORCE_TOLERANCE_N: float = 0.1          # 하중 가드 허용 오차 (N)
+    EMERGENCY_STOP_ENABLED: bool = True     # 수집 스레드에서 제한 검사 후 즉시 정지
+
+
+@dataclass
+class SafetyRulesConfig:
+    """하중/온도 규칙 엔진 설정 (제한값 0 이하는 해당 규칙 끔)"""
+    ENABLED: bool = False                # 규칙 엔진 사용 (False면 기존 SafetyGuard만 사용)
+    LEGACY_FORCE_DELTA: bool = True      # 기존 연속 샘플 하중 변화량 검사 유지
+    WINDOW_SIZE: int = 8192              # 평가 윈도우 샘플 수
+    EVIDENCE_SEC: float = 1.0            # 발동 시 함께 보고할 직전 구간 (초)
+    
+    ABS_FORCE_LIMIT_N: float = 0.0       # 절대 하중 제한 (N)
+    FORCE_RATE_LIMIT_N_S: float = 0.0    # 하중 변화율 제한 (N/s)
+    RATE_LAG_SEC: float = 0.05           # 변화율 계산 간격 (샘플 주기와 무관)
+    SLOPE_LIMIT_N_S: float = 0.0         # 최소제곱 기울기 제한 (N/s)
+    SLOPE_WINDOW_SEC: float = 0.5        # 기울기 윈도우 (초)
+    LOAD_DROP_FRACTION: float = 0.0      # 급격한 하중 감소 비율 (0~1, 시편 파단)
+    LOAD_DROP_WINDOW_SEC: float = 0.2    # 하중 감소 판단 윈도우 (초)
+    LOAD_DROP_MIN_PEAK_N: float = 0.5    # 하중 감소 판단 최소 피크 (N)
+    TEMP_EXCURSION_C: float = 0.0        # 기준 온도 대비 허용 편차 (°C)
+
+
+@dataclass
+class BreakDetectorConfig:
+    """시편 파단 감지 설정"""
+    ENABLED: bool = True                 # 파단 감지 시 모터 자동 정지
+    DROP_PERCENT: float = 50.0           # 피크 대비 하중 감소 비율 (%)
+    SUSTAIN_SAMPLES: int = 3             # 감소가 연속되어야 하는 샘플 수
+    MIN_PEAK_N: float = 1.0              # 판정 최소 피크 하중 (N, 노이즈 방지)
 
 
 @dataclass
 class PretensionConfig:
     """Pre-Tension 관련 설정"""
     SETTLING_TIME_MS: int = 500          # 진동 안정화 대기 시간 (ms)
-    CHECK_INTERVAL_MS: int = 50          # 하중 감시 주기 (ms)
+    LOADCELL_ZERO_SETTLE_MS: int = 300   # 로드셀 0점(CDL) 후 대기 (ms)
+    MOTOR_ZERO_SETTLE_MS: int = 50       # 모터 0점(커맨드 8) 후 대기 (ms)
+    
+    # 목표 하중 접근 시 감속 (하중 샘플마다 jog 속도 조정)
+    APPROACH_SLOWDOWN: bool = False      # 감속 사용
+    APPROACH_START_FRACTION: float = 0.7 # 목표의 이 비율부터 감속 시작
+    APPROACH_MIN_SPEED_FRACTION: float = 0.2  # 목표 직전 최저 속도 (시작 속도 대비)
 
 
 @dataclass
 class SyncConfig:
     """데이터 동기화 설정"""
     MAX_TIME_DIFF_MS: int = 50           # 동기화 허용 오차 (ms)
-    BUFFER_SIZE: int = 100               # 동기화 버퍼 크기
+    BUFFER_SIZE: int = 20000             # 동기화 버퍼 크기 (이진 탐색이므로 크게 잡아도 무방)
+    INTERPOLATE: bool = False            # 앞뒤 위치 샘플 사이 선형 보간
 
 
 @dataclass
@@ -185,15 +248,119 @@ class StabilizationConfig:
     LOG_INTERVAL_SEC: int = 10           # 진행 상황 로그 주기 (초)
 
 
+@dataclass
+class LogWriterConfig:
+    """테스트 로그 기록 스레드 설정"""
+    QUEUE_MAX_ROWS: int = 100000         # 대기 큐 최대 행 수 (초과 시 행 폐기)
+    BATCH_MAX_ROWS: int = 1000           # 한 번에 기록할 최대 행 수
+    FLUSH_INTERVAL_MS: int = 200         # 배치 대기/flush 주기 (ms)
+    FSYNC_INTERVAL_SEC: float = 5.0      # 디스크 동기화(fsync) 체크포인트 주기 (초)
+    STOP_TIMEOUT_SEC: float = 10.0       # 종료 시 잔여 행 기록 대기 시간 (초)
+    BINARY_LOG_ENABLED: bool = False     # CSV와 함께 바이너리 로그(.ttlog) 기록
+
+
+@dataclass
+class CaptureConfig:
+    """원시 장비 스트림 캡처 (.ttcap, Stream_Capture.py로 재생)"""
+    ENABLED: bool = False                # True면 프로그램 실행 동안 모든 워커의 원시 데이터 기록
+    DIRECTORY: str = "captures"          # 캡처 파일 저장 폴더
+    BUFFER_BYTES: int = 1 << 20          # 파일 쓰기 버퍼 (워커 스레드의 디스크 대기 방지)
+
+
+@dataclass
+class BusConfig:
+    """Modbus 버스 스케줄러 설정 (같은 포트의 장치는 버스 하나를 공유)"""
+    CALL_TIMEOUT_SEC: float = 3.0        # 트랜잭션 결과 대기 시간 (큐 대기 + 통신)
+
+
+@dataclass
+class RateControlConfig:
+    """폐루프 속도 제어 설정 (BasicTest 당김 중 jog 속도 보정)"""
+    ENABLED: bool = False                # False면 기존 개루프 jog (설정 속도 고정)
+    MODE: str = "displacement"           # displacement(μm/s) / force(N/s) / strain(1/s)
+    TARGET_RATE: float = 0.0             # 목표 변화율 (MODE 단위, displacement에서 0이면 설정 속도)
+    GAUGE_LENGTH_MM: float = 25.0        # 변형률 모드 게이지 길이 (mm)
+    LOOP_HZ: float = 10.0                # 제어 주기 (Hz)
+    ESTIMATE_WINDOW_SEC: float = 0.5     # 변화율 추정 (최소제곱) 윈도우 (초)
+    STALE_SEC: float = 0.5               # 최신 샘플이 이보다 오래되면 출력 유지
+    KP: float = 0.5                      # 비례 게인 (상대 오차 → 피드포워드 대비 비율)
+    KI: float = 0.2                      # 적분 게인 (1/s)
+    KD: float = 0.0                      # 미분 게인 (s)
+    INTEGRAL_LIMIT: float = 1.0          # 적분항 한계 (anti-windup)
+    MIN_DELTA_RPS: float = 1.0           # 이보다 작은 속도 변화는 전송 생략 (레지스터 분해능)
+
+
+@dataclass
+class ProfileConfig:
+    """다단계 시험 프로파일 설정"""
+    PROFILE_PATH: str = ""               # JSON/YAML 프로파일 (지정 시 Test Start가 프로파일 실행)
+    POSITION_TOLERANCE_UM: float = 2.0   # 위치 구간 도달 판정 허용 오차 (μm)
+    UNLOAD_FORCE_N: float = 0.5          # unload 구간 종료 하중 (N)
+    TICK_MS: int = 50                    # hold 종료 / 단계 시간 초과 / 샘플 끊김 검사 주기 (ms)
+    SAMPLE_STALE_S: float = 1.0          # 로드셀 샘플이 이 시간 넘게 없으면 시작 거부 / 중단 (s)
+
+
+@dataclass
+class SimulatorConfig:
+    """가상 장비 설정 (COM 포트 목록의 SIM: 항목, 하드웨어 없는 부하 시험/교육용)"""
+    ENABLED: bool = False                # COM 포트 목록에 SIM:MOTOR / SIM:LOADCELL / SIM:TEMP 표시
+                                         # (운용 PC 기본 꺼짐, Main.py --sim 또는 TENSILE_TESTER_SIM=1로 켬)
+    LOADCELL_RATE_HZ: float = 500.0      # 로드셀 연속 출력(MSV?0) 프레임 속도 (Hz)
+    LATENCY_MS: float = 2.0              # 명령 → 응답 지연 (ms, Modbus/CDL 공통)
+    NOISE_N: float = 0.01                # 하중 노이즈 표준편차 (N)
+    DROPOUT_RATE: float = 0.0            # 응답/프레임 누락 확률 (0~1)
+    SEED: int = 1234                     # 노이즈/누락 난수 시드
+
+    # 합성 시편 (선형 탄성 → 항복 → 선형 경화 → 파단)
+    SPECIMEN_SLACK_UM: float = 50.0          # 하중이 걸리기 시작하는 변위 (μm)
+    SPECIMEN_STIFFNESS_N_PER_UM: float = 0.02  # 탄성 강성 (N/μm)
+    SPECIMEN_YIELD_N: float = 30.0           # 항복 하중 (N)
+    SPECIMEN_HARDENING: float = 0.05         # 항복 후 접선 강성 / 탄성 강성
+    SPECIMEN_BREAK_UM: float = 3000.0        # 파단 변위 (μm)
+
+    # 가상 온도 제어기 (1차 지연)
+    TEMP_AMBIENT_C: float = 25.0         # 주변 온도 (°C)
+    TEMP_TIME_CONSTANT_S: float = 30.0   # SV 추종 시정수 (초)
+
+
+@dataclass
+class DaemonConfig:
+    """헤드리스 수집 데몬 (Acquisition_Daemon.py) 로컬 소켓 설정"""
+    SERVER_NAME: str = "tensile_tester_daemon"  # QLocalServer 이름 (Unix 소켓 / 명명 파이프)
+    PUBLISH_HZ: float = 20.0             # 클라이언트로 샘플/상태 방출 주기 (Hz)
+    MAX_POINTS_PER_PUBLISH: int = 200    # 방출 1회당 최대 샘플 수 (초과 시 LTTB 축약)
+    MAX_CLIENT_BACKLOG_BYTES: int = 1 << 20  # 전송 대기 바이트가 이보다 많은 클라이언트는 샘플 건너뜀
+    MAX_LINE_BYTES: int = 1 << 16        # 메시지 한 줄 최대 크기
+    CALL_TIMEOUT_MS: int = 3000          # DaemonClient.call() 응답 대기 시간 (ms)
+    MAX_PENDING_REPLIES: int = 256       # 클라이언트가 보관하는 미수거 응답 수
+
+
+@dataclass
+class SampleBusConfig:
+    """로드셀 샘플 버스 (Sample_Bus.py, 공유 메모리 SPMC 링)"""
+    ENABLED: bool = False                # True면 샘플별 시그널 대신 링 기록 + 깨우기 시그널
+    CAPACITY: int = 1 << 16              # 링 레코드 수 (소비자가 이만큼 뒤처지면 유실)
+
+
 # ===== 전역 접근용 인스턴스 =====
 motor_cfg = MotorConfig()
 loadcell_cfg = LoadcellConfig()
 temp_cfg = TempConfig()
 monitor_cfg = MonitorConfig()
 safety_cfg = SafetyConfig()
+safety_rules_cfg = SafetyRulesConfig()
+break_cfg = BreakDetectorConfig()
 pretension_cfg = PretensionConfig()
 sync_cfg = SyncConfig()
 stabilization_cfg = StabilizationConfig()
+log_writer_cfg = LogWriterConfig()
+capture_cfg = CaptureConfig()
+bus_cfg = BusConfig()
+rate_control_cfg = RateControlConfig()
+profile_cfg = ProfileConfig()
+sim_cfg = SimulatorConfig()
+daemon_cfg = DaemonConfig()
+sample_bus_cfg = SampleBusConfig()
 
 
 # ===== 설정 검증 함수 =====
@@ -224,6 +391,12 @@ def validate_config():
     assert 1 <= loadcell_cfg.DEVICE_ADDRESS <= 99, \
         f"장비 주소는 1~99 사이여야 함"
     
+    assert loadcell_cfg.STREAM_FRAME_SIZE == 4, \
+        "스트리밍 프레임은 4바이트 sint32여야 함"
+    
+    assert loadcell_cfg.STREAM_POLL_INTERVAL_MS > 0, \
+        "스트리밍 드레인 주기는 양수여야 함"
+    
     logger.info("✓ Loadcell 설정 검증 완료")
     
     # 3. Temp 설정 검증
@@ -260,8 +433,14 @@ def validate_config():
     assert pretension_cfg.SETTLING_TIME_MS > 0, \
         "안정화 대기 시간은 양수여야 함"
     
-    assert pretension_cfg.CHECK_INTERVAL_MS > 0, \
-        "감시 주기는 양수여야 함"
+    assert pretension_cfg.LOADCELL_ZERO_SETTLE_MS >= 0 and pretension_cfg.MOTOR_ZERO_SETTLE_MS >= 0, \
+        "0점 대기 시간은 0 이상이어야 함"
+    
+    assert 0.0 < pretension_cfg.APPROACH_START_FRACTION < 1.0, \
+        "감속 시작 비율은 0~1 사이여야 함"
+    
+    assert 0.0 < pretension_cfg.APPROACH_MIN_SPEED_FRACTION <= 1.0, \
+        "최저 속도 비율은 0 초과 1 이하여야 함"
     
     logger.info("✓ Pretension 설정 검증 완료")
     
@@ -283,6 +462,123 @@ def validate_config():
     
     logger.info("✓ Stabilization 설정 검증 완료")
     
+    # 9. Log Writer 설정 검증
+    assert log_writer_cfg.QUEUE_MAX_ROWS > 0, \
+        "로그 큐 크기는 양수여야 함"
+    
+    assert log_writer_cfg.BATCH_MAX_ROWS > 0, \
+        "배치 크기는 양수여야 함"
+    
+    assert log_writer_cfg.FLUSH_INTERVAL_MS > 0, \
+        "flush 주기는 양수여야 함"
+    
+    logger.info("✓ Log Writer 설정 검증 완료")
+    
+    # 10. Plot 데시메이션 설정 검증
+    assert monitor_cfg.PLOT_DECIMATION in ("minmax", "lttb", "none"), \
+        f"PLOT_DECIMATION은 minmax/lttb/none 중 하나여야 함 (현재: {monitor_cfg.PLOT_DECIMATION})"
+    
+    assert monitor_cfg.PLOT_ENVELOPE_FACTOR >= 2, \
+        "엔벨로프 단계 비율은 2 이상이어야 함"
+    
+    logger.info("✓ Plot 설정 검증 완료")
+    
+    # 11. Modbus 버스 설정 검증
+    assert bus_cfg.CALL_TIMEOUT_SEC > motor_cfg.DEFAULT_TIMEOUT, \
+        "버스 대기 시간은 통신 타임아웃보다 커야 함"
+    
+    logger.info("✓ Modbus Bus 설정 검증 완료")
+    
+    # 12. 안전 규칙 엔진 설정 검증
+    assert safety_rules_cfg.WINDOW_SIZE >= 16, \
+        "규칙 윈도우는 16 샘플 이상이어야 함"
+    
+    assert safety_rules_cfg.RATE_LAG_SEC > 0 and safety_rules_cfg.SLOPE_WINDOW_SEC > 0, \
+        "변화율/기울기 윈도우는 양수여야 함"
+    
+    assert 0.0 <= safety_rules_cfg.LOAD_DROP_FRACTION < 1.0, \
+        "하중 감소 비율은 0 이상 1 미만이어야 함"
+    
+    logger.info("✓ Safety Rules 설정 검증 완료")
+    
+    # 13. 파단 감지 설정 검증
+    assert 0.0 < break_cfg.DROP_PERCENT < 100.0, \
+        "파단 감소 비율은 0~100% 사이여야 함"
+    
+    assert break_cfg.SUSTAIN_SAMPLES >= 1, \
+        "파단 판정 샘플 수는 1 이상이어야 함"
+    
+    logger.info("✓ Break Detector 설정 검증 완료")
+    
+    # 14. 폐루프 속도 제어 설정 검증
+    assert rate_control_cfg.MODE in ("displacement", "force", "strain"), \
+        f"MODE는 displacement/force/strain 중 하나여야 함 (현재: {rate_control_cfg.MODE})"
+    
+    assert 0 < rate_control_cfg.LOOP_HZ <= 100, \
+        "제어 주기는 0~100 Hz 사이여야 함"
+    
+    assert rate_control_cfg.ESTIMATE_WINDOW_SEC > 0 and rate_control_cfg.GAUGE_LENGTH_MM > 0, \
+        "추정 윈도우와 게이지 길이는 양수여야 함"
+    
+    logger.info("✓ Rate Control 설정 검증 완료")
+    
+    # 15. 시험 프로파일 설정 검증
+    assert profile_cfg.POSITION_TOLERANCE_UM > 0, \
+        "위치 도달 허용 오차는 양수여야 함"
+    
+    assert profile_cfg.TICK_MS > 0 and profile_cfg.SAMPLE_STALE_S > 0, \
+        "프로파일 검사 주기와 샘플 끊김 판정 시간은 양수여야 함"
+    
+    assert profile_cfg.UNLOAD_FORCE_N >= 0, \
+        "unload 종료 하중은 0 이상이어야 함"
+    
+    logger.info("✓ Profile 설정 검증 완료")
+    
+    # 16. 가상 장비 설정 검증
+    assert sim_cfg.LOADCELL_RATE_HZ > 0 and sim_cfg.LATENCY_MS >= 0, \
+        "가상 로드셀 속도는 양수, 지연은 0 이상이어야 함"
+    
+    assert 0.0 <= sim_cfg.DROPOUT_RATE < 1.0, \
+        "누락 확률은 0 이상 1 미만이어야 함"
+    
+    assert sim_cfg.SPECIMEN_STIFFNESS_N_PER_UM > 0 and 0.0 <= sim_cfg.SPECIMEN_HARDENING < 1.0, \
+        "시편 강성은 양수, 경화 비율은 0 이상 1 미만이어야 함"
+    
+    assert sim_cfg.TEMP_TIME_CONSTANT_S > 0, \
+        "온도 시정수는 양수여야 함"
+    
+    logger.info("✓ Simulator 설정 검증 완료")
+    
+    # 17. 캡처 설정 검증
+    assert capture_cfg.DIRECTORY, \
+        "캡처 저장 폴더가 비어 있음"
+    
+    assert capture_cfg.BUFFER_BYTES > 0, \
+        "캡처 쓰기 버퍼는 양수여야 함"
+    
+    logger.info("✓ Capture 설정 검증 완료")
+    
+    # 18. 수집 데몬 설정 검증
+    assert daemon_cfg.SERVER_NAME, \
+        "데몬 소켓 이름이 비어 있음"
+    
+    assert daemon_cfg.PUBLISH_HZ > 0 and daemon_cfg.MAX_POINTS_PER_PUBLISH >= 3, \
+        "방출 주기는 양수, 방출 샘플 수는 3 이상이어야 함"
+    
+    assert daemon_cfg.MAX_CLIENT_BACKLOG_BYTES > 0 and daemon_cfg.MAX_LINE_BYTES > 0, \
+        "클라이언트 버퍼 크기는 양수여야 함"
+    
+    assert daemon_cfg.CALL_TIMEOUT_MS > 0 and daemon_cfg.MAX_PENDING_REPLIES > 0, \
+        "응답 대기 시간/보관 수는 양수여야 함"
+    
+    logger.info("✓ Daemon 설정 검증 완료")
+    
+    # 19. 샘플 버스 설정 검증
+    assert sample_bus_cfg.CAPACITY > 0, \
+        "샘플 버스 용량은 양수여야 함"
+    
+    logger.info("✓ SampleBus 설정 검증 완료")
+    
     logger.info("=" * 60)
     logger.info("✅ 모든 설정 검증 완료")
     logger.info("=" * 60)
@@ -304,6 +600,7 @@ def print_config_summary():
     logger.info(f"[Loadcell]")
     logger.info(f"  - Device Address: {loadcell_cfg.DEVICE_ADDRESS}")
     logger.info(f"  - Scaling: {loadcell_cfg.NORMALIZATION_FACTOR} * {loadcell_cfg.GRAVITY_FACTOR}")
+    logger.info(f"  - Streaming: {loadcell_cfg.STREAMING_ENABLED}")
     
     logger.info(f"[Temp]")
     logger.info(f"  - Control Channel: {temp_cfg.DEFAULT_CONTROL_CHANNEL}")
@@ -315,7 +612,7 @@ def print_config_summary():
     
     logger.info(f"[Pretension]")
     logger.info(f"  - Settling Time: {pretension_cfg.SETTLING_TIME_MS} ms")
-    logger.info(f"  - Check Interval: {pretension_cfg.CHECK_INTERVAL_MS} ms")
+    logger.info(f"  - Approach Slowdown: {pretension_cfg.APPROACH_SLOWDOWN}")
     
     logger.info(f"[Stabilization]")
     logger.info(f"  - Check Interval: {stabilization_cfg.CHECK_INTERVAL_SEC} sec")
@@ -6,6 +6,7 @@
 
 from abc import ABC, abstractmethod
 from typing import Optional, Tuple
+import numpy as np
 
 
 class IDataReceiver(ABC):
@@ -17,8 +18,19 @@ class IDataReceiver(ABC):
         pass
     
     @abstractmethod
-    def receive_loadcell_data(self, force_n: float, position_um: float, temp_ch1: float):
-        """로드셀 데이터 수신 (동기화된 위치 포함)"""
+    def receive_loadcell_data(
+        self,
+        force_n: float,
+        position_um: float,
+        temp_ch1: float,
+        timestamp: Optional[float] = None
+    ):
+        """
+        로드셀 데이터 수신 (동기화된 위치 포함)
+        
+        Args:
+            timestamp: 획득 시각 (perf_counter 기준 초, None이면 수신 시각 사용)
+        """
         pass
     
     @abstractmethod
@@ -26,6 +38,33 @@ class IDataReceiver(ABC):
         """온도 데이터 수신"""
         pass
 
+    def receive_loadcell_batch(self, times, forces, positions, temps):
+        """
+        로드셀 샘플 배치 수신 (시간 오름차순 NumPy 배열)
+
+        기본 구현은 샘플마다 receive_loadcell_data 호출 (단일 샘플 구현 호환).
+        벡터화할 수 있는 수신자는 재정의한다.
+
+        Args:
+            times: 획득 시각 (perf_counter 기준 초)
+            forces: 하중 (N)
+            positions: 동기화된 위치 (um)
+            temps: 같은 시각의 CH1 온도
+        """
+        for t, force, pos, temp in zip(times, forces, positions, temps):
+            self.receive_loadcell_data(float(force), float(pos), float(temp), timestamp=float(t))
+
+    def mark_event(self, kind: str, timestamp: Optional[float] = None, **info):
+        """
+        테스트 이벤트 기록 (파단 등, 기본: 무시)
+
+        Args:
+            kind: 이벤트 종류 (예: 'break')
+            timestamp: 이벤트 샘플의 획득 시각 (perf_counter 기준 초)
+            **info: 함께 저장할 값 (JSON 직렬화 가능)
+        """
+        pass
+
 
 class IUIUpdater(ABC):
     """UI 업데이트 인터페이스"""
@@ -45,6 +84,11 @@ class IUIUpdater(ABC):
         """온도 라벨 업데이트"""
         pass
 
+    def update_loadcell_batch(self, forces):
+        """로드셀 샘플 배치 (기본: 마지막 값만 표시)"""
+        if len(forces):
+            self.update_loadcell_value(float(forces[-1]))
+
 
 class ISafetyGuard(ABC):
     """안전 가드 인터페이스"""
@@ -72,9 +116,50 @@ class ISafetyGuard(ABC):
         """하중 가드 리셋"""
         pass
 
+    def evaluate_batch(
+        self,
+        times,
+        forces,
+        temps=None,
+        previous_force: Optional[float] = None
+    ) -> Tuple[bool, str]:
+        """
+        하중 샘플 배치 평가 (시간 오름차순)
+
+        기본 구현은 연속 샘플 간 check_force_limit 검사.
+        규칙 엔진 등은 재정의하여 배치 전체를 한 번에 평가한다.
+
+        Args:
+            times: 획득 시각 (perf_counter 기준 초)
+            forces: 하중 (N)
+            temps: 같은 시각의 CH1 온도 (없으면 None, 미측정은 NaN)
+            previous_force: 배치 직전 하중 (첫 샘플의 비교 기준)
+        Returns: (제한 초과 여부, 메시지)
+        """
+        previous = previous_force
+        for force in forces:
+            if previous is not None:
+                exceeded, message = self.check_force_limit(force, previous)
+                if exceeded:
+                    return (True, message)
+            previous = force
+        return (False, "")
+
+    def set_load_drop_checks(self, enabled: bool):
+        """
+        하중 감소를 이상으로 판단하는 검사 켜기/끄기 (기본: 무시)
+
+        하중을 의도적으로 줄이는 구간(프로파일 unload/cycle 등) 동안 끈다.
+        """
+        pass
+
 
 class IDataSynchronizer(ABC):
-    """데이터 동기화 인터페이스"""
+    """
+    데이터 동기화 인터페이스
+    
+    timestamp는 모두 워커 스레드의 획득 시각 (perf_counter 기준 초)
+    """
     
     @abstractmethod
     def add_position(self, timestamp: float, pos_um: float):
@@ -94,6 +179,17 @@ class IDataSynchronizer(ABC):
         """
         pass
 
+    def add_force_batch(self, times, forces):
+        """하중 샘플 배치 추가 (기본: 샘플별 add_force)"""
+        for t, force in zip(times, forces):
+            self.add_force(float(t), float(force))
+
+    def get_matched_positions(self, force_timestamps) -> np.ndarray:
+        """하중 타임스탬프 배열에 매칭되는 위치 배열 (기본: 샘플별 get_matched_position)"""
+        return np.array(
+            [self.get_matched_position(float(t)) for t in force_timestamps], dtype=np.float64
+        )
+
 
 class ITensioningController(ABC):
     """텐셔닝 제어 인터페이스"""
@@ -119,4 +215,62 @@ class ITensioningController(ABC):
     @abstractmethod
     def is_active(self) -> bool:
         """텐셔닝 활성 상태 여부"""
-        pass
\ No newline at end of file
+        pass
+
+
+# ============================================================================
+# 단일 샘플 구현용 배치 어댑터
+# ============================================================================
+
+class SingleSampleReceiverAdapter(IDataReceiver):
+    """
+    배치 메서드가 없는 수신자(인터페이스를 상속하지 않은 기존 구현)를 감싸서
+    receive_loadcell_batch를 샘플별 호출로 풀어 준다.
+    """
+
+    def __init__(self, receiver):
+        self.inner = receiver
+
+    def receive_motor_data(self, elapsed: float, displacement_um: float):
+        self.inner.receive_motor_data(elapsed, displacement_um)
+
+    def receive_loadcell_data(self, force_n, position_um, temp_ch1, timestamp=None):
+        self.inner.receive_loadcell_data(force_n, position_um, temp_ch1, timestamp=timestamp)
+
+    def receive_temp_data(self, elapsed: float, temps: list):
+        self.inner.receive_temp_data(elapsed, temps)
+
+    def mark_event(self, kind: str, timestamp: Optional[float] = None, **info):
+        mark_event = getattr(self.inner, 'mark_event', None)  # 이벤트 기록이 없는 기존 구현 허용
+        if mark_event is not None:
+            mark_event(kind, timestamp=timestamp, **info)
+
+
+class SingleSampleUIAdapter(IUIUpdater):
+    """배치 메서드가 없는 UI 업데이터용 어댑터"""
+
+    def __init__(self, ui_updater):
+        self.inner = ui_updater
+
+    def update_motor_position(self, pos_um: float):
+        self.inner.update_motor_position(pos_um)
+
+    def update_loadcell_value(self, force_n: float):
+        self.inner.update_loadcell_value(force_n)
+
+    def update_temperature(self, channel: int, temp: float):
+        self.inner.update_temperature(channel, temp)
+
+
+def as_batch_receiver(receiver) -> IDataReceiver:
+    """receive_loadcell_batch를 지원하는 수신자 (없으면 어댑터로 감쌈)"""
+    if hasattr(receiver, 'receive_loadcell_batch'):
+        return receiver
+    return SingleSampleReceiverAdapter(receiver)
+
+
+def as_batch_ui_updater(ui_updater) -> IUIUpdater:
+    """update_loadcell_batch를 지원하는 UI 업데이터 (없으면 어댑터로 감쌈)"""
+    if hasattr(ui_updater, 'update_loadcell_batch'):
+        return ui_updater
+    return SingleSampleUIAdapter(ui_updater)
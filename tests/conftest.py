@@ -1,10 +1,17 @@
 # tests/conftest.py
+import os
 import sys
+import tempfile
 from pathlib import Path
 
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Main.py import 시 설정되는 파일 로그를 저장소 루트 대신 임시 폴더에 기록
+os.environ.setdefault(
+    "TENSILE_TESTER_LOG", os.path.join(tempfile.gettempdir(), "tensile_tester_test.log")
+)
+
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -0,0 +1,230 @@
+# tests/test_acquisition_daemon.py
+"""
+헤드리스 수집 데몬 테스트
+- 줄 단위 JSON 메시지 분리
+- 방출 샘플 축약 (LTTB, 위치 정렬 유지)
+- 명령 오류 응답
+- 가상 장비로 연결 → 시험 시작(로그) → 정지, 클라이언트 샘플 수신
+- GUI / 데몬 공용 구성 (Acquisition_Core)
+- MainWindow attach 모드 (DaemonClient로 상태/샘플/명령)
+"""
+
+import os
+import pytest
+from unittest.mock import MagicMock, patch
+import Daemon_Attach
+import Device_Simulator
+from Acquisition_Core import (
+    DeviceConnectError, begin_test_safety, connect_loadcell, end_test_safety, release_device,
+    set_unloading
+)
+from Acquisition_Daemon import (
+    AcquisitionDaemon, DaemonClient, DaemonError, DaemonRecorder, _LineReader
+)
+from config import sim_cfg
+
+
+@pytest.fixture
+def daemon(qapp):
+    Device_Simulator.reset_rig()
+    d = AcquisitionDaemon(server_name=f"tt_daemon_test_{os.getpid()}")
+    with patch.multiple(sim_cfg, LATENCY_MS=0.0, NOISE_N=0.0, DROPOUT_RATE=0.0):
+        yield d
+        d.close()
+    Device_Simulator.reset_rig()
+
+
+class TestLineReader:
+    """_LineReader"""
+
+    def test_split_across_chunks_and_skip_garbage(self):
+        reader = _LineReader()
+
+        assert reader.feed(b'{"cmd": "sta') == []
+        assert reader.feed(b'tus"}\nnot json\n\n{"id": 2}\n') == [{"cmd": "status"}, {"id": 2}]
+
+
+class TestRecorderBatch:
+    """DaemonRecorder.take_batch"""
+
+    def test_small_batch_passes_through(self):
+        rec = DaemonRecorder()
+        for i in range(5):
+            rec.receive_loadcell_data(float(i), 10.0 * i, 25.0, timestamp=i * 0.01)
+
+        batch = rec.take_batch(200)
+
+        assert batch["force"] == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert batch["received"] == 5
+        assert rec.take_batch(200)["received"] == 0
+
+    def test_large_batch_is_decimated_keeping_peak(self):
+        rec = DaemonRecorder()
+        for i in range(1000):
+            force = 50.0 if i == 637 else 0.0
+            rec.receive_loadcell_data(force, float(i), 25.0, timestamp=i * 0.001)
+
+        batch = rec.take_batch(50)
+
+        assert len(batch["t"]) == 50 and batch["received"] == 1000
+        assert 50.0 in batch["force"]
+        peak = batch["force"].index(50.0)
+        assert batch["pos"][peak] == 637.0  # 선택된 샘플의 위치가 함께 유지됨
+        assert batch["t"][peak] == pytest.approx(0.637)
+
+
+class TestCommands:
+    """명령 처리 (소켓 없이)"""
+
+    def test_errors_are_replied(self, daemon):
+        unknown = daemon.handle_message({"id": 1, "cmd": "fly"})
+        bad_args = daemon.handle_message({"id": 2, "cmd": "set_speed", "args": {"rpm": 3}})
+        no_motor = daemon.handle_message({"id": 3, "cmd": "start_test"})
+
+        assert unknown["ok"] is False and "fly" in unknown["error"]
+        assert bad_args["ok"] is False and bad_args["id"] == 2
+        assert no_motor["ok"] is False
+
+    def test_set_limits_and_status(self, daemon):
+        reply = daemon.handle_message(
+            {"id": 1, "cmd": "set_limits", "args": {"force_limit_n": 5}}
+        )
+        status = daemon.handle_message({"id": 2, "cmd": "status"})["result"]
+
+        assert reply["ok"] is True
+        assert status["force_limit_n"] == 5.0
+        assert status["ports"] == {} and status["running"] is False
+
+
+class TestDaemonSession:
+    """가상 장비 + 로컬 소켓 클라이언트"""
+
+    @pytest.mark.timeout(30)
+    def test_connect_start_log_stop(self, daemon, qtbot, tmp_path):
+        assert daemon.listen()
+        client = DaemonClient(daemon.server_name)
+        assert client.connect_to_daemon()
+
+        replies = {}
+        client.reply_received.connect(lambda r: replies.__setitem__(r["id"], r))
+        samples, events = [], []
+        client.samples_received.connect(samples.append)
+        client.event_received.connect(events.append)
+
+        def call(cmd, **args):
+            request_id = client.request(cmd, **args)
+            qtbot.waitUntil(lambda: request_id in replies, timeout=5000)
+            return replies[request_id]
+
+        assert call("connect", device="motor", port="SIM:MOTOR")["ok"]
+        assert call("connect", device="loadcell", port="SIM:LOADCELL")["ok"]
+        assert call("connect", device="motor", port="SIM:MOTOR")["ok"] is False  # 중복 연결
+
+        log_path = str(tmp_path / "daemon.csv")
+        started = call("start_test", log_path=log_path)
+        assert started["ok"], started
+        assert started["result"]["running"] is True
+
+        qtbot.waitUntil(lambda: any(s["received"] for s in samples), timeout=5000)
+        qtbot.waitUntil(lambda: daemon.recorder._rows_submitted >= 3, timeout=5000)
+
+        stopped = call("stop", reason="테스트 종료")
+        assert stopped["result"]["running"] is False
+        assert stopped["result"]["logging"] is None
+        qtbot.waitUntil(lambda: any(e.get("kind") == "stopped" for e in events), timeout=2000)
+
+        with open(log_path, encoding="utf-8") as f:
+            assert len(f.read().splitlines()) >= 3
+
+        client.close()
+
+
+class TestSharedWiring:
+    """Acquisition_Core (MainWindow / 데몬 공용)"""
+
+    def test_connect_failure_is_typed_and_port_closed(self, daemon):
+        with patch("Acquisition_Core.verify_loadcell_connection", return_value=(False, "응답 없음")):
+            with pytest.raises(DeviceConnectError, match="응답 없음"):
+                connect_loadcell(daemon.loadcell_manager, "SIM:LOADCELL", 9600, 100)
+            with pytest.raises(DaemonError, match="응답 없음"):
+                daemon.connect_device("loadcell", "SIM:LOADCELL")
+
+        assert not daemon.loadcell_manager.is_connected()
+        assert "loadcell" not in daemon.ports
+
+    def test_connect_and_release(self, daemon):
+        ser = connect_loadcell(daemon.loadcell_manager, "SIM:LOADCELL", 9600, 100)
+        assert daemon.loadcell_manager.is_connected()
+
+        release_device(daemon.loadcell_manager, ser)
+
+        assert not daemon.loadcell_manager.is_connected()
+        assert not ser.is_open
+
+    def test_test_safety_start_and_end(self, daemon):
+        handler = daemon.data_handler
+        begin_test_safety(handler)
+        assert handler.break_detection_enabled is True
+        assert daemon.safety_guard.load_drop_checks is True
+
+        set_unloading(handler, True)   # 프로파일 하중 제거 단계
+        assert handler.break_detection_enabled is False
+        assert daemon.safety_guard.load_drop_checks is False
+
+        end_test_safety(daemon.emergency_stop, handler)
+
+        assert handler.break_detection_enabled is False
+        assert daemon.safety_guard.load_drop_checks is True
+        assert not daemon.emergency_stop.is_armed
+
+
+class TestAttachMode:
+    """MainWindow attach 모드 (장비는 데몬이 소유)"""
+
+    @pytest.mark.timeout(30)
+    def test_gui_drives_daemon(self, daemon, qtbot, tmp_path):
+        from Main import MainWindow
+
+        assert daemon.listen()
+        client = DaemonClient(daemon.server_name)
+        assert client.connect_to_daemon()
+        log_path = str(tmp_path / "attach.csv")
+
+        with patch.object(Daemon_Attach, "ErrorHandler", MagicMock()) as handler, \
+                patch.object(Daemon_Attach.QtWidgets.QFileDialog, "getSaveFileName",
+                             return_value=(log_path, "")):
+            window = MainWindow(daemon_client=client)
+            qtbot.addWidget(window)
+            ui = window.ui
+
+            # 연결 버튼 → 데몬이 포트를 열고, 상태가 버튼에 반영됨 (로컬 Manager는 그대로)
+            for combo, port in ((ui.Com_comboBox, "SIM:MOTOR"), (ui.Com_comboBox_2, "SIM:LOADCELL")):
+                combo.addItem(port)
+                combo.setCurrentText(port)
+            ui.Comconnect_pushButton.click()
+            ui.Comconnect_pushButton_2.click()
+            qtbot.waitUntil(lambda: set(daemon.ports) == {"motor", "loadcell"}, timeout=5000)
+            qtbot.waitUntil(lambda: ui.Comdisconnect_pushButton_2.isEnabled(), timeout=5000)
+            assert not ui.Comconnect_pushButton.isEnabled()
+            assert not window.motor_manager.is_connected()
+
+            # 제한값 입력 → 데몬 가드
+            force_limit = ui.ForceLimitMax_doubleSpinBox.value() + 1.5   # 저장된 값과 다르게
+            ui.ForceLimitMax_doubleSpinBox.setValue(force_limit)
+            qtbot.waitUntil(
+                lambda: daemon.safety_guard.limits.force_limit_n == pytest.approx(force_limit), timeout=5000
+            )
+
+            # 시작 → 데몬 시험 + 로그, 방출 샘플로 GUI 플롯
+            ui.Basicteststart_pushButton.click()
+            qtbot.waitUntil(lambda: daemon.recorder.is_logging, timeout=5000)
+            qtbot.waitUntil(lambda: len(window.plot_service.x_data) > 0, timeout=5000)
+            assert daemon.recorder.log_path == log_path
+
+            ui.Basicteststop_pushButton.click()
+            qtbot.waitUntil(lambda: not window.daemon_link._plotting, timeout=5000)
+            assert daemon.last_stop_reason == "사용자 Stop 버튼 클릭"
+
+            window.daemon_link.close()
+            handler.show_error.assert_not_called()
+            handler.show_warning.assert_not_called()
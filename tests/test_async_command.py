@@ -0,0 +1,188 @@
+# tests/test_async_command.py
+"""
+비동기 장비 명령 테스트
+- 명령 완료 보고 (Future / CommandResult 시그널 / 소요 시간)
+- 명령 시퀀스: 단계 사이 대기는 GUI 스레드 타이머, 실패 시 중단
+- 모터: 0점 설정 중에도 버스 스레드 점유 없음
+- 로드셀: 모니터 워커 스레드에서 실행, 스트리밍 일시 정지
+"""
+
+import threading
+import pytest
+from concurrent.futures import Future
+from unittest.mock import MagicMock, patch
+from Async_Command import CommandQueue, CommandSequence, CommandSignals, track_command
+from Controller_Loadcell import LoadcellService
+from Controller_motor import MotorService
+from Modbus_Bus import acquire_modbus_client
+from Monitor_loadcell import LoadcellWorker
+
+
+class TestCommandLayer:
+    """CommandQueue / track_command 단위 테스트"""
+
+    def test_track_command_reports_result_and_timing(self):
+        signals = CommandSignals()
+        results = []
+        signals.finished.connect(results.append)
+        future = track_command(Future(), "motor.zero_position", signals)
+
+        future.set_result(False)  # False 반환은 실패
+
+        result = results[0]
+        assert result.command_id == future.command_id
+        assert result.label == "motor.zero_position"
+        assert result.ok is False
+        assert result.elapsed_ms >= 0.0
+
+    def test_queue_runs_in_draining_thread(self):
+        queue = CommandQueue("test")
+        queue.active = True
+        future = queue.submit(lambda: threading.current_thread().name)
+
+        worker = threading.Thread(target=queue.drain, name="io-thread")
+        worker.start()
+        worker.join(2)
+
+        assert future.result(1) == "io-thread"
+
+    def test_closed_queue_fails_pending(self):
+        queue = CommandQueue("test")
+        queue.active = True
+        pending = queue.submit(lambda: 1)
+
+        queue.close("모니터 정지")
+
+        with pytest.raises(ConnectionError):
+            pending.result(1)
+        with pytest.raises(ConnectionError):
+            queue.submit(lambda: 1).result(1)
+
+
+class TestCommandSequence:
+    """CommandSequence (GUI 스레드 타이머로 단계 대기)"""
+
+    @staticmethod
+    def _done(value):
+        future = Future()
+        future.set_result(value)
+        return future
+
+    @pytest.mark.timeout(5)
+    def test_steps_run_in_order_after_settle(self, qtbot):
+        sequence = CommandSequence("test")
+        order, done = [], []
+        sequence.finished.connect(lambda ok, err: done.append((ok, err)))
+
+        assert sequence.start([
+            ("a", lambda: order.append("a") or self._done(True), 50),
+            ("b", lambda: order.append("b") or self._done(None), 0),
+        ])
+
+        assert order == ["a"]   # 두 번째 단계는 대기 후
+        assert not sequence.start([])   # 실행 중에는 새 시퀀스 거부
+        qtbot.waitUntil(lambda: len(done) == 1, timeout=1000)
+        assert order == ["a", "b"] and done == [(True, "")]
+
+    @pytest.mark.timeout(5)
+    def test_failed_step_stops_sequence(self, qtbot):
+        sequence = CommandSequence("test")
+        order, done = [], []
+        sequence.finished.connect(lambda ok, err: done.append((ok, err)))
+
+        sequence.start([
+            ("a", lambda: order.append("a") or self._done(False), 0),
+            ("b", lambda: order.append("b") or self._done(True), 0),
+        ])
+
+        qtbot.waitUntil(lambda: len(done) == 1, timeout=1000)
+        qtbot.wait(20)
+        assert order == ["a"]
+        assert done[0][0] is False and done[0][1].startswith("a:")
+        assert not sequence.is_running
+
+
+class TestMotorAsync:
+    """MotorService 비동기 명령"""
+
+    @pytest.mark.timeout(5)
+    def test_zero_sequence_keeps_bus_free(self, qtbot):
+        """0점 설정: 정지는 SAFETY, 명령만 버스 스레드에서 실행하고 대기 동안 버스는 비어 있음"""
+        client = MagicMock()
+        client.is_socket_open.return_value = True
+        writes = []
+        ok = MagicMock(isError=lambda: False)
+        client.write_register.side_effect = lambda **kw: writes.append((threading.current_thread().name, kw["value"])) or ok
+        client.write_registers.side_effect = lambda **kw: writes.append((threading.current_thread().name, "zero")) or ok
+        client.read_holding_registers.return_value = ok
+        proxy = acquire_modbus_client("ASYNC_PORT", client_factory=lambda **kw: client)
+        try:
+            motor = MotorService(proxy)
+            results = []
+            motor.signals.finished.connect(results.append)
+            sequence = CommandSequence("motor.zero")
+            done = []
+            sequence.finished.connect(lambda ok_, err: done.append(ok_))
+
+            with patch("Controller_motor.time.sleep", side_effect=AssertionError("버스 스레드 대기")):
+                sequence.start([
+                    ("stop", motor.stop_async, 300),
+                    ("write_zero_position", motor.write_zero_position_async, 0),
+                ])
+                qtbot.waitUntil(lambda: len(writes) == 1, timeout=1000)
+
+                # 정지 후 대기 중에도 폴링은 바로 처리됨
+                poll = proxy.submit("read_holding_registers", address=0x75, count=2, device_id=1)
+                assert poll.result(0.2) is ok
+                assert sequence.is_running
+
+                qtbot.waitUntil(lambda: done == [True], timeout=2000)
+
+            assert [value for _, value in writes] == [6, "zero", 8]
+            assert all(name == "ModbusBus-ASYNC_PORT" for name, _ in writes)
+            assert [r.label for r in results] == ["motor.stop", "motor.write_zero_position"]
+        finally:
+            proxy.close()
+
+    def test_direct_client_uses_executor_thread(self):
+        client = MagicMock()
+        client.is_socket_open.return_value = True
+        motor = MotorService(client)
+        caller = threading.current_thread()
+
+        future = motor.submit_async("probe", lambda: threading.current_thread())
+
+        assert future.result(2) is not caller
+
+
+class TestLoadcellAsync:
+    """LoadcellService 비동기 명령 (모니터 워커 스레드)"""
+
+    def test_command_pauses_stream(self):
+        """스트리밍 중이면 명령 전에 연속 출력을 멈추고 실행 후 다시 시작"""
+        ser = MagicMock()
+        ser.is_open = True
+        queue = CommandQueue("loadcell")
+        service = LoadcellService(ser)
+        service.io_queue = queue
+        worker = LoadcellWorker(ser, interval_ms=100, streaming=True, command_queue=queue)
+        worker._running = True
+        queue.active = True
+
+        calls = []
+        with patch("Monitor_loadcell._stop_stream_via_serial", side_effect=lambda s: calls.append("stop")), \
+             patch("Monitor_loadcell._start_stream_via_serial", side_effect=lambda s: calls.append("start")):
+            future = service.submit_async("probe", lambda: calls.append("command") or True)
+            worker._run_commands()  # 워커 스레드의 command_posted 슬롯
+
+        assert future.result(1) is True
+        assert calls == ["stop", "command", "start"]
+
+    def test_without_monitor_falls_back_to_executor(self):
+        ser = MagicMock()
+        ser.is_open = False
+        service = LoadcellService(ser)
+
+        future = service.send_zero_command_async()
+
+        assert future.result(2) is False  # 포트 닫힘 → 실패 보고
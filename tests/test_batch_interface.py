@@ -0,0 +1,191 @@
+# tests/test_batch_interface.py
+"""
+배치 단위 IDataReceiver 경로 테스트
+- TimeSeriesBuffer.extend == append 반복
+- 벡터화 위치 매칭 == 샘플별 매칭
+- SafetyGuard 배치 평가 == 샘플별 평가
+- 단일 샘플 구현 어댑터
+- DataHandler 배치 경로 (파단 위치, 가드 트립)
+- 워커 배치 방출
+"""
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+from Break_Detector import BreakDetector
+from Data_Handler import DataHandler
+from Data_Synchronizer import DataSynchronizer
+from Monitor_loadcell import LoadcellWorker, _counts_to_force
+from Ring_Buffer import TimeSeriesBuffer
+from Safety_Guard import SafetyGuard, SafetyLimits
+from Tensioning_Controller import TensioningController
+from interfaces import SingleSampleReceiverAdapter, as_batch_receiver
+from config import BreakDetectorConfig, safety_cfg
+
+
+def _make_handler(limits=None, break_detector=None):
+    return DataHandler(
+        ui_updater=MagicMock(),
+        safety_guard=SafetyGuard(None, safety_cfg, limits=limits or SafetyLimits()),
+        synchronizer=DataSynchronizer(),
+        tensioning=TensioningController(),
+        data_receiver=MagicMock(),
+        stop_callback=MagicMock(),
+        break_detector=break_detector
+    )
+
+
+class TestVectorizedBuffers:
+    """버퍼 / 동기화 벡터화"""
+
+    @pytest.mark.parametrize("n", [3, 8, 13])
+    def test_extend_matches_append(self, n):
+        by_append = TimeSeriesBuffer(8, channels=2)
+        by_extend = TimeSeriesBuffer(8, channels=2)
+        for buf in (by_append, by_extend):
+            buf.append(0.0, -1.0, -2.0)
+        t = np.arange(1, n + 1) * 0.1
+
+        for i in range(n):
+            by_append.append(t[i], t[i] * 10, t[i] * 20)
+        by_extend.extend(t, t * 10, t * 20)
+
+        assert len(by_extend) == len(by_append)
+        assert np.array_equal(by_extend.times, by_append.times)
+        assert np.array_equal(by_extend.values(1), by_append.values(1))
+
+    @pytest.mark.parametrize("interpolate", [False, True])
+    def test_matched_positions_match_scalar(self, interpolate):
+        sync = DataSynchronizer()
+        sync.interpolate = interpolate
+        for i in range(10):
+            sync.add_position(i * 0.01, i * 100.0)
+        queries = np.array([-0.005, 0.0, 0.013, 0.045, 0.0899, 0.5])
+
+        vectorized = sync.get_matched_positions(queries)
+
+        scalar = [sync.get_matched_position(float(t)) for t in queries]
+        assert vectorized.tolist() == pytest.approx(scalar)
+
+
+class TestGuardBatch:
+    """SafetyGuard.evaluate_batch"""
+
+    def test_batch_trips_like_per_sample(self):
+        forces = [0.0, 1.0, 2.0, 9.0, 9.5, 20.0]
+        batch_guard = SafetyGuard(None, safety_cfg, limits=SafetyLimits(force_limit_n=5.0))
+        sample_guard = SafetyGuard(None, safety_cfg, limits=SafetyLimits(force_limit_n=5.0))
+
+        exceeded, message = batch_guard.evaluate_batch(
+            np.arange(len(forces)) * 0.01, forces, previous_force=0.0
+        )
+
+        expected = [sample_guard.check_force_limit(cur, prev)
+                    for prev, cur in zip([0.0] + forces[:-1], forces)]
+        assert exceeded is True
+        assert (exceeded, message) == next(r for r in expected if r[0])
+        assert batch_guard.evaluate_batch([1.0], [100.0], previous_force=0.0) == (False, "")
+
+
+class TestLegacyAdapter:
+    """단일 샘플 수신자 호환"""
+
+    def test_duck_typed_receiver_gets_each_sample(self):
+        class LegacyReceiver:
+            def __init__(self):
+                self.rows = []
+
+            def receive_loadcell_data(self, force_n, position_um, temp_ch1, timestamp=None):
+                self.rows.append((timestamp, force_n, position_um, temp_ch1))
+
+        legacy = LegacyReceiver()
+        receiver = as_batch_receiver(legacy)
+
+        receiver.receive_loadcell_batch(
+            np.array([1.0, 2.0]), np.array([3.0, 4.0]), np.array([5.0, 6.0]), np.array([25.0, 25.0])
+        )
+
+        assert isinstance(receiver, SingleSampleReceiverAdapter)
+        assert legacy.rows == [(1.0, 3.0, 5.0, 25.0), (2.0, 4.0, 6.0, 25.0)]
+        assert all(type(v) is float for row in legacy.rows for v in row)
+
+    def test_receiver_without_mark_event_is_tolerated(self):
+        class LegacyReceiver:
+            def receive_loadcell_data(self, force_n, position_um, temp_ch1, timestamp=None):
+                pass
+
+        receiver = as_batch_receiver(LegacyReceiver())
+
+        receiver.mark_event('break', timestamp=1.0, samples_ago=0)   # 예외 없음
+
+
+class TestDataHandlerBatch:
+    """DataHandler.update_loadcell_batch"""
+
+    def test_batch_is_delivered_once(self):
+        handler = _make_handler()
+        handler.sync.add_position(0.0, 100.0)
+        ts_ns = np.array([10, 20, 30]) * 1_000_000
+
+        handler.update_loadcell_batch(np.array([1.0, 2.0, 3.0]), ts_ns)
+
+        call = handler.receiver.receive_loadcell_batch.call_args
+        times, forces, positions, _ = call.args
+        assert handler.receiver.receive_loadcell_batch.call_count == 1
+        assert times.tolist() == pytest.approx([0.01, 0.02, 0.03])
+        assert positions.tolist() == [100.0, 100.0, 100.0]
+        assert handler.last_force == 3.0
+        handler.ui_updater.update_loadcell_batch.assert_called_once()
+        handler.stop_callback.assert_not_called()
+
+    def test_break_samples_ago_counts_from_batch_end(self):
+        """배치 중간에서 파단 판정 → 배치 끝 기준 행 위치로 환산"""
+        detector = BreakDetector(
+            BreakDetectorConfig(DROP_PERCENT=50.0, SUSTAIN_SAMPLES=3, MIN_PEAK_N=1.0)
+        )
+        handler = _make_handler(break_detector=detector)
+        handler.break_detection_enabled = True
+        forces = np.array([2.0, 6.0, 10.0, 1.0, 0.8, 0.5, 0.4, 0.3])
+
+        handler.update_loadcell_batch(forces, (np.arange(len(forces)) + 1) * 10_000_000)
+
+        handler.stop_callback.assert_called_once()
+        info = handler.receiver.mark_event.call_args.kwargs
+        assert info['timestamp'] == pytest.approx(0.04)
+        assert info['samples_ago'] == 4   # 첫 감소 샘플(인덱스 3) → 마지막 샘플(인덱스 7)
+
+    def test_guard_trip_uses_previous_force(self):
+        handler = _make_handler(limits=SafetyLimits(force_limit_n=5.0))
+        handler.update_loadcell_batch(np.array([0.0, 1.0]), np.array([1, 2]) * 1_000_000)
+        handler.stop_callback.assert_not_called()
+
+        handler.update_loadcell_batch(np.array([7.0, 7.5]), np.array([3, 4]) * 1_000_000)
+
+        handler.stop_callback.assert_called_once()
+        assert "하중" in handler.stop_callback.call_args.kwargs['reason']
+
+
+class TestWorkerBatch:
+    """LoadcellWorker batch 모드"""
+
+    def test_one_emit_per_poll_tick(self):
+        payload = b"".join(c.to_bytes(4, "big", signed=True) + b"\r\n" for c in (100, 200, 300))
+        mock_serial = MagicMock()
+        mock_serial.is_open = True
+        mock_serial.in_waiting = len(payload)
+        mock_serial.read.return_value = payload
+
+        worker = LoadcellWorker(mock_serial, interval_ms=100, streaming=True, batch=True)
+        worker._running = True
+        singles, batches = [], []
+        worker.data_ready.connect(lambda f, ts: singles.append(f))
+        worker.batch_ready.connect(lambda f, ts: batches.append((f, ts)))
+
+        worker._do_work()
+        mock_serial.in_waiting = 0
+        worker._do_work()   # 읽은 샘플 없음 → 방출 없음
+
+        assert singles == [] and len(batches) == 1
+        forces, ts_ns = batches[0]
+        assert forces.tolist() == pytest.approx([_counts_to_force(c) for c in (100, 200, 300)])
+        assert ts_ns.dtype == np.int64 and np.all(np.diff(ts_ns) >= 0)
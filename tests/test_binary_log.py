@@ -0,0 +1,74 @@
+# tests/test_binary_log.py
+"""
+바이너리 테스트 로그(.ttlog) 테스트
+- 기록/메모리 매핑 읽기 왕복
+- 잘린 레코드 처리
+- Data_Repack 로더 연동
+"""
+
+import numpy as np
+import pytest
+from Binary_Log import BinaryLogSink, read_binary_log, COLUMN_LABELS
+
+
+def _write_log(path, rows, metadata=None):
+    sink = BinaryLogSink(str(path), metadata)
+    sink.write_rows(rows)
+    sink.close()
+
+
+class TestBinaryLog:
+    """BinaryLogSink / read_binary_log 테스트"""
+    
+    def test_roundtrip_with_metadata(self, tmp_path):
+        """기록한 행과 메타데이터를 그대로 읽어옴"""
+        # Given: 온도 없는 행 포함 3행
+        path = tmp_path / "run.ttlog"
+        _write_log(path, [
+            (0.0, 0.0, 0.0, 25.0),
+            (0.1, 10.0, 0.5, None),
+            (0.2, 20.0, 1.0, 25.5),
+        ], metadata={'rate_um_s': 50.0})
+        
+        # When: 읽기
+        records, meta = read_binary_log(str(path))
+        
+        # Then: 컬럼 뷰, 온도 없음은 NaN, 메타데이터 보존
+        assert len(records) == 3
+        assert records['position_um'].tolist() == [0.0, 10.0, 20.0]
+        assert np.isnan(records['temp_ch1_c'][1])
+        assert meta['rate_um_s'] == 50.0
+        assert meta['columns'] == list(records.dtype.names)
+    
+    def test_truncated_record_ignored(self, tmp_path):
+        """비정상 종료로 잘린 마지막 레코드는 무시"""
+        # Given: 정상 2행 + 잘린 바이트
+        path = tmp_path / "crash.ttlog"
+        _write_log(path, [(0.0, 1.0, 2.0, 3.0), (0.1, 1.1, 2.1, 3.1)])
+        with open(path, 'ab') as f:
+            f.write(b"\x00" * 5)
+        
+        # When/Then: 완전한 레코드만
+        records, _ = read_binary_log(str(path))
+        assert len(records) == 2
+    
+    def test_rejects_non_log_file(self, tmp_path):
+        """형식이 다른 파일은 ValueError"""
+        path = tmp_path / "bad.ttlog"
+        path.write_bytes(b"Time (s),Load (N)\n")
+        
+        with pytest.raises(ValueError):
+            read_binary_log(str(path))
+    
+    def test_data_repack_loader(self, tmp_path):
+        """load_test_log는 CSV와 같은 컬럼명의 DataFrame 반환"""
+        from Data_Repack import load_test_log
+        
+        path = tmp_path / "run.ttlog"
+        _write_log(path, [(0.0, 0.0, 0.1, None), (0.1, 5.0, 0.2, None)], {'speed_rps': 1.0})
+        
+        df = load_test_log(str(path))
+        
+        assert list(df.columns) == list(COLUMN_LABELS)
+        assert df['Load (N)'].tolist() == pytest.approx([0.1, 0.2])
+        assert df.attrs['metadata']['speed_rps'] == 1.0
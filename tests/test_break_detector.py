@@ -0,0 +1,136 @@
+# tests/test_break_detector.py
+"""
+시편 파단 감지 테스트
+- 피크 대비 감소 비율 + 연속 샘플 판정
+- DataHandler 파이프라인에서 정지 및 이벤트 기록
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from Break_Detector import BreakDetector
+from Data_Handler import DataHandler
+from Data_Synchronizer import DataSynchronizer
+from Safety_Guard import SafetyGuard, SafetyLimits
+from Tensioning_Controller import TensioningController
+from config import BreakDetectorConfig, safety_cfg
+
+
+@pytest.fixture
+def detector():
+    return BreakDetector(BreakDetectorConfig(DROP_PERCENT=50.0, SUSTAIN_SAMPLES=3, MIN_PEAK_N=1.0))
+
+
+class TestBreakDetector:
+    """BreakDetector 단위 테스트"""
+
+    def test_sustained_drop_declares_break(self, detector):
+        """피크의 50% 이하가 3샘플 연속이면 첫 감소 샘플 기준으로 파단 판정"""
+        forces = [1.0, 4.0, 8.0, 10.0, 3.0, 2.0, 1.0, 0.5]
+        events = [detector.update(i * 0.01, f) for i, f in enumerate(forces)]
+
+        event = events[6]
+        assert [e is not None for e in events] == [False] * 6 + [True, False]
+        assert event.time == pytest.approx(0.04)
+        assert event.force_n == 3.0
+        assert event.peak_n == 10.0
+        assert event.samples_ago == 2
+
+    def test_transient_dip_ignored(self, detector):
+        """연속 샘플 수보다 짧은 하강은 무시"""
+        for i, f in enumerate([10.0, 3.0, 3.0, 9.0, 3.0, 9.5]):
+            assert detector.update(i * 0.01, f) is None
+
+    def test_low_peak_ignored(self, detector):
+        """최소 피크 미만(노이즈 수준)에서는 판정하지 않음"""
+        for i, f in enumerate([0.5, 0.1, 0.0, 0.0, 0.0]):
+            assert detector.update(i * 0.01, f) is None
+
+    def test_reset_rearms(self, detector):
+        for i, f in enumerate([10.0, 1.0, 1.0, 1.0]):
+            detector.update(i, f)
+        assert detector.detected is not None
+
+        detector.reset()
+
+        assert detector.detected is None
+        assert detector.peak_n == 0.0
+
+
+class TestBreakInPipeline:
+    """DataHandler 파단 처리 테스트"""
+
+    def test_break_stops_and_marks_event(self, detector):
+        """파단 판정 시 stop_callback 호출 + 수신자에 이벤트 전달"""
+        # Given: 가드 제한이 없는 DataHandler
+        handler = DataHandler(
+            ui_updater=MagicMock(),
+            safety_guard=SafetyGuard(None, safety_cfg, limits=SafetyLimits()),
+            synchronizer=DataSynchronizer(),
+            tensioning=TensioningController(),
+            data_receiver=MagicMock(),
+            stop_callback=MagicMock(),
+            break_detector=detector
+        )
+        handler.break_detection_enabled = True  # 시험 시작 상태
+
+        # When: 하중 상승 후 급감
+        for i, f in enumerate([2.0, 6.0, 10.0, 1.0, 0.8, 0.5]):
+            handler.update_loadcell_value(f, timestamp_ns=(i + 1) * 10_000_000)
+
+        # Then: 정지 1회, 첫 감소 샘플 위치로 이벤트 기록
+        handler.stop_callback.assert_called_once()
+        kind = handler.receiver.mark_event.call_args.args[0]
+        info = handler.receiver.mark_event.call_args.kwargs
+        assert kind == 'break'
+        assert info['timestamp'] == pytest.approx(0.04)
+        assert info['samples_ago'] == 2
+
+    def test_disabled_outside_test(self, detector):
+        """시험 밖(기본 상태)의 하중 감소는 파단으로 판정하지 않음 (jog 후 하중 제거 등)"""
+        handler = DataHandler(
+            ui_updater=MagicMock(),
+            safety_guard=SafetyGuard(None, safety_cfg, limits=SafetyLimits()),
+            synchronizer=DataSynchronizer(),
+            tensioning=TensioningController(),
+            data_receiver=MagicMock(),
+            stop_callback=MagicMock(),
+            break_detector=detector
+        )
+
+        for i, f in enumerate([2.0, 6.0, 10.0, 1.0, 0.8, 0.5]):
+            handler.update_loadcell_value(f, timestamp_ns=(i + 1) * 10_000_000)
+
+        handler.stop_callback.assert_not_called()
+        handler.receiver.mark_event.assert_not_called()
+
+    def test_reset_guards_rearms_detector(self, detector):
+        handler = DataHandler(
+            ui_updater=MagicMock(),
+            safety_guard=SafetyGuard(None, safety_cfg),
+            synchronizer=DataSynchronizer(),
+            tensioning=TensioningController(),
+            data_receiver=MagicMock(),
+            stop_callback=MagicMock(),
+            break_detector=detector
+        )
+        detector.update(0.0, 10.0)
+
+        handler.reset_guards()
+
+        assert detector.peak_n == 0.0
+
+
+class TestMainWindowBreakGating:
+    """MainWindow 시험 구간에서만 파단 감지"""
+
+    @pytest.mark.timeout(10)
+    def test_enabled_only_between_start_and_stop(self, qtbot):
+        from Main import MainWindow
+        window = MainWindow()
+        qtbot.addWidget(window)
+        assert window.data_handler.break_detection_enabled is False
+
+        window.data_handler.break_detection_enabled = True   # on_basic_test_start 상태
+        window._stop_all_tests(reason="테스트")
+
+        assert window.data_handler.break_detection_enabled is False
@@ -12,6 +12,9 @@ from Safety_Guard import SafetyGuard
 from Tensioning_Controller import TensioningController
 from UI_Updater import UIUpdater
 from unittest.mock import MagicMock
+from PyQt5 import QtCore
+import Monitor_loadcell
+import Monitor_motor
 from config import safety_cfg
 
 
@@ -119,3 +122,31 @@ class TestConcurrency:
             data_receiver=MagicMock(),
             stop_callback=MagicMock()
         )
+
+
+class _EagerThread(QtCore.QThread):
+    """start()가 started 방출이 끝날 때까지 돌아오지 않는 스레드 (시작 경합 재현용)"""
+    
+    def start(self):
+        super().start()
+        while not self.isRunning():
+            QtCore.QThread.msleep(1)
+        QtCore.QThread.msleep(20)
+
+
+class TestMonitorThreadStart:
+    """모니터 스레드 시작 순서 (started → worker.run 연결 후 start)"""
+    
+    @pytest.mark.timeout(10)
+    @pytest.mark.parametrize("module, make_monitor", [
+        (Monitor_loadcell, lambda: Monitor_loadcell.LoadcellMonitor(MagicMock(), MagicMock())),
+        (Monitor_motor, lambda: Monitor_motor.MotorMonitor(MagicMock(), MagicMock())),
+    ], ids=["loadcell", "motor"])
+    def test_worker_runs_even_if_thread_starts_first(self, qtbot, monkeypatch, module, make_monitor):
+        """스레드가 곧바로 started를 방출해도 워커 타이머가 시작됨"""
+        monkeypatch.setattr(module.QtCore, "QThread", _EagerThread)
+        monitor = make_monitor()
+        try:
+            qtbot.waitUntil(lambda: monitor.worker._running, timeout=2000)
+        finally:
+            monitor.stop()
@@ -10,7 +10,7 @@ import pytest
 from unittest.mock import MagicMock, patch
 from Data_Handler import DataHandler
 from Data_Synchronizer import DataSynchronizer
-from Safety_Guard import SafetyGuard
+from Safety_Guard import SafetyGuard, SafetyLimits
 from Tensioning_Controller import TensioningController
 from UI_Updater import UIUpdater
 from config import safety_cfg
@@ -61,6 +61,20 @@ class TestDataHandler:
         # Then: 가장 가까운 위치(150.0)와 매칭되어야 함
         assert matched_pos == 150.0
     
+    def test_acquisition_timestamp_used_for_matching(self, handler):
+        """워커 획득 타임스탬프 기준으로 위치-하중 매칭"""
+        # Given: 획득 시각이 찍힌 위치 데이터 2개 (1.0s, 2.0s)
+        handler.update_motor_position(100.0, timestamp_ns=1_000_000_000)
+        handler.update_motor_position(200.0, timestamp_ns=2_000_000_000)
+        
+        # When: 1.1s에 획득된 하중이 늦게 도착
+        handler.update_loadcell_value(0.1, timestamp_ns=1_100_000_000)
+        
+        # Then: 도착 시각이 아닌 획득 시각 기준으로 매칭, 타임스탬프 전달
+        args, kwargs = handler.receiver.receive_loadcell_data.call_args
+        assert args[1] == 100.0
+        assert kwargs["timestamp"] == pytest.approx(1.1)
+    
     def test_temperature_ch1_integration(self, handler):
         """온도 CH1 데이터 통합 테스트"""
         # Given: 온도 데이터 설정
@@ -144,6 +158,40 @@ class TestSafetyGuard:
         exceeded, _ = guard.check_displacement_limit(6000.0, 0.0)
         assert exceeded is True  # 리셋 후 다시 발동 가능
 
+    def test_check_does_not_touch_widgets(self, guard, mock_ui):
+        """검사 경로는 SpinBox를 읽지 않고 스냅샷만 사용"""
+        # Given: 생성 시 1회 읽은 뒤 호출 기록 초기화
+        mock_ui.DisplaceLimitMax_doubleSpinBox.value.reset_mock()
+        mock_ui.ForceLimitMax_doubleSpinBox.value.reset_mock()
+
+        # When: 여러 샘플 검사
+        for i in range(100):
+            guard.check_displacement_limit(float(i), 0.0)
+            guard.check_force_limit(0.0, 0.0)
+
+        # Then: 위젯 접근 없음
+        mock_ui.DisplaceLimitMax_doubleSpinBox.value.assert_not_called()
+        mock_ui.ForceLimitMax_doubleSpinBox.value.assert_not_called()
+
+    def test_set_limits_swaps_snapshot(self, guard):
+        """set_limits는 지정한 값만 바꾼 새 스냅샷으로 교체"""
+        before = guard.limits
+
+        guard.set_limits(displacement_limit_mm=1.0)
+
+        assert guard.limits is not before
+        assert guard.limits == SafetyLimits(displacement_limit_mm=1.0, force_limit_n=0.5)
+        exceeded, _ = guard.check_displacement_limit(2000.0, 0.0)
+        assert exceeded is True
+
+    def test_headless_guard_without_ui(self):
+        """UI 없이 제한값만으로 동작 (워커 스레드/재생용)"""
+        guard = SafetyGuard(None, safety_cfg, limits=SafetyLimits(force_limit_n=1.0))
+
+        exceeded, _ = guard.check_force_limit(3.0, 1.0)
+
+        assert exceeded is True
+
 
 class TestTensioningController:
     """TensioningController 단위 테스트"""
@@ -234,3 +282,47 @@ class TestDataSynchronizer:
         # Then: 최대 10개만 유지
         assert len(sync.pos_buffer) == 10
         assert sync.pos_buffer[0][1] == 50.0  # 가장 오래된 데이터는 index 5
+    
+    def test_interpolation_between_samples(self):
+        """보간 모드: 앞뒤 위치 샘플 사이 선형 보간"""
+        # Given: 보간 활성화 + 위치 2개
+        sync = DataSynchronizer(buffer_size=10, interpolate=True)
+        sync.add_position(1.000, 100.0)
+        sync.add_position(1.020, 120.0)
+        
+        # When: 1/4 지점 매칭
+        matched_pos = sync.get_matched_position(1.005)
+        
+        # Then: 105.0
+        assert matched_pos == pytest.approx(105.0)
+    
+    def test_interpolation_outside_range_uses_nearest(self):
+        """보간 모드라도 범위 밖은 외삽하지 않고 끝 샘플 사용"""
+        sync = DataSynchronizer(buffer_size=10, interpolate=True)
+        sync.add_position(1.000, 100.0)
+        sync.add_position(1.020, 120.0)
+        
+        assert sync.get_matched_position(0.5) == 100.0
+        assert sync.get_matched_position(2.0) == 120.0
+    
+    def test_matching_after_wraparound(self, sync):
+        """링 버퍼가 한 바퀴 돈 뒤에도 매칭 정확"""
+        # Given: 용량(10)의 2배 이상 추가
+        for i in range(25):
+            sync.add_position(float(i), float(i * 10))
+        
+        # When/Then: 유효 구간 내 매칭, 구간 이전은 가장 오래된 값
+        assert sync.get_matched_position(20.4) == 200.0
+        assert sync.get_matched_position(0.0) == 150.0
+    
+    def test_timestamp_rollback_resets_buffer(self, sync):
+        """타임스탬프가 역행하면 버퍼를 비우고 새로 시작"""
+        sync.add_position(10.0, 100.0)
+        sync.add_position(11.0, 110.0)
+        
+        # When: 과거 시각 추가
+        sync.add_position(1.0, 5.0)
+        
+        # Then: 새 샘플만 남음
+        assert len(sync.pos_buffer) == 1
+        assert sync.get_matched_position(10.5) == 5.0
@@ -123,3 +123,52 @@ class TestCSVOutput:
         
         # Then: False 반환
         assert result is False
+    
+    def test_binary_log_written_alongside_csv(self, plot_service, tmp_path):
+        """바이너리 로그 활성화 시 같은 이름의 .ttlog도 기록"""
+        from Binary_Log import read_binary_log
+        from config import log_writer_cfg
+        
+        # Given: 바이너리 로그 활성화
+        csv_path = tmp_path / "test_bin.csv"
+        with patch.object(log_writer_cfg, 'BINARY_LOG_ENABLED', True), \
+             patch('PyQt5.QtWidgets.QFileDialog.getSaveFileName',
+                   return_value=(str(csv_path), '')):
+            plot_service.start_plotting(metadata={'rate_um_s': 10.0})
+        
+        # When: 데이터 2개 추가 후 중지
+        plot_service.receive_loadcell_data(force_n=1.0, position_um=100.0, temp_ch1=None)
+        plot_service.receive_loadcell_data(force_n=2.0, position_um=200.0, temp_ch1=25.0)
+        plot_service.stop_plotting()
+        
+        # Then: 같은 행이 바이너리 로그에도 존재
+        records, meta = read_binary_log(str(tmp_path / "test_bin.ttlog"))
+        assert records['load_n'].tolist() == [1.0, 2.0]
+        assert meta['rate_um_s'] == 10.0
+        assert 'created' in meta
+    
+    def test_break_event_written_to_sidecar(self, plot_service, tmp_path):
+        """파단 이벤트는 CSV 컬럼을 바꾸지 않고 이벤트 파일에 행 인덱스로 기록"""
+        from Log_Writer import read_events
+        from Data_Repack.utils import load_test_log
+        
+        # Given: 플로팅 중 5행 기록
+        csv_path = tmp_path / "test_break.csv"
+        with patch('PyQt5.QtWidgets.QFileDialog.getSaveFileName',
+                   return_value=(str(csv_path), '')):
+            plot_service.start_plotting()
+        for force in (1.0, 5.0, 9.0, 2.0, 1.0):
+            plot_service.receive_loadcell_data(force_n=force, position_um=0.0, temp_ch1=None)
+        
+        # When: 마지막 행 기준 1행 전(인덱스 3)에서 파단
+        plot_service.mark_event('break', timestamp=None, samples_ago=1, peak_n=9.0)
+        plot_service.stop_plotting()
+        
+        # Then: 이벤트 파일에 행 인덱스, CSV는 4컬럼 유지
+        events = read_events(str(tmp_path / "test_break.events.json"))
+        assert events == [{'kind': 'break', 'row': 3, 'time_s': None, 'peak_n': 9.0}]
+        
+        df = load_test_log(str(csv_path))
+        assert len(df.columns) == 4
+        assert df.attrs['events'][0]['row'] == 3
+        assert df.iloc[3]['Load (N)'] == pytest.approx(2.0)
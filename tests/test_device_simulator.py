@@ -0,0 +1,194 @@
+# tests/test_device_simulator.py
+"""
+가상 장비 테스트
+- SIM: 포트 선택 (실제 포트와 구분)
+- 가상 로드셀: CDL 핸드셰이크 / 단일 측정 / 연속 출력 속도 / 0점
+- 가상 모터: jog 당김 → 시편 하중 증가, 0점, 절대 이동
+- 합성 시편: 항복 후 경화, 파단
+- 가상 TM4: SV 추종
+"""
+
+import time
+import pytest
+from unittest.mock import patch
+import Device_Simulator
+from Controller_Loadcell import LoadcellService, verify_loadcell_connection
+from Controller_motor import MotorService
+from Controller_temp import TempController
+from Device_Simulator import (
+    SIM_ENABLE_ENV, SimulatedModbusClient, SpecimenModel, create_serial, get_rig,
+    is_sim_port, list_sim_ports, modbus_client_factory
+)
+from Monitor_loadcell import _counts_to_force, _msv_once_via_serial, _parse_stream_frames, _start_stream_via_serial
+from config import SimulatorConfig, sim_cfg, temp_cfg
+
+
+@pytest.fixture(autouse=True)
+def fresh_rig():
+    """테스트마다 새 시편, 지연/노이즈 없음"""
+    Device_Simulator.reset_rig()
+    with patch.multiple(sim_cfg, LATENCY_MS=0.0, NOISE_N=0.0, DROPOUT_RATE=0.0):
+        yield
+    Device_Simulator.reset_rig()
+
+
+def _open_loadcell():
+    ser = create_serial("SIM:LOADCELL")
+    ser.open()
+    return ser
+
+
+def _motor():
+    client = SimulatedModbusClient("SIM:MOTOR")
+    client.connect()
+    return MotorService(client)
+
+
+class TestPortSelection:
+    """SIM: 포트 선택"""
+
+    def test_sim_ports_listed_and_recognized(self):
+        with patch.object(sim_cfg, "ENABLED", True):
+            assert "SIM:LOADCELL" in list_sim_ports()
+        assert is_sim_port("sim:motor")
+        assert not is_sim_port("COM3")
+        assert modbus_client_factory("COM3") is None
+        assert modbus_client_factory("SIM:TEMP") is SimulatedModbusClient
+
+    def test_disabled_hides_ports(self, monkeypatch):
+        monkeypatch.delenv(SIM_ENABLE_ENV, raising=False)
+        with patch.object(sim_cfg, "ENABLED", False):
+            assert list_sim_ports() == []
+
+    def test_hidden_by_default(self, monkeypatch):
+        """운용 PC 기본값: 가상 포트 숨김 (저장된 SIM: 포트도 복원되지 않음)"""
+        monkeypatch.delenv(SIM_ENABLE_ENV, raising=False)
+        assert SimulatorConfig().ENABLED is False
+        assert list_sim_ports() == []
+
+    @pytest.mark.parametrize("value, listed", [("1", True), ("true", True), ("0", False), ("", False)])
+    def test_env_var_enables_ports(self, monkeypatch, value, listed):
+        monkeypatch.setenv(SIM_ENABLE_ENV, value)
+        with patch.object(sim_cfg, "ENABLED", False):
+            assert bool(list_sim_ports()) is listed
+
+
+class TestSimulatedLoadcell:
+    """가상 로드셀 (CDL)"""
+
+    def test_handshake_and_single_measure(self):
+        ser = _open_loadcell()
+
+        ok, err = verify_loadcell_connection(ser)
+        assert ok, err
+
+        get_rig().tare_n = -1.5  # 무부하에서 1.5 N 출력
+        ok, counts, raw = _msv_once_via_serial(ser)
+        assert ok and raw.endswith(b"\r\n")
+        assert _counts_to_force(counts) == pytest.approx(1.5, abs=1e-6)
+
+    def test_zero_command_tares_output(self):
+        ser = _open_loadcell()
+        get_rig().tare_n = -2.0
+
+        assert LoadcellService(ser).send_zero_command() is True
+
+        _, counts, _ = _msv_once_via_serial(ser)
+        assert _counts_to_force(counts) == pytest.approx(0.0, abs=1e-6)
+
+    def test_stream_rate(self):
+        """연속 출력은 LOADCELL_RATE_HZ 간격으로 프레임 생성"""
+        with patch.object(sim_cfg, "LOADCELL_RATE_HZ", 1000.0):
+            ser = _open_loadcell()
+            assert _start_stream_via_serial(ser)
+            time.sleep(0.1)
+
+            buf = bytearray(ser.read(ser.in_waiting))
+
+        frames = _parse_stream_frames(buf)
+        assert 60 <= len(frames) <= 140
+
+    def test_unselected_address_is_silent(self):
+        ser = _open_loadcell()
+        ser.timeout = 0.05
+        ser.write(b";S99;;MSV?;")
+
+        assert ser.read(16) == b""
+
+
+class TestSimulatedMotor:
+    """가상 모터 + 시편"""
+
+    def test_jog_backward_loads_specimen(self):
+        motor = _motor()
+        lc = _open_loadcell()
+
+        motor.set_jog_speed(100)   # 100 rps × 0.01 mm = 1000 μm/s
+        motor.jog_backward()       # 당김
+        time.sleep(0.2)
+        motor.stop_motor()
+
+        pos = motor._read_current_position_debug()["mon"]
+        assert pos < -1000         # 당김 → 펄스 감소 (표시 변위 증가)
+        _, counts, _ = _msv_once_via_serial(lc)
+        assert _counts_to_force(counts) > 1.0
+
+    def test_zero_and_absolute_move(self):
+        motor = _motor()
+        rig = get_rig()
+        rig.abs_pulses = -500.0
+
+        assert motor.write_zero_position()
+        assert motor._read_current_position_debug()["mon"] == 0
+
+        assert motor.move_to_absolute(200, 500)   # 500 rps → 50000 펄스/s
+        time.sleep(0.05)
+        assert motor._read_current_position_debug()["mon"] == 200
+        assert rig.abs_pulses == pytest.approx(-300.0)
+
+    def test_dropout_returns_error_response(self):
+        motor = _motor()
+        with patch.object(sim_cfg, "DROPOUT_RATE", 0.99):
+            assert motor._read_current_position_debug() is None
+
+
+class TestSpecimenModel:
+    """합성 응력-변형 모델"""
+
+    def test_yield_hardening_and_break(self):
+        model = SpecimenModel()
+        k = sim_cfg.SPECIMEN_STIFFNESS_N_PER_UM
+        slack = sim_cfg.SPECIMEN_SLACK_UM
+
+        assert model.force(slack) == 0.0
+        assert model.force(slack + 100) == pytest.approx(k * 100)
+
+        yield_ext = slack + sim_cfg.SPECIMEN_YIELD_N / k
+        beyond = model.force(yield_ext + 500)
+        tangent = sim_cfg.SPECIMEN_HARDENING * k
+        assert beyond == pytest.approx(sim_cfg.SPECIMEN_YIELD_N + tangent * 500)
+
+        # 제하: 탄성 복귀 (소성 변형 잔류)
+        assert model.force(yield_ext) < beyond - tangent * 500
+
+        assert model.force(sim_cfg.SPECIMEN_BREAK_UM) == 0.0
+        assert model.force(slack + 100) == 0.0  # 파단 후 하중 없음
+
+
+class TestSimulatedTemp:
+    """가상 TM4"""
+
+    def test_pv_follows_sv_when_running(self):
+        client = SimulatedModbusClient("SIM:TEMP")
+        client.connect()
+        tc = TempController(client)
+        rig = get_rig()
+
+        assert tc.read_pv(1) == round(sim_cfg.TEMP_AMBIENT_C)
+        tc.set_sv(1, 125)
+        tc.set_run_stop(1, True)
+        rig.advance(rig._t + 5 * sim_cfg.TEMP_TIME_CONSTANT_S)
+
+        assert tc.read_pv(1) in (124, 125)
+        chk = client.read_input_registers(address=temp_cfg.HANDSHAKE_TEST_ADDRESS, count=1, device_id=1)
+        assert not chk.isError()
@@ -0,0 +1,149 @@
+# tests/test_emergency_stop.py
+"""
+긴급 정지 단계 테스트
+- 수집 스레드 내 제한 검사 및 1회 정지 명령 제출
+- 샘플 → 정지 명령 지연 히스토그램
+"""
+
+import time
+import pytest
+from concurrent.futures import Future
+from unittest.mock import MagicMock
+from Emergency_Stop import EmergencyStop, LatencyHistogram
+from Monitor_motor import MotorWorker
+from config import SafetyConfig
+
+
+@pytest.fixture
+def estop():
+    return EmergencyStop(SafetyConfig(DISPLACEMENT_TOLERANCE_UM=5.0))
+
+
+class TestLatencyHistogram:
+    """LatencyHistogram 단위 테스트"""
+
+    def test_buckets_and_percentiles(self):
+        """기록값이 버킷에 나뉘고 분위수는 버킷 상한으로 보고됨"""
+        hist = LatencyHistogram(edges_us=(100, 1000))
+
+        for ns in (50_000, 60_000, 500_000, 5_000_000):
+            hist.record(ns)
+
+        summary = hist.summary()
+        assert summary['count'] == 4
+        assert summary['buckets'] == {'<=100': 2, '<=1000': 1, '>1000': 1}
+        assert summary['min_us'] == pytest.approx(50.0)
+        assert summary['max_us'] == pytest.approx(5000.0)
+        assert summary['p50_us'] == 100.0
+        assert summary['p99_us'] == pytest.approx(5000.0)
+
+    def test_empty_summary(self):
+        assert LatencyHistogram().summary()['p99_us'] is None
+
+
+class TestEmergencyStop:
+    """EmergencyStop 단위 테스트"""
+
+    def test_displacement_trip_submits_stop_once(self, estop):
+        """변위 제한 도달 시 정지 명령 1회 제출 후 자동 해제"""
+        # Given: 시작 1000 um, 제한 500 um (허용 오차 5 um)
+        stop_fn = MagicMock(return_value=None)
+        messages = []
+        estop.tripped.connect(messages.append)
+        estop.arm(stop_fn, start_pos_um=1000.0, displacement_limit_um=500.0, force_limit_n=0.0)
+        now = time.perf_counter_ns()
+
+        # When: 제한 미만 → 제한 도달 → 이후 샘플
+        assert estop.check_position(1400.0, now) is False
+        assert estop.check_position(1496.0, now) is True
+        assert estop.check_position(1600.0, now) is False
+
+        # Then: 정지 1회, 해제, 지연 기록
+        stop_fn.assert_called_once()
+        assert not estop.is_armed
+        assert len(messages) == 1
+        assert estop.get_latency_stats()['decision']['count'] == 1
+
+    def test_force_delta_uses_previous_sample(self, estop):
+        """하중은 직전 샘플 대비 변화량으로 판단 (장착 전 샘플도 기준이 됨)"""
+        stop_fn = MagicMock()
+        estop.check_force(1.0, 0)  # 장착 전 샘플
+        estop.arm(stop_fn, start_pos_um=0.0, displacement_limit_um=0.0, force_limit_n=2.0)
+
+        assert estop.check_force(2.5, 0) is False
+        assert estop.check_force(0.4, 0) is True
+        stop_fn.assert_called_once()
+
+    def test_force_drops_ignored_when_suspended(self, estop):
+        """프로파일 unload 구간: 감소 방향 변화량은 무시, 증가 방향은 검사"""
+        stop_fn = MagicMock()
+        estop.check_force(10.0, 0)
+        estop.arm(stop_fn, start_pos_um=0.0, displacement_limit_um=0.0, force_limit_n=2.0,
+                  check_force_drops=False)
+
+        assert estop.check_force(0.5, 0) is False
+        assert estop.check_force(3.0, 0) is True
+        stop_fn.assert_called_once()
+
+    def test_disarmed_never_trips(self, estop):
+        stop_fn = MagicMock()
+
+        assert estop.check_position(1e9, 0) is False
+        assert estop.check_force(1e9, 0) is False
+        stop_fn.assert_not_called()
+
+    def test_command_latency_recorded_on_completion(self, estop):
+        """Future 반환 시 명령 완료 시점에 command 지연이 기록됨"""
+        future = Future()
+        estop.arm(lambda: future, start_pos_um=0.0, displacement_limit_um=10.0, force_limit_n=0.0)
+
+        estop.check_position(100.0, time.perf_counter_ns())
+        assert estop.get_latency_stats()['command']['count'] == 0
+
+        future.set_result("ok")
+        assert estop.get_latency_stats()['command']['count'] == 1
+
+    def test_motor_worker_checks_before_emit(self, estop, mock_modbus_client):
+        """모터 워커 스레드가 샘플 방출 전에 긴급 정지를 검사"""
+        # Given: 위치 레지스터 값이 큰 모터와 장착된 긴급 정지
+        mock_modbus_client.read_holding_registers.return_value.registers = [0x1000, 0x0000]
+        stop_fn = MagicMock()
+        estop.arm(stop_fn, start_pos_um=0.0, displacement_limit_um=100.0, force_limit_n=0.0)
+
+        worker = MotorWorker(mock_modbus_client, unit_id=1, interval_ms=100, safety_stage=estop)
+        worker._running = True
+        order = []
+        stop_fn.side_effect = lambda: order.append("stop")
+        worker.data_ready.connect(lambda pos, ts: order.append("emit"))
+
+        # When: 타이머 콜백 1회
+        worker._do_work()
+
+        # Then: 정지 명령이 GUI 전달보다 먼저
+        assert order == ["stop", "emit"]
+
+
+class TestMainWindowArming:
+    """MainWindow 긴급 정지 장착"""
+
+    @pytest.mark.timeout(10)
+    def test_limit_edit_rearms_while_armed(self, qtbot):
+        from Main import MainWindow
+        window = MainWindow()
+        qtbot.addWidget(window)
+        window.motor_manager.controller = MagicMock()
+        window.ui.DisplaceLimitMax_doubleSpinBox.setValue(10.0)
+        window.ui.ForceLimitMax_doubleSpinBox.setValue(5.0)
+
+        window._arm_emergency_stop()
+        window.ui.DisplaceLimitMax_doubleSpinBox.setValue(20.0)
+        window.ui.ForceLimitMax_doubleSpinBox.setValue(7.5)
+
+        _, disp_limit_um, force_limit_n = window.emergency_stop._armed[:3]
+        assert disp_limit_um == pytest.approx(20_000.0)
+        assert force_limit_n == pytest.approx(7.5)
+
+        window.emergency_stop.disarm()
+        window.ui.ForceLimitMax_doubleSpinBox.setValue(9.0)   # 해제 상태에서는 장착하지 않음
+        assert not window.emergency_stop.is_armed
+
@@ -33,3 +33,16 @@ class TestErrorHandler:
             assert "Motor" in message
             assert "COM3" in message
             assert "Port not found" in message
+
+    @pytest.mark.timeout(5)
+    @pytest.mark.parametrize("label, title_key", [
+        ("motor.write_zero_position", "msg.zeroing_error"),
+        ("loadcell.send_zero_command", "msg.zeroing_error"),
+        ("motor.move_to_absolute", "error.command_failed"),
+    ])
+    def test_command_error_message_follows_label(self, label, title_key):
+        """0점 명령만 영점 오류, 나머지 명령은 일반 명령 오류"""
+        with patch.object(ErrorHandler, 'show_error') as mock_error:
+            ErrorHandler.show_command_error(label, "timeout")
+
+        assert mock_error.call_args[0][0] == ErrorHandler._translate(title_key)
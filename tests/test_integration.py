@@ -120,8 +120,8 @@ class TestIntegration:
         """안전 가드 통합 테스트"""
         window = mock_main_window
         
-        # Given: 제한값 설정
-        window.ui.DisplaceLimitMax_doubleSpinBox.value.return_value = 1.0  # 1mm
+        # Given: 제한값 설정 (SpinBox valueChanged와 같은 경로)
+        window.data_handler.guard.set_limits(displacement_limit_mm=1.0)  # 1mm
         
         # When: 시작 위치 캡처
         window.data_handler.capture_start_position()
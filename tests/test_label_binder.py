@@ -0,0 +1,104 @@
+# tests/test_label_binder.py
+"""
+라벨 표시 주기 제한 / 변경 감지 테스트
+- 같은 문자열 setText 생략
+- 표시 주기 안의 값은 마지막 값만 타이머로 반영
+- display_hz <= 0이면 즉시 반영
+- UIUpdater / TempManager 경로
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from Manager_temp import TempManager
+from UI_Updater import LabelBinder, UIUpdater
+
+
+class TestLabelBinder:
+    """LabelBinder"""
+
+    def test_identical_text_is_skipped(self):
+        binder = LabelBinder(display_hz=0)
+        label = MagicMock()
+
+        for text in ("1.0", "1.0", "1.0", "2.0"):
+            binder.set_text(label, text)
+
+        assert [c.args[0] for c in label.setText.call_args_list] == ["1.0", "2.0"]
+        assert binder.skipped == 2
+
+    @pytest.mark.timeout(5)
+    def test_burst_is_coalesced_to_last_value(self, qtbot):
+        binder = LabelBinder(display_hz=20)
+        label = MagicMock()
+
+        for i in range(50):
+            binder.set_text(label, f"{i}")
+
+        # 첫 값은 즉시, 나머지는 주기 끝에 마지막 값 한 번
+        assert [c.args[0] for c in label.setText.call_args_list] == ["0"]
+        qtbot.waitUntil(lambda: label.setText.call_count == 2, timeout=2000)
+        assert label.setText.call_args.args[0] == "49"
+        assert binder.coalesced == 48
+
+    @pytest.mark.timeout(5)
+    def test_pending_value_reverting_to_shown_is_dropped(self, qtbot):
+        binder = LabelBinder(display_hz=20)
+        label = MagicMock()
+        binder.set_text(label, "a")
+        binder.set_text(label, "b")
+        binder.set_text(label, "a")
+
+        qtbot.wait(100)
+
+        assert [c.args[0] for c in label.setText.call_args_list] == ["a"]
+
+    def test_labels_are_limited_independently(self):
+        binder = LabelBinder(display_hz=1)
+        first, second = MagicMock(), MagicMock()
+
+        binder.set_text(first, "x")
+        binder.set_text(second, "y")
+        binder.set_text(first, "z")   # 주기 안 → 대기
+
+        first.setText.assert_called_once_with("x")
+        second.setText.assert_called_once_with("y")
+        binder.flush()
+        assert first.setText.call_args.args[0] == "z"
+
+    def test_zero_rate_applies_every_change(self):
+        binder = LabelBinder(display_hz=0)
+        label = MagicMock()
+
+        for i in range(5):
+            binder.set_text(label, str(i))
+
+        assert label.setText.call_count == 5
+
+
+class TestUIUpdaterBinding:
+    """UIUpdater / TempManager 라벨 경로"""
+
+    def test_same_formatted_value_sets_text_once(self):
+        ui = MagicMock()
+        updater = UIUpdater(ui, display_hz=0)
+
+        for force in (1.0001, 1.0002, 1.0004):   # 모두 "1.000 [N]"
+            updater.update_loadcell_value(force)
+
+        ui.test_load_label.setText.assert_called_once_with("1.000 [N]")
+        ui.Load0Currentnow_label.setText.assert_called_once_with("1.000 [N]")
+
+    def test_temp_manager_routes_through_shared_updater(self):
+        ui = MagicMock()
+        ui.temp_channels = {i: {'lbl': MagicMock()} for i in range(1, 5)}
+        updater = UIUpdater(ui, display_hz=0)
+        manager = TempManager(ui, ui_updater=updater)
+        manager.start_time = 0.0
+
+        manager.update_all([25.0, None, 27.0, 28.0])
+        manager.update_all([25.0, None, 27.0, 28.0])
+
+        assert manager.ui_updater is updater
+        ui.temp_channels[1]['lbl'].setText.assert_called_once_with("25.0 °C")
+        ui.temp_channels[2]['lbl'].setText.assert_not_called()
+        assert updater.labels.skipped == 3
@@ -0,0 +1,51 @@
+# tests/test_log_writer.py
+"""
+테스트 로그 기록 스레드 테스트
+- 배치 기록 / 종료 시 잔여 행 기록
+- 큐 포화 시 논블로킹 폐기
+"""
+
+import csv
+import pytest
+from Log_Writer import LogWriter, CsvLogSink, CSV_HEADER
+from config import LogWriterConfig
+
+
+class TestLogWriter:
+    """LogWriter 단위 테스트"""
+    
+    @pytest.mark.timeout(5)
+    def test_all_rows_written_on_stop(self, tmp_path):
+        """stop() 이후 제출한 모든 행이 순서대로 기록됨"""
+        # Given: CSV sink를 가진 기록기
+        csv_path = tmp_path / "log.csv"
+        writer = LogWriter([CsvLogSink(str(csv_path))])
+        writer.start()
+        
+        # When: 2,500행 제출 후 종료 (배치 여러 개)
+        for i in range(2500):
+            writer.submit((i * 0.01, float(i), i * 0.001, None if i % 2 else 25.0))
+        writer.stop()
+        
+        # Then: 헤더 + 전체 행, 온도 없음은 N/A
+        with open(csv_path, 'r', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == CSV_HEADER
+        assert len(rows) == 2501
+        assert rows[1] == ['0.000', '0.000', '0.000', '25.00']
+        assert rows[2][3] == 'N/A'
+        assert writer.get_stats()['written'] == 2500
+    
+    def test_submit_drops_when_queue_full(self, tmp_path):
+        """큐가 가득 차면 블로킹 없이 행을 폐기하고 개수를 기록"""
+        # Given: 큐 크기 2, 기록 스레드 미시작
+        cfg = LogWriterConfig(QUEUE_MAX_ROWS=2)
+        writer = LogWriter([CsvLogSink(str(tmp_path / "log.csv"))], config=cfg)
+        
+        # When: 3행 제출
+        results = [writer.submit((0.0, 0.0, 0.0, None)) for _ in range(3)]
+        
+        # Then: 마지막 행만 폐기
+        assert results == [True, True, False]
+        assert writer.get_stats() == {'backlog': 2, 'written': 0, 'dropped': 1}
+        writer.sinks[0].close()
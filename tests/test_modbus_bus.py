@@ -0,0 +1,116 @@
+# tests/test_modbus_bus.py
+"""
+Modbus 버스 스케줄러 테스트
+- 우선순위 순서 (SAFETY > WRITE > POLL)
+- Future / 예외 전달
+- 같은 포트 공유 및 참조 해제
+"""
+
+import threading
+import pytest
+from unittest.mock import MagicMock
+from Modbus_Bus import Priority, acquire_modbus_client
+from Controller_motor import MotorService
+
+
+def _make_client():
+    """호출 순서를 기록하는 가짜 Modbus 클라이언트"""
+    client = MagicMock()
+    client.is_socket_open.return_value = True
+    client.calls = []
+    client.gate = threading.Event()
+    client.gate.set()
+
+    def record(name):
+        def _call(*args, **kwargs):
+            client.gate.wait(2)
+            client.calls.append((name, kwargs.get("address"), kwargs.get("value")))
+            return name
+        return _call
+
+    client.read_holding_registers.side_effect = record("read")
+    client.write_register.side_effect = record("write")
+    return client
+
+
+@pytest.fixture
+def bus_client():
+    client = _make_client()
+    proxy = acquire_modbus_client("TEST_PORT", client_factory=lambda **kw: client, baudrate=9600)
+    yield proxy, client
+    client.gate.set()
+    proxy.close()
+
+
+class TestModbusBus:
+    """ModbusBus / BusClient 단위 테스트"""
+
+    @pytest.mark.timeout(5)
+    def test_stop_preempts_queued_polls(self, bus_client):
+        """대기 중인 폴링/쓰기보다 정지 명령이 먼저 전송됨"""
+        # Given: 진행 중인 트랜잭션 1개가 버스를 점유
+        proxy, client = bus_client
+        client.gate.clear()
+        busy = proxy.submit("read_holding_registers", address=0)
+        while not busy.running():
+            pass
+
+        # When: 폴링 3개, 쓰기 1개, 정지 1개 순서로 제출
+        polls = [proxy.submit("read_holding_registers", address=i) for i in range(1, 4)]
+        write = proxy.submit("write_register", address=0x0132, value=10)
+        service = MotorService(proxy, unit_id=1)
+        stop_thread = threading.Thread(target=service.stop_motor)
+        stop_thread.start()
+        while proxy.bus.backlog < 5:
+            pass
+        client.gate.set()
+        stop_thread.join(2)
+        for f in [busy, write] + polls:
+            f.result(2)
+
+        # Then: 진행 중이던 읽기 다음에 정지 → 쓰기 → 폴링 순서
+        assert client.calls[0] == ("read", 0, None)
+        assert client.calls[1] == ("write", 0x0143, 6)
+        assert client.calls[2] == ("write", 0x0132, 10)
+        assert [c[1] for c in client.calls[3:]] == [1, 2, 3]
+
+    def test_future_result_and_exception(self, bus_client):
+        """결과와 예외가 Future로 호출자에게 전달됨"""
+        proxy, client = bus_client
+
+        assert proxy.read_holding_registers(address=5, count=1) == "read"
+
+        client.write_register.side_effect = IOError("timeout")
+        with pytest.raises(IOError):
+            proxy.write_register(address=1, value=1)
+
+    def test_priority_keyword_not_forwarded(self, bus_client):
+        """priority 인자는 버스에서 소비되고 클라이언트로 전달되지 않음"""
+        proxy, client = bus_client
+
+        proxy.write_register(address=1, value=2, device_id=1, priority=Priority.SAFETY)
+
+        _, kwargs = client.write_register.call_args
+        assert "priority" not in kwargs
+
+    def test_same_port_shares_bus(self):
+        """같은 포트는 버스 하나를 공유하고, 마지막 close에서만 포트를 닫음"""
+        # Given: 같은 포트에 두 장치
+        client = _make_client()
+        factory = MagicMock(return_value=client)
+        motor = acquire_modbus_client("SHARED", client_factory=factory, baudrate=9600)
+        temp = acquire_modbus_client("SHARED", client_factory=factory, baudrate=9600)
+
+        # Then: 클라이언트는 한 번만 생성
+        assert motor.bus is temp.bus
+        assert factory.call_count == 1
+
+        # When: 한쪽만 닫음 → 포트 유지
+        motor.close()
+        assert not client.close.called
+        assert temp.read_holding_registers(address=0) == "read"
+
+        # When: 나머지도 닫음 → 포트 닫힘
+        temp.close()
+        assert client.close.called
+        assert not temp.is_socket_open()
@@ -0,0 +1,125 @@
+# tests/test_monitor_loadcell.py
+"""
+로드셀 연속 측정(스트리밍) 모드 테스트
+- 롤링 버퍼 프레임 파싱
+- 워커의 버퍼 드레인
+"""
+
+import time
+import pytest
+from unittest.mock import MagicMock
+from Monitor_loadcell import (
+    LoadcellWorker,
+    _parse_stream_frames,
+    _counts_to_force,
+)
+
+
+def _frame(counts: int) -> bytes:
+    """테스트용 스트리밍 프레임 (sint32 BE + CRLF)"""
+    return counts.to_bytes(4, "big", signed=True) + b"\r\n"
+
+
+class TestStreamFrameParser:
+    """_parse_stream_frames 단위 테스트"""
+
+    def test_parse_multiple_frames(self):
+        """연속된 프레임을 모두 파싱"""
+        # Given: 프레임 3개
+        buf = bytearray(_frame(1000) + _frame(-1000) + _frame(0))
+
+        # When: 파싱
+        counts = _parse_stream_frames(buf)
+
+        # Then: 순서대로 반환, 버퍼 비움
+        assert counts == [1000, -1000, 0]
+        assert len(buf) == 0
+
+    def test_partial_frame_kept_in_buffer(self):
+        """미완성 프레임은 다음 호출까지 버퍼에 유지"""
+        # Given: 프레임 1개 + 다음 프레임의 앞 3바이트
+        second = _frame(42)
+        buf = bytearray(_frame(7) + second[:3])
+
+        # When: 첫 파싱
+        counts = _parse_stream_frames(buf)
+
+        # Then: 완성된 프레임만 반환
+        assert counts == [7]
+        assert bytes(buf) == second[:3]
+
+        # When: 나머지 바이트 수신 후 재파싱
+        buf += second[3:]
+
+        # Then: 이어 붙여서 파싱
+        assert _parse_stream_frames(buf) == [42]
+
+    def test_resync_after_garbage(self):
+        """앞쪽 쓰레기 바이트가 있어도 프레임 경계 재동기화"""
+        # Given: 쓰레기 2바이트 + 정상 프레임
+        buf = bytearray(b"\x55\xAA" + _frame(123456))
+
+        # When: 파싱
+        counts = _parse_stream_frames(buf)
+
+        # Then: 정상 프레임만 반환
+        assert counts == [123456]
+
+
+class TestLoadcellWorkerStreaming:
+    """LoadcellWorker 스트리밍 드레인 테스트"""
+
+    def test_drain_emits_every_frame(self):
+        """한 주기에 수신된 모든 프레임을 방출"""
+        # Given: 프레임 3개가 수신 버퍼에 있는 Mock Serial
+        payload = _frame(100) + _frame(200) + _frame(300)
+        mock_serial = MagicMock()
+        mock_serial.is_open = True
+        mock_serial.in_waiting = len(payload)
+        mock_serial.read.return_value = payload
+
+        worker = LoadcellWorker(mock_serial, interval_ms=100, streaming=True)
+        worker._running = True
+
+        received = []
+        worker.data_ready.connect(received.append)
+
+        # When: 타이머 콜백 1회
+        worker._do_work()
+
+        # Then: 3개 모두 변환되어 방출
+        assert received == pytest.approx(
+            [_counts_to_force(100), _counts_to_force(200), _counts_to_force(300)]
+        )
+
+    def test_drain_spreads_timestamps(self):
+        """한 번에 읽힌 프레임은 읽기 간격 안에 증가하는 타임스탬프를 가짐"""
+        # Given: 직전 읽기 시각이 기록된 스트리밍 워커
+        payload = _frame(1) + _frame(2) + _frame(3)
+        mock_serial = MagicMock()
+        mock_serial.is_open = True
+        mock_serial.in_waiting = len(payload)
+        mock_serial.read.return_value = payload
+
+        worker = LoadcellWorker(mock_serial, interval_ms=100, streaming=True)
+        worker._running = True
+        worker._last_read_ns = time.perf_counter_ns() - 30_000_000
+        start_ns = worker._last_read_ns
+
+        stamps = []
+        worker.data_ready.connect(lambda force, ts: stamps.append(ts))
+
+        # When: 타이머 콜백 1회
+        worker._do_work()
+
+        # Then: 직전 읽기 이후, 단조 증가, 마지막은 이번 읽기 시각
+        assert len(stamps) == 3
+        assert start_ns < stamps[0] < stamps[1] < stamps[2]
+        assert stamps[2] <= worker._last_read_ns
+
+    def test_polling_mode_does_not_drain(self):
+        """폴링 모드에서는 스트림 드레인을 사용하지 않음"""
+        worker = LoadcellWorker(MagicMock(), interval_ms=100)
+
+        assert worker.streaming is False
+        assert worker._timer_interval_ms() == 100
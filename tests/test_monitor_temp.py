@@ -90,3 +90,78 @@ class TestTempMonitor:
         
         # Then: 예외 없이 완료
         assert True
+
+
+class TestTempReadPlanner:
+    """온도 PV 일괄 읽기 테스트"""
+    
+    def test_plan_coalesces_pv_addresses(self):
+        """4채널 PV 주소(6 간격)는 블록 1개로 묶임"""
+        from Monitor_temp import _plan_register_reads
+        
+        plan = _plan_register_reads([0x03E8, 0x03EE, 0x03F4, 0x03FA], max_gap=8, max_count=125)
+        
+        assert len(plan) == 1
+        start, count, indices, offsets = plan[0]
+        assert (start, count) == (0x03E8, 19)
+        assert offsets.tolist() == [0, 6, 12, 18]
+    
+    def test_plan_splits_on_large_gap_and_keeps_order(self):
+        """빈 구간이 크면 블록 분리, 결과 인덱스는 입력 순서 유지"""
+        from Monitor_temp import _plan_register_reads
+        
+        plan = _plan_register_reads([300, 100, 102], max_gap=8, max_count=125)
+        
+        assert [(s, c) for s, c, _, _ in plan] == [(100, 3), (300, 1)]
+        assert plan[0][2].tolist() == [1, 2]
+        assert plan[1][2].tolist() == [0]
+    
+    def test_single_block_read_per_poll(self):
+        """한 주기에 블록 읽기 1회로 4채널 추출"""
+        # Given: 19개 레지스터 응답 (CH n = 20 + n)
+        regs = [0] * 19
+        for ch, offset in enumerate([0, 6, 12, 18], 1):
+            regs[offset] = 20 + ch
+        mock_client = MagicMock()
+        mock_client.is_socket_open.return_value = True
+        response = MagicMock()
+        response.isError.return_value = False
+        response.registers = regs
+        mock_client.read_input_registers.return_value = response
+        
+        worker = TempWorker(mock_client, interval_ms=100)
+        received = []
+        worker.temp_ready.connect(received.append)
+        
+        # When: 폴링 1회
+        worker._do_work()
+        
+        # Then: 읽기 1회, 채널 값 정상
+        assert mock_client.read_input_registers.call_count == 1
+        assert received == [[21, 22, 23, 24]]
+    
+    def test_block_failure_falls_back_and_caches_split(self):
+        """블록 읽기가 거부되면 단일 읽기로 전환하고 계획에 반영"""
+        # Given: 블록(count>1) 읽기는 에러, 단일 읽기만 성공
+        mock_client = MagicMock()
+        mock_client.is_socket_open.return_value = True
+        
+        def read(address, count, device_id):
+            res = MagicMock()
+            res.isError.return_value = count > 1
+            res.registers = [address - 0x03E8]
+            return res
+        mock_client.read_input_registers.side_effect = read
+        
+        worker = TempWorker(mock_client, interval_ms=100)
+        received = []
+        worker.temp_ready.connect(received.append)
+        
+        # When: 두 번 폴링
+        worker._do_work()
+        worker._do_work()
+        
+        # Then: 값 정상, 두 번째 폴링은 블록 시도 없이 단일 읽기 4회
+        assert received == [[0, 6, 12, 18], [0, 6, 12, 18]]
+        assert len(worker._read_plan) == 4
+        assert mock_client.read_input_registers.call_count == 5 + 4
@@ -0,0 +1,84 @@
+# tests/test_plot_decimation.py
+"""
+플롯 데시메이션 테스트
+- min/max 엔벨로프 단계 선택
+- LTTB 다운샘플링
+"""
+
+import numpy as np
+import pytest
+from Plot_Decimation import EnvelopeStore, lttb
+
+
+@pytest.fixture
+def store():
+    """최근 원본 1,000개 + 20,000 샘플 이력 (중간에 스파이크 1개)"""
+    s = EnvelopeStore(capacity=1000, factor=8)
+    for i in range(20000):
+        y = 100.0 if i == 5003 else np.sin(i / 500.0)
+        s.append(i * 0.01, y)
+    return s
+
+
+class TestEnvelopeStore:
+    """EnvelopeStore 테스트"""
+    
+    def test_full_history_within_budget(self, store):
+        """전체 이력을 예산 이하 포인트로, 처음부터 끝까지 표시"""
+        x, y = store.select(0.0, 199.99, max_points=2000)
+        
+        assert len(x) <= 2000
+        assert x[0] == 0.0
+        assert x[-1] == pytest.approx(199.99)
+        assert np.all(np.diff(x) >= 0)
+    
+    def test_envelope_keeps_peaks(self, store):
+        """원본 버퍼에서 사라진 스파이크도 엔벨로프에 남음"""
+        x, y = store.select(0.0, 199.99, max_points=500)
+        
+        assert y.max() == 100.0
+        assert y.min() == pytest.approx(-1.0, abs=1e-3)
+    
+    def test_recent_range_uses_raw_samples(self, store):
+        """최근 구간 확대 시 원본 해상도"""
+        x, y = store.select(195.0, 196.0, max_points=2000)
+        
+        # 101개 + 앞뒤 여유 1개씩
+        assert len(x) == 103
+        assert np.allclose(np.diff(x), 0.01)
+    
+    def test_clear(self, store):
+        store.clear()
+        
+        assert len(store) == 0
+        x, y = store.select(0.0, 1.0, max_points=100)
+        assert len(x) == 0
+
+
+class TestLTTB:
+    """LTTB 다운샘플링 테스트"""
+    
+    def test_output_size_and_endpoints(self):
+        x = np.arange(10000, dtype=float)
+        y = np.sin(x / 100.0)
+        
+        xo, yo = lttb(x, y, 500)
+        
+        assert len(xo) == 500
+        assert xo[0] == 0.0 and xo[-1] == 9999.0
+        assert np.all(np.diff(xo) > 0)
+    
+    def test_keeps_outlier(self):
+        """단일 이상치는 삼각형 면적이 가장 커서 선택됨"""
+        x = np.arange(1000, dtype=float)
+        y = np.zeros(1000)
+        y[437] = 50.0
+        
+        xo, yo = lttb(x, y, 50)
+        
+        assert 50.0 in yo
+    
+    def test_small_input_unchanged(self):
+        x = np.arange(10, dtype=float)
+        xo, yo = lttb(x, x, 100)
+        assert len(xo) == 10
@@ -0,0 +1,124 @@
+# tests/test_plot_service.py
+"""
+PlotService 렌더링 테스트
+- 렌더 스케줄러 (dirty 표시 후 주기적 갱신)
+- 보이지 않는 위젯/숨긴 채널 건너뛰기
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from PyQt5 import QtCore
+from Plot_Service import PlotService
+from config import monitor_cfg
+
+
+@pytest.fixture
+def plot_service():
+    """렌더 타이머(30fps)가 켜진 PlotService"""
+    def plot_widget_mock():
+        widget = MagicMock()
+        widget.plot.side_effect = lambda *args, **kwargs: MagicMock()  # 곡선마다 별도 객체
+        return widget
+    
+    ui = MagicMock()
+    ui.temp_plot_splits = [plot_widget_mock() for _ in range(4)]
+    with patch.object(monitor_cfg, 'PLOT_RENDER_FPS', 30):
+        service = PlotService(
+            main_window=MagicMock(),
+            plot_widget=MagicMock(),
+            ui=ui,
+            temp_plot_widget=plot_widget_mock()
+        )
+    service._is_plotting = True
+    service.start_time.start()
+    yield service
+    service._render_timer.stop()
+
+
+class TestRenderScheduler:
+    """렌더 스케줄러 테스트"""
+    
+    def test_samples_only_mark_dirty(self, plot_service):
+        """샘플 수신은 dirty 표시만, 그리기는 렌더 주기에 1회"""
+        # Given: 초기화 시 setData 호출 기록 제거
+        plot_service.data_line.setData.reset_mock()
+        
+        # When: 100 샘플 수신
+        for i in range(100):
+            plot_service.receive_loadcell_data(float(i), 0.0, None)
+        
+        # Then: 아직 그리지 않음
+        assert plot_service.data_line.setData.call_count == 0
+        
+        # When: 렌더 주기 1회
+        plot_service._render_tick()
+        
+        # Then: 한 번에 100 포인트 갱신
+        assert plot_service.data_line.setData.call_count == 1
+        x, y = plot_service.data_line.setData.call_args[0]
+        assert len(x) == 100
+        assert plot_service._load_dirty is False
+    
+    def test_hidden_widget_skipped_until_visible(self, plot_service):
+        """다른 탭에 있어 안 보이는 그래프는 보일 때까지 미룸"""
+        plot_service.data_line.setData.reset_mock()
+        plot_service.plot_widget.isVisible.return_value = False
+        plot_service.receive_loadcell_data(1.0, 0.0, None)
+        
+        # When: 숨겨진 상태에서 렌더
+        plot_service._render_tick()
+        
+        # Then: 그리지 않고 dirty 유지
+        assert plot_service.data_line.setData.call_count == 0
+        assert plot_service._load_dirty is True
+        
+        # When: 다시 보임
+        plot_service.plot_widget.isVisible.return_value = True
+        plot_service._render_tick()
+        
+        # Then: 그림
+        assert plot_service.data_line.setData.call_count == 1
+    
+    def test_inactive_temp_view_and_hidden_channel_skipped(self, plot_service):
+        """비활성 스택 뷰와 숨긴 채널은 그리지 않음"""
+        # Given: 통합 뷰, CH2 숨김
+        plot_service.init_temp_plot()
+        plot_service._on_channel_toggled(1, QtCore.Qt.Unchecked)
+        for curve in plot_service.temp_curves + plot_service.temp_curves_split:
+            curve.setData.reset_mock()
+        
+        # When: 온도 수신 후 렌더
+        plot_service.update_temp_plot(1.0, [25.0, 26.0, 27.0, 28.0])
+        plot_service._render_tick()
+        
+        # Then: 통합 뷰의 보이는 채널만 갱신, 분할 뷰는 건너뜀
+        called = [c.setData.called for c in plot_service.temp_curves]
+        assert called == [True, False, True, True]
+        assert not any(c.setData.called for c in plot_service.temp_curves_split)
+
+
+class TestLoadCurveDecimation:
+    """하중 곡선 전체 이력 표시 테스트"""
+    
+    def test_whole_history_rendered_beyond_max_points(self):
+        """MAX_PLOT_POINTS를 넘어도 자동 범위에서는 처음부터 표시"""
+        # Given: 최근 원본 500개, min/max 데시메이션
+        with patch.object(monitor_cfg, 'MAX_PLOT_POINTS', 500), \
+             patch.object(monitor_cfg, 'PLOT_RENDER_FPS', 0), \
+             patch.object(monitor_cfg, 'PLOT_DECIMATION', 'minmax'):
+            service = PlotService(main_window=MagicMock(), plot_widget=MagicMock())
+            view_box = service.plot_item.getViewBox.return_value
+            view_box.width.return_value = 400
+            view_box.state = {'autoRange': [True, True]}
+            service._is_plotting = True
+            
+            # When: 5,000 샘플 (획득 타임스탬프 10ms 간격)
+            for i in range(5000):
+                service.receive_loadcell_data(float(i), 0.0, None, timestamp=i * 0.01)
+        
+        # Then: 최근 원본은 500개지만 그려진 곡선은 0초부터, 예산(800) 이하
+        assert len(service.x_data) == 500
+        x, y = service.data_line.setData.call_args[0]
+        assert x[0] == 0.0
+        assert len(x) <= 800
+        assert y.max() == 4999.0
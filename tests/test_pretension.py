@@ -0,0 +1,135 @@
+# tests/test_pretension.py
+"""
+Pre-Tension 테스트
+- 하중 샘플 이벤트 기반 목표 검출 (폴링 지연 없음)
+- 접근 감속
+- 비차단 안정화 → 0점 상태 기계
+"""
+
+import threading
+import pytest
+from concurrent.futures import Future
+from unittest.mock import MagicMock, patch
+from Data_Handler import DataHandler
+from Pretension_Test import PretensionTest
+from config import pretension_cfg
+
+
+def _done(value):
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+@pytest.fixture
+def pretension(qapp):
+    handler = DataHandler(
+        ui_updater=MagicMock(),
+        safety_guard=MagicMock(),
+        synchronizer=MagicMock(),
+        tensioning=MagicMock(),
+        data_receiver=MagicMock(),
+        stop_callback=MagicMock()
+    )
+    handler.tension.is_active.return_value = False
+    handler.guard.evaluate_batch.return_value = (False, "")
+    handler.sync.get_matched_position.return_value = 0.0
+
+    motor = MagicMock()
+    loadcell = MagicMock()
+    test = PretensionTest(motor, loadcell, handler)
+    return test, motor, loadcell, handler
+
+
+class TestPretension:
+    """PretensionTest 상태 기계"""
+
+    def test_target_detected_on_sample_without_polling(self, pretension):
+        """목표 하중 샘플이 들어오는 즉시(같은 호출 안에서) 모터 정지"""
+        test, motor, _, handler = pretension
+        test.start(target_speed_rps=10.0, target_load_n=5.0)
+        motor.jog_backward.assert_called_once()
+
+        handler.update_loadcell_value(4.9)
+        motor.stop_motor.assert_not_called()
+
+        handler.update_loadcell_value(-5.0)  # 절대값 비교
+
+        motor.stop_motor.assert_called_once()
+        assert test.state == "settling"
+        assert handler._sample_listeners == []
+
+    @pytest.mark.timeout(5)
+    def test_zeroing_runs_without_blocking(self, pretension, qtbot):
+        """안정화 대기 후 로드셀 → 모터 순서로 0점, 대기 중에도 이벤트 루프 동작"""
+        test, motor, loadcell, handler = pretension
+        order = []
+        loadcell.send_zero_command_async.side_effect = lambda: order.append("loadcell") or _done(True)
+        motor.write_zero_position_async.side_effect = lambda: order.append("motor") or _done(True)
+
+        with patch.multiple(pretension_cfg, SETTLING_TIME_MS=20,
+                            LOADCELL_ZERO_SETTLE_MS=20, MOTOR_ZERO_SETTLE_MS=10):
+            test.start(target_speed_rps=10.0, target_load_n=1.0)
+            handler.update_loadcell_value(1.5)
+            assert order == []  # 아직 안정화 대기 중 (호출이 막히지 않음)
+
+            with qtbot.waitSignal(test.finished, timeout=2000):
+                pass
+
+        assert order == ["loadcell", "motor"]
+        motor.zero_position.assert_not_called()  # sleep 포함 동기 버전은 사용하지 않음
+        loadcell.send_zero_command.assert_not_called()
+        assert not test.is_running
+
+    def test_stop_cancels_pending_zeroing(self, pretension, qtbot):
+        test, motor, loadcell, handler = pretension
+        finished = []
+        test.finished.connect(lambda: finished.append(True))
+
+        with patch.object(pretension_cfg, "SETTLING_TIME_MS", 20):
+            test.start(target_speed_rps=10.0, target_load_n=1.0)
+            handler.update_loadcell_value(2.0)
+            test.stop()
+            qtbot.wait(60)
+
+        loadcell.send_zero_command_async.assert_not_called()
+        assert finished == []
+        assert test.state == "idle"
+
+    @pytest.mark.timeout(5)
+    def test_waits_for_io_thread_completion(self, pretension, qtbot):
+        """로드셀 0점 명령이 I/O 스레드에서 끝나기 전에는 모터 0점으로 넘어가지 않음"""
+        test, motor, loadcell, handler = pretension
+        pending = Future()
+        loadcell.send_zero_command_async.return_value = pending
+        motor.write_zero_position_async.return_value = _done(True)
+
+        with patch.multiple(pretension_cfg, SETTLING_TIME_MS=0,
+                            LOADCELL_ZERO_SETTLE_MS=0, MOTOR_ZERO_SETTLE_MS=0):
+            test.start(target_speed_rps=10.0, target_load_n=1.0)
+            handler.update_loadcell_value(1.5)
+            qtbot.waitUntil(lambda: test.state == "zero_loadcell", timeout=1000)
+            qtbot.wait(30)
+            motor.write_zero_position_async.assert_not_called()
+
+            # 다른 스레드에서 완료 → GUI 스레드에서 다음 단계
+            with qtbot.waitSignal(test.finished, timeout=2000):
+                threading.Thread(target=pending.set_result, args=(True,)).start()
+
+        motor.write_zero_position_async.assert_called_once()
+
+    def test_approach_slowdown(self, pretension):
+        """감속 구간에서 목표에 가까울수록 jog 속도를 낮추고, 같은 정수 값은 재전송 안 함"""
+        test, motor, _, handler = pretension
+
+        with patch.multiple(pretension_cfg, APPROACH_SLOWDOWN=True,
+                            APPROACH_START_FRACTION=0.5, APPROACH_MIN_SPEED_FRACTION=0.2):
+            test.start(target_speed_rps=10.0, target_load_n=10.0)
+            motor.set_jog_speed.reset_mock()
+
+            for force in (2.0, 4.0, 6.6, 6.8, 9.9):
+                handler.update_loadcell_value(force)
+
+        speeds = [call.args[0] for call in motor.set_jog_speed.call_args_list]
+        assert speeds == pytest.approx([6.8, 2.0])  # 6.8 N은 같은 정수 값(6)이라 생략
+        assert test.state == "approach"
@@ -0,0 +1,401 @@
+# tests/test_profile_sequencer.py
+"""
+다단계 시험 프로파일 테스트
+- 프로파일 파일 로드 / 형식 검증
+- 구간별 종료 조건에 따른 자동 진행 (ramp → hold → cycle → unload)
+- 시간 조건(hold/시간 초과)과 위치 도달은 하중 샘플 없이도 진행, 로드셀 끊김 시 중단
+- 하중 제거 단계 동안만 파단 감지 / 하중 감소 검사 중지
+"""
+
+import json
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+from Acquisition_Core import begin_test_safety, set_unloading
+from Break_Detector import BreakDetector
+from Data_Handler import DataHandler
+from Profile_Test import Profile, ProfileSequencer, load_profile
+from Safety_Guard import SafetyGuard, SafetyLimits
+from Safety_Rules import SafetyRuleEngine
+from config import SafetyRulesConfig, motor_cfg, safety_cfg
+
+
+def _handler():
+    handler = DataHandler(
+        ui_updater=MagicMock(),
+        safety_guard=MagicMock(),
+        synchronizer=MagicMock(),
+        tensioning=MagicMock(),
+        data_receiver=MagicMock(),
+        stop_callback=MagicMock()
+    )
+    handler.tension.is_active.return_value = False
+    handler.guard.evaluate_batch.return_value = (False, "")
+    handler.guard.check_displacement_limit.return_value = (False, "")
+    return handler
+
+
+def _guarded_handler():
+    """실제 규칙 엔진(load_drop) + 파단 감지기를 쓰는 DataHandler"""
+    base = SafetyGuard(None, safety_cfg, limits=SafetyLimits(force_limit_n=0.0))
+    engine = SafetyRuleEngine(base, SafetyRulesConfig(
+        ENABLED=True, LOAD_DROP_FRACTION=0.5, LOAD_DROP_WINDOW_SEC=1.0
+    ))
+    handler = DataHandler(
+        ui_updater=MagicMock(),
+        safety_guard=engine,
+        synchronizer=MagicMock(),
+        tensioning=MagicMock(),
+        data_receiver=MagicMock(),
+        stop_callback=MagicMock(),
+        break_detector=BreakDetector()
+    )
+    handler.tension.is_active.return_value = False
+    handler.sync.get_matched_position.return_value = 0.0
+    return handler
+
+
+def _feed(handler, force_n, pos_um=0.0, t=None):
+    """하중 샘플 1개 (매칭 위치는 pos_um)"""
+    handler.sync.get_matched_position.return_value = pos_um
+    t = time.perf_counter() if t is None else t
+    handler.update_loadcell_value(force_n, timestamp_ns=int(t * 1e9))
+
+
+def _move(handler, pos_um):
+    """모터 위치 샘플 1개"""
+    handler.update_motor_position(pos_um, timestamp_ns=int(time.perf_counter() * 1e9))
+
+
+@pytest.fixture
+def sequencer(qapp):
+    motor = MagicMock()
+    handler = _handler()
+    _feed(handler, 0.0)   # 로드셀 샘플이 들어오는 상태에서 시작
+    seq = ProfileSequencer(motor, handler, lambda: 10.0)
+    yield seq, motor, handler
+    seq.stop("teardown")
+
+
+class TestProfileLoading:
+    """프로파일 파일 로드"""
+
+    def test_load_json(self, tmp_path):
+        path = tmp_path / "p.json"
+        path.write_text(json.dumps({"name": "creep", "segments": [
+            {"type": "ramp", "control": "force", "target": 5, "speed_rps": 20},
+            {"type": "hold", "duration_s": 60},
+        ]}), encoding='utf-8')
+
+        profile = load_profile(str(path))
+
+        assert profile.name == "creep"
+        assert [s.type for s in profile.segments] == ["ramp", "hold"]
+
+    def test_load_yaml(self, tmp_path):
+        pytest.importorskip("yaml")
+        path = tmp_path / "p.yaml"
+        path.write_text(
+            "name: fatigue\n"
+            "segments:\n"
+            "  - {type: cycle, control: position, lower: 100, upper: 500, cycles: 3}\n"
+            "  - {type: unload}\n",
+            encoding='utf-8'
+        )
+
+        profile = load_profile(str(path))
+
+        assert profile.segments[0].cycles == 3
+        assert profile.segments[1].type == "unload"
+
+    @pytest.mark.parametrize("segment", [
+        {"type": "spin"},
+        {"type": "hold"},
+        {"type": "cycle", "lower": 5, "upper": 1},
+        {"type": "ramp", "control": "torque"},
+        {"type": "ramp", "speed_rps": motor_cfg.MAX_SPEED_RPS + 1},
+        {"type": "ramp", "tagret": 5},
+        {"type": "ramp", "control": "force", "target": 0},   # 노이즈로 풀기 종료 불가
+        {"type": "cycle", "control": "force", "lower": 0, "upper": 5},
+    ])
+    def test_invalid_segment_rejected(self, segment):
+        with pytest.raises(ValueError):
+            Profile.from_dict({"segments": [segment]})
+
+
+
+class TestProfileSequencer:
+    """ProfileSequencer 상태 기계"""
+
+    def test_runs_segments_without_operator(self, sequencer):
+        """ramp → hold → cycle → unload 가 샘플 조건만으로 끝까지 진행"""
+        seq, motor, handler = sequencer
+        finished = []
+        seq.finished.connect(lambda ok, reason: finished.append(ok))
+        profile = Profile.from_dict({"segments": [
+            {"type": "ramp", "control": "force", "target": 5.0},
+            {"type": "hold", "duration_s": 0.05},
+            {"type": "cycle", "control": "force", "lower": 2.0, "upper": 5.0, "cycles": 2},
+            {"type": "unload"},
+        ]})
+
+        # ramp: 기본 속도로 당김, 목표 하중 도달 시 다음 구간
+        seq.start(profile)
+        motor.set_jog_speed.assert_called_with(10.0)
+        motor.jog_backward.assert_called_once()
+        _feed(handler, 3.0)
+        assert seq.current_step.label.startswith("ramp")
+        _feed(handler, -5.2)  # 하중은 절대값으로 비교
+        assert seq.current_step.kind == "hold"
+
+        # hold: 시간 경과 후 cycle 진입
+        _feed(handler, 5.1)
+        assert seq.current_step.kind == "hold"
+        time.sleep(0.06)
+        _feed(handler, 5.1)
+        assert seq.current_step.label == "cycle 1/2 force → 5"
+
+        # cycle: 목표가 현재 하중보다 낮으면 풀기 방향으로 접근
+        _feed(handler, 5.0)
+        assert seq.current_step.label == "cycle 1/2 force → 2"
+        motor.jog_forward.assert_called()
+        for force in (1.9, 5.0):
+            _feed(handler, force)
+        assert seq.current_step.label == "cycle 2/2 force → 2"
+        _feed(handler, 2.0)
+
+        # unload: 풀기 후 완료
+        assert seq.current_step.label == "unload force"
+        _feed(handler, 0.4)
+
+        assert finished == [True]
+        assert not seq.is_running
+        assert seq._on_sample not in handler._sample_listeners
+        motor.stop_motor.assert_called()
+
+    def test_position_segment_uses_absolute_move(self, sequencer):
+        """위치 구간은 시작 위치 기준 절대 이동, 허용 오차 안에 들면 완료"""
+        seq, motor, handler = sequencer
+        handler.start_pos_um = 1000.0
+        profile = Profile.from_dict({"segments": [
+            {"type": "ramp", "control": "position", "target": -500.0, "speed_rps": 30},
+        ]})
+
+        seq.start(profile)
+
+        # 모니터 위치 500 μm ↔ 드라이브 펄스 (MotorWorker 변환의 역)
+        expected_pulses = round(
+            500.0 / motor_cfg.UM_PER_MM * motor_cfg.POSITION_SCALE_FACTOR
+            / motor_cfg.POSITION_SIGN_INVERT
+        )
+        motor.move_to_absolute.assert_called_once_with(expected_pulses, 30)
+        _feed(handler, 1.0, pos_um=520.0)
+        assert seq.is_running
+        _feed(handler, 1.0, pos_um=501.0)
+        assert not seq.is_running
+
+    def test_step_timeout_aborts(self, sequencer):
+        seq, motor, handler = sequencer
+        results = []
+        seq.finished.connect(lambda ok, reason: results.append((ok, reason)))
+        seq.start(Profile.from_dict({"segments": [
+            {"type": "ramp", "control": "force", "target": 50.0, "timeout_s": 0.01},
+        ]}))
+
+        time.sleep(0.02)
+        _feed(handler, 1.0)
+
+        assert results and results[0][0] is False
+        assert "시간 초과" in results[0][1]
+        motor.stop_motor.assert_called()
+
+    def test_external_stop_does_not_emit_finished(self, sequencer):
+        seq, motor, handler = sequencer
+        finished = []
+        seq.finished.connect(lambda ok, reason: finished.append(ok))
+        seq.start(Profile.from_dict({"segments": [{"type": "hold", "duration_s": 10}]}))
+
+        seq.stop("사용자 Stop")
+
+        assert finished == []
+        assert not seq.is_running
+        assert handler._sample_listeners == []
+        assert handler._position_listeners == []
+
+    @pytest.mark.timeout(10)
+    def test_hold_expires_without_samples(self, sequencer, qtbot):
+        """hold 경과는 하중 샘플 없이 시퀀서 타이머로 진행"""
+        seq, motor, handler = sequencer
+        results = []
+        seq.finished.connect(lambda ok, reason: results.append(ok))
+        seq.start(Profile.from_dict({"segments": [{"type": "hold", "duration_s": 0.1}]}))
+
+        qtbot.waitUntil(lambda: results == [True], timeout=2000)
+        assert not seq.is_running
+
+    @pytest.mark.timeout(10)
+    def test_timeout_fires_without_samples(self, sequencer, qtbot):
+        """단계 시간 초과도 샘플 도착과 무관하게 판정"""
+        seq, motor, handler = sequencer
+        results = []
+        seq.finished.connect(lambda ok, reason: results.append((ok, reason)))
+        seq.start(Profile.from_dict({"segments": [
+            {"type": "ramp", "control": "force", "target": 50.0, "timeout_s": 0.1},
+        ]}))
+
+        qtbot.waitUntil(lambda: len(results) == 1, timeout=2000)
+        assert results[0][0] is False
+        assert "시간 초과" in results[0][1]
+        motor.stop_motor.assert_called()
+
+    def test_position_ramp_completes_on_motor_samples(self, sequencer):
+        """위치 전용 프로파일은 모터 샘플만으로 도달 판정"""
+        seq, motor, handler = sequencer
+        results = []
+        seq.finished.connect(lambda ok, reason: results.append(ok))
+        seq.start(Profile.from_dict({"segments": [
+            {"type": "ramp", "control": "position", "target": 300.0},
+        ]}))
+
+        _move(handler, 150.0)
+        assert seq.is_running
+        _move(handler, 299.0)
+
+        assert results == [True]
+        assert handler._position_listeners == []
+
+    def test_refuses_to_start_without_loadcell(self, qapp):
+        """로드셀 샘플이 한 번도 없으면 시작 거부"""
+        motor = MagicMock()
+        handler = _handler()
+        seq = ProfileSequencer(motor, handler, lambda: 10.0)
+        results = []
+        seq.finished.connect(lambda ok, reason: results.append((ok, reason)))
+
+        started = seq.start(Profile.from_dict({"segments": [
+            {"type": "ramp", "control": "force", "target": 5.0},
+        ]}))
+
+        assert started is False
+        assert not seq.is_running
+        assert results and results[0][0] is False and "로드셀" in results[0][1]
+        motor.jog_backward.assert_not_called()
+
+    @pytest.mark.timeout(10)
+    def test_aborts_when_loadcell_goes_stale(self, sequencer, qtbot):
+        """실행 중 로드셀 샘플이 끊기면 모터 정지 후 중단"""
+        seq, motor, handler = sequencer
+        results = []
+        seq.finished.connect(lambda ok, reason: results.append((ok, reason)))
+
+        with patch('Profile_Test.profile_cfg.SAMPLE_STALE_S', 0.1):
+            assert seq.start(Profile.from_dict({"segments": [
+                {"type": "ramp", "control": "force", "target": 50.0},
+            ]}))
+            motor.jog_backward.assert_called_once()
+            qtbot.waitUntil(lambda: len(results) == 1, timeout=2000)
+
+        assert results[0][0] is False
+        assert "로드셀" in results[0][1]
+        motor.stop_motor.assert_called()
+        assert not seq.is_running
+
+
+class TestUnloadingScope:
+    """하중 제거 단계 동안만 파단 감지 / 하중 감소 검사 중지"""
+
+    def _run(self, qapp, segments):
+        handler = _guarded_handler()
+        _feed(handler, 0.0)
+        seq = ProfileSequencer(MagicMock(), handler, lambda: 10.0)
+        events = []
+        seq.unloading_changed.connect(events.append)
+        seq.unloading_changed.connect(lambda unloading: set_unloading(handler, unloading))
+        begin_test_safety(handler)
+        seq.start(Profile.from_dict({"segments": segments}))
+        return seq, handler, events
+
+    def _ramp(self, handler, forces, t0):
+        for i, force in enumerate(forces):
+            _feed(handler, force, t=t0 + i * 0.01)
+        return t0 + len(forces) * 0.01
+
+    def test_drop_during_first_ramp_still_trips(self, qapp):
+        """ramp → unload 프로파일이라도 첫 ramp 중 급감은 정지"""
+        seq, handler, events = self._run(qapp, [
+            {"type": "ramp", "control": "force", "target": 20.0},
+            {"type": "unload"},
+        ])
+
+        self._ramp(handler, [3.0, 6.0, 9.0, 12.0, 2.0, 2.0, 2.0], time.perf_counter())
+
+        assert events == []
+        assert handler.break_detection_enabled is True
+        handler.stop_callback.assert_called()
+        seq.stop()
+
+    def test_unload_step_suspends_checks(self, qapp):
+        """unload 단계의 하중 감소는 정지시키지 않음"""
+        seq, handler, events = self._run(qapp, [
+            {"type": "ramp", "control": "force", "target": 20.0},
+            {"type": "unload"},
+        ])
+
+        t = self._ramp(handler, [5.0, 10.0, 15.0, 20.0], time.perf_counter())
+        assert events == [True]
+        assert handler.guard.base.load_drop_checks is False
+        self._ramp(handler, [10.0, 2.0, 0.3], t)
+
+        handler.stop_callback.assert_not_called()
+        assert not seq.is_running
+
+    def test_checks_resume_when_loading_again(self, qapp):
+        """하중 제거 후 다시 당기는 단계에서는 낮아진 하중 기준으로 검사 재개"""
+        seq, handler, events = self._run(qapp, [
+            {"type": "ramp", "control": "force", "target": 20.0},
+            {"type": "ramp", "control": "force", "target": 5.0},
+            {"type": "ramp", "control": "force", "target": 30.0},
+        ])
+
+        t = self._ramp(handler, [10.0, 20.0, 12.0, 5.0], time.perf_counter())
+        assert events == [True, False]
+        assert handler.break_detection_enabled is True
+        # 하중 제거 전 피크(20 N)와 비교해 바로 발동하지 않음
+        t = self._ramp(handler, [6.0, 8.0, 12.0], t)
+        handler.stop_callback.assert_not_called()
+
+        self._ramp(handler, [2.0, 2.0, 2.0], t)
+
+        handler.stop_callback.assert_called()
+        seq.stop()
+
+    def test_position_move_toward_start_counts_as_unloading(self, sequencer):
+        seq, motor, handler = sequencer
+        events = []
+        seq.unloading_changed.connect(events.append)
+        seq.start(Profile.from_dict({"segments": [
+            {"type": "cycle", "control": "position", "lower": 100, "upper": 500},
+            {"type": "hold", "duration_s": 10},
+        ]}))
+
+        _move(handler, 500.0)
+        _move(handler, 100.0)
+
+        assert events == [True, False]
+
+
+class TestMainWindowProfileChecks:
+    """MainWindow 프로파일 종료 시 하중 감소 검사 복구"""
+
+    @pytest.mark.timeout(10)
+    def test_stop_restores_load_drop_checks(self, qtbot):
+        from Main import MainWindow
+        window = MainWindow()
+        qtbot.addWidget(window)
+        window.data_handler.guard.set_load_drop_checks(False)   # unload 프로파일 실행 중
+
+        with patch('Main.ErrorHandler.show_success'):
+            window._on_profile_finished(True, "프로파일 완료")
+
+        assert window.safety_guard.load_drop_checks is True
+        assert window.data_handler.break_detection_enabled is False
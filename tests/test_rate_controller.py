@@ -0,0 +1,169 @@
+# tests/test_rate_controller.py
+"""
+폐루프 속도 제어 테스트
+- 피드포워드 + PID가 플랜트 이득 차이를 보정해 목표 변화율 유지
+- 고정 주기 스레드 및 지터 기록
+"""
+
+import time
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+from Basic_Test import BasicTest
+from Data_Synchronizer import DataSynchronizer
+from Rate_Controller import RateController, estimate_rate
+from config import RateControlConfig
+
+LEAD_UM_PER_REV = 1000.0  # 1 rps = 1000 μm/s
+
+
+def _umsec_to_rps(um_s):
+    return um_s / LEAD_UM_PER_REV
+
+
+class _Plant:
+    """
+    jog 속도 → 위치/하중 시뮬레이션
+
+    gain: 지령 대비 실제 이송 비율 (프레임 컴플라이언스 등)
+    stiffness: N/μm
+    """
+
+    def __init__(self, sync, rps, gain=0.5, stiffness=0.01):
+        self.sync = sync
+        self.rps = rps
+        self.gain = gain
+        self.stiffness = stiffness
+        self.pos_um = 0.0
+
+    def set_jog_speed(self, rps):
+        self.rps = rps
+
+    def advance(self, t, dt):
+        self.pos_um += self.rps * LEAD_UM_PER_REV * self.gain * dt
+        self.sync.add_position(t, -self.pos_um)  # 당김 방향은 위치 감소
+        self.sync.add_force(t, self.pos_um * self.stiffness)
+
+
+def _simulate(controller, plant, seconds, loop_hz=10.0, sample_hz=100.0):
+    """샘플 주기로 플랜트를 진행시키며 제어 주기마다 step()"""
+    dt = 1.0 / sample_hz
+    per_tick = int(sample_hz / loop_hz)
+    t = 0.0
+    for i in range(int(seconds * sample_hz)):
+        t += dt
+        plant.advance(t, dt)
+        if i % per_tick == 0:
+            controller.step(t)
+    return t
+
+
+def _prepare(controller, base_rps):
+    """스레드 없이 start()와 같은 초기 상태 구성"""
+    controller.target_rate, controller.feedforward_rps = controller._resolve_target(base_rps)
+    controller._sent_rps = base_rps
+
+
+class TestRateController:
+    """RateController 단위 테스트"""
+
+    def test_estimate_rate_least_squares(self):
+        t = np.arange(10) * 0.1
+
+        assert estimate_rate(t, 3.0 * t + 1.0) == pytest.approx(3.0)
+        assert estimate_rate(t[:2], t[:2]) is None
+
+    def test_displacement_rate_converges_despite_plant_gain(self):
+        """실제 이송이 지령의 절반이어도 목표 변위율(100 μm/s)에 수렴"""
+        # Given: 피드포워드 0.1 rps, 플랜트 이득 0.5
+        sync = DataSynchronizer(buffer_size=5000)
+        cfg = RateControlConfig(ENABLED=True, MODE="displacement", TARGET_RATE=100.0,
+                                KP=0.5, KI=1.0, MIN_DELTA_RPS=0.0, ESTIMATE_WINDOW_SEC=0.3)
+        plant = _Plant(sync, rps=0.1, gain=0.5)
+        controller = RateController(plant, sync, _umsec_to_rps, cfg)
+        _prepare(controller, base_rps=0.1)
+
+        # When
+        _simulate(controller, plant, seconds=20.0)
+
+        # Then: 지령은 약 2배로 보정되고 측정 변위율이 목표에 근접
+        assert controller.last_rate == pytest.approx(100.0, rel=0.05)
+        assert plant.rps == pytest.approx(0.2, rel=0.05)
+
+    def test_force_rate_mode(self):
+        """하중률 모드는 설정 속도를 피드포워드로 두고 N/s 목표를 추종"""
+        sync = DataSynchronizer(buffer_size=5000)
+        cfg = RateControlConfig(ENABLED=True, MODE="force", TARGET_RATE=2.0,
+                                KP=0.5, KI=1.0, MIN_DELTA_RPS=0.0, ESTIMATE_WINDOW_SEC=0.3)
+        plant = _Plant(sync, rps=0.1, gain=1.0, stiffness=0.01)  # 초기 1 N/s
+        controller = RateController(plant, sync, _umsec_to_rps, cfg)
+        _prepare(controller, base_rps=0.1)
+
+        _simulate(controller, plant, seconds=20.0)
+
+        assert controller.last_rate == pytest.approx(2.0, rel=0.05)
+
+    def test_strain_target_uses_gauge_length(self):
+        """변형률 0.004/s × 게이지 25 mm = 100 μm/s → 0.1 rps 피드포워드"""
+        cfg = RateControlConfig(MODE="strain", TARGET_RATE=0.004, GAUGE_LENGTH_MM=25.0)
+        controller = RateController(MagicMock(), DataSynchronizer(), _umsec_to_rps, cfg)
+
+        target, feedforward = controller._resolve_target(base_rps=5.0)
+
+        assert target == pytest.approx(0.004)
+        assert feedforward == pytest.approx(0.1)
+
+    def test_holds_output_on_stale_samples(self):
+        """최신 샘플이 오래되면 속도를 바꾸지 않음"""
+        sync = DataSynchronizer()
+        for i in range(10):
+            sync.add_position(i * 0.01, i * 1.0)
+        motor = MagicMock()
+        controller = RateController(motor, sync, _umsec_to_rps,
+                                    RateControlConfig(TARGET_RATE=50.0, STALE_SEC=0.5))
+        _prepare(controller, base_rps=0.05)
+
+        assert controller.step(now=5.0) is None
+        motor.set_jog_speed.assert_not_called()
+
+    def test_small_changes_not_sent(self):
+        """MIN_DELTA_RPS 미만의 속도 변화는 버스로 전송하지 않음"""
+        sync = DataSynchronizer()
+        for i in range(10):
+            sync.add_position(i * 0.01, i * 0.99)  # 99 μm/s (목표 100)
+        motor = MagicMock()
+        controller = RateController(motor, sync, _umsec_to_rps,
+                                    RateControlConfig(TARGET_RATE=100.0, MIN_DELTA_RPS=1.0))
+        _prepare(controller, base_rps=0.1)
+
+        rps = controller.step(now=0.1)
+
+        assert rps is not None and rps > 0.1
+        motor.set_jog_speed.assert_not_called()
+
+    @pytest.mark.timeout(5)
+    def test_thread_runs_at_fixed_rate_and_records_jitter(self):
+        """전용 스레드가 고정 주기로 실행되고 지터를 기록"""
+        controller = RateController(MagicMock(), DataSynchronizer(), _umsec_to_rps,
+                                    RateControlConfig(LOOP_HZ=50.0))
+
+        controller.start(base_rps=1.0)
+        time.sleep(0.3)
+        controller.stop()
+
+        stats = controller.get_stats()
+        assert not controller.is_running
+        assert 5 <= stats['ticks'] <= 20
+        assert stats['jitter']['count'] == stats['ticks']
+
+    def test_basic_test_starts_and_stops_controller(self):
+        motor = MagicMock()
+        controller = MagicMock()
+        test = BasicTest(motor, lambda: 2.0, rate_controller=controller)
+
+        test.start()
+        controller.start.assert_called_once_with(2.0)
+        test.stop()
+
+        motor.stop_motor.assert_called_once()
+        controller.stop.assert_called_once()
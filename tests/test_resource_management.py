@@ -93,6 +93,35 @@ class TestResourceManagement:
         # Then: 최대 1000개로 제한
         assert len(plot_service.temp_x) <= 1000
     
+    @pytest.mark.timeout(5)
+    def test_plot_ring_buffer_keeps_latest_points(self):
+        """플롯 버퍼가 가득 차면 최신 포인트만 순서대로 유지"""
+        from config import monitor_cfg
+        
+        # Given: 최대 100 포인트 PlotService (온도 위젯 포함)
+        with patch.object(monitor_cfg, 'MAX_PLOT_POINTS', 100):
+            plot_service = PlotService(
+                main_window=MagicMock(),
+                plot_widget=MagicMock(),
+                temp_plot_widget=MagicMock()
+            )
+        plot_service._is_plotting = True
+        plot_service.start_time.start()
+        
+        # When: 250개씩 추가
+        for i in range(250):
+            plot_service.receive_loadcell_data(
+                force_n=float(i), position_um=0.0, temp_ch1=None, timestamp=None
+            )
+            plot_service.update_temp_plot(float(i), [i, i + 1, None, i + 3])
+        
+        # Then: 최근 100개, 오래된 순
+        assert plot_service.y_data.tolist() == [float(i) for i in range(150, 250)]
+        assert plot_service.temp_x[0] == 150.0
+        assert plot_service.temp_x[-1] == 249.0
+        assert plot_service.temp_y[1][-1] == 250.0
+        assert plot_service.temp_y[2][-1] == 0.0  # None → 0.0
+    
     def _create_plot_service(self):
         """테스트용 PlotService 생성"""
         main_window = MagicMock()
@@ -0,0 +1,148 @@
+# tests/test_safety_rules.py
+"""
+안전 규칙 엔진 테스트
+- 규칙별 발동 / 근거 윈도우
+- 샘플 주기와 무관한 변화율 규칙
+"""
+
+import numpy as np
+import pytest
+from Safety_Guard import SafetyGuard, SafetyLimits
+from Safety_Rules import SafetyRuleEngine, emergency_force_limit
+from config import SafetyRulesConfig, safety_cfg
+
+
+def _engine(force_delta_n=0.0, **overrides):
+    cfg = SafetyRulesConfig(ENABLED=True, **overrides)
+    base = SafetyGuard(None, safety_cfg, limits=SafetyLimits(force_limit_n=force_delta_n))
+    return SafetyRuleEngine(base, cfg)
+
+
+class TestSafetyRuleEngine:
+    """SafetyRuleEngine 단위 테스트"""
+
+    def test_abs_force_reports_rule_and_evidence(self):
+        """절대 하중 규칙 발동 시 규칙명과 직전 구간 샘플을 보고"""
+        engine = _engine(ABS_FORCE_LIMIT_N=10.0, EVIDENCE_SEC=0.05)
+        t = np.arange(20) * 0.01
+        f = np.linspace(0.0, 19.0, 20)
+
+        exceeded, message = engine.evaluate_batch(t, f)
+
+        assert exceeded is True
+        v = engine.last_violation
+        assert v.rule == 'abs_force'
+        assert v.time == pytest.approx(0.10)  # 첫 초과 샘플 (10 N)
+        assert v.evidence_times[-1] == pytest.approx(0.10)
+        assert v.evidence_times[0] >= 0.05 - 1e-9
+        assert "절대 하중" in message
+
+    def test_rate_rule_independent_of_sample_rate(self):
+        """같은 노이즈 크기에서 샘플 주기를 올려도 변화율 규칙은 발동하지 않음"""
+        # Given: 1 kHz, ±0.05 N 노이즈, 완만한 증가 (1 N/s)
+        rng = np.random.default_rng(0)
+        t = np.arange(2000) * 0.001
+        f = t * 1.0 + rng.uniform(-0.05, 0.05, len(t))
+
+        # When: 샘플 간 변화량 가드(0.05 N)와 변화율 규칙(5 N/s, 50 ms 간격) 비교
+        legacy = _engine(force_delta_n=0.05, LEGACY_FORCE_DELTA=True)
+        rate = _engine(LEGACY_FORCE_DELTA=False, FORCE_RATE_LIMIT_N_S=5.0, RATE_LAG_SEC=0.05)
+        legacy_hit, _ = legacy.evaluate_batch(t, f)
+        rate_hit, _ = rate.evaluate_batch(t, f)
+
+        # Then: 기존 가드는 노이즈로 오발동, 변화율 규칙은 정상
+        assert legacy_hit is True
+        assert rate_hit is False
+
+    def test_load_drop_detects_break(self):
+        """피크 대비 급격한 하중 감소를 파단으로 판단"""
+        engine = _engine(LOAD_DROP_FRACTION=0.5, LOAD_DROP_WINDOW_SEC=0.2)
+        t = np.arange(100) * 0.01
+        f = np.concatenate([np.linspace(0, 20, 90), np.full(10, 2.0)])
+
+        # 샘플을 작은 배치로 나눠 평가 (실시간과 동일)
+        results = [engine.evaluate_batch(t[i:i + 5], f[i:i + 5])[0] for i in range(0, 100, 5)]
+
+        assert any(results)
+        assert engine.last_violation.rule == 'load_drop'
+        assert engine.last_violation.time == pytest.approx(0.90)
+
+    def test_load_drop_checks_suspended_for_unload(self):
+        """의도적 하중 제거 구간: load_drop 규칙과 기존 가드의 감소 방향 검사 중지"""
+        engine = _engine(force_delta_n=5.0, LOAD_DROP_FRACTION=0.5, LOAD_DROP_WINDOW_SEC=0.2)
+        engine.set_load_drop_checks(False)
+        t = np.arange(100) * 0.01
+        f = np.concatenate([np.linspace(0, 20, 90), np.full(10, 2.0)])   # 20 → 2 N 급감
+
+        results = [engine.evaluate_batch(t[i:i + 5], f[i:i + 5])[0] for i in range(0, 100, 5)]
+
+        assert not any(results)
+        # 증가 방향 변화량은 계속 검사
+        assert engine.evaluate_batch([1.01], [9.0], previous_force=2.0)[0] is True
+
+    def test_load_drop_resumes_from_lowered_load(self):
+        """하중 제거 후 검사를 다시 켜면 제거 전 피크와 비교하지 않음"""
+        engine = _engine(LOAD_DROP_FRACTION=0.5, LOAD_DROP_WINDOW_SEC=1.0)
+        engine.evaluate_batch(np.arange(10) * 0.01, np.linspace(0, 20, 10))
+        engine.set_load_drop_checks(False)
+        assert engine.evaluate_batch([0.10, 0.11], [8.0, 4.0])[0] is False
+
+        engine.set_load_drop_checks(True)
+
+        assert engine.evaluate_batch([0.12, 0.13], [4.5, 5.0])[0] is False
+        # 재개 후 피크(5 N) 대비 급감은 발동
+        assert engine.evaluate_batch([0.14], [1.0])[0] is True
+        assert engine.last_violation.rule == 'load_drop'
+
+    def test_slope_rule(self):
+        engine = _engine(SLOPE_LIMIT_N_S=20.0, SLOPE_WINDOW_SEC=0.1)
+        t = np.arange(50) * 0.01
+
+        assert engine.evaluate_batch(t, t * 10.0)[0] is False
+        engine.reset_all()
+        assert engine.evaluate_batch(t, t * 30.0)[0] is True
+        assert engine.last_violation.rule == 'slope'
+
+    def test_temperature_excursion_ignores_missing(self):
+        """온도 규칙은 첫 측정값을 기준으로, NaN(미측정)은 무시"""
+        engine = _engine(TEMP_EXCURSION_C=2.0)
+        t = np.arange(4) * 0.1
+        f = np.zeros(4)
+
+        assert engine.evaluate_batch(t, f, temps=[np.nan, 25.0, 26.0, np.nan])[0] is False
+        exceeded, _ = engine.evaluate_batch([0.5], [0.0], temps=[27.5])
+
+        assert exceeded is True
+        assert engine.last_violation.rule == 'temp_excursion'
+
+    def test_fires_once_until_reset(self):
+        engine = _engine(ABS_FORCE_LIMIT_N=1.0)
+
+        assert engine.evaluate_batch([0.0], [2.0])[0] is True
+        assert engine.evaluate_batch([0.1], [3.0])[0] is False
+
+        engine.reset_all()
+        assert engine.evaluate_batch([0.2], [3.0])[0] is True
+
+    def test_displacement_delegated_to_base(self):
+        engine = _engine()
+        engine.base.set_limits(displacement_limit_mm=1.0)
+
+        exceeded, _ = engine.check_displacement_limit(2000.0, 0.0)
+
+        assert exceeded is True
+
+
+class TestEmergencyForceLimit:
+    """워커 긴급 정지에 장착할 하중 변화량 제한"""
+
+    @pytest.mark.parametrize("enabled, legacy, expected", [
+        (False, False, 5.0),
+        (True, True, 5.0),
+        (True, False, 0.0),   # 규칙 엔진이 변화량 규칙을 대체
+    ])
+    def test_legacy_delta_retired_only_with_rule_engine(self, enabled, legacy, expected):
+        config = SafetyRulesConfig(ENABLED=enabled, LEGACY_FORCE_DELTA=legacy)
+
+        assert emergency_force_limit(5.0, config) == expected
+
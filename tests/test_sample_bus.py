@@ -0,0 +1,165 @@
+# tests/test_sample_bus.py
+"""
+공유 메모리 샘플 버스 테스트
+- 링 순서 / 순환 / 소비자별 커서
+- 뒤처진 소비자 유실 계산, 쓰는 중인 슬롯 버림
+- 다른 매핑(attach)에서 같은 데이터
+- 깨우기 시그널 합치기
+- 로드셀 워커/모니터 연동
+"""
+
+import threading
+import numpy as np
+import pytest
+from unittest.mock import MagicMock, patch
+import Device_Simulator
+from Device_Simulator import create_serial
+from Monitor_loadcell import LoadcellMonitor, LoadcellWorker, _counts_to_force
+from Sample_Bus import SampleBus, SampleRing
+from config import sim_cfg
+
+
+@pytest.fixture
+def ring():
+    r = SampleRing(8)
+    yield r
+    r.close()
+
+
+class TestSampleRing:
+    """SampleRing"""
+
+    def test_read_in_order_across_wrap(self, ring):
+        cursor = ring.cursor()
+        for i in range(6):
+            ring.publish(i, i * 0.5)
+        assert cursor.read()['ts_ns'].tolist() == [0, 1, 2, 3, 4, 5]
+
+        ring.publish_many(np.arange(6, 12), np.arange(6, 12) * 0.5)   # 슬롯 6,7,0,1,2,3
+        records = cursor.read()
+
+        assert records['ts_ns'].tolist() == [6, 7, 8, 9, 10, 11]
+        assert records['value'].tolist() == pytest.approx([3.0, 3.5, 4.0, 4.5, 5.0, 5.5])
+        assert cursor.lost == 0 and cursor.pending == 0
+
+    def test_cursors_are_independent(self, ring):
+        fast, slow = ring.cursor(), ring.cursor()
+        ring.publish(1, 1.0)
+        ring.publish(2, 2.0)
+
+        assert len(fast.read()) == 2
+        ring.publish(3, 3.0)
+        assert fast.read()['ts_ns'].tolist() == [3]
+        assert slow.read(max_records=2)['ts_ns'].tolist() == [1, 2]
+        assert slow.read()['ts_ns'].tolist() == [3]
+
+    def test_lagging_consumer_counts_lost(self, ring):
+        cursor = ring.cursor()
+        ring.publish_many(np.arange(20), np.zeros(20))
+
+        records = cursor.read()
+
+        assert records['ts_ns'].tolist() == list(range(12, 20))
+        assert cursor.lost == 12
+
+    def test_slots_being_written_are_dropped(self, ring):
+        """생산자가 쓰는 중인 구간(reserve_seq)과 겹치는 앞쪽 레코드는 버림"""
+        cursor = ring.cursor()
+        ring.publish_many(np.arange(8), np.zeros(8))
+        ring._header[1] = 10   # 레코드 8, 9 기록 중 → 슬롯 0, 1 (레코드 0, 1) 덮어쓰는 중
+
+        records = cursor.read()
+
+        assert records['ts_ns'].tolist() == [2, 3, 4, 5, 6, 7]
+        assert cursor.lost == 2
+
+    def test_attach_sees_same_records(self, ring):
+        other = SampleRing.attach(ring.name)
+        try:
+            cursor = other.cursor()
+            ring.publish(42, 1.25)
+
+            records = cursor.read()
+
+            assert other.capacity == 8
+            assert records['ts_ns'].tolist() == [42] and records['value'][0] == 1.25
+        finally:
+            other.close()
+
+
+class TestSampleBus:
+    """SampleBus 깨우기"""
+
+    @pytest.mark.timeout(10)
+    def test_wakeups_are_coalesced(self, qtbot):
+        bus = SampleBus(4096)
+        cursor = bus.cursor()
+        wakeups, received = [], []
+
+        def on_wakeup():
+            wakeups.append(1)
+            received.extend(cursor.read()['ts_ns'].tolist())
+
+        bus.samples_available.connect(on_wakeup)
+
+        def produce():
+            for i in range(2000):
+                bus.publish(i, float(i))
+
+        t = threading.Thread(target=produce)
+        t.start()
+        t.join()
+        qtbot.waitUntil(lambda: len(received) == 2000, timeout=5000)
+
+        assert received == list(range(2000))
+        assert len(wakeups) < 2000
+        bus.close()
+
+
+class TestLoadcellBus:
+    """로드셀 워커/모니터 연동"""
+
+    def test_worker_publishes_instead_of_emitting(self):
+        payload = b"".join(c.to_bytes(4, "big", signed=True) + b"\r\n" for c in (100, 200, 300))
+        mock_serial = MagicMock()
+        mock_serial.is_open = True
+        mock_serial.in_waiting = len(payload)
+        mock_serial.read.return_value = payload
+
+        bus = SampleBus(64)
+        cursor = bus.cursor()
+        worker = LoadcellWorker(mock_serial, interval_ms=100, streaming=True, sample_bus=bus)
+        worker._running = True
+        emitted = []
+        worker.data_ready.connect(lambda f, ts: emitted.append(f))
+
+        worker._do_work()
+
+        records = cursor.read()
+        assert emitted == []
+        assert records['value'].tolist() == pytest.approx([_counts_to_force(c) for c in (100, 200, 300)])
+        assert np.all(np.diff(records['ts_ns']) >= 0)
+        bus.close()
+
+    @pytest.mark.timeout(20)
+    def test_monitor_delivers_stream_through_bus(self, qtbot):
+        Device_Simulator.reset_rig()
+        with patch.multiple(sim_cfg, LATENCY_MS=0.0, NOISE_N=0.0, DROPOUT_RATE=0.0,
+                            LOADCELL_RATE_HZ=2000.0):
+            ser = create_serial("SIM:LOADCELL")
+            ser.open()
+            bus = SampleBus(1 << 12)
+            samples = []
+            monitor = LoadcellMonitor(
+                ser, lambda f, ts: samples.append(ts), interval_ms=100,
+                streaming=True, sample_bus=bus
+            )
+            try:
+                qtbot.waitUntil(lambda: len(samples) >= 200, timeout=10000)
+            finally:
+                monitor.stop()
+                bus.close()
+                ser.close()
+
+        assert samples == sorted(samples)
+        assert monitor._bus_cursor is None
@@ -0,0 +1,88 @@
+# tests/test_serial_reader.py
+"""
+시리얼 프레임 읽기 테스트
+- 종료 바이트 도착 즉시 반환 (폴링 sleep / idle gap 대기 없음)
+- 바이너리 값 안의 CRLF 오인 방지
+- 종료 바이트 없는 응답은 idle gap 후 반환
+"""
+
+import threading
+import time
+import pytest
+from Serial_Reader import read_frame
+
+
+class FakeSerial:
+    """serial.Serial처럼 timeout 동안 블로킹하는 가짜 포트"""
+
+    def __init__(self, timeout=1.0):
+        self.timeout = timeout
+        self._buf = bytearray()
+        self._cond = threading.Condition()
+
+    @property
+    def in_waiting(self):
+        with self._cond:
+            return len(self._buf)
+
+    def feed(self, data: bytes, delay: float = 0.0):
+        def _put():
+            with self._cond:
+                self._buf += data
+                self._cond.notify_all()
+        if delay:
+            threading.Timer(delay, _put).start()
+        else:
+            _put()
+
+    def read(self, size=1):
+        with self._cond:
+            self._cond.wait_for(lambda: self._buf, timeout=self.timeout)
+            data = bytes(self._buf[:size])
+            del self._buf[:size]
+            return data
+
+
+class TestReadFrame:
+    """read_frame"""
+
+    @pytest.mark.timeout(5)
+    def test_returns_on_terminator_without_idle_wait(self):
+        ser = FakeSerial()
+        ser.feed(b"0\r\n", delay=0.03)
+
+        t0 = time.perf_counter()
+        raw = read_frame(ser, max_wait=1.0, idle_gap=0.5)
+        elapsed = time.perf_counter() - t0
+
+        assert raw == b"0\r\n"
+        assert elapsed < 0.3  # idle_gap(0.5 s)을 기다리지 않음
+        assert ser.timeout == 1.0  # 원래 timeout 복원
+
+    def test_binary_value_containing_crlf(self):
+        """MSV? 값 0x0D0A0000 + CRLF - 값 안의 CRLF에서 끊지 않음"""
+        ser = FakeSerial()
+        ser.feed(b"\r\n\x00\x00\r\n")
+
+        raw = read_frame(ser, max_wait=1.0, min_size=4)
+
+        assert raw == b"\r\n\x00\x00\r\n"
+
+    def test_unterminated_reply_ends_after_idle_gap(self):
+        ser = FakeSerial()
+        ser.feed(b"\x00\x00\x03\xe8")
+
+        t0 = time.perf_counter()
+        raw = read_frame(ser, max_wait=1.0, idle_gap=0.05)
+
+        assert raw == b"\x00\x00\x03\xe8"
+        assert time.perf_counter() - t0 < 0.5
+
+    def test_no_reply_returns_empty_after_max_wait(self):
+        ser = FakeSerial()
+
+        t0 = time.perf_counter()
+        raw = read_frame(ser, max_wait=0.1)
+
+        assert raw == b""
+        assert 0.09 <= time.perf_counter() - t0 < 0.5
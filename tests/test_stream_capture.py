@@ -0,0 +1,216 @@
+# tests/test_stream_capture.py
+"""
+원시 스트림 캡처 / 재생 테스트
+- .ttcap 기록 → 읽기 왕복, 잘린 마지막 레코드 허용
+- 재생 시 워커와 같은 디코딩/타임스탬프
+- 재생 속도 (실시간 / 최대 속도)
+- 워커 캡처 훅
+- GUI 없는 파이프라인의 가드 트립 기록
+"""
+
+import time
+import pytest
+from unittest.mock import MagicMock
+from Monitor_loadcell import LoadcellWorker, _counts_to_force, _stream_samples
+from Monitor_motor import _decode_position_um
+from Stream_Capture import (
+    SOURCE_LOADCELL_POLL, SOURCE_LOADCELL_STREAM, SOURCE_MOTOR, SOURCE_TEMP,
+    CaptureReplayer, ReplayStats, StreamCapture, build_headless_pipeline, read_capture
+)
+from config import loadcell_cfg
+
+
+def _frame(counts: int) -> bytes:
+    """테스트용 로드셀 프레임 (sint32 BE + CRLF)"""
+    return counts.to_bytes(4, "big", signed=True) + b"\r\n"
+
+
+def _write_capture(path, records):
+    cap = StreamCapture()
+    cap.open(str(path), metadata={"note": "테스트"})
+    for source, ts, payload in records:
+        cap.record(source, ts, payload)
+    cap.close()
+    return cap
+
+
+class TestCaptureFile:
+    """캡처 파일 형식"""
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "a.ttcap"
+        cap = StreamCapture()
+        cap.open(str(path), metadata={"note": "테스트"})
+        cap.record_motor(1_000, 0x1234, 0xFFFF)
+        cap.record_loadcell_poll(2_000, _frame(500))
+        cap.record_temps(3_000, [25, None, 30, 31])
+        cap.close()
+
+        metadata, records = read_capture(str(path))
+
+        assert metadata["note"] == "테스트"
+        assert [(ts, src) for ts, src, _ in records] == [
+            (1_000, SOURCE_MOTOR), (2_000, SOURCE_LOADCELL_POLL), (3_000, SOURCE_TEMP)
+        ]
+        assert records[1][2] == _frame(500)
+        assert cap.records == 3
+
+    def test_record_before_open_is_ignored(self):
+        cap = StreamCapture()
+        cap.record_loadcell_poll(1, b"\x00")
+
+        assert cap.records == 0 and not cap.is_open
+
+    def test_write_error_closes_file(self, tmp_path):
+        """기록 실패 시 파일 핸들을 닫고 캡처 중단"""
+        cap = StreamCapture()
+        cap.open(str(tmp_path / "c.ttcap"))
+        f = cap._file
+        f.write = MagicMock(side_effect=OSError("디스크 가득 참"))
+
+        cap.record_loadcell_poll(1, _frame(1))
+
+        assert f.closed and not cap.is_open
+        cap.record_loadcell_poll(2, _frame(2))   # 이후 호출은 무시
+
+    def test_reopen_closes_previous_file(self, tmp_path):
+        cap = StreamCapture()
+        cap.open(str(tmp_path / "first.ttcap"))
+        first = cap._file
+        cap.record_loadcell_poll(1, _frame(1))
+
+        cap.open(str(tmp_path / "second.ttcap"))
+        cap.close()
+
+        assert first.closed
+        assert len(read_capture(str(tmp_path / "first.ttcap"))[1]) == 1
+
+    def test_truncated_tail_is_dropped(self, tmp_path):
+        """비정상 종료로 잘린 마지막 레코드는 버리고 나머지는 사용"""
+        path = tmp_path / "b.ttcap"
+        _write_capture(path, [
+            (SOURCE_LOADCELL_POLL, 1, _frame(1)),
+            (SOURCE_LOADCELL_POLL, 2, _frame(2)),
+        ])
+        data = path.read_bytes()
+        path.write_bytes(data[:-3])
+
+        _, records = read_capture(str(path))
+
+        assert [ts for ts, _, _ in records] == [1]
+
+    def test_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / "c.ttcap"
+        path.write_bytes(b"timestamp,force\n" * 4)
+
+        with pytest.raises(ValueError):
+            read_capture(str(path))
+
+
+class TestReplay:
+    """CaptureReplayer"""
+
+    def test_dispatch_matches_live_decoding(self):
+        handler = MagicMock()
+        stream_a = _frame(10) + _frame(20)[:3]
+        stream_b = _frame(20)[3:] + _frame(30)
+        records = [
+            (1_000_000, SOURCE_MOTOR, (0x3412).to_bytes(2, "little") + (0xFFFF).to_bytes(2, "little")),
+            (2_000_000, SOURCE_LOADCELL_POLL, _frame(777)),
+            (3_000_000, SOURCE_LOADCELL_STREAM, stream_a),
+            (5_000_000, SOURCE_LOADCELL_STREAM, stream_b),
+            (6_000_000, SOURCE_TEMP, (123).to_bytes(4, "little", signed=True)),
+        ]
+
+        stats = CaptureReplayer(handler, speed=0).run(records)
+
+        handler.update_motor_position.assert_called_once_with(
+            _decode_position_um(0x3412, 0xFFFF), 1_000_000
+        )
+        # 라이브 워커와 같은 버퍼/타임스탬프 배분
+        buf = bytearray()
+        expected = []
+        prev = 3_000_000
+        for ts, chunk in ((3_000_000, stream_a), (5_000_000, stream_b)):
+            buf += chunk
+            expected += _stream_samples(buf, prev, ts)
+            prev = ts
+        calls = [c.args for c in handler.update_loadcell_value.call_args_list]
+        assert calls == [(_counts_to_force(777), 2_000_000)] + expected
+        assert [f for f, _ in expected] == pytest.approx([_counts_to_force(c) for c in (10, 20, 30)])
+        handler.update_temperature_ch1.assert_called_once_with(123, 6_000_000)
+        assert stats.samples == {"motor": 1, "loadcell": 4, "temp": 1}
+        assert stats.latency.count == 6
+
+    def test_missing_temperature_is_skipped(self):
+        handler = MagicMock()
+        payload = (-0x80000000).to_bytes(4, "little", signed=True)
+
+        CaptureReplayer(handler, speed=0).run([(1, SOURCE_TEMP, payload)])
+
+        handler.update_temperature_ch1.assert_not_called()
+
+    @pytest.mark.timeout(5)
+    def test_speed_paces_wall_clock(self):
+        """speed=1은 캡처 간격을 지키고, speed<=0은 대기하지 않음"""
+        records = [(i * 50_000_000, SOURCE_LOADCELL_POLL, _frame(i)) for i in range(5)]
+
+        t0 = time.perf_counter()
+        realtime = CaptureReplayer(MagicMock(), speed=1.0).run(records)
+        assert time.perf_counter() - t0 >= 0.19
+        assert realtime.capture_sec == pytest.approx(0.2)
+
+        t0 = time.perf_counter()
+        CaptureReplayer(MagicMock(), speed=0).run(records)
+        assert time.perf_counter() - t0 < 0.1
+
+
+class TestWorkerCapture:
+    """워커 캡처 훅"""
+
+    def test_stream_drain_records_raw_chunk(self, tmp_path):
+        payload = _frame(100) + _frame(200)
+        mock_serial = MagicMock()
+        mock_serial.is_open = True
+        mock_serial.in_waiting = len(payload)
+        mock_serial.read.return_value = payload
+
+        cap = StreamCapture()
+        cap.open(str(tmp_path / "w.ttcap"))
+        worker = LoadcellWorker(mock_serial, interval_ms=100, streaming=True, capture=cap)
+        worker._running = True
+        live = []
+        worker.data_ready.connect(lambda force, ts: live.append((force, ts)))
+
+        worker._do_work()
+        cap.close()
+
+        _, records = read_capture(str(tmp_path / "w.ttcap"))
+        assert [(src, p) for _, src, p in records] == [(SOURCE_LOADCELL_STREAM, payload)]
+
+        handler = MagicMock()
+        CaptureReplayer(handler, speed=0).run(records)
+        assert [c.args for c in handler.update_loadcell_value.call_args_list] == live
+
+
+class TestHeadlessPipeline:
+    """GUI 없는 재생 파이프라인"""
+
+    def test_force_guard_trip_is_recorded(self):
+        stats = ReplayStats()
+        jump = _counts_to_force(loadcell_cfg.FULLSCALE)
+        handler = build_headless_pipeline(stats, force_limit_n=abs(jump) / 2)
+        records = [
+            (1_000_000_000, SOURCE_LOADCELL_POLL, _frame(0)),
+            (1_500_000_000, SOURCE_LOADCELL_POLL, _frame(0)),
+            (2_000_000_000, SOURCE_LOADCELL_POLL, _frame(loadcell_cfg.FULLSCALE)),
+            (2_500_000_000, SOURCE_LOADCELL_POLL, _frame(loadcell_cfg.FULLSCALE)),
+        ]
+
+        CaptureReplayer(handler, speed=0).run(records, stats)
+
+        assert len(stats.trips) == 1
+        t, reason = stats.trips[0]
+        assert t == pytest.approx(1.0)
+        assert "하중" in reason
+        assert stats.samples["loadcell"] == 4